@@ -1,535 +1,258 @@
-from flask import Flask, request, jsonify, send_file
+import time
+_boot_start = time.perf_counter()
+
+from flask import Blueprint, Flask, Request, Response, current_app, request, jsonify, send_file, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 import re
 import io
+import hashlib
 import os
 from datetime import datetime
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
-import spacy
 from werkzeug.utils import secure_filename
 import json
+from resume_parser import PARSER_VERSION
+from ner import PARSER_NER
+from models import Resume, ValidationError
+import fast_json
+from ingest import EmptyDocumentError, cacheable, error_reader, extract_document, iter_zip_documents, parse_many, parse_text
+from export import FORMATS, ThumbnailUnavailable, cache_template, iter_export_zip, render_docx, render_pdf, render_preview, render_thumbnail
+from jobs import QueueFullError, RenderQueue
+from cache import ParseCache, RenderCache
+from duplicates import NearDuplicates
+from sessions import MemorySessionStore, PatchError, Sessions, SQLiteSessionStore, VersionConflict
+from template_specs import resolve_profile, resolve_template
+from startup import peak_rss_bytes, rss_bytes, startup_report
+from static_files import StaticFiles
+from uploads import UploadBudget, UploadBudgetExceeded, UploadSpool
+import metrics
+import request_log
+from request_log import logger
+import nlp_model
+from contextlib import ExitStack
+from functools import wraps
 
-app = Flask(__name__)
-CORS(app)
+# reportlab (pdf_templates), python-docx (docx_generator) and spaCy
+# (nlp_model) are imported on first use to keep worker startup fast.
 
 # Configuration
-UPLOAD_FOLDER = 'uploads'
+UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER', 'uploads')
 ALLOWED_EXTENSIONS = {'doc', 'docx'}
-MAX_FILE_SIZE = 16 * 1024 * 1024
-
-app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
-app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
+MAX_FILE_SIZE = int(os.environ.get('MAX_FILE_SIZE', 16 * 1024 * 1024))
+# Batch endpoints accept far larger bodies and more multipart parts.
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 512 * 1024 * 1024))
+MAX_BATCH_FILES = int(os.environ.get('MAX_BATCH_FILES', 10000))
+MAX_EXPORT_RESUMES = int(os.environ.get('MAX_EXPORT_RESUMES', 5000))
+BATCH_ENDPOINTS = {'api.upload_batch', 'api.generate_batch'}
+# gunicorn.conf.py exports its worker count. A client's next request
+# usually reaches another worker, so state it must find again is kept in
+# SQLite files in UPLOAD_FOLDER unless their own setting names one.
+WEB_WORKERS = int(os.environ.get('GUNICORN_WORKERS') or 1)
+# Uploaded files beyond UPLOAD_SPOOL_BYTES are spooled to a temporary file
+# in UPLOAD_FOLDER instead of being held in memory.
+upload_spool = UploadSpool(int(os.environ.get('UPLOAD_SPOOL_BYTES', 1024 * 1024)))
+# Bytes of uploads each worker receives and parses at once; requests past it
+# wait up to UPLOAD_BUDGET_WAIT seconds, then get 503. 0 turns it off.
+upload_budget = UploadBudget(int(os.environ.get('UPLOAD_BUDGET_BYTES', 64 * 1024 * 1024)),
+                             wait=float(os.environ.get('UPLOAD_BUDGET_WAIT', 5)))
 
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-    print("✓ spaCy model loaded successfully")
-except Exception as e:
-    print(f"⚠ Warning: spaCy model not loaded: {e}")
-    nlp = None
+def shared_db(setting, filename):
+    """SQLite path from ``setting``, defaulting to ``filename`` in UPLOAD_FOLDER under several workers"""
+    if os.environ.get(setting):
+        return os.environ[setting]
+    if WEB_WORKERS > 1:
+        os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+        return os.path.join(UPLOAD_FOLDER, filename)
+    return None
 
-def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-
-class EnhancedResumeParser:
-    """Enhanced resume parser with improved accuracy"""
+class ResumeRequest(Request):
+    """Request with per-endpoint body limits"""
     
-    def __init__(self, text):
-        self.text = text
-        self.lines = [line.strip() for line in text.split('\n') if line.strip()]
-        
-    def extract_email(self):
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.findall(email_pattern, self.text)
-        return matches[0] if matches else ""
-    
-    def extract_phone(self):
-        phone_patterns = [
-            r'\+?1?\s*\(?(\d{3})\)?[\s.-]?(\d{3})[\s.-]?(\d{4})',
-            r'\+?\d{1,3}[\s.-]?\(?\d{2,4}\)?[\s.-]?\d{3,4}[\s.-]?\d{4}',
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-        ]
-        for pattern in phone_patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                return match.group(0)
-        return ""
-    
-    def extract_name(self):
-        if self.lines:
-            first_line = self.lines[0]
-            first_line = re.sub(r'^(Resume|CV|Curriculum Vitae)[\s:]*', '', first_line, flags=re.IGNORECASE)
-            if len(first_line.split()) <= 5 and first_line[0].isupper():
-                return first_line
-        return "Your Name"
-    
-    def extract_linkedin(self):
-        """Extract LinkedIn profile URL"""
-        linkedin_pattern = r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+'
-        match = re.search(linkedin_pattern, self.text, re.IGNORECASE)
-        return match.group(0) if match else ""
-    
-    def extract_location(self):
-        location_patterns = [
-            r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b',
-            r'\b[A-Z][a-z]+,\s*[A-Z][a-z]+\b'
-        ]
-        for pattern in location_patterns:
-            match = re.search(pattern, self.text)
-            if match:
-                return match.group(0)
-        return ""
-    
-    def extract_skills(self):
-        skills = []
-        tech_skills = [
-            'Python', 'Java', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue',
-            'Node.js', 'Express', 'Django', 'Flask', 'FastAPI', 'Spring Boot',
-            'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Elasticsearch',
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'Git',
-            'HTML', 'CSS', 'SCSS', 'Tailwind', 'Bootstrap', 'Material-UI',
-            'REST API', 'GraphQL', 'gRPC', 'WebSocket',
-            'Machine Learning', 'Deep Learning', 'AI', 'Data Science', 
-            'TensorFlow', 'PyTorch', 'Scikit-learn', 'Pandas', 'NumPy',
-            'C++', 'C#', 'Ruby', 'PHP', 'Swift', 'Kotlin', 'Go', 'Rust',
-            'Agile', 'Scrum', 'DevOps', 'CI/CD', 'Microservices', 'Linux',
-            'Firebase', 'Supabase', 'Next.js', 'Svelte', 'Remix'
-        ]
-        
-        text_lower = self.text.lower()
-        skills_keywords = ['skills', 'technical skills', 'competencies', 'expertise', 'technologies', 'tools']
-        
-        for keyword in skills_keywords:
-            idx = text_lower.find(keyword)
-            if idx != -1:
-                skills_section = self.text[idx:idx+600]
-                for skill in tech_skills:
-                    if re.search(r'\b' + re.escape(skill) + r'\b', skills_section, re.IGNORECASE):
-                        if skill not in skills:
-                            skills.append(skill)
-                break
-        
-        if not skills:
-            for skill in tech_skills[:20]:
-                if re.search(r'\b' + re.escape(skill) + r'\b', self.text, re.IGNORECASE):
-                    if skill not in skills:
-                        skills.append(skill)
-        
-        skills = list(dict.fromkeys(skills))[:15]
-        return skills if skills else ["Communication", "Problem Solving", "Teamwork", "Leadership"]
+    @property
+    def max_content_length(self):
+        if self.endpoint in BATCH_ENDPOINTS:
+            return MAX_BATCH_SIZE
+        return current_app.config['MAX_CONTENT_LENGTH']
     
-    def extract_experience(self):
-        experience = []
-        text_lower = self.text.lower()
-        exp_keywords = ['experience', 'work experience', 'employment', 'work history', 'professional experience']
-        
-        exp_start_idx = -1
-        for keyword in exp_keywords:
-            idx = text_lower.find(keyword)
-            if idx != -1:
-                exp_start_idx = idx
-                break
-        
-        if exp_start_idx != -1:
-            end_keywords = ['education', 'skills', 'projects', 'certifications']
-            exp_end_idx = len(self.text)
-            
-            for keyword in end_keywords:
-                idx = text_lower.find(keyword, exp_start_idx + 50)
-                if idx != -1 and idx < exp_end_idx:
-                    exp_end_idx = idx
-            
-            exp_section = self.text[exp_start_idx:exp_end_idx]
-            date_pattern = r'(\d{4}|[A-Z][a-z]+\s+\d{4})\s*[-–—]\s*(\d{4}|Present|Current|Now)'
-            dates = re.findall(date_pattern, exp_section, re.IGNORECASE)
-            
-            if dates:
-                for i, date in enumerate(dates[:4]):
-                    lines_around_date = exp_section.split('\n')
-                    title = f"Position {i+1}"
-                    company = f"Company {i+1}"
-                    
-                    for line in lines_around_date:
-                        if date[0] in line:
-                            idx = lines_around_date.index(line)
-                            if idx > 0:
-                                title = lines_around_date[idx-1].strip()
-                            if idx > 1:
-                                company = lines_around_date[idx-2].strip()
-                            break
-                    
-                    experience.append({
-                        'title': title[:100],
-                        'company': company[:100],
-                        'period': f"{date[0]} - {date[1]}",
-                        'description': 'Responsible for key tasks and deliverables in the role'
-                    })
-        
-        if not experience:
-            experience = [
-                {
-                    'title': 'Software Developer',
-                    'company': 'Tech Company',
-                    'period': '2020 - Present',
-                    'description': 'Developed and maintained web applications using modern technologies'
-                }
-            ]
-        
-        return experience[:4]
+    @property
+    def max_form_parts(self):
+        if self.endpoint in BATCH_ENDPOINTS:
+            return MAX_BATCH_FILES + 10
+        return 1000
     
-    def extract_education(self):
-        education = []
-        text_lower = self.text.lower()
-        edu_keywords = ['education', 'academic', 'qualification', 'degree']
-        
-        edu_start_idx = -1
-        for keyword in edu_keywords:
-            idx = text_lower.find(keyword)
-            if idx != -1:
-                edu_start_idx = idx
-                break
-        
-        if edu_start_idx != -1:
-            edu_section = self.text[edu_start_idx:edu_start_idx+600]
-            
-            degree_patterns = [
-                r'(Bachelor|Master|PhD|Doctorate|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|B\.?Tech|M\.?Tech|MBA|BBA|BCA|MCA)[\s\w\.,\(\)]*',
-                r'(Diploma|Certificate|Associate)[\s\w]*'
-            ]
-            
-            degrees = []
-            for pattern in degree_patterns:
-                matches = re.findall(pattern, edu_section, re.IGNORECASE)
-                degrees.extend(matches)
-            
-            year_pattern = r'\b(19|20)\d{2}\b'
-            years = re.findall(year_pattern, edu_section)
-            
-            institution_pattern = r'(?:at |from |,\s*)([A-Z][A-Za-z\s&,\.]+(?:University|College|Institute|School|Academy))'
-            institutions = re.findall(institution_pattern, edu_section, re.IGNORECASE)
-            
-            for i in range(min(len(degrees), 3)):
-                education.append({
-                    'degree': degrees[i].strip(),
-                    'institution': institutions[i].strip() if i < len(institutions) else 'University',
-                    'year': years[i] if i < len(years) else '2020'
-                })
-        
-        if not education:
-            education = [{
-                'degree': 'Bachelor of Science in Computer Science',
-                'institution': 'University',
-                'year': '2020'
-            }]
-        
-        return education
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return upload_spool.open(current_app.config['UPLOAD_FOLDER'])
+
+
+class JSONProvider(DefaultJSONProvider):
+    """Flask's JSON on orjson when it is installed; indented (debug) output stays with the standard library"""
     
-    def extract_summary(self):
-        summary_keywords = ['summary', 'objective', 'profile', 'about', 'professional summary', 'overview']
-        text_lower = self.text.lower()
-        
-        for keyword in summary_keywords:
-            idx = text_lower.find(keyword)
-            if idx != -1:
-                summary_start = idx + len(keyword)
-                summary_section = self.text[summary_start:summary_start+500]
-                sentences = re.split(r'[.!?]\s+', summary_section)
-                valid_sentences = [s.strip() for s in sentences if len(s.split()) > 5]
-                if valid_sentences:
-                    summary = '. '.join(valid_sentences[:3]) + '.'
-                    return summary[:400]
-        
-        return 'Experienced professional with strong technical skills and a proven track record of delivering high-quality results.'
+    def dumps(self, obj, **kwargs):
+        if fast_json.orjson is None or kwargs.get('indent'):
+            return super().dumps(obj, **kwargs)
+        try:
+            return fast_json.dumps(obj, sort_keys=self.sort_keys)
+        except TypeError:
+            return super().dumps(obj, **kwargs)
     
-    def calculate_score(self, data):
-        """Calculate resume completeness score"""
-        score = 0
-        max_score = 100
-        
-        if data.get('name') and data['name'] != 'Your Name':
-            score += 10
-        if data.get('email'):
-            score += 15
-        if data.get('phone'):
-            score += 10
-        if data.get('summary') and len(data['summary']) > 50:
-            score += 15
-        if data.get('skills') and len(data['skills']) >= 5:
-            score += 20
-        if data.get('experience') and len(data['experience']) >= 1:
-            score += 20
-        if data.get('education') and len(data['education']) >= 1:
-            score += 10
-        
-        return min(score, max_score)
-    
-    def parse(self):
-        data = {
-            'name': self.extract_name(),
-            'email': self.extract_email(),
-            'phone': self.extract_phone(),
-            'linkedin': self.extract_linkedin(),
-            'location': self.extract_location(),
-            'summary': self.extract_summary(),
-            'skills': self.extract_skills(),
-            'experience': self.extract_experience(),
-            'education': self.extract_education()
-        }
-        
-        data['score'] = self.calculate_score(data)
-        return data
+    def loads(self, s, **kwargs):
+        return fast_json.loads(s)
 
 
-class EnhancedPDFGenerator:
-    """Enhanced PDF generator with new templates"""
-    
-    @staticmethod
-    def create_modern_template(buffer, data):
-        """Modern template with blue accent"""
-        doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=50, leftMargin=50, topMargin=50, bottomMargin=30)
-        story = []
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'], fontSize=28,
-            textColor=colors.HexColor('#1e40af'), spaceAfter=8, fontName='Helvetica-Bold')
-        
-        contact_style = ParagraphStyle('Contact', parent=styles['Normal'], fontSize=10,
-            textColor=colors.HexColor('#4b5563'), spaceAfter=16)
-        
-        heading_style = ParagraphStyle('CustomHeading', parent=styles['Heading2'], fontSize=14,
-            textColor=colors.HexColor('#1e40af'), spaceAfter=8, spaceBefore=14, fontName='Helvetica-Bold')
-        
-        story.append(Paragraph(data['name'], title_style))
-        
-        contact_parts = []
-        if data.get('email'):
-            contact_parts.append(data['email'])
-        if data.get('phone'):
-            contact_parts.append(data['phone'])
-        if data.get('location'):
-            contact_parts.append(data['location'])
-        
-        if contact_parts:
-            story.append(Paragraph(' | '.join(contact_parts), contact_style))
-        
-        story.append(Spacer(1, 0.1*inch))
-        
-        if data.get('summary'):
-            story.append(Paragraph('PROFESSIONAL SUMMARY', heading_style))
-            story.append(Paragraph(data['summary'], styles['Normal']))
-            story.append(Spacer(1, 0.15*inch))
-        
-        if data.get('experience'):
-            story.append(Paragraph('WORK EXPERIENCE', heading_style))
-            for exp in data['experience']:
-                job_style = ParagraphStyle('Job', parent=styles['Normal'], fontName='Helvetica-Bold', fontSize=11)
-                story.append(Paragraph(exp['title'], job_style))
-                company_style = ParagraphStyle('Company', parent=styles['Normal'], fontSize=10, textColor=colors.HexColor('#4b5563'))
-                story.append(Paragraph(f"{exp['company']} | {exp['period']}", company_style))
-                story.append(Paragraph(exp['description'], styles['Normal']))
-                story.append(Spacer(1, 0.12*inch))
-        
-        if data.get('education'):
-            story.append(Paragraph('EDUCATION', heading_style))
-            for edu in data['education']:
-                degree_style = ParagraphStyle('Degree', parent=styles['Normal'], fontName='Helvetica-Bold', fontSize=11)
-                story.append(Paragraph(edu['degree'], degree_style))
-                institution_style = ParagraphStyle('Institution', parent=styles['Normal'], fontSize=10, textColor=colors.HexColor('#4b5563'))
-                story.append(Paragraph(f"{edu['institution']} | {edu['year']}", institution_style))
-                story.append(Spacer(1, 0.12*inch))
-        
-        if data.get('skills'):
-            story.append(Paragraph('SKILLS', heading_style))
-            skills_text = ' • '.join(data['skills'])
-            story.append(Paragraph(skills_text, styles['Normal']))
-        
-        doc.build(story)
-        return buffer
-    
-    @staticmethod
-    def create_professional_template(buffer, data):
-        """Professional centered template"""
-        doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=60, leftMargin=60, topMargin=60, bottomMargin=30)
-        story = []
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'], fontSize=26,
-            textColor=colors.black, spaceAfter=8, alignment=TA_CENTER, fontName='Helvetica-Bold')
-        
-        contact_style = ParagraphStyle('Contact', parent=styles['Normal'], fontSize=10,
-            textColor=colors.HexColor('#374151'), spaceAfter=20, alignment=TA_CENTER)
-        
-        heading_style = ParagraphStyle('CustomHeading', parent=styles['Heading2'], fontSize=12,
-            textColor=colors.black, spaceAfter=6, spaceBefore=12, fontName='Helvetica-Bold')
-        
-        story.append(Paragraph(data['name'], title_style))
-        
-        contact_parts = []
-        if data.get('email'):
-            contact_parts.append(data['email'])
-        if data.get('phone'):
-            contact_parts.append(data['phone'])
-        if data.get('location'):
-            contact_parts.append(data['location'])
-        
-        if contact_parts:
-            story.append(Paragraph(' | '.join(contact_parts), contact_style))
-        
-        story.append(Spacer(1, 0.1*inch))
-        
-        if data.get('summary'):
-            story.append(Paragraph('SUMMARY', heading_style))
-            story.append(Paragraph(data['summary'], styles['Normal']))
-            story.append(Spacer(1, 0.15*inch))
-        
-        if data.get('experience'):
-            story.append(Paragraph('EXPERIENCE', heading_style))
-            for exp in data['experience']:
-                job_style = ParagraphStyle('Job', parent=styles['Normal'], fontName='Helvetica-Bold', fontSize=11)
-                story.append(Paragraph(exp['title'], job_style))
-                company_style = ParagraphStyle('Company', parent=styles['Normal'], fontSize=10,
-                    textColor=colors.HexColor('#4b5563'), fontName='Helvetica-Oblique')
-                story.append(Paragraph(f"{exp['company']} | {exp['period']}", company_style))
-                story.append(Paragraph(exp['description'], styles['Normal']))
-                story.append(Spacer(1, 0.12*inch))
-        
-        if data.get('education'):
-            story.append(Paragraph('EDUCATION', heading_style))
-            for edu in data['education']:
-                degree_style = ParagraphStyle('Degree', parent=styles['Normal'], fontName='Helvetica-Bold', fontSize=11)
-                story.append(Paragraph(edu['degree'], degree_style))
-                institution_style = ParagraphStyle('Institution', parent=styles['Normal'], fontSize=10, textColor=colors.HexColor('#4b5563'))
-                story.append(Paragraph(f"{edu['institution']} | {edu['year']}", institution_style))
-                story.append(Spacer(1, 0.12*inch))
-        
-        if data.get('skills'):
-            story.append(Paragraph('SKILLS', heading_style))
-            skills_text = ' • '.join(data['skills'])
-            story.append(Paragraph(skills_text, styles['Normal']))
-        
-        doc.build(story)
-        return buffer
-    
-    @staticmethod
-    def create_creative_template(buffer, data):
-        """Creative template with colorful design"""
-        doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=50, leftMargin=50, topMargin=50, bottomMargin=30)
-        story = []
-        styles = getSampleStyleSheet()
-        
-        title_style = ParagraphStyle('CreativeTitle', parent=styles['Heading1'], fontSize=30,
-            textColor=colors.HexColor('#ec4899'), spaceAfter=8, fontName='Helvetica-Bold')
-        
-        heading_style = ParagraphStyle('CreativeHeading', parent=styles['Heading2'], fontSize=14,
-            textColor=colors.HexColor('#f97316'), spaceAfter=8, spaceBefore=14, fontName='Helvetica-Bold')
-        
-        story.append(Paragraph(data['name'], title_style))
-        
-        contact_parts = []
-        if data.get('email'):
-            contact_parts.append(data['email'])
-        if data.get('phone'):
-            contact_parts.append(data['phone'])
-        
-        if contact_parts:
-            story.append(Paragraph(' | '.join(contact_parts), styles['Normal']))
-        
-        story.append(Spacer(1, 0.1*inch))
-        
-        if data.get('summary'):
-            story.append(Paragraph('ABOUT ME', heading_style))
-            story.append(Paragraph(data['summary'], styles['Normal']))
-            story.append(Spacer(1, 0.15*inch))
-        
-        if data.get('skills'):
-            story.append(Paragraph('EXPERTISE', heading_style))
-            skills_text = ' • '.join(data['skills'])
-            story.append(Paragraph(skills_text, styles['Normal']))
-            story.append(Spacer(1, 0.15*inch))
-        
-        if data.get('experience'):
-            story.append(Paragraph('EXPERIENCE', heading_style))
-            for exp in data['experience']:
-                story.append(Paragraph(f"<b>{exp['title']}</b>", styles['Normal']))
-                story.append(Paragraph(f"{exp['company']} | {exp['period']}", styles['Normal']))
-                story.append(Paragraph(exp['description'], styles['Normal']))
-                story.append(Spacer(1, 0.12*inch))
-        
-        if data.get('education'):
-            story.append(Paragraph('EDUCATION', heading_style))
-            for edu in data['education']:
-                story.append(Paragraph(f"<b>{edu['degree']}</b>", styles['Normal']))
-                story.append(Paragraph(f"{edu['institution']} | {edu['year']}", styles['Normal']))
-                story.append(Spacer(1, 0.12*inch))
-        
-        doc.build(story)
-        return buffer
+api = Blueprint('api', __name__)
+site = Blueprint('frontend', __name__)
+
+
+def env_flag(name, default=False):
+    return os.environ.get(name, str(default)).lower() in ('1', 'true', 'yes')
 
 
-class DocxGenerator:
-    """Generate DOCX resumes"""
+def create_app(config=None):
+    """Build the Flask app; settings come from the environment (see .env), then ``config``"""
+    # No built-in /static route: it would shadow the frontend's static/ files.
+    app = Flask(__name__, static_folder=None)
+    app.json = JSONProvider(app)
+    app.request_class = ResumeRequest
+    CORS(app)
     
-    @staticmethod
-    def create_docx(data):
-        doc = Document()
-        
-        # Title
-        title = doc.add_heading(data['name'], 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # Contact info
-        contact_parts = []
-        if data.get('email'):
-            contact_parts.append(data['email'])
-        if data.get('phone'):
-            contact_parts.append(data['phone'])
-        if data.get('location'):
-            contact_parts.append(data['location'])
-        
-        if contact_parts:
-            p = doc.add_paragraph(' | '.join(contact_parts))
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # Summary
-        if data.get('summary'):
-            doc.add_heading('Professional Summary', 1)
-            doc.add_paragraph(data['summary'])
-        
-        # Skills
-        if data.get('skills'):
-            doc.add_heading('Skills', 1)
-            doc.add_paragraph(' • '.join(data['skills']))
-        
-        # Experience
-        if data.get('experience'):
-            doc.add_heading('Work Experience', 1)
-            for exp in data['experience']:
-                doc.add_heading(exp['title'], 2)
-                doc.add_paragraph(f"{exp['company']} | {exp['period']}")
-                doc.add_paragraph(exp['description'])
-        
-        # Education
-        if data.get('education'):
-            doc.add_heading('Education', 1)
-            for edu in data['education']:
-                doc.add_heading(edu['degree'], 2)
-                doc.add_paragraph(f"{edu['institution']} | {edu['year']}")
-        
-        return doc
+    app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+    app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY')
+    app.config['DEBUG'] = env_flag('FLASK_DEBUG')
+    app.config.update(config or {})
+    
+    os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+    request_log.configure_logging()
+    request_log.init_app(app)
+    app.register_blueprint(api)
+    if frontend is not None:
+        app.register_blueprint(site)
+    return app
+
+
+# Parse results keyed by upload hash + parser version. PARSE_CACHE_DB adds a
+# SQLite tier that survives restarts, bounded by row count and age.
+parse_cache = ParseCache(
+    PARSER_VERSION,
+    max_bytes=int(os.environ.get('PARSE_CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+    db_path=os.environ.get('PARSE_CACHE_DB') or None,
+    db_max_rows=int(os.environ.get('PARSE_CACHE_DB_MAX_ROWS', 100000)),
+    db_max_age=int(os.environ.get('PARSE_CACHE_DB_MAX_AGE', 30 * 24 * 3600))
+)
+# Rendered PDF/DOCX bytes keyed by template + resume data hash.
+render_cache = RenderCache(max_bytes=int(os.environ.get('RENDER_CACHE_MAX_BYTES', 128 * 1024 * 1024)))
+# Render jobs run in the worker they were submitted to. With more than one
+# gunicorn worker they are also written to RENDER_JOB_DB, so a poll or a
+# download reaching another worker finds them.
+render_jobs = RenderQueue(
+    workers=int(os.environ.get('RENDER_WORKERS', 2)),
+    depth=int(os.environ.get('RENDER_QUEUE_DEPTH', 64)),
+    ttl=int(os.environ.get('RENDER_JOB_TTL', 600)),
+    cache=render_cache,
+    max_jobs=int(os.environ.get('RENDER_JOB_MAX', 1000)),
+    db_path=shared_db('RENDER_JOB_DB', 'render_jobs.db')
+)
+MAX_JOB_WAIT = 30
+PREVIEW_WIDTH = 300
+MAX_PREVIEW_WIDTH = 1200
+# Resume sessions opened by /api/upload. SESSION_DB shares them between
+# workers through SQLite, and is on by default under several workers;
+# otherwise the one process keeps them in memory.
+SESSION_TTL = int(os.environ.get('SESSION_TTL', 3600))
+SESSION_DB = shared_db('SESSION_DB', 'sessions.db')
+if SESSION_DB:
+    session_store = SQLiteSessionStore(SESSION_DB, ttl=SESSION_TTL,
+                                       max_sessions=int(os.environ.get('SESSION_MAX', 100000)))
+else:
+    session_store = MemorySessionStore(ttl=SESSION_TTL,
+                                       max_bytes=int(os.environ.get('SESSION_MAX_BYTES', 64 * 1024 * 1024)))
+sessions = Sessions(session_store)
+metrics.register_stats('parse_cache', parse_cache)
+metrics.register_stats('render_cache', render_cache)
+metrics.register_stats('render_jobs', render_jobs)
+metrics.register_stats('sessions', sessions)
+metrics.register_stats('upload_spool', upload_spool)
+metrics.register_stats('upload_budget', upload_budget)
+# Searchable store of every parsed upload, off unless CANDIDATE_DB names a
+# SQLite file; each worker indexes it in memory and catches up per query.
+CANDIDATE_DB = os.environ.get('CANDIDATE_DB')
+if CANDIDATE_DB:
+    from candidates import Candidates, filter_query
+    candidates = Candidates(CANDIDATE_DB)
+    metrics.register_stats('candidates', candidates)
+else:
+    candidates = None
+MAX_CANDIDATE_RESULTS = 100
+# Near-duplicate detection on /api/upload, off unless DUPLICATE_MAX sets how
+# many signatures each worker keeps (about 750 bytes apiece). DUPLICATE_DB
+# shares the seen resumes between workers and restarts.
+DUPLICATE_MAX = int(os.environ.get('DUPLICATE_MAX', 0))
+if DUPLICATE_MAX:
+    duplicates = NearDuplicates(os.environ.get('DUPLICATE_DB'),
+                                threshold=float(os.environ.get('DUPLICATE_THRESHOLD', 0.8)),
+                                max_entries=DUPLICATE_MAX)
+    metrics.register_stats('duplicates', duplicates)
+else:
+    duplicates = None
+# The built frontend, served from memory at / when FRONTEND_BUILD names the
+# build directory (frontend/build).
+FRONTEND_BUILD = os.environ.get('FRONTEND_BUILD')
+if FRONTEND_BUILD:
+    frontend = StaticFiles(FRONTEND_BUILD)
+    metrics.register_stats('frontend', frontend)
+else:
+    frontend = None
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
+def allowed_file(filename):
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+
+
+def admin_required(view):
+    """Require the X-Admin-Token header when ADMIN_TOKEN is configured"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if ADMIN_TOKEN and request.headers.get('X-Admin-Token') != ADMIN_TOKEN:
+            return jsonify({'error': 'Unauthorized'}), 401
+        return view(*args, **kwargs)
+    return wrapper
 
 
-@app.route('/api/upload', methods=['POST'])
+def within_upload_budget(view):
+    """Run ``view`` holding its request's body size in the upload budget, or answer 503 if no room comes.
+
+    The size is charged before the body is read, so it must be known: a
+    chunked upload without ``Content-Length`` gets 411. A streamed response
+    holds it until the stream closes, since its documents are parsed then.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if request.content_length is None:
+            return jsonify({'error': 'Uploads need a Content-Length header'}), 411
+        reservation = ExitStack()
+        try:
+            reservation.enter_context(upload_budget.reserve(request.content_length))
+        except UploadBudgetExceeded as e:
+            response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+            response.status_code = 503
+            response.headers['Retry-After'] = str(e.retry_after)
+            return response
+        with reservation:
+            response = current_app.make_response(view(*args, **kwargs))
+            if response.is_streamed:
+                response.call_on_close(reservation.pop_all().close)
+            return response
+    return wrapper
+
+
+def ner_requested():
+    return request.values.get('ner', str(PARSER_NER)).lower() in ('1', 'true', 'yes')
+
+
+@api.route('/api/upload', methods=['POST'])
+@within_upload_budget
 def upload_document():
     """Handle document upload and parsing"""
     if 'file' not in request.files:
@@ -544,123 +267,580 @@ def upload_document():
         return jsonify({'error': 'Only .doc and .docx files are supported'}), 400
     
     try:
-        doc = Document(file)
-        text = '\n'.join([paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()])
-        
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    if cell.text.strip():
-                        text += '\n' + cell.text
-        
-        if not text.strip():
-            return jsonify({'error': 'Document appears to be empty'}), 400
-        
-        parser = EnhancedResumeParser(text)
-        parsed_data = parser.parse()
-        
-        return jsonify({
-            'success': True,
-            'data': parsed_data,
-            'raw_text': text[:500]
-        })
+        use_ner = ner_requested()
+        # Read from the spooled upload rather than into memory.
+        with metrics.stage('upload_read'):
+            digest = hashlib.file_digest(file.stream, 'sha256').hexdigest()
+        cache_key = parse_cache.digest_key(digest, 'ner' if use_ner else '')
+        cached = parse_cache.get(cache_key)
+        if cached is not None:
+            index_candidate(cached['data'])
+            return jsonify({'success': True, 'cached': True, **cached, 'nearDuplicate': seen_before(digest),
+                            **session_fields(sessions.create(cached['data']))})
+        
+        text = extract_document(file.stream)
+        duplicate = near_duplicate(digest, text)
+        result = parse_text(text, ner=use_ner)
+        if cacheable(result, use_ner):
+            parse_cache.put(cache_key, result)
+        index_candidate(result['data'])
+        
+        return jsonify({'success': True, 'cached': False, **result, 'nearDuplicate': duplicate,
+                        **session_fields(sessions.create(result['data']))})
+    
+    except EmptyDocumentError as e:
+        return jsonify({'error': str(e)}), 400
     
     except Exception as e:
-        print(f"Error processing document: {str(e)}")
+        logger.exception('Error processing document')
         return jsonify({'error': f'Error processing document: {str(e)}'}), 500
 
 
-@app.route('/api/update-data', methods=['POST'])
+def near_duplicate(digest, text):
+    """The earlier upload ``text`` nearly duplicates, as ``{'sha256', 'similarity'}``, or None"""
+    if duplicates is None:
+        return None
+    try:
+        with metrics.stage('dedupe'):
+            return duplicates.check(digest, text)
+    except Exception:
+        logger.exception('Error checking for duplicates')
+        return None
+
+
+def seen_before(digest):
+    """Like ``near_duplicate`` for a cached upload, whose text isn't extracted again"""
+    if duplicates is None:
+        return None
+    try:
+        return duplicates.seen(digest)
+    except Exception:
+        logger.exception('Error checking for duplicates')
+        return None
+
+
+def batch_documents(uploads):
+    """``(name, read)`` pairs for uploaded ``(filename, stream)``, expanding zip archives"""
+    for filename, stream in uploads:
+        try:
+            if filename.lower().endswith('.zip'):
+                try:
+                    yield from ((f"{filename}/{name}", read)
+                                for name, read in iter_zip_documents(stream, MAX_FILE_SIZE))
+                except Exception as e:
+                    yield filename, error_reader(f'Invalid zip archive: {e}')
+            elif allowed_file(filename):
+                yield filename, stream.read
+            else:
+                yield filename, error_reader('Only .doc, .docx and .zip files are supported')
+        finally:
+            stream.close()
+
+
+@api.route('/api/upload-batch', methods=['POST'])
+@within_upload_budget
+def upload_batch():
+    """Parse many documents (files and/or zip archives), streaming NDJSON results"""
+    files = request.files.getlist('files') + request.files.getlist('file')
+    if not files:
+        return jsonify({'error': 'No files provided'}), 400
+    
+    use_ner = ner_requested()
+    # The request closes its uploaded files as soon as the view returns,
+    # before the response has streamed, so the batch takes over the streams.
+    uploads = []
+    for file in files:
+        uploads.append((file.filename or '', file.stream))
+        file.stream = io.BytesIO()
+    
+    def generate():
+        total = failed = 0
+        for result in parse_many(batch_documents(uploads), cache=parse_cache, ner=use_ner):
+            total += 1
+            failed += not result['success']
+            if result['success']:
+                index_candidate(result['data'])
+            yield json.dumps(result) + '\n'
+        yield json.dumps({'done': True, 'total': total, 'failed': failed}) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                    headers={'X-Accel-Buffering': 'no'})
+
+
+def index_candidate(data):
+    """Add a parsed resume to the candidate store (a re-upload is stored once); a failure here doesn't fail the upload"""
+    if candidates is None:
+        return
+    try:
+        with metrics.stage('candidate_index'):
+            candidates.add(data)
+    except Exception:
+        logger.exception('Error indexing candidate')
+
+
+def candidate_limit(value):
+    try:
+        return max(1, min(int(value), MAX_CANDIDATE_RESULTS))
+    except (TypeError, ValueError):
+        return 20
+
+
+@api.route('/api/candidates/rank', methods=['POST'])
+def rank_candidates():
+    """Stored candidates most similar to ``jobDescription``, optionally filtered by skills, title and company"""
+    if candidates is None:
+        return jsonify({'error': 'Candidate index is not enabled'}), 501
+    data = request.json or {}
+    text = data.get('jobDescription')
+    if not isinstance(text, str) or not text.strip():
+        return jsonify({'error': 'No job description provided'}), 400
+    skills = data.get('skills') or []
+    if not isinstance(skills, list):
+        return jsonify({'error': 'skills must be a list'}), 400
+    
+    start = time.perf_counter()
+    keys = filter_query(skills, data.get('title') or '', data.get('company') or '')
+    with metrics.stage('candidate_rank'):
+        results = candidates.rank(text, candidate_limit(data.get('limit', 20)), keys)
+    return jsonify({'success': True, 'results': results,
+                    'took_ms': round((time.perf_counter() - start) * 1000, 2)})
+
+
+@api.route('/api/candidates', methods=['GET'])
+def search_candidates():
+    """Most recent candidates having every ``skill`` (repeatable), ``title`` word and ``company`` word"""
+    if candidates is None:
+        return jsonify({'error': 'Candidate index is not enabled'}), 501
+    keys = filter_query(request.args.getlist('skill'), request.args.get('title', ''), request.args.get('company', ''))
+    results, total = candidates.search(keys, candidate_limit(request.args.get('limit', 20)))
+    return jsonify({'success': True, 'results': results, 'total': total})
+
+
+@api.route('/api/candidates/<int:candidate_id>', methods=['GET'])
+def get_candidate(candidate_id):
+    if candidates is None:
+        return jsonify({'error': 'Candidate index is not enabled'}), 501
+    data = candidates.get(candidate_id)
+    if data is None:
+        return jsonify({'error': 'Unknown candidate'}), 404
+    return jsonify({'success': True, 'id': candidate_id, 'data': data})
+
+
+@api.route('/api/admin/parse-cache', methods=['GET', 'DELETE'])
+@admin_required
+def parse_cache_admin():
+    """Parse cache stats (GET) and invalidation (DELETE, optionally ?sha256=<digest>)"""
+    if request.method == 'DELETE':
+        digest = request.args.get('sha256')
+        removed = parse_cache.invalidate_digest(digest) if digest else parse_cache.invalidate()
+        return jsonify({'success': True, 'removed': removed})
+    
+    return jsonify(parse_cache.stats())
+
+
+@api.route('/api/update-data', methods=['POST'])
 def update_data():
-    """Update parsed resume data"""
+    """Update parsed resume data: a patch to a session, or (legacy) the whole document echoed back"""
     data = request.json
     
     if not data:
         return jsonify({'error': 'No data provided'}), 400
+    if isinstance(data, dict) and data.get('sessionId'):
+        return patch_session(data['sessionId'], data.get('patch'), data.get('version'))
     
     return jsonify({'success': True, 'data': data})
 
 
-@app.route('/api/generate-pdf', methods=['POST'])
+def session_fields(session):
+    return {'sessionId': session['id'], 'version': session['version']}
+
+
+@api.route('/api/sessions', methods=['POST'])
+def create_session():
+    """Open a session from ``resumeData``"""
+    data = request.json or {}
+    try:
+        session = sessions.create(data.get('resumeData'))
+    except PatchError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    response = jsonify({'success': True, **session_fields(session), 'score': session['data']['score']})
+    response.status_code = 201
+    response.headers['Location'] = f"/api/sessions/{session['id']}"
+    return response
+
+
+@api.route('/api/sessions/<session_id>', methods=['GET'])
+def get_session(session_id):
+    """A session's current data and version"""
+    session = sessions.get(session_id)
+    if session is None:
+        return jsonify({'error': 'Unknown or expired session'}), 404
+    return jsonify({'success': True, **session_fields(session), 'data': session['data']})
+
+
+@api.route('/api/sessions/<session_id>', methods=['PATCH'])
+def update_session(session_id):
+    """Apply a JSON Patch (RFC 6902); the body is the operation list or ``{"patch", "version"}``"""
+    data = request.json
+    if isinstance(data, dict):
+        return patch_session(session_id, data.get('patch'), data.get('version'))
+    
+    version = request.headers.get('If-Match', '').strip('"')
+    return patch_session(session_id, data, int(version) if version.isdigit() else None)
+
+
+def patch_session(session_id, operations, version=None):
+    """Patch a session and respond with its new version and score, not the whole document"""
+    # bool is an int subclass, but true is no version number.
+    if version is not None and (isinstance(version, bool) or not isinstance(version, int)):
+        return jsonify({'error': 'version must be an integer'}), 400
+    try:
+        session = sessions.patch(session_id, operations, version)
+    except PatchError as e:
+        return jsonify({'error': str(e)}), 400
+    except VersionConflict as e:
+        return jsonify({'error': str(e), 'version': e.version}), 409
+    if session is None:
+        return jsonify({'error': 'Unknown or expired session'}), 404
+    
+    return jsonify({'success': True, **session_fields(session), 'score': session['data']['score']})
+
+
+@api.route('/api/sessions/<session_id>', methods=['DELETE'])
+def delete_session(session_id):
+    if not sessions.delete(session_id):
+        return jsonify({'error': 'Unknown or expired session'}), 404
+    return jsonify({'success': True})
+
+
+def requested_resume(data, fmt, template):
+    """``(Resume, render cache key)`` for a request naming a ``sessionId`` or sending ``resumeData``.
+    
+    Raises LookupError for an unknown session and ValidationError for
+    resume data of the wrong shape.
+    """
+    session_id = data.get('sessionId')
+    if session_id:
+        session = sessions.get(session_id)
+        if session is None:
+            raise LookupError('Unknown or expired session')
+        return Resume.from_dict(session['data']), RenderCache.session_key(fmt, template, session)
+    
+    resume_data = data.get('resumeData')
+    if not resume_data:
+        return None, None
+    resume = Resume.from_dict(resume_data)
+    return resume, RenderCache.key(fmt, template, resume)
+
+
+def render_filename(resume, fmt):
+    name = (resume.name or 'Resume').replace(' ', '_')
+    return f"{name}_{datetime.now().strftime('%Y%m%d')}.{fmt}"
+
+
+def cached_render(key, render):
+    body = render_cache.get(key)
+    if body is None:
+        body = render()
+        render_cache.put(key, body)
+    return body
+
+
+def send_rendered(key, render, mimetype, filename, as_attachment=True):
+    """Send a cached or freshly rendered file with a strong ETag.
+    
+    The ETag is the render cache key, so a matching If-None-Match gets a 304
+    without rendering anything.
+    """
+    if request.if_none_match.contains(key):
+        response = current_app.response_class(status=304)
+        response.set_etag(key)
+        return response
+    
+    body = cached_render(key, render)
+    response = send_file(io.BytesIO(body), mimetype=mimetype, as_attachment=as_attachment,
+                         download_name=filename, etag=False)
+    response.set_etag(key)
+    return response
+
+
+@api.route('/api/generate-pdf', methods=['POST'])
 def generate_pdf():
     """Generate PDF resume"""
     data = request.json
-    resume_data = data.get('resumeData')
-    template = data.get('template', 'modern')
+    template = resolve_template(data.get('template', 'modern'))
+    profile = resolve_profile(data.get('profile'))
+    try:
+        resume, key = requested_resume(data, 'pdf', cache_template('pdf', template, profile))
+    except LookupError as e:
+        return jsonify({'error': str(e)}), 404
+    except ValidationError as e:
+        return jsonify({'error': str(e)}), 400
     
-    if not resume_data:
+    if not resume:
         return jsonify({'error': 'No resume data provided'}), 400
     
     try:
-        buffer = io.BytesIO()
-        
-        if template == 'professional':
-            EnhancedPDFGenerator.create_professional_template(buffer, resume_data)
-        elif template == 'creative':
-            EnhancedPDFGenerator.create_creative_template(buffer, resume_data)
-        else:
-            EnhancedPDFGenerator.create_modern_template(buffer, resume_data)
-        
-        buffer.seek(0)
+        filename = render_filename(resume, 'pdf')
         
-        name = resume_data.get('name', 'Resume').replace(' ', '_')
-        filename = f"{name}_{datetime.now().strftime('%Y%m%d')}.pdf"
-        
-        return send_file(buffer, mimetype='application/pdf', as_attachment=True, download_name=filename)
+        return send_rendered(key, lambda: render_pdf(resume, template, profile),
+                             FORMATS['pdf'], filename)
     
     except Exception as e:
-        print(f"Error generating PDF: {str(e)}")
+        logger.exception('Error generating PDF')
         return jsonify({'error': f'Error generating PDF: {str(e)}'}), 500
 
 
-@app.route('/api/generate-docx', methods=['POST'])
+@api.route('/api/generate-docx', methods=['POST'])
 def generate_docx():
     """Generate DOCX resume"""
     data = request.json
-    resume_data = data.get('resumeData')
+    template = resolve_template(data.get('template', 'modern'))
+    try:
+        resume, key = requested_resume(data, 'docx', cache_template('docx', template))
+    except LookupError as e:
+        return jsonify({'error': str(e)}), 404
+    except ValidationError as e:
+        return jsonify({'error': str(e)}), 400
     
-    if not resume_data:
+    if not resume:
         return jsonify({'error': 'No resume data provided'}), 400
     
     try:
-        doc = DocxGenerator.create_docx(resume_data)
-        
-        buffer = io.BytesIO()
-        doc.save(buffer)
-        buffer.seek(0)
+        filename = render_filename(resume, 'docx')
         
-        name = resume_data.get('name', 'Resume').replace(' ', '_')
-        filename = f"{name}_{datetime.now().strftime('%Y%m%d')}.docx"
-        
-        return send_file(buffer, mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-                        as_attachment=True, download_name=filename)
+        return send_rendered(key, lambda: render_docx(resume, template),
+                             FORMATS['docx'], filename)
     
     except Exception as e:
-        print(f"Error generating DOCX: {str(e)}")
+        logger.exception('Error generating DOCX')
         return jsonify({'error': f'Error generating DOCX: {str(e)}'}), 500
 
 
-@app.route('/api/health', methods=['GET'])
+@api.route('/api/preview', methods=['GET', 'POST'])
+def preview():
+    """First page of a PDF resume, or a PNG thumbnail of it, for live template switching
+    
+    Takes ``resumeData`` (POST) or ``sessionId``, ``template``, ``format``
+    (``pdf`` or ``png``) and ``width`` (pixels, PNG only). GET with a
+    ``sessionId`` lets the browser revalidate with its ETag.
+    """
+    data = request.args if request.method == 'GET' else (request.json or {})
+    fmt = data.get('format', 'pdf')
+    if fmt not in ('pdf', 'png'):
+        return jsonify({'error': 'format must be pdf or png'}), 400
+    
+    template = resolve_template(data.get('template', 'modern'))
+    try:
+        resume, key = requested_resume(data, 'preview', cache_template('pdf', template))
+    except LookupError as e:
+        return jsonify({'error': str(e)}), 404
+    except ValidationError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    if not resume:
+        return jsonify({'error': 'No resume data provided'}), 400
+    
+    render = lambda: render_preview(resume, template)
+    try:
+        if fmt == 'pdf':
+            return send_rendered(key, render, FORMATS['pdf'], 'preview.pdf', as_attachment=False)
+        
+        try:
+            width = min(max(int(data.get('width', PREVIEW_WIDTH)), 16), MAX_PREVIEW_WIDTH)
+        except (TypeError, ValueError):
+            return jsonify({'error': 'width must be an integer'}), 400
+        return send_rendered(f"{key}-png{width}",
+                             lambda: render_thumbnail(cached_render(key, render), width),
+                             'image/png', 'preview.png', as_attachment=False)
+    
+    except ThumbnailUnavailable as e:
+        return jsonify({'error': str(e)}), 501
+    
+    except Exception as e:
+        logger.exception('Error rendering preview')
+        return jsonify({'error': f'Error rendering preview: {str(e)}'}), 500
+
+
+@api.route('/api/jobs', methods=['POST'])
+def submit_render_job():
+    """Queue a PDF/DOCX render and return its job ID"""
+    data = request.json or {}
+    fmt = data.get('format', 'pdf')
+    
+    if fmt not in FORMATS:
+        return jsonify({'error': f"format must be one of: {', '.join(FORMATS)}"}), 400
+    
+    template = resolve_template(data.get('template', 'modern'))
+    profile = resolve_profile(data.get('profile'))
+    try:
+        resume, key = requested_resume(data, fmt, cache_template(fmt, template, profile))
+    except LookupError as e:
+        return jsonify({'error': str(e)}), 404
+    except ValidationError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    if not resume:
+        return jsonify({'error': 'No resume data provided'}), 400
+    
+    try:
+        job = render_jobs.submit(fmt, template, resume, key, render_filename(resume, fmt), profile)
+    except QueueFullError as e:
+        response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response
+    
+    response = jsonify(job_response(job))
+    response.status_code = 202
+    response.headers['Location'] = f"/api/jobs/{job.id}"
+    return response
+
+
+def job_response(job):
+    result = job.as_dict()
+    result['status_url'] = f"/api/jobs/{job.id}"
+    if job.state == 'done':
+        result['download_url'] = f"/api/jobs/{job.id}/download"
+    return result
+
+
+@api.route('/api/jobs', methods=['GET'])
+def render_job_stats():
+    """Queue depth, rejections and recent latency percentiles"""
+    return jsonify(render_jobs.stats())
+
+
+@api.route('/api/jobs/<job_id>', methods=['GET'])
+def render_job_status(job_id):
+    """Job state; ``?wait=<seconds>`` long-polls until the job finishes"""
+    wait = min(request.args.get('wait', 0, type=float), MAX_JOB_WAIT)
+    job = render_jobs.get(job_id, wait=wait)
+    if job is None:
+        return jsonify({'error': 'Unknown or expired job'}), 404
+    return jsonify(job_response(job))
+
+
+@api.route('/api/jobs/<job_id>/download', methods=['GET'])
+def render_job_download(job_id):
+    """Download a finished job's file"""
+    job = render_jobs.get(job_id, body=True)
+    if job is None:
+        return jsonify({'error': 'Unknown or expired job'}), 404
+    if job.state != 'done':
+        return jsonify(job_response(job)), 409
+    
+    return send_rendered(job.key, lambda: job.body, FORMATS[job.fmt], job.filename)
+
+
+@api.route('/api/generate-batch', methods=['POST'])
+def generate_batch():
+    """Render many resumes into a zip archive streamed as it is built"""
+    data = request.json or {}
+    resumes = data.get('resumes')
+    formats = data.get('format', 'pdf')
+    formats = [formats] if isinstance(formats, str) else formats
+    
+    if not resumes or not isinstance(resumes, list):
+        return jsonify({'error': 'No resumes provided'}), 400
+    if len(resumes) > MAX_EXPORT_RESUMES:
+        return jsonify({'error': f'At most {MAX_EXPORT_RESUMES} resumes per export'}), 400
+    if not isinstance(formats, list) or not formats or any(fmt not in FORMATS for fmt in formats):
+        return jsonify({'error': f"format must be one or more of: {', '.join(FORMATS)}"}), 400
+    try:
+        resumes = [Resume.from_dict(resume, f'resumes[{i}]') for i, resume in enumerate(resumes)]
+    except ValidationError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    template = resolve_template(data.get('template', 'modern'))
+    filename = f"resumes_{template}_{datetime.now().strftime('%Y%m%d')}.zip"
+    
+    return Response(stream_with_context(iter_export_zip(resumes, list(dict.fromkeys(formats)), template,
+                                                        cache=render_cache, profile=data.get('profile'))),
+                    mimetype='application/zip',
+                    headers={'Content-Disposition': f'attachment; filename={filename}',
+                             'X-Accel-Buffering': 'no'})
+
+
+@api.route('/api/admin/render-cache', methods=['GET', 'DELETE'])
+@admin_required
+def render_cache_admin():
+    """Render cache stats (GET) and invalidation (DELETE)"""
+    if request.method == 'DELETE':
+        return jsonify({'success': True, 'removed': render_cache.invalidate()})
+    
+    return jsonify(render_cache.stats())
+
+
+@api.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus metrics: stage histograms, input sizes, cache and queue gauges"""
+    body, content_type = metrics.exposition()
+    return Response(body, content_type=content_type)
+
+
+def memory_report():
+    """Memory of the worker process that answers, and of the uploads it holds"""
+    return {
+        'pid': os.getpid(),
+        'rss_bytes': rss_bytes(),
+        'peak_rss_bytes': peak_rss_bytes(),
+        'uploads': {'budget': upload_budget.stats(), 'spool': upload_spool.stats()},
+        'render_cache_bytes': render_cache.stats()['bytes'],
+        'parse_cache_bytes': parse_cache.memory.stats()['bytes']
+    }
+
+
+@api.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
         'version': '2.0',
         'message': 'Resume Generator API is running',
-        'spacy_loaded': nlp is not None,
+        'spacy_loaded': nlp_model.status() == 'loaded',
+        'spacy_status': nlp_model.status(),
+        'startup': startup_report(BOOT_SECONDS),
+        'memory': memory_report(),
         'timestamp': datetime.now().isoformat()
     })
 
 
+@site.route('/', defaults={'path': ''}, methods=['GET'])
+@site.route('/<path:path>', methods=['GET'])
+def frontend_file(path):
+    """A file of the frontend build, precompressed; app routes get index.html"""
+    asset = None if path.split('/', 1)[0] == 'api' else frontend.lookup(path)
+    if asset is None:
+        return jsonify({'error': 'Not found'}), 404
+    encoding, body = asset.select(request.accept_encodings.quality)
+    response = Response(body, mimetype=asset.mimetype)
+    response.headers['Cache-Control'] = asset.cache_control
+    if len(asset.variants) > 1:
+        response.vary.add('Accept-Encoding')
+    if encoding:
+        response.content_encoding = encoding
+    response.set_etag(f'{asset.etag}-{encoding}' if encoding else asset.etag)
+    return response.make_conditional(request)
+
+
+app = create_app()
+
+BOOT_SECONDS = round(time.perf_counter() - _boot_start, 4)
+
+
 if __name__ == '__main__':
     print("\n" + "="*60)
     print("🚀 AI Resume Generator v2.0 - API Starting...")
     print("="*60)
     print(f"📁 Upload folder: {UPLOAD_FOLDER}")
-    print(f"🤖 spaCy loaded: {'✓ Yes' if nlp else '✗ No'}")
+    print(f"🤖 spaCy: {nlp_model.SPACY_MODEL} ({nlp_model.status()}, loads on first use)")
+    print(f"⏱  Startup: {BOOT_SECONDS:.2f}s")
     print(f"🌐 Server: http://localhost:5000")
     print(f"💚 Health: http://localhost:5000/api/health")
     print(f"📊 Version: 2.0 (Enhanced)")
     print("="*60 + "\n")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # Development server; production runs wsgi:app under gunicorn.
+    app.run(debug=env_flag('FLASK_DEBUG', True), host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""Candidate index build rate, memory and query latency at scale.
+
+Indexes ``--count`` synthetic parsed resumes in memory, then reports the
+latency percentiles of ranking every candidate against a few job
+descriptions, with and without filters, and of filter-only searches. Run
+from ``backend/``::
+
+    python benchmarks/bench_candidates.py [--count N] [--queries N]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmarks.corpus import synthetic_data
+from candidates import CandidateIndex, filter_query
+from startup import rss_bytes
+
+JOB_DESCRIPTIONS = {
+    'backend': 'Senior backend engineer: Python, PostgreSQL, Docker and Kubernetes on AWS. '
+               'You will design APIs and own services in production.',
+    'data': 'Data analyst with SQL, Pandas and Tableau experience to build dashboards and reports.',
+    'frontend': 'Frontend developer, React and TypeScript, strong JavaScript and CSS.',
+    'vague': 'Engineer wanted for a growing team.',
+}
+FILTERS = {
+    'none': [],
+    'skill': filter_query(skills=['Python']),
+    'skill+title': filter_query(skills=['Python', 'Docker'], title='engineer'),
+    'company': filter_query(company='Initech'),
+}
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return [samples[min(len(samples) - 1, int(len(samples) * p))] * 1000 for p in (0.5, 0.95, 0.99)]
+
+
+def timed(fn, queries):
+    samples = []
+    for _ in range(queries):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the candidate index.')
+    parser.add_argument('--count', type=int, default=100_000, help='resumes to index')
+    parser.add_argument('--queries', type=int, default=50, help='timed queries per case')
+    args = parser.parse_args()
+
+    rss = rss_bytes()
+    index = CandidateIndex()
+    start = time.perf_counter()
+    batch = []
+    for i in range(args.count):
+        batch.append((i + 1, synthetic_data(i)))
+        if len(batch) == 1000:
+            index.add_many(batch)
+            batch = []
+    index.add_many(batch)
+    elapsed = time.perf_counter() - start
+    stats = index.stats()
+    print(f"indexed {len(index)} resumes in {elapsed:.1f} s ({len(index) / elapsed:.0f}/s, "
+          f"including generating them), {stats['terms']} terms, {stats['postings']} postings, "
+          f"+{(rss_bytes() - rss) / 2 ** 20:.0f} MB RSS")
+
+    print(f"\n{'rank':<10} {'filter':<12} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, text in JOB_DESCRIPTIONS.items():
+        for filter_name, keys in FILTERS.items():
+            p50, p95, p99 = timed(lambda: index.rank(text, 20, keys), args.queries)
+            print(f"{name:<10} {filter_name:<12} {p50:>8.2f} {p95:>8.2f} {p99:>8.2f}")
+
+    print(f"\n{'search':<23} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for filter_name, keys in FILTERS.items():
+        p50, p95, p99 = timed(lambda: index.search(keys, 20), args.queries)
+        print(f"{filter_name:<23} {p50:>8.2f} {p95:>8.2f} {p99:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""DOCX renders per second: cloned templates against ``Document()`` per request.
+
+``legacy_render`` is the generator as it was before templates were compiled:
+python-docx's default template loaded, styles looked up by name and every
+part saved again for each resume. Run from ``backend/``::
+
+    python benchmarks/bench_docx.py [--count N] [--profile typical|long|dense]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+import docx_generator
+from benchmarks.corpus import synthetic_data
+from benchmarks.suite import PROFILES
+from models import as_resume
+from template_specs import TEMPLATES
+
+
+def legacy_render(data):
+    resume = as_resume(data)
+    doc = Document()
+    title = doc.add_heading(resume.name, 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    contact_parts = [value for value in (resume.email, resume.phone, resume.location) if value]
+    if contact_parts:
+        doc.add_paragraph(' | '.join(contact_parts)).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    if resume.summary:
+        doc.add_heading('Professional Summary', 1)
+        doc.add_paragraph(resume.summary)
+    if resume.skills:
+        doc.add_heading('Skills', 1)
+        doc.add_paragraph(' • '.join(resume.skills))
+    if resume.experience:
+        doc.add_heading('Work Experience', 1)
+        for exp in resume.experience:
+            doc.add_heading(exp.title, 2)
+            doc.add_paragraph(f"{exp.company} | {exp.period}")
+            doc.add_paragraph(exp.description)
+    if resume.education:
+        doc.add_heading('Education', 1)
+        for edu in resume.education:
+            doc.add_heading(edu.degree, 2)
+            doc.add_paragraph(f"{edu.institution} | {edu.year}")
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def measure(render, resumes):
+    """``(renders per second, p50 ms, p95 ms, peak KB, mean bytes)`` over ``resumes``"""
+    render(resumes[0])
+    latencies, sizes = [], []
+    for data in resumes:
+        start = time.perf_counter()
+        sizes.append(len(render(data)))
+        latencies.append(time.perf_counter() - start)
+    tracemalloc.start()
+    render(resumes[0])
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    latencies.sort()
+    return (len(latencies) / sum(latencies), latencies[len(latencies) // 2] * 1000,
+            latencies[int(len(latencies) * 0.95)] * 1000, peak / 1024, sum(sizes) / len(sizes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark DOCX rendering.')
+    parser.add_argument('--count', type=int, default=200, help='resumes per renderer')
+    parser.add_argument('--profile', choices=PROFILES, default='typical', help='synthetic resume shape')
+    args = parser.parse_args()
+
+    shape = {key: value for key, value in PROFILES[args.profile].items() if key != 'tables'}
+    resumes = [synthetic_data(i, **shape) for i in range(args.count)]
+    start = time.perf_counter()
+    docx_generator.compile_template('modern')
+    print(f"compiled a template in {(time.perf_counter() - start) * 1000:.1f} ms\n")
+
+    renderers = [('Document() per request', legacy_render)]
+    renderers += [(f'cloned: {name}', lambda data, name=name: docx_generator.render(data, name)) for name in TEMPLATES]
+    print(f"{'renderer':<24} {'renders/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'peak KB':>8} {'bytes':>8}")
+    for label, render in renderers:
+        rate, p50, p95, peak, size = measure(render, resumes)
+        print(f"{label:<24} {rate:>10.1f} {p50:>8.2f} {p95:>8.2f} {peak:>8.0f} {size:>8.0f}")
+
+
+if __name__ == '__main__':
+    main()
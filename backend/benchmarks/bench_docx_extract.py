@@ -0,0 +1,88 @@
+"""Upload text extraction: python-docx object graph vs the streaming reader.
+
+Builds synthetic .docx files (text-heavy, table-heavy and image-heavy) and
+reports latency and peak Python heap for both paths. Run from ``backend/``::
+
+    python benchmarks/bench_docx_extract.py
+"""
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from docx import Document
+from docx.shared import Inches
+
+from docx_extract import extract_text
+
+LINE = 'Delivered a customer-facing platform in Python and React used by thousands of people.'
+
+
+def make_docx(paragraphs=0, tables=0, images=0):
+    doc = Document()
+    for i in range(paragraphs):
+        doc.add_paragraph(f'{i} {LINE}')
+    for _ in range(tables):
+        table = doc.add_table(rows=10, cols=4)
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = 'Skill cell'
+    if images:
+        from PIL import Image
+        image = io.BytesIO()
+        Image.frombytes('RGB', (1200, 1200), os.urandom(1200 * 1200 * 3)).save(image, 'PNG')
+        for _ in range(images):
+            image.seek(0)
+            doc.add_picture(image, width=Inches(2))
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def python_docx_extract(stream):
+    doc = Document(stream)
+    text = '\n'.join([paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()])
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                if cell.text.strip():
+                    text += '\n' + cell.text
+    return text
+
+
+def measure(fn, data, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(io.BytesIO(data))
+    latency = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    fn(io.BytesIO(data))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return latency, peak
+
+
+def main():
+    cases = [
+        ('2 pages', dict(paragraphs=60)),
+        ('20 pages', dict(paragraphs=600)),
+        ('100 pages', dict(paragraphs=3000)),
+        ('20 tables', dict(paragraphs=60, tables=20)),
+        ('10 images', dict(paragraphs=60, images=10)),
+    ]
+    print(f"{'document':<10} {'size KB':>8} | {'python-docx ms':>14} {'peak MB':>8} | {'streaming ms':>12} {'peak MB':>8}")
+    for name, spec in cases:
+        data = make_docx(**spec)
+        repeat = 3 if len(data) > 1_000_000 or spec.get('paragraphs', 0) > 1000 else 10
+        old_latency, old_peak = measure(python_docx_extract, data, repeat)
+        new_latency, new_peak = measure(extract_text, data, repeat)
+        print(f"{name:<10} {len(data) / 1024:>8.0f} | {old_latency * 1000:>14.1f} {old_peak / 1e6:>8.2f} | "
+              f"{new_latency * 1000:>12.1f} {new_peak / 1e6:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Near-duplicate detection accuracy, memory and lookup latency.
+
+Remembers ``--count`` synthetic resumes, then checks edited copies of some
+of them (a few words replaced) and reports, against the exact Jaccard
+similarity of their shingle sets, how many duplicates were found, how many
+dissimilar copies were flagged and how far the similarity estimate was off.
+Run from ``backend/``::
+
+    python benchmarks/bench_duplicates.py [--count N] [--probes N]
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmarks.corpus import synthetic_data
+from duplicates import SHINGLE_WORDS, WORD_PATTERN, NearDuplicates
+from startup import rss_bytes
+
+EDITS = (1, 3, 10, 30, 80)
+
+
+def resume_text(data):
+    jobs = [f"{job['title']} {job['company']} {job['description']}" for job in data['experience']]
+    return '\n'.join([data['name'], data['summary'], *jobs])
+
+
+def shingle_set(text):
+    words = WORD_PATTERN.findall(text.lower())
+    return {' '.join(words[i:i + SHINGLE_WORDS]) for i in range(max(len(words) - SHINGLE_WORDS + 1, 1))}
+
+
+def digest(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark near-duplicate detection.')
+    parser.add_argument('--count', type=int, default=100_000, help='resumes to remember')
+    parser.add_argument('--probes', type=int, default=200, help='edited copies to check')
+    args = parser.parse_args()
+
+    rss = rss_bytes()
+    duplicates = NearDuplicates(max_entries=args.count)
+    start = time.perf_counter()
+    for i in range(args.count):
+        text = resume_text(synthetic_data(i))
+        duplicates.check(digest(text), text)
+    elapsed = time.perf_counter() - start
+    stats = duplicates.stats()
+    print(f"remembered {stats['signatures']} resumes in {elapsed:.1f} s, {stats['matches']} flagged, "
+          f"{stats['bytes'] / stats['signatures']:.0f} bytes each (+{(rss_bytes() - rss) / 2 ** 20:.0f} MB RSS)")
+
+    rng = random.Random(0)
+    found = missed = false_flags = 0
+    errors, latencies = [], []
+    for _ in range(args.probes):
+        text = resume_text(synthetic_data(rng.randrange(args.count)))
+        words = text.split()
+        for _ in range(rng.choice(EDITS)):
+            words[rng.randrange(len(words))] = 'edited'
+        edited = ' '.join(words)
+        similarity = len(shingle_set(text) & shingle_set(edited)) / len(shingle_set(text) | shingle_set(edited))
+
+        # Not remembered, so probes don't match each other.
+        start = time.perf_counter()
+        match = duplicates.check(digest(edited), edited, remember=False)
+        latencies.append(time.perf_counter() - start)
+        if match:
+            errors.append(abs(match['similarity'] - similarity))
+        if similarity >= duplicates.threshold + 0.05:
+            found += match is not None
+            missed += match is None
+        elif similarity < duplicates.threshold - 0.1 and match:
+            false_flags += 1
+
+    latencies.sort()
+    p50, p95, p99 = (latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 for p in (0.5, 0.95, 0.99))
+    print(f"duplicates found {found}, missed {missed}; flagged below {duplicates.threshold - 0.1:.1f}: "
+          f"{false_flags}")
+    if errors:
+        print(f"similarity estimate error: mean {sum(errors) / len(errors):.3f}, max {max(errors):.3f}")
+    print(f"check latency p50 {p50:.2f} ms, p95 {p95:.2f} ms, p99 {p99:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
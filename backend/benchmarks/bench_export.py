@@ -0,0 +1,65 @@
+"""Bulk export throughput: resumes/s and time to first byte.
+
+Compares rendering every resume into its own ``BytesIO`` one after another
+(what per-resume ``/api/generate-pdf`` calls amount to) against the streamed
+zip export with process pools of a few sizes. Run from ``backend/``::
+
+    python benchmarks/bench_export.py [resumes] [format]
+"""
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmarks.bench_pdf_templates import RESUME
+from export import iter_export_zip, render_document
+from ingest import mp_context
+
+
+def resumes(count):
+    return [dict(RESUME, name=f"Candidate {i}") for i in range(count)]
+
+
+def sequential(data, fmt):
+    start = time.perf_counter()
+    for resume in data:
+        render_document(fmt, 'modern', resume)
+    return time.perf_counter() - start, None, None
+
+
+def exported(data, fmt, executor):
+    start = time.perf_counter()
+    first = None
+    size = 0
+    for chunk in iter_export_zip(data, [fmt], 'modern', executor=executor):
+        if first is None and chunk:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    return time.perf_counter() - start, first, size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    fmt = sys.argv[2] if len(sys.argv) > 2 else 'pdf'
+    data = resumes(count)
+    print(f"{count} resumes, {fmt}, {os.cpu_count()} CPUs")
+    print(f"{'mode':<22} {'seconds':>8} {'resumes/s':>10} {'first byte s':>13} {'zip MB':>7}")
+
+    elapsed, _, _ = sequential(data, fmt)
+    print(f"{'sequential BytesIO':<22} {elapsed:>8.2f} {count / elapsed:>10.1f} {'-':>13} {'-':>7}")
+
+    context = mp_context()
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            # Warm the workers so imports aren't counted.
+            list(executor.map(render_document, [fmt] * workers, ['modern'] * workers, data[:workers]))
+            elapsed, first, size = exported(data, fmt, executor)
+        label = f"zip, {workers} worker{'s' if workers > 1 else ''}"
+        print(f"{label:<22} {elapsed:>8.2f} {count / elapsed:>10.1f} {first:>13.3f} {size / 1e6:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Memory and serialization cost of resumes as dicts versus ``models.Resume``.
+
+Reports the memory one resume takes held in a cache or a batch (Python
+objects, pickled for a worker process, JSON text), and the per-request cost
+of the JSON work around a render: decoding the body, validating it, and
+hashing it into the render cache key. Uses whichever JSON backend
+``fast_json`` picked; install orjson to compare. Run from ``backend/``::
+
+    python benchmarks/bench_models.py [--count N]
+"""
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import fast_json
+from benchmarks.corpus import synthetic_data
+from models import Resume
+
+
+def held_bytes(build, count):
+    """Bytes per object of ``count`` objects kept alive"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+
+def per_call_us(fn, items, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+def stdlib_key(body):
+    data = json.loads(body)['resumeData']
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def model_key(body):
+    resume = Resume.from_dict(fast_json.loads(body)['resumeData'])
+    return hashlib.sha256(fast_json.dumps(resume, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the resume models.')
+    parser.add_argument('--count', type=int, default=2000, help='resumes per measurement')
+    args = parser.parse_args()
+
+    texts = [json.dumps(synthetic_data(i)) for i in range(args.count)]
+    # Each object is decoded from JSON so it owns its strings, as a cached
+    # request body would.
+    dict_bytes = held_bytes(lambda i: json.loads(texts[i]), args.count)
+    model_bytes = held_bytes(lambda i: Resume.from_dict(json.loads(texts[i])), args.count)
+    text_bytes = held_bytes(lambda i: ''.join(texts[i]), args.count)
+    sample = json.loads(texts[0])
+    print(f"{'held as':<12} {'bytes/resume':>13} {'pickled':>9}")
+    print(f"{'dict':<12} {dict_bytes:>13.0f} {len(pickle.dumps(sample)):>9}")
+    print(f"{'Resume':<12} {model_bytes:>13.0f} {len(pickle.dumps(Resume.from_dict(sample))):>9}")
+    print(f"{'JSON text':<12} {text_bytes:>13.0f}")
+
+    bodies = [json.dumps({'resumeData': json.loads(text), 'template': 'modern'}).encode('utf-8') for text in texts]
+    dicts = [json.loads(text) for text in texts]
+    models = [Resume.from_dict(data) for data in dicts]
+    print(f"\nper request, JSON backend {fast_json.BACKEND}:")
+    rows = [
+        ('decode body (json)', lambda body: json.loads(body), bodies),
+        ('decode body (fast_json)', fast_json.loads, bodies),
+        ('validate (Resume.from_dict)', Resume.from_dict, dicts),
+        ('encode dict (json)', lambda data: json.dumps(data, separators=(',', ':')), dicts),
+        ('encode dict (fast_json)', fast_json.dumps, dicts),
+        ('encode Resume (fast_json)', fast_json.dumps, models),
+        ('render key: json + dict', stdlib_key, bodies),
+        ('render key: fast_json + Resume', model_key, bodies),
+    ]
+    for label, fn, items in rows:
+        print(f"  {label:<32} {per_call_us(fn, items):>8.1f} us")
+
+
+if __name__ == '__main__':
+    main()
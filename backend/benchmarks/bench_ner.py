@@ -0,0 +1,99 @@
+"""Regex-only parsing vs NER mode: throughput and field accuracy.
+
+Generates a labeled synthetic corpus, parses it with the regex parser and
+with ``parse_resumes(ner=True)`` at a few batch sizes, and reports docs/s and
+the share of documents where name, location, first company and first
+institution match the labels. Needs a spaCy model (``SPACY_MODEL``, default
+``en_core_web_sm``). Run from ``backend/``::
+
+    python benchmarks/bench_ner.py [documents]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import nlp_model
+from ner import parse_resumes
+
+FIRST = ['Maria', 'James', 'Aisha', 'Wei', 'Carlos', 'Priya', 'Olga', 'Kwame', 'Hannah', 'Diego']
+LAST = ['Garcia', 'Okafor', 'Chen', 'Novak', 'Patel', 'Johansson', 'Haddad', 'Silva', 'Kim', 'Murphy']
+CITIES = [('Boston', 'MA'), ('Denver', 'CO'), ('Seattle', 'WA'), ('Austin', 'TX'), ('Chicago', 'IL')]
+COMPANIES = ['Northwind Traders', 'Contoso Ltd', 'Globex Corporation', 'Initech', 'Umbrella Health',
+             'Stark Industries', 'Wayne Enterprises', 'Acme Robotics']
+INSTITUTIONS = ['University of Michigan', 'Georgia Institute of Technology', 'Boston College',
+                'University of Toronto', 'Imperial College London']
+TITLES = ['Software Engineer', 'Data Analyst', 'Product Manager', 'DevOps Engineer']
+
+
+def synthetic_resume(rng):
+    name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+    city, state = rng.choice(CITIES)
+    companies = rng.sample(COMPANIES, 2)
+    institution = rng.choice(INSTITUTIONS)
+    contact = f"{name.split()[0].lower()}@example.com | (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
+    # Layouts the first-line and capitalization heuristics don't expect.
+    layout = rng.randrange(3)
+    if layout == 0:
+        header = [name, contact, f"{city}, {state}"]
+    elif layout == 1:
+        header = [rng.choice(TITLES), name, contact, f"Based in {city}"]
+    else:
+        header = [f"{name} - {rng.choice(TITLES)} - {city} area", contact]
+    lines = header + [
+        'Professional Summary',
+        'Engineer with a record of shipping reliable products for large customers and teams.',
+        'Work Experience',
+    ]
+    year = 2023
+    for company in companies:
+        lines += [rng.choice(TITLES), f"{company}, {city}", f"{year - 3} - {year}",
+                  'Built services in Python and Go and mentored junior engineers.']
+        year -= 3
+    lines += ['Education', f"Bachelor of Science in Computer Science, {institution}, {year - 1}",
+              'Skills', 'Python, Go, Docker, Kubernetes, AWS, PostgreSQL']
+    labels = {'name': name, 'location': city, 'company': companies[0], 'institution': institution}
+    return '\n'.join(lines), labels
+
+
+def accuracy(results, labels):
+    hits = {field: 0 for field in ('name', 'location', 'company', 'institution')}
+    for data, label in zip(results, labels):
+        hits['name'] += data['name'] == label['name']
+        hits['location'] += label['location'] in data['location']
+        hits['company'] += any(label['company'] in exp['company'] for exp in data['experience'])
+        hits['institution'] += any(label['institution'] in edu['institution'] for edu in data['education'])
+    return {field: count / len(results) for field, count in hits.items()}
+
+
+def run(label, texts, labels, **kwargs):
+    start = time.perf_counter()
+    results, applied = parse_resumes(texts, **kwargs)
+    elapsed = time.perf_counter() - start
+    scores = accuracy(results, labels)
+    print(f"{label:<22} {len(texts) / elapsed:>8.1f} " +
+          ' '.join(f"{scores[field]:>11.0%}" for field in scores))
+    return applied
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = random.Random(7)
+    corpus = [synthetic_resume(rng) for _ in range(count)]
+    texts = [text for text, _ in corpus]
+    labels = [label for _, label in corpus]
+
+    print(f"{'mode':<22} {'docs/s':>8} {'name':>11} {'location':>11} {'company':>11} {'institution':>11}")
+    run('regex', texts, labels, ner=False)
+    if nlp_model.get_nlp() is None:
+        print(f"NER skipped: spaCy model {nlp_model.SPACY_MODEL!r} is not available")
+        return
+    for batch_size in (1, 32, 128):
+        run(f'ner batch={batch_size}', texts, labels, ner=True, batch_size=batch_size)
+    run('ner batch=64 procs=2', texts, labels, ner=True, batch_size=64, n_process=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Renders per second for each PDF template, and size and speed per output profile.
+
+Reports full renders (story build + layout + PDF write) and story building
+alone, for a one-page resume and a multi-page one. Then, for each output
+profile, bytes per resume and render time, with the Helvetica templates and
+with a template set in an embedded (subset) TrueType font. Run from
+``backend/``::
+
+    python benchmarks/bench_pdf_templates.py
+"""
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from pdf_templates import PDF_PROFILES, TEMPLATES, build_story, compile_template, register_template, render
+
+RESUME = {
+    'name': 'Jane Doe',
+    'email': 'jane@example.com',
+    'phone': '(555) 123-4567',
+    'location': 'Austin, TX',
+    'summary': 'Backend engineer with eight years of experience building scalable APIs and data platforms.',
+    'skills': ['Python', 'Go', 'Kubernetes', 'Docker', 'AWS', 'PostgreSQL', 'React', 'Redis'],
+    'experience': [{'title': 'Senior Software Engineer', 'company': 'Acme Corp', 'period': '2019 - Present',
+                    'description': 'Led the migration of a monolith to services on Kubernetes.'}] * 3,
+    'education': [{'degree': 'Bachelor of Science in Computer Science', 'institution': 'Stanford University',
+                   'year': '2014'}],
+}
+LONG_RESUME = dict(RESUME, experience=RESUME['experience'] * 12, education=RESUME['education'] * 6)
+
+
+def rate(fn, seconds=1.0):
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def allocations(fn):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    fn()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, 'filename') if stat.size_diff > 0)
+
+
+def best_ms(fn, repeat=20):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def ttf_template():
+    """The modern template set in Bitstream Vera, which ships with ReportLab"""
+    for name, path in (('Vera', 'Vera.ttf'), ('Vera-Bold', 'VeraBd.ttf'), ('Vera-Oblique', 'VeraIt.ttf')):
+        pdfmetrics.registerFont(TTFont(name, path))
+    spec = dict(TEMPLATES['modern'])
+    spec['styles'] = {role: dict(style, fontName=style.get('fontName', 'Vera').replace('Helvetica', 'Vera'))
+                      for role, style in spec['styles'].items() if isinstance(style, dict)}
+    spec['styles']['body'] = {'parent': 'Normal', 'fontName': 'Vera'}
+    register_template('modern-vera', spec)
+    return 'modern-vera'
+
+
+def profiles():
+    print(f"\n{'profile':<20} {'template':<12} {'resume':<7} {'bytes':>8} {'render ms':>10}")
+    cases = [('modern', 'modern'), ('ttf', ttf_template())]
+    PDF_PROFILES['standard-ascii85'] = dict(PDF_PROFILES['standard'], ascii85=True)
+    for profile in PDF_PROFILES:
+        for template_label, template in cases:
+            for resume_label, data in (('1 page', RESUME), ('3 pages', LONG_RESUME)):
+                size = len(render(io.BytesIO(), data, template, profile=profile).getvalue())
+                ms = best_ms(lambda: render(io.BytesIO(), data, template, profile=profile))
+                print(f"{profile:<20} {template_label:<12} {resume_label:<7} {size:>8} {ms:>10.2f}")
+
+
+def main():
+    print(f"{'template':<13} {'resume':<7} {'renders/s':>10} {'story builds/s':>15} {'alloc KB/render':>16}")
+    for name in TEMPLATES:
+        compiled = compile_template(name)
+        for label, data in (('1 page', RESUME), ('3 pages', LONG_RESUME)):
+            full = rate(lambda: render(io.BytesIO(), data, name))
+            story = rate(lambda: build_story(compiled, data))
+            allocated = allocations(lambda: render(io.BytesIO(), data, name))
+            print(f"{name:<13} {label:<7} {full:>10.1f} {story:>15.0f} {allocated / 1024:>16.1f}")
+    profiles()
+
+
+if __name__ == '__main__':
+    main()
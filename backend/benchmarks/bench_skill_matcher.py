@@ -0,0 +1,74 @@
+"""Skill matcher throughput against dictionary size.
+
+Compares the compiled single-pass matcher with the previous approach of one
+``re.search`` per dictionary entry. Run from ``backend/``::
+
+    python benchmarks/bench_skill_matcher.py
+"""
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from skill_matcher import DEFAULT_SKILLS, SkillMatcher
+
+SIZES = [len(DEFAULT_SKILLS), 1000, 5000, 20000]
+TEXT_WORDS = 2000
+
+
+def synthetic_dictionary(size, rng):
+    skills = list(DEFAULT_SKILLS)
+    while len(skills) < size:
+        words = rng.randint(1, 3)
+        skills.append(' '.join(''.join(rng.choice(string.ascii_lowercase)
+                                       for _ in range(rng.randint(3, 10)))
+                               for _ in range(words)).title())
+    return skills[:size]
+
+
+def synthetic_text(skills, rng):
+    filler = ['developed', 'led', 'team', 'the', 'and', 'platform', 'using', 'with', 'for', 'built']
+    words = []
+    for _ in range(TEXT_WORDS):
+        words.append(rng.choice(skills) if rng.random() < 0.05 else rng.choice(filler))
+    return ' '.join(words)
+
+
+def legacy_find(skills, text):
+    return [skill for skill in skills
+            if re.search(r'\b' + re.escape(skill) + r'\b', text, re.IGNORECASE)]
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'terms':>7} {'build ms':>9} {'matcher ms':>11} {'MB/s':>8} {'legacy ms':>10} {'speedup':>8}")
+    for size in SIZES:
+        skills = synthetic_dictionary(size, rng)
+        text = synthetic_text(skills, rng)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build = time.perf_counter() - start
+
+        matcher_time = timed(lambda: matcher.find(text), 20)
+        # re caches only 512 patterns, so large legacy runs recompile every call.
+        legacy_time = timed(lambda: legacy_find(skills, text), 1 if size > 1000 else 5)
+        mb_per_s = len(text) / matcher_time / 1e6
+
+        print(f"{size:>7} {build * 1000:>9.1f} {matcher_time * 1000:>11.2f} {mb_per_s:>8.1f} "
+              f"{legacy_time * 1000:>10.1f} {legacy_time / matcher_time:>7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
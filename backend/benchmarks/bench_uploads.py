@@ -0,0 +1,65 @@
+"""Memory of one ``/api/upload`` request with and without spooling to disk.
+
+Posts .docx files padded with an image-like member (which extraction never
+reads) to the app through Flask's test client, and reports the peak Python
+memory of each request with uploads held in memory and with them spooled
+to ``UPLOAD_FOLDER`` past ``UPLOAD_SPOOL_BYTES``. Run from ``backend/``::
+
+    python benchmarks/bench_uploads.py [--sizes 0.1,1,4,15]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+import tracemalloc
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+os.environ.setdefault('DUPLICATE_MAX', '0')
+
+from benchmarks.corpus import synthetic_resume
+from benchmarks.load_test import multipart
+
+
+def padded_docx(size):
+    """A synthetic resume grown to about ``size`` bytes by an incompressible media file"""
+    base, _ = synthetic_resume(0)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(base)) as source, zipfile.ZipFile(buffer, 'w') as archive:
+        for info in source.infolist():
+            archive.writestr(info, source.read(info))
+        archive.writestr('word/media/image1.png', os.urandom(max(size - len(base), 0)))
+    return buffer.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark upload memory.')
+    parser.add_argument('--sizes', default='0.1,1,4,15', help='upload sizes in MB, comma-separated')
+    args = parser.parse_args()
+
+    import app
+    client = app.app.test_client()
+    # Every upload misses the cache, so each one is extracted.
+    app.parse_cache.get = lambda key: None
+    spool_bytes = app.upload_spool.max_memory
+    print(f"{'size MB':>8} {'in memory KB':>13} {'spooled KB':>11} {'spooled ms':>11}")
+    for size in (float(value) for value in args.sizes.split(',')):
+        body, content_type = multipart('resume.docx', padded_docx(int(size * 1024 * 1024)))
+        peaks = []
+        for max_memory in (float('inf'), spool_bytes):
+            app.upload_spool.max_memory = max_memory
+            tracemalloc.start()
+            start = time.perf_counter()
+            response = client.post('/api/upload', data=body, content_type=content_type)
+            elapsed = time.perf_counter() - start
+            peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+            tracemalloc.stop()
+            assert response.status_code == 200, response.json
+        print(f"{size:>8.1f} {peaks[0]:>13.0f} {peaks[1]:>11.0f} {elapsed * 1000:>11.1f}")
+    print(f"\nspooled past UPLOAD_SPOOL_BYTES={spool_bytes}")
+
+
+if __name__ == '__main__':
+    main()
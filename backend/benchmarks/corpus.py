@@ -0,0 +1,148 @@
+"""Synthetic resume corpus.
+
+``synthetic_resume`` builds a reproducible .docx resume of controllable size
+together with the structured data it contains (``synthetic_data`` builds the
+data alone), so the same corpus can drive extraction, parsing and rendering
+benchmarks. Run directly to write a corpus to disk::
+
+    python benchmarks/corpus.py out_dir [count] [--pages N] [--jobs N] [--tables N] [--skill-density F]
+"""
+import io
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from docx import Document
+
+from skill_matcher import DEFAULT_SKILLS
+
+FIRST = ['Maria', 'James', 'Aisha', 'Wei', 'Carlos', 'Priya', 'Olga', 'Kwame', 'Hannah', 'Diego']
+LAST = ['Garcia', 'Okafor', 'Chen', 'Novak', 'Patel', 'Johansson', 'Haddad', 'Silva', 'Kim', 'Murphy']
+CITIES = ['Boston, MA', 'Denver, CO', 'Seattle, WA', 'Austin, TX', 'Chicago, IL']
+COMPANIES = ['Northwind Traders', 'Contoso Ltd', 'Globex Corporation', 'Initech', 'Umbrella Health',
+             'Stark Industries', 'Wayne Enterprises', 'Acme Robotics']
+TITLES = ['Software Engineer', 'Senior Developer', 'Data Analyst', 'Product Manager', 'DevOps Engineer']
+DEGREES = ['Bachelor of Science in Computer Science', 'Master of Science in Data Science',
+           'Bachelor of Arts in Economics']
+INSTITUTIONS = ['University of Michigan', 'Georgia Institute of Technology', 'Boston College']
+WORDS = ('designed built led improved migrated reduced latency across teams delivering reliable '
+         'services for customers while mentoring engineers and owning the roadmap').split()
+
+LINES_PER_PAGE = 45
+
+
+def _sentence(rng, skills, skill_density, length=14):
+    """A sentence where roughly ``skill_density`` of the words are skill names"""
+    words = [rng.choice(skills) if rng.random() < skill_density else rng.choice(WORDS)
+             for _ in range(length)]
+    return ' '.join(words).capitalize() + '.'
+
+
+def _resume_data(rng, seed, pages, jobs, skill_density):
+    skills = list(DEFAULT_SKILLS)
+    name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+    data = {
+        'name': name,
+        'email': f"{name.split()[0].lower()}.{seed}@example.com",
+        'phone': f"(555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        'location': rng.choice(CITIES),
+        'linkedin': f"linkedin.com/in/{name.replace(' ', '').lower()}{seed}",
+        'summary': ' '.join(_sentence(rng, skills, skill_density) for _ in range(3)),
+        'skills': rng.sample(skills, 12),
+        'experience': [],
+        'education': [{'degree': rng.choice(DEGREES), 'institution': rng.choice(INSTITUTIONS),
+                       'year': str(rng.randint(2000, 2020))}],
+    }
+
+    bullets_per_job = max(3, (pages * LINES_PER_PAGE - 20 - jobs * 2) // max(jobs, 1))
+    for i in range(jobs):
+        start = 2023 - 2 * (i + 1)
+        data['experience'].append({
+            'title': rng.choice(TITLES),
+            'company': rng.choice(COMPANIES),
+            'period': f"{start} - {'Present' if i == 0 else start + 2}",
+            'description': ' '.join(_sentence(rng, skills, skill_density) for _ in range(bullets_per_job)),
+        })
+    return data
+
+
+def synthetic_data(seed=0, pages=1, jobs=3, skill_density=0.15):
+    """The ``resume_data`` of ``synthetic_resume`` without building the .docx"""
+    return _resume_data(random.Random(seed), seed, pages, jobs, skill_density)
+
+
+def synthetic_resume(seed=0, pages=1, jobs=3, tables=0, skill_density=0.15):
+    """Return ``(docx_bytes, resume_data)`` for one synthetic resume.
+
+    ``pages`` pads the experience section with bullets until the document is
+    roughly that many pages long; ``tables`` adds skills tables of 5x4 cells.
+    """
+    rng = random.Random(seed)
+    skills = list(DEFAULT_SKILLS)
+    data = _resume_data(rng, seed, pages, jobs, skill_density)
+    name = data['name']
+
+    doc = Document()
+    doc.add_paragraph(name)
+    doc.add_paragraph(f"{data['email']} | {data['phone']} | {data['location']}")
+    doc.add_paragraph(data['linkedin'])
+    doc.add_paragraph('PROFESSIONAL SUMMARY')
+    doc.add_paragraph(data['summary'])
+    doc.add_paragraph('TECHNICAL SKILLS')
+    doc.add_paragraph(', '.join(data['skills']))
+    for _ in range(tables):
+        table = doc.add_table(rows=5, cols=4)
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = rng.choice(skills)
+    doc.add_paragraph('PROFESSIONAL EXPERIENCE')
+    for exp in data['experience']:
+        doc.add_paragraph(exp['title'])
+        doc.add_paragraph(f"{exp['company']} | {exp['period']}")
+        for sentence in exp['description'].split('. '):
+            doc.add_paragraph('• ' + sentence.rstrip('.') + '.')
+    doc.add_paragraph('EDUCATION')
+    for edu in data['education']:
+        doc.add_paragraph(edu['degree'])
+        doc.add_paragraph(f"{edu['institution']} | {edu['year']}")
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue(), data
+
+
+def corpus(count, seed=0, **spec):
+    """``count`` synthetic resumes with consecutive seeds"""
+    return [synthetic_resume(seed + i, **spec) for i in range(count)]
+
+
+def main():
+    args = sys.argv[1:]
+    spec = {}
+    options = {'--pages': ('pages', int), '--jobs': ('jobs', int), '--tables': ('tables', int),
+               '--skill-density': ('skill_density', float)}
+    positional = []
+    while args:
+        arg = args.pop(0)
+        if arg in options:
+            key, cast = options[arg]
+            spec[key] = cast(args.pop(0))
+        else:
+            positional.append(arg)
+    if not positional:
+        print(__doc__)
+        sys.exit(1)
+
+    out_dir = positional[0]
+    count = int(positional[1]) if len(positional) > 1 else 100
+    os.makedirs(out_dir, exist_ok=True)
+    for i, (content, data) in enumerate(corpus(count, **spec)):
+        with open(os.path.join(out_dir, f"resume_{i:05d}.docx"), 'wb') as f:
+            f.write(content)
+    print(f"Wrote {count} resumes to {out_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""Pathological-input fuzz suite for the resume parser.
+
+Times every extractor on inputs built to trigger regex backtracking (long
+runs of letters, spaces, dots, digits, ``@`` and keyword soup) and on seeded
+random text over small, regex-hostile alphabets, at growing sizes. Fails if
+an extractor raises, if time grows much faster than input size, or if a
+full ``parse()`` overruns the time budget by more than one extractor's worth.
+Run from ``backend/``::
+
+    python benchmarks/fuzz_parser.py [--max-size BYTES] [--seed N] [--random N]
+
+Sizes start at 10 KB and grow tenfold up to ``--max-size`` (default 1 MB;
+beyond ``MAX_PARSE_CHARS`` the parser truncates, so larger inputs check the
+cut-off). Exits with status 1 on any failure.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from resume_parser import MAX_PARSE_CHARS, PARSE_FIELDS, PARSE_TIME_BUDGET, EnhancedResumeParser
+
+CASES = {
+    'letters': lambda n: 'experience\n' + 'a' * n,
+    'capitalized': lambda n: 'experience\n' + 'Ab' * (n // 2),
+    'spaces': lambda n: 'experience\n' + ' ' * n,
+    'digits': lambda n: '1' * n,
+    'dots': lambda n: 'x@' + 'a.' * (n // 2),
+    'alnum_dots': lambda n: ('a' * 30 + '.') * (n // 31),
+    'at_signs': lambda n: 'a@' * (n // 2),
+    'commas': lambda n: 'education\n' + 'a, ' * (n // 3),
+    'newlines': lambda n: 'summary\n' + 'a\n' * (n // 2),
+    'keywords': lambda n: ('Experience 2019 - 2020 John Smith, NY Bachelor University ' * (n // 58 + 1))[:n],
+}
+RANDOM_ALPHABETS = [
+    'a .@-',
+    'aA1 \n.,-',
+    '0123456789 ()+-.',
+    'abc@.-_%+',
+    'Ab 2019-Present\n',
+]
+# Ten times the input may take at most this many times as long.
+MAX_GROWTH = 15
+# Below this many milliseconds timings are too noisy to compare.
+MIN_MS = 5.0
+
+
+def random_text(rng, alphabet, n):
+    return ''.join(rng.choice(alphabet) for _ in range(n))
+
+
+def time_extractors(text):
+    """Milliseconds per field, or the exception an extractor raised"""
+    parser = EnhancedResumeParser(text)
+    timings = {}
+    for field in PARSE_FIELDS:
+        start = time.perf_counter()
+        try:
+            getattr(parser, f'extract_{field}')()
+        except Exception as e:
+            timings[field] = e
+            continue
+        timings[field] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def sizes(max_size):
+    size = 10_000
+    while size <= max_size:
+        yield size
+        size *= 10
+
+
+def check_case(name, make, max_size, failures):
+    previous = None
+    for size in sizes(max_size):
+        timings = time_extractors(make(size))
+        errors = {field: value for field, value in timings.items() if isinstance(value, Exception)}
+        for field, error in errors.items():
+            failures.append(f"{name} {size}: extract_{field} raised {error!r}")
+        timings = {field: value for field, value in timings.items() if field not in errors}
+        slowest = max(timings, key=timings.get)
+        print(f"{name:<14} {size:>9} {sum(timings.values()):>9.1f} ms  slowest {slowest} {timings[slowest]:.1f} ms")
+
+        if previous:
+            for field, ms in timings.items():
+                before = previous.get(field)
+                if before and before >= MIN_MS and ms > before * MAX_GROWTH:
+                    failures.append(f"{name} {size}: extract_{field} grew {ms / before:.0f}x for 10x input "
+                                    f"({before:.1f} -> {ms:.1f} ms)")
+        previous = timings
+
+    # The budget is checked between extractors, so a parse may overrun it by
+    # at most the slowest extractor.
+    if PARSE_TIME_BUDGET:
+        text = make(max_size)
+        start = time.perf_counter()
+        data = EnhancedResumeParser(text).parse()
+        elapsed = time.perf_counter() - start
+        limit = PARSE_TIME_BUDGET * 2
+        if elapsed > limit:
+            failures.append(f"{name} {max_size}: parse() took {elapsed:.2f} s, over {limit:.2f} s")
+        if max_size > MAX_PARSE_CHARS and not data.get('partial', {}).get('truncated'):
+            failures.append(f"{name} {max_size}: result not marked truncated")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fuzz the resume parser with pathological inputs.')
+    parser.add_argument('--max-size', type=int, default=1_000_000, help='largest input in characters')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the random cases')
+    parser.add_argument('--random', type=int, default=len(RANDOM_ALPHABETS), help='number of random cases')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cases = dict(CASES)
+    for i in range(args.random):
+        alphabet = RANDOM_ALPHABETS[i % len(RANDOM_ALPHABETS)]
+        seed = rng.randrange(2 ** 32)
+        cases[f'random{i}'] = lambda n, alphabet=alphabet, seed=seed: random_text(random.Random(seed), alphabet, n)
+
+    print(f"{'case':<14} {'chars':>9} {'total':>12}")
+    failures = []
+    for name, make in cases.items():
+        check_case(name, make, args.max_size, failures)
+
+    if failures:
+        print(f"\n{len(failures)} failure(s):")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nAll extractors linear and within budget.")
+
+
+if __name__ == '__main__':
+    main()
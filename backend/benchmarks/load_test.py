@@ -0,0 +1,110 @@
+"""Requests per second for upload and generate against a running server.
+
+Start the server first (``gunicorn -c gunicorn.conf.py wsgi:app`` or
+``python app.py``), then run from ``backend/``::
+
+    python benchmarks/load_test.py [base_url] [requests] [concurrency ...]
+
+By default every request sends a different document so the parse and render
+caches don't answer; ``--cached`` repeats one document instead.
+"""
+import io
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmarks.bench_pdf_templates import RESUME
+from docx_generator import DocxGenerator
+
+
+def resume_docx(name):
+    buffer = io.BytesIO()
+    DocxGenerator.create_docx(dict(RESUME, name=name)).save(buffer)
+    return buffer.getvalue()
+
+
+def multipart(filename, content):
+    boundary = uuid.uuid4().hex
+    body = (f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            f'Content-Type: application/octet-stream\r\n\r\n').encode() + content + f'\r\n--{boundary}--\r\n'.encode()
+    return body, f'multipart/form-data; boundary={boundary}'
+
+
+def upload_request(base_url, documents):
+    def request(i, run):
+        body, content_type = multipart('resume.docx', documents[i % len(documents)])
+        return urllib.request.Request(f'{base_url}/api/upload', data=body, method='POST',
+                                      headers={'Content-Type': content_type})
+    return request
+
+
+def generate_request(base_url, cached):
+    def request(i, run):
+        data = RESUME if cached else dict(RESUME, name=f"Candidate {run}-{i}")
+        body = json.dumps({'resumeData': data, 'template': 'modern'}).encode()
+        return urllib.request.Request(f'{base_url}/api/generate-pdf', data=body, method='POST',
+                                      headers={'Content-Type': 'application/json'})
+    return request
+
+
+def run(make_request, total, concurrency, run_id):
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def send(i):
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(make_request(i, run_id), timeout=120) as response:
+                response.read()
+            ok = True
+        except (urllib.error.URLError, OSError):
+            ok = False
+        with lock:
+            if ok:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(send, range(total)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    pick = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000 if latencies else 0
+    return len(latencies) / elapsed, pick(0.5), pick(0.95), pick(0.99), errors
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    cached = '--cached' in sys.argv
+    base_url = args[0].rstrip('/') if args else 'http://localhost:5000'
+    total = int(args[1]) if len(args) > 1 else 200
+    levels = [int(arg) for arg in args[2:]] or [1, 4, 16]
+
+    print(f"{base_url}, {total} requests per run, {'cached' if cached else 'uncached'}")
+    print(f"{'endpoint':<13} {'conc':>5} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for name in ('upload', 'generate-pdf'):
+        for run_id, concurrency in enumerate(levels):
+            if name == 'upload':
+                # Fresh documents for every run, or the parse cache answers.
+                names = ['Candidate'] if cached else [f"Candidate {run_id}-{i}" for i in range(total)]
+                make_request = upload_request(base_url, [resume_docx(name) for name in names])
+            else:
+                make_request = generate_request(base_url, cached)
+            rps, p50, p95, p99, errors = run(make_request, total, concurrency, run_id)
+            print(f"{name:<13} {concurrency:>5} {rps:>8.1f} {p50:>8.1f} {p95:>8.1f} {p99:>8.1f} {errors:>7}")
+
+
+if __name__ == '__main__':
+    main()
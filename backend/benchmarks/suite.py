@@ -0,0 +1,191 @@
+"""Benchmark suite for the hot paths, with a regression gate.
+
+Generates a synthetic corpus per profile (see ``corpus.py``) and times each
+stage on every document: text extraction, parsing, each PDF template, the
+first-page preview and DOCX generation. Reports p50/p95/p99 latency and peak
+traced memory per stage. Run from ``backend/``::
+
+    python benchmarks/suite.py [--docs N] [--rounds N] [--profile NAME ...] [--json results.json]
+    python benchmarks/suite.py --save-baseline baseline.json
+    python benchmarks/suite.py --baseline baseline.json [--threshold 0.25]
+
+With ``--baseline`` the run exits with status 1 when any stage's p95 or peak
+memory is more than ``threshold`` (a fraction) above the baseline. Latency is
+normalized by a reference workload timed in every round, which absorbs
+load and clock changes but not different hardware: record the baseline on
+the machine that runs the comparison.
+"""
+import argparse
+import gc
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmarks.corpus import corpus
+from docx_extract import extract_text
+import docx_generator
+from pdf_templates import TEMPLATES, render
+from resume_parser import EnhancedResumeParser
+
+PROFILES = {
+    'typical': dict(pages=1, jobs=3, tables=0, skill_density=0.15),
+    'long': dict(pages=5, jobs=10, tables=2, skill_density=0.15),
+    'dense': dict(pages=2, jobs=4, tables=4, skill_density=0.5),
+}
+# Differences below this many milliseconds are noise, whatever the ratio.
+MIN_DELTA_MS = 0.2
+
+
+def _render_pdf(template):
+    return lambda item: render(io.BytesIO(), item['data'], template)
+
+
+def _render_docx(item):
+    docx_generator.render(item['data'])
+
+
+def stages():
+    """``(name, fn)`` for each stage; ``fn`` takes a corpus item"""
+    result = [
+        ('extract', lambda item: extract_text(io.BytesIO(item['docx']))),
+        ('parse', lambda item: EnhancedResumeParser(item['text']).parse()),
+    ]
+    result += [(f'pdf:{template}', _render_pdf(template)) for template in TEMPLATES]
+    result.append(('preview', lambda item: render(io.BytesIO(), item['data'], 'modern', first_page=True)))
+    result.append(('docx', _render_docx))
+    return result
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def reference_ms(repeat=10):
+    """Best time of a fixed pure-Python workload, a yardstick for machine speed"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        sorted(str(i * 7919 % 10007) for i in range(20000))
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def peak_kb(fn, items):
+    """Peak traced memory of ``fn`` over ``items``, traced apart from timing since tracing is slow"""
+    peak = 0
+    for item in items:
+        tracemalloc.start()
+        fn(item)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+def run(profiles, docs, rounds=3, memory_samples=5):
+    """Latency percentiles across documents and peak memory for every profile and stage.
+
+    Each document's latency is its best of ``rounds`` runs. Rounds sweep
+    every stage in turn, so a burst of load on the machine hits one attempt
+    per document rather than all of them, while slow documents stay slow.
+    """
+    corpora = {}
+    for profile in profiles:
+        items = [{'docx': content, 'data': data} for content, data in corpus(docs, **PROFILES[profile])]
+        for item in items:
+            item['text'] = extract_text(io.BytesIO(item['docx']))
+        corpora[profile] = items
+
+    cases = [(f'{profile}/{stage}', fn, items) for profile, items in corpora.items() for stage, fn in stages()]
+    for _, fn, items in cases:
+        fn(items[0])  # warm-up: imports, compiled templates, caches
+
+    timings = {key: [float('inf')] * len(items) for key, _, items in cases}
+    reference = float('inf')
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            reference = min(reference, reference_ms())
+            for key, fn, items in cases:
+                best = timings[key]
+                for i, item in enumerate(items):
+                    start = time.perf_counter()
+                    fn(item)
+                    best[i] = min(best[i], (time.perf_counter() - start) * 1000)
+    finally:
+        gc.enable()
+
+    results = {}
+    for key, fn, items in cases:
+        values = timings[key]
+        results[key] = {
+            'count': len(values),
+            'p50_ms': round(percentile(values, 0.50), 3),
+            'p95_ms': round(percentile(values, 0.95), 3),
+            'p99_ms': round(percentile(values, 0.99), 3),
+            'peak_kb': peak_kb(fn, items[:memory_samples]),
+            'reference_ms': round(reference, 3),
+        }
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Regression messages for stages worse than ``baseline`` by more than ``threshold``"""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        # Latency is compared relative to the reference workload, so a
+        # machine that is busier or slower overall than when the baseline was
+        # recorded doesn't read as a regression.
+        speed = result['reference_ms'] / base['reference_ms'] if base.get('reference_ms') else 1.0
+        for metric, scale, slack in (('p95_ms', speed, MIN_DELTA_MS), ('peak_kb', 1.0, 0)):
+            expected = base[metric] * scale
+            if result[metric] > expected * (1 + threshold) and result[metric] - expected > slack:
+                regressions.append(f"{key} {metric}: {result[metric]} > {expected:.3f} "
+                                   f"(+{(result[metric] / expected - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parse, extract and render stages.')
+    parser.add_argument('--docs', type=int, default=50, help='documents per profile')
+    parser.add_argument('--rounds', type=int, default=3, help='runs per document; the best one counts')
+    parser.add_argument('--profile', action='append', choices=sorted(PROFILES), help='profiles to run (default: all)')
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--baseline', help='compare against this results file')
+    parser.add_argument('--save-baseline', help='write results to this file as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed regression as a fraction (default 0.25)')
+    args = parser.parse_args()
+
+    results = run(args.profile or list(PROFILES), args.docs, args.rounds)
+
+    print(f"{'stage':<28} {'n':>4} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'peak KB':>9}")
+    for key, result in results.items():
+        print(f"{key:<28} {result['count']:>4} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+              f"{result['p99_ms']:>8.2f} {result['peak_kb']:>9.1f}")
+
+    for path in (args.json, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nNo regressions over {args.threshold:.0%}.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+"""Parse a backlog of .docx resumes offline, without the web server.
+
+Walks directories, .zip archives and single files and parses every document
+in the batch process pool, with the same extraction and parser as
+``/api/upload``. Each result is appended to a JSONL file as soon as it is
+ready. A checkpoint file next to the output records how much of it is
+complete, so an interrupted run started again with the same arguments skips
+what is already done. Run from ``backend/``::
+
+    python bulk_parse.py archive/ more.zip -o results.jsonl [--workers N] [--ner]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import zipfile
+
+from ingest import BATCH_WORKERS, DOCUMENT_EXTENSIONS, error_reader, iter_zip_documents, parse_many, reset_executor, set_workers
+
+MAX_FILE_SIZE = int(os.environ.get('MAX_FILE_SIZE', 16 * 1024 * 1024))
+# The output is synced and the checkpoint rewritten after this many
+# documents or seconds, whichever comes first; an interrupted run redoes at
+# most that much.
+CHECKPOINT_DOCUMENTS = 200
+CHECKPOINT_SECONDS = 10
+PROGRESS_SECONDS = 5
+
+
+class CheckpointError(Exception):
+    """The checkpoint doesn't belong to this run"""
+
+
+def iter_sources(sources):
+    """``(kind, path)`` of every .docx (``'file'``) and .zip (``'zip'``) under ``sources``, in a stable order"""
+    for source in sources:
+        if os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    yield from _classify(os.path.join(root, name))
+        else:
+            yield from _classify(source)
+
+
+def _classify(path):
+    if os.path.basename(path).startswith(('~$', '._')):
+        return
+    if path.lower().endswith('.zip'):
+        yield 'zip', path
+    elif path.lower().endswith(DOCUMENT_EXTENSIONS):
+        yield 'file', path
+
+
+def _reader(path, max_size):
+    def read():
+        if os.path.getsize(path) > max_size:
+            raise ValueError(f'File exceeds the {max_size} byte limit')
+        with open(path, 'rb') as f:
+            return f.read()
+    return read
+
+
+def iter_documents(sources, done=frozenset(), max_size=MAX_FILE_SIZE):
+    """``(name, read)`` of each document not in ``done``; zip members are named ``archive.zip/member``"""
+    for kind, path in iter_sources(sources):
+        if kind == 'file':
+            if path not in done:
+                yield path, _reader(path, max_size)
+            continue
+        with open(path, 'rb') as stream:
+            try:
+                for name, read in iter_zip_documents(stream, max_size):
+                    name = f'{path}/{name}'
+                    if name not in done:
+                        yield name, read
+            except zipfile.BadZipFile as e:
+                if path not in done:
+                    yield path, error_reader(f'Invalid zip archive: {e}')
+
+
+def count_documents(sources):
+    """Documents under ``sources``, from directory listings and zip directories only"""
+    count = 0
+    for kind, path in iter_sources(sources):
+        if kind == 'file':
+            count += 1
+            continue
+        try:
+            with open(path, 'rb') as stream:
+                count += sum(1 for _ in iter_zip_documents(stream, MAX_FILE_SIZE))
+        except zipfile.BadZipFile:
+            count += 1
+    return count
+
+
+def load_checkpoint(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(path, state):
+    """Replace the checkpoint atomically, so a crash leaves the old one or the new one"""
+    temporary = f'{path}.tmp'
+    with open(temporary, 'w') as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+def completed(output):
+    """``(names, failed)`` of the documents already in ``output``"""
+    names = set()
+    failed = 0
+    for line in output:
+        result = json.loads(line)
+        names.add(result['file'])
+        failed += not result['success']
+    return names, failed
+
+
+def format_seconds(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours}h{minutes:02d}m{seconds:02d}s' if hours else f'{minutes}m{seconds:02d}s'
+
+
+class Progress:
+    """Counts and throughput of a run, printed to stderr every few seconds"""
+
+    def __init__(self, total, done, failed, stream=sys.stderr):
+        self.total = total
+        self.done = done
+        self.failed = failed
+        self.processed = 0
+        self.start = self.printed = time.monotonic()
+        self.stream = stream
+
+    def update(self, success):
+        self.done += 1
+        self.processed += 1
+        self.failed += not success
+        if time.monotonic() - self.printed >= PROGRESS_SECONDS:
+            self.report()
+
+    def rate(self):
+        return self.processed / max(time.monotonic() - self.start, 1e-9)
+
+    def report(self):
+        self.printed = time.monotonic()
+        rate = self.rate()
+        remaining = max(self.total - self.done, 0)
+        eta = format_seconds(remaining / rate) if rate else '?'
+        percent = self.done / self.total * 100 if self.total else 100.0
+        print(f'{self.done}/{self.total} documents ({percent:.1f}%), {self.failed} failed, '
+              f'{rate:.1f} docs/s, ETA {eta}', file=self.stream, flush=True)
+
+
+def open_output(path, checkpoint_path, state, restart):
+    """The output file, opened for reading what is done and appending the rest.
+
+    Whatever was written after the last checkpoint is truncated away and
+    parsed again.
+    """
+    if restart or state is None:
+        if not restart and os.path.exists(path) and os.path.getsize(path):
+            raise CheckpointError(f'{path} exists without a checkpoint; pass --restart to overwrite it')
+        return open(path, 'w+b')
+
+    if not os.path.exists(path):
+        raise CheckpointError(f'{checkpoint_path} refers to a missing {path}; pass --restart to start over')
+    output = open(path, 'r+b')
+    output.truncate(state['output_bytes'])
+    return output
+
+
+def run(args):
+    sources = [os.path.abspath(source) for source in args.sources]
+    checkpoint_path = args.checkpoint or f'{args.output}.checkpoint'
+    state = None if args.restart else load_checkpoint(checkpoint_path)
+    if state is not None and (state.get('sources') != sources or state.get('ner') != args.ner):
+        raise CheckpointError(f'{checkpoint_path} was written for other sources or options; '
+                              'pass --restart to start over')
+
+    output = open_output(args.output, checkpoint_path, state, args.restart)
+    with output:
+        output.seek(0)
+        done, failed = completed(output)
+        output.seek(0, os.SEEK_END)
+        total = count_documents(sources)
+        if done:
+            print(f'Resuming: {len(done)} documents already done', file=sys.stderr)
+
+        progress = Progress(total, len(done), failed)
+        checkpointed = (progress.processed, time.monotonic())
+
+        def checkpoint(output_bytes, finished=False):
+            output.flush()
+            os.fsync(output.fileno())
+            save_checkpoint(checkpoint_path, {
+                'sources': sources,
+                'ner': args.ner,
+                'output_bytes': output_bytes,
+                'documents': progress.done,
+                'failed': progress.failed,
+                'finished': finished,
+                'updated': time.time()
+            })
+
+        # End of the last complete line; an interrupt may land mid-write.
+        written = output.tell()
+        set_workers(args.workers)
+        try:
+            for result in parse_many(iter_documents(sources, done, args.max_size), ner=args.ner):
+                result.pop('cached', None)
+                output.write(json.dumps(result, ensure_ascii=False).encode('utf-8') + b'\n')
+                written = output.tell()
+                progress.update(result['success'])
+                if (progress.processed - checkpointed[0] >= CHECKPOINT_DOCUMENTS
+                        or time.monotonic() - checkpointed[1] >= CHECKPOINT_SECONDS):
+                    checkpoint(written)
+                    checkpointed = (progress.processed, time.monotonic())
+        except KeyboardInterrupt:
+            checkpoint(written)
+            reset_executor()
+            print(f'\nInterrupted after {progress.done}/{total} documents; '
+                  'run the same command again to resume.', file=sys.stderr)
+            return 130
+        checkpoint(written, finished=True)
+
+    elapsed = time.monotonic() - progress.start
+    print(f'Parsed {progress.processed} documents in {format_seconds(elapsed)} ({progress.rate():.1f} docs/s); '
+          f'{progress.done}/{total} done, {progress.failed} failed. Results in {args.output}', file=sys.stderr)
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Parse .docx resumes in bulk into a JSONL file.')
+    parser.add_argument('sources', nargs='+', help='.docx files, .zip archives or directories of either')
+    parser.add_argument('-o', '--output', required=True, help='JSONL file, one result per document')
+    parser.add_argument('--checkpoint', help='checkpoint file (default: OUTPUT.checkpoint)')
+    parser.add_argument('--workers', type=int, default=BATCH_WORKERS, help='parser processes (default: BATCH_WORKERS)')
+    parser.add_argument('--ner', action='store_true', help='also run the spaCy NER model')
+    parser.add_argument('--max-size', type=int, default=MAX_FILE_SIZE, help='largest document in bytes')
+    parser.add_argument('--restart', action='store_true', help='ignore the checkpoint and overwrite the output')
+    args = parser.parse_args(argv)
+
+    missing = [source for source in args.sources if not os.path.exists(source)]
+    if missing:
+        parser.error(f"no such file or directory: {', '.join(missing)}")
+    try:
+        return run(args)
+    except CheckpointError as e:
+        parser.exit(2, f'{parser.prog}: error: {e}\n')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,265 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import fast_json
+
+
+class LRUCache:
+    """Thread-safe LRU cache bounded by the total size of its values.
+
+    ``sizeof`` returns the cost of a value in bytes; the least recently used
+    entries are evicted until the total fits in ``max_bytes``. A value larger
+    than the whole budget is not stored.
+    """
+
+    def __init__(self, max_bytes, sizeof=len):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self.entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def pop(self, key):
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                return None
+            self.bytes -= entry[1]
+            return entry[0]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+def _json_size(value):
+    return len(fast_json.dumps(value))
+
+
+class ParseCache:
+    """Parse results keyed by the uploaded bytes and the parser version.
+
+    Lookups go to the in-process LRU first and then to an optional SQLite
+    file, which survives restarts and is shared by every worker on the host.
+    Entries written by another parser version never match, since the
+    version is part of the key. The SQLite tier keeps at most ``db_max_rows``
+    entries, none older than ``db_max_age`` seconds (0 lifts either bound);
+    it is pruned every ``PRUNE_EVERY`` writes, oldest entries first.
+    """
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, version, max_bytes=64 * 1024 * 1024, db_path=None, db_max_rows=100000,
+                 db_max_age=30 * 24 * 3600):
+        self.version = version
+        self.memory = LRUCache(max_bytes, sizeof=_json_size)
+        self.db_path = db_path
+        self.db_max_rows = db_max_rows
+        self.db_max_age = db_max_age
+        self.db_hits = 0
+        self.db_writes = 0
+        self.db_pruned = 0
+        self.db_lock = threading.Lock()
+        self._db = None
+        self._db_pid = None
+
+    @property
+    def db(self):
+        """SQLite connection for this process, or None without a db path.
+
+        Opened lazily and reopened after a fork, since a connection must not
+        be shared between processes.
+        """
+        if not self.db_path:
+            return None
+        if self._db is None or self._db_pid != os.getpid():
+            db = sqlite3.connect(self.db_path, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS parse_cache '
+                       '(key TEXT PRIMARY KEY, payload TEXT NOT NULL, created REAL NOT NULL)')
+            db.execute('CREATE INDEX IF NOT EXISTS parse_cache_created ON parse_cache (created)')
+            db.commit()
+            self._db, self._db_pid = db, os.getpid()
+        return self._db
+
+    def key(self, data, variant=''):
+        """Cache key for uploaded bytes; ``variant`` separates parse modes"""
+        return self.digest_key(hashlib.sha256(data).hexdigest(), variant)
+
+    def digest_key(self, digest, variant=''):
+        key = f"{digest}:{self.version}"
+        return f"{key}:{variant}" if variant else key
+
+    def get(self, key):
+        value = self.memory.get(key)
+        if value is not None or not self.db_path:
+            return value
+        with self.db_lock:
+            row = self.db.execute('SELECT payload FROM parse_cache WHERE key = ? AND created >= ?',
+                                  (key, self._oldest())).fetchone()
+        if row is None:
+            return None
+        value = fast_json.loads(row[0])
+        self.db_hits += 1
+        self.memory.put(key, value)
+        return value
+
+    def put(self, key, value):
+        self.memory.put(key, value)
+        if self.db_path:
+            with self.db_lock:
+                self.db.execute('INSERT OR REPLACE INTO parse_cache (key, payload, created) VALUES (?, ?, ?)',
+                                (key, fast_json.dumps(value), time.time()))
+                self.db_writes += 1
+                if self.db_writes % self.PRUNE_EVERY == 0:
+                    self._prune()
+                self.db.commit()
+
+    def _oldest(self):
+        """Creation time of the oldest entry still fresh enough to use"""
+        return time.time() - self.db_max_age if self.db_max_age else 0
+
+    def _prune(self):
+        """Delete the SQLite entries past the age and row limits; call with ``db_lock`` held"""
+        removed = self.db.execute('DELETE FROM parse_cache WHERE created < ?', (self._oldest(),)).rowcount
+        if self.db_max_rows:
+            removed += self.db.execute(
+                'DELETE FROM parse_cache WHERE created <= '
+                '(SELECT created FROM parse_cache ORDER BY created DESC LIMIT 1 OFFSET ?)',
+                (self.db_max_rows,)
+            ).rowcount
+        self.db_pruned += removed
+
+    def invalidate(self, key=None):
+        """Drop one entry, or everything when ``key`` is None. Returns the number of entries removed."""
+        if key is None:
+            removed = len(self.memory)
+            self.memory.clear()
+        else:
+            removed = int(self.memory.pop(key) is not None)
+        if self.db_path:
+            with self.db_lock:
+                if key is None:
+                    cursor = self.db.execute('DELETE FROM parse_cache')
+                else:
+                    cursor = self.db.execute('DELETE FROM parse_cache WHERE key = ?', (key,))
+                self.db.commit()
+            removed = max(removed, cursor.rowcount)
+        return removed
+
+    def invalidate_digest(self, digest):
+        """Drop every entry of one upload: all parse modes and parser versions"""
+        prefix = f"{digest}:"
+        with self.memory.lock:
+            keys = [key for key in self.memory.entries if key.startswith(prefix)]
+        removed = sum(self.memory.pop(key) is not None for key in keys)
+        if self.db_path:
+            with self.db_lock:
+                cursor = self.db.execute("DELETE FROM parse_cache WHERE substr(key, 1, ?) = ?",
+                                         (len(prefix), prefix))
+                self.db.commit()
+            removed = max(removed, cursor.rowcount)
+        return removed
+
+    def stats(self):
+        stats = {'version': self.version, 'memory': self.memory.stats()}
+        if self.db_path:
+            with self.db_lock:
+                entries = self.db.execute('SELECT COUNT(*) FROM parse_cache').fetchone()[0]
+            stats['sqlite'] = {
+                'path': self.db_path,
+                'entries': entries,
+                'hits': self.db_hits,
+                'max_rows': self.db_max_rows,
+                'max_age_seconds': self.db_max_age,
+                'pruned': self.db_pruned
+            }
+        return stats
+
+
+class RenderCache:
+    """Rendered PDF/DOCX bytes keyed by format, template and resume data.
+
+    The key is a hash of the canonical JSON of ``resumeData``, so it can be
+    computed (and used as a strong ETag) before anything is rendered.
+    """
+
+    def __init__(self, max_bytes=128 * 1024 * 1024):
+        self.memory = LRUCache(max_bytes)
+
+    @staticmethod
+    def key(fmt, template, resume_data):
+        canonical = fast_json.dumps(resume_data, sort_keys=True)
+        digest = hashlib.sha256(f"{fmt}:{template}:".encode('utf-8'))
+        digest.update(canonical.encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def session_key(fmt, template, session):
+        """Key for a session's data, which its id and version identify without hashing it"""
+        return hashlib.sha256(f"{fmt}:{template}:session:{session['id']}:{session['version']}".encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        return self.memory.get(key)
+
+    def put(self, key, body):
+        self.memory.put(key, body)
+
+    def invalidate(self):
+        removed = len(self.memory)
+        self.memory.clear()
+        return removed
+
+    def stats(self):
+        return self.memory.stats()
@@ -0,0 +1,355 @@
+"""Candidate search over parsed resumes.
+
+Parsed resumes are kept in a SQLite file (``CandidateStore``) and indexed in
+memory (``CandidateIndex``):
+
+- an inverted index of skills, title words and company words for exact
+  filters;
+- a TF-IDF matrix, stored as per-term posting arrays, for ranking every
+  candidate against a job description by cosine similarity.
+
+Ranking is one ``numpy.bincount`` over the postings of the description's
+terms, so its cost grows with how many resumes share those terms rather
+than with the size of the vocabulary. Each process keeps its own index and
+catches up with rows other workers added before every query.
+"""
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections import Counter
+
+import numpy as np
+
+from resume_parser import FALLBACKS, SKILL_MATCHER
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]')
+STOPWORDS = frozenset('''a an and are as at be by for from has have in is it its of on or our that the their to
+was were will with we you your this these those who while into per via across all any can not'''.split())
+# Term frequencies are multiplied by these before log scaling.
+SKILL_WEIGHT = 3
+TITLE_WEIGHT = 2
+# Document norms are computed with the IDF of the moment; they are all
+# recomputed once the index has grown by this fraction since the last time.
+NORM_REFRESH_GROWTH = 0.1
+# Fields a candidate is ranked or filtered by; a parse with none of them
+# found is not stored.
+SEARCHED_FIELDS = ('skills', 'summary', 'experience')
+
+
+def tokens(text):
+    return [token for token in TOKEN_PATTERN.findall(str(text or '').lower()) if token not in STOPWORDS]
+
+
+def resume_terms(data):
+    """Weighted term counts of a parsed resume"""
+    terms = Counter()
+    for skill in data.get('skills') or ():
+        terms[str(skill).lower()] += SKILL_WEIGHT
+    terms.update(tokens(data.get('summary')))
+    for job in data.get('experience') or ():
+        if isinstance(job, dict):
+            for token in tokens(job.get('title')):
+                terms[token] += TITLE_WEIGHT
+            terms.update(tokens(job.get('description')))
+    return terms
+
+
+def query_terms(text):
+    """Weighted term counts of a job description; known skills count as resume skills do"""
+    terms = Counter(tokens(text))
+    for skill in SKILL_MATCHER.find(text):
+        terms[skill.lower()] += SKILL_WEIGHT
+    return terms
+
+
+def filter_keys(data):
+    """Inverted index keys: each skill, title word and company word"""
+    keys = {f'skill:{str(skill).lower()}' for skill in data.get('skills') or ()}
+    for job in data.get('experience') or ():
+        if isinstance(job, dict):
+            keys.update(f'title:{token}' for token in tokens(job.get('title')))
+            keys.update(f'company:{token}' for token in tokens(job.get('company')))
+    return keys
+
+
+def without_fallbacks(data):
+    """``data`` minus the fields the parser filled with placeholders, or None if no searched field is left.
+
+    A field the parser found nothing for (or skipped, out of time) holds
+    its fallback value, made-up titles, companies and skills that would
+    otherwise match job descriptions.
+    """
+    data = {field: value for field, value in data.items()
+            if field not in FALLBACKS or value != FALLBACKS[field]}
+    if not any(data.get(field) for field in SEARCHED_FIELDS):
+        return None
+    return data
+
+
+def digest(data):
+    """Identity of a parsed resume: the same upload parsed twice is stored once"""
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def filter_query(skills=(), title='', company=''):
+    """Keys a candidate must all have for the given filters"""
+    keys = [f'skill:{str(skill).lower().strip()}' for skill in skills if str(skill).strip()]
+    keys += [f'title:{token}' for token in tokens(title)]
+    keys += [f'company:{token}' for token in tokens(company)]
+    return keys
+
+
+class CandidateIndex:
+    """In-memory TF-IDF and filter index, appended to one resume at a time.
+
+    Documents are numbered in insertion order. Postings live in ``array``
+    buffers, cheap to append and viewed by NumPy without copying; the lock
+    keeps appends from resizing a buffer while a query is viewing it.
+    """
+
+    def __init__(self):
+        self.ids = array('q')       # document -> store row id
+        self.names = []
+        self.norms = array('d')
+        self.vocabulary = {}
+        self.df = array('q')
+        self.postings = []          # term -> (documents, log-scaled weights)
+        self.filters = {}           # key -> documents
+        self.normed_at = 0
+        self.lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _idf(self, df):
+        return math.log((1 + len(self.ids)) / (1 + df)) + 1
+
+    def add(self, row_id, data):
+        self.add_many([(row_id, data)])
+
+    def add_many(self, rows):
+        """Index ``(row_id, data)`` pairs, recomputing stale norms once at the end"""
+        # Tokenized before taking the lock, so queries aren't held up by it.
+        prepared = [(row_id, str(data.get('name') or ''), resume_terms(data), filter_keys(data))
+                    for row_id, data in rows]
+        with self.lock:
+            for row in prepared:
+                self._add(*row)
+            if len(self.ids) > max(self.normed_at, 1) * (1 + NORM_REFRESH_GROWTH):
+                self._refresh_norms()
+
+    def _add(self, row_id, name, terms, keys):
+        document = len(self.ids)
+        self.ids.append(row_id)
+        self.names.append(name)
+        squares = 0.0
+        for term, count in terms.items():
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                term_id = self.vocabulary[term] = len(self.postings)
+                self.postings.append((array('q'), array('d')))
+                self.df.append(0)
+            weight = 1 + math.log(count)
+            documents, weights = self.postings[term_id]
+            documents.append(document)
+            weights.append(weight)
+            self.df[term_id] += 1
+            squares += (weight * self._idf(self.df[term_id])) ** 2
+        self.norms.append(math.sqrt(squares))
+        for key in keys:
+            self.filters.setdefault(key, array('q')).append(document)
+
+    def _refresh_norms(self):
+        """Recompute every document norm with the current IDF"""
+        count = len(self.ids)
+        squares = np.zeros(count)
+        for term_id, (documents, weights) in enumerate(self.postings):
+            idf = self._idf(self.df[term_id])
+            squares += np.bincount(np.frombuffer(documents, dtype=np.int64),
+                                   (np.frombuffer(weights) * idf) ** 2, minlength=count)
+        self.norms = array('d', np.sqrt(squares).tobytes())
+        self.normed_at = count
+
+    def _matching(self, keys):
+        """Sorted documents having every filter key"""
+        matched = None
+        for key in keys:
+            documents = self.filters.get(key)
+            if documents is None:
+                return np.zeros(0, dtype=np.int64)
+            documents = np.frombuffer(documents, dtype=np.int64)
+            matched = documents.copy() if matched is None else np.intersect1d(matched, documents, assume_unique=True)
+        return matched
+
+    def search(self, keys, limit=20):
+        """Row ids of up to ``limit`` documents having every filter key, most recent first"""
+        with self.lock:
+            matched = self._matching(keys)
+            if matched is None:
+                matched = np.arange(len(self.ids))
+            return [self.ids[int(document)] for document in matched[::-1][:limit]], len(matched)
+
+    def rank(self, text, limit=20, keys=()):
+        """``[(row_id, name, score)]`` of the documents most similar to ``text``.
+
+        ``keys`` restricts the ranking to documents having every filter key.
+        """
+        query = query_terms(text)
+        with self.lock:
+            count = len(self.ids)
+            parts = []
+            query_squares = 0.0
+            for term, weight in query.items():
+                term_id = self.vocabulary.get(term)
+                if term_id is None:
+                    continue
+                idf = self._idf(self.df[term_id])
+                query_weight = (1 + math.log(weight)) * idf
+                query_squares += query_weight ** 2
+                documents, weights = self.postings[term_id]
+                parts.append((np.frombuffer(documents, dtype=np.int64), np.frombuffer(weights) * (query_weight * idf)))
+            if not parts or not count:
+                return []
+
+            scores = np.bincount(np.concatenate([documents for documents, _ in parts]),
+                                 np.concatenate([weights for _, weights in parts]), minlength=count)
+            norms = np.frombuffer(self.norms)[:count]
+            scores = np.divide(scores, norms * math.sqrt(query_squares), out=np.zeros(count), where=norms > 0)
+            del parts, norms
+
+            if keys:
+                allowed = self._matching(keys)
+                if allowed is None:
+                    allowed = np.arange(count)
+                masked = np.zeros(count)
+                masked[allowed] = scores[allowed]
+                scores = masked
+
+            candidates = np.flatnonzero(scores)
+            if len(candidates) > limit:
+                candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+            top = candidates[np.argsort(-scores[candidates], kind='stable')]
+            return [(self.ids[int(document)], self.names[document], round(float(scores[document]), 4))
+                    for document in top]
+
+    def stats(self):
+        with self.lock:
+            return {
+                'candidates': len(self.ids),
+                'terms': len(self.vocabulary),
+                'postings': sum(self.df),
+                'filter_keys': len(self.filters)
+            }
+
+
+class CandidateStore:
+    """Parsed resumes in SQLite, one row per distinct parse result"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.db_lock = threading.Lock()
+        self._db = None
+        self._db_pid = None
+
+    @property
+    def db(self):
+        """SQLite connection for this process, reopened after a fork"""
+        if self._db is None or self._db_pid != os.getpid():
+            db = sqlite3.connect(self.db_path, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS candidates (id INTEGER PRIMARY KEY, digest TEXT UNIQUE, '
+                       'payload TEXT NOT NULL, created REAL NOT NULL)')
+            db.commit()
+            self._db, self._db_pid = db, os.getpid()
+        return self._db
+
+    def put(self, data):
+        """Store a parsed resume unless an identical one is already stored"""
+        with self.db_lock:
+            self.db.execute('INSERT OR IGNORE INTO candidates (digest, payload, created) VALUES (?, ?, ?)',
+                            (digest(data), json.dumps(data), time.time()))
+            self.db.commit()
+
+    def since(self, row_id):
+        """``(id, data)`` of rows added after ``row_id``, oldest first"""
+        with self.db_lock:
+            rows = self.db.execute('SELECT id, payload FROM candidates WHERE id > ? ORDER BY id', (row_id,)).fetchall()
+        return [(row_id, json.loads(payload)) for row_id, payload in rows]
+
+    def get_many(self, row_ids):
+        if not row_ids:
+            return {}
+        with self.db_lock:
+            rows = self.db.execute(f"SELECT id, payload FROM candidates WHERE id IN ({','.join('?' * len(row_ids))})",
+                                   list(row_ids)).fetchall()
+        return {row_id: json.loads(payload) for row_id, payload in rows}
+
+
+class Candidates:
+    """A candidate store and the index over it"""
+
+    def __init__(self, db_path):
+        self.store = CandidateStore(db_path)
+        self.index = CandidateIndex()
+        self.loaded_to = 0
+        self.sync_lock = threading.Lock()
+
+    def sync(self):
+        """Index rows added since the last sync, by any process"""
+        with self.sync_lock:
+            rows = self.store.since(self.loaded_to)
+            if rows:
+                self.index.add_many(rows)
+                self.loaded_to = rows[-1][0]
+
+    def add(self, data):
+        """Store and index a parse result without its fallback fields; returns False if nothing is left to search"""
+        data = without_fallbacks(data)
+        if data is None:
+            return False
+        self.store.put(data)
+        self.sync()
+        return True
+
+    def get(self, row_id):
+        return self.store.get_many([row_id]).get(row_id)
+
+    def search(self, keys, limit=20):
+        self.sync()
+        row_ids, total = self.index.search(keys, limit)
+        rows = self.store.get_many(row_ids)
+        return [self._summary(row_id, rows.get(row_id) or {}) for row_id in row_ids], total
+
+    def rank(self, text, limit=20, keys=()):
+        self.sync()
+        ranked = self.index.rank(text, limit, keys)
+        rows = self.store.get_many([row_id for row_id, _, _ in ranked])
+        wanted = {skill.lower() for skill in SKILL_MATCHER.find(text)}
+        results = []
+        for row_id, _, score in ranked:
+            result = self._summary(row_id, rows.get(row_id) or {})
+            result['score'] = score
+            result['matched_skills'] = [skill for skill in result['skills'] if str(skill).lower() in wanted]
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _summary(row_id, data):
+        return {
+            'id': row_id,
+            'name': data.get('name'),
+            'email': data.get('email'),
+            'location': data.get('location'),
+            'skills': data.get('skills') or [],
+            'titles': [job.get('title') for job in data.get('experience') or () if isinstance(job, dict)]
+        }
+
+    def stats(self):
+        return self.index.stats()
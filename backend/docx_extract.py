@@ -0,0 +1,156 @@
+"""Streaming text extraction for .docx files.
+
+Reads the WordprocessingML parts straight out of the zip with an incremental
+XML parser instead of building python-docx's object graph. Only the text
+parts are decompressed, so embedded images never reach memory, and each
+element is discarded once its text has been emitted.
+"""
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+P = W + 'p'
+T = W + 't'
+TAB = W + 'tab'
+BR = W + 'br'
+CR = W + 'cr'
+TC = W + 'tc'
+TBL = W + 'tbl'
+VMERGE = W + 'vMerge'
+VAL = W + 'val'
+FALLBACK = MC + 'Fallback'
+
+DOCUMENT_PART = 'word/document.xml'
+_HEADER_PART = re.compile(r'word/header\d*\.xml$')
+_FOOTER_PART = re.compile(r'word/footer\d*\.xml$')
+
+
+class DocxStats:
+    """Counts collected while extracting one document."""
+
+    def __init__(self):
+        self.paragraphs = 0
+        self.tables = 0
+        self.cells = 0
+
+    def as_dict(self):
+        return {'paragraphs': self.paragraphs, 'tables': self.tables, 'cells': self.cells}
+
+
+def _iter_part(stream, stats):
+    """Yield the non-empty text blocks of one part in document order.
+
+    A block is a paragraph outside any table, or a whole table cell (its
+    paragraphs joined by newlines, like python-docx's ``cell.text``).
+    Continuation cells of a vertical merge are skipped, so merged content
+    is reported once. Text boxes nested in a paragraph come out as their
+    own blocks; the VML fallback copy Word stores next to them is ignored.
+    """
+    paragraphs = []  # text buffers of the open (possibly nested) paragraphs
+    cells = []       # [paragraph texts, is merge continuation] per open cell
+    fallback = 0
+    depth = 0
+    root = body = None
+
+    for event, elem in iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            depth += 1
+            if depth == 1:
+                root = elem
+            elif depth == 2:
+                body = elem
+            if fallback:
+                if tag == FALLBACK:
+                    fallback += 1
+            elif tag == P:
+                paragraphs.append([])
+            elif tag == TC:
+                cells.append([[], False])
+            elif tag == FALLBACK:
+                fallback += 1
+            elif tag == VMERGE and cells and elem.get(VAL, 'continue') == 'continue':
+                cells[-1][1] = True
+            continue
+
+        depth -= 1
+        # Drop finished top-level blocks so the tree never holds more than
+        # the block being read.
+        if depth == 2:
+            del body[:]
+        elif depth == 1:
+            del root[:]
+
+        if tag == FALLBACK:
+            fallback -= 1
+            elem.clear()
+        elif fallback:
+            continue
+        elif tag == T:
+            if paragraphs and elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag == TAB:
+            if paragraphs:
+                paragraphs[-1].append('\t')
+        elif tag in (BR, CR):
+            if paragraphs:
+                paragraphs[-1].append('\n')
+        elif tag == P:
+            text = ''.join(paragraphs.pop())
+            elem.clear()
+            stats.paragraphs += 1
+            # A paragraph belongs to the innermost open cell unless it sits in
+            # a text box inside another paragraph.
+            if cells and not paragraphs:
+                cells[-1][0].append(text)
+            elif text.strip():
+                yield text
+        elif tag == TC:
+            texts, continuation = cells.pop()
+            elem.clear()
+            stats.cells += 1
+            text = '\n'.join(texts).strip('\n')
+            if not continuation and text.strip():
+                if cells:
+                    cells[-1][0].append(text)
+                else:
+                    yield text
+        elif tag == TBL:
+            stats.tables += 1
+            elem.clear()
+
+
+def iter_docx_text(file, stats=None):
+    """Yield the text blocks of a .docx file.
+
+    ``file`` is a path or a binary file object. The body comes first, in
+    document order, so its first line is the candidate's name and not a
+    running header; headers and footers follow. Header and footer blocks
+    repeated across sections (first page, even page, default) are emitted
+    once.
+    """
+    stats = stats if stats is not None else DocxStats()
+    with zipfile.ZipFile(file) as archive:
+        names = archive.namelist()
+        headers = sorted(name for name in names if _HEADER_PART.match(name))
+        footers = sorted(name for name in names if _FOOTER_PART.match(name))
+
+        with archive.open(DOCUMENT_PART) as stream:
+            yield from _iter_part(stream, stats)
+
+        for parts in (headers, footers):
+            seen = set()
+            for name in parts:
+                with archive.open(name) as stream:
+                    for text in _iter_part(stream, stats):
+                        if text not in seen:
+                            seen.add(text)
+                            yield text
+
+
+def extract_text(file, stats=None):
+    """Return the text of a .docx file as newline-separated blocks."""
+    return '\n'.join(iter_docx_text(file, stats))
@@ -0,0 +1,214 @@
+"""DOCX resume rendering.
+
+``Document()`` unzips and parses python-docx's bundled template on every
+call, and ``save`` serializes and compresses every part of it again. Here a
+template's base document (that default, or the branded ``.docx`` named by
+``DOCX_BASE``) is parsed and styled once, the first time the template is
+used. A render deep-copies only the main document part, fills it from
+pre-styled paragraphs, and writes it into a copy of a zip that already holds
+every other part.
+
+Templates share their names and styling with the PDF ones (see
+``template_specs``): each style role becomes a ``Resume ...`` paragraph
+style. A branded base that defines one of those styles keeps its own.
+"""
+import copy
+import io
+import os
+import zipfile
+from functools import lru_cache
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml.parser import OxmlElement
+from docx.shared import Pt, RGBColor
+from docx.text.paragraph import Paragraph
+
+from metrics import stage
+from models import as_resume
+from template_specs import DEFAULT_TEMPLATE, TEMPLATES, resolve_template
+
+DOCX_BASE = os.environ.get('DOCX_BASE') or None
+ALIGNMENTS = {'left': WD_ALIGN_PARAGRAPH.LEFT, 'center': WD_ALIGN_PARAGRAPH.CENTER,
+              'right': WD_ALIGN_PARAGRAPH.RIGHT, 'justify': WD_ALIGN_PARAGRAPH.JUSTIFY}
+# Built-in style each role's style is based on when the base lacks it.
+BASE_STYLES = {'title': 'Title', 'heading': 'Heading 1'}
+# Fixed member timestamps, so equal resumes give equal bytes.
+ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+
+def style_name(role):
+    return f'Resume {role.capitalize()}'
+
+
+def _zip_member(name):
+    member = zipfile.ZipInfo(name, date_time=ZIP_DATE)
+    member.compress_type = zipfile.ZIP_DEFLATED
+    return member
+
+
+def _add_style(styles, role, spec):
+    """Add the paragraph style of ``role``, from a template spec style"""
+    style = styles.add_style(style_name(role), WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = styles[BASE_STYLES.get(role, 'Normal')]
+    style.quick_style = True
+    if isinstance(spec, str):
+        return style
+    font = style.font
+    if 'fontSize' in spec:
+        font.size = Pt(spec['fontSize'])
+    if 'textColor' in spec:
+        font.color.rgb = RGBColor.from_string(spec['textColor'].lstrip('#').upper())
+    if 'fontName' in spec:
+        font.bold = 'Bold' in spec['fontName']
+        font.italic = 'Oblique' in spec['fontName'] or 'Italic' in spec['fontName']
+    paragraph_format = style.paragraph_format
+    if 'spaceBefore' in spec:
+        paragraph_format.space_before = Pt(spec['spaceBefore'])
+    if 'spaceAfter' in spec:
+        paragraph_format.space_after = Pt(spec['spaceAfter'])
+    if 'alignment' in spec:
+        paragraph_format.alignment = ALIGNMENTS[spec['alignment']]
+    return style
+
+
+class CompiledDocxTemplate:
+    """A base document styled for one template, cloned by every render"""
+
+    def __init__(self, name, spec, base=None):
+        document = Document(base)
+        body = document.element.body
+        for child in list(body):
+            if child is not body.sectPr:
+                body.remove(child)
+
+        styles = document.styles
+        names = {style.name for style in styles}
+        self.paragraphs = {'body': self._paragraph(styles['Normal'])}
+        for role, style in spec['styles'].items():
+            if style_name(role) in names:
+                style = styles[style_name(role)]
+            else:
+                style = _add_style(styles, role, style)
+            self.paragraphs[role] = self._paragraph(style)
+
+        self.name = name
+        self.contact_fields = tuple(spec['contact_fields'])
+        self.sections = tuple((section, heading) for section, heading, _ in spec['sections'])
+        self.document = document
+        self._pack(document)
+
+    @staticmethod
+    def _paragraph(style):
+        """An empty paragraph in ``style``, copied for each paragraph written in it"""
+        paragraph = OxmlElement('w:p')
+        paragraph.style = style.style_id
+        return paragraph
+
+    def _pack(self, document):
+        """Set up cloning: the parts every render shares and a zip of them"""
+        part = document.part
+        self.members = (part.partname.membername, part.partname.rels_uri.membername)
+        self.relationships = len(part.rels)
+        # Deep copies of the package stop at these and share them.
+        self.shared = {}
+        for shared in part.package.iter_parts():
+            if shared is not part:
+                self.shared[id(shared)] = shared
+                element = getattr(shared, '_element', None)
+                if element is not None:
+                    self.shared[id(element)] = element
+
+        saved = io.BytesIO()
+        document.save(saved)
+        skeleton = io.BytesIO()
+        with zipfile.ZipFile(saved) as source, zipfile.ZipFile(skeleton, 'w') as archive:
+            for name in source.namelist():
+                if name not in self.members:
+                    archive.writestr(_zip_member(name), source.read(name))
+        self.skeleton = skeleton.getvalue()
+
+    def new_document(self):
+        """An empty document in this template; only its main part is copied"""
+        package = copy.deepcopy(self.document.part.package, dict(self.shared))
+        return package.main_document_part.document
+
+    def add(self, document, role, text):
+        paragraph = copy.deepcopy(self.paragraphs[role])
+        body = document.element.body
+        if body.sectPr is not None:
+            body.sectPr.addprevious(paragraph)
+        else:
+            body.append(paragraph)
+        Paragraph(paragraph, document).add_run(text)
+
+    def save(self, document):
+        """The bytes of ``document``, a clone from ``new_document``"""
+        part = document.part
+        buffer = io.BytesIO()
+        if len(part.rels) != self.relationships:
+            # Content added parts (images, ...); the skeleton no longer fits.
+            document.save(buffer)
+            return buffer.getvalue()
+        buffer.write(self.skeleton)
+        with zipfile.ZipFile(buffer, 'a') as archive:
+            archive.writestr(_zip_member(self.members[0]), part.blob)
+            archive.writestr(_zip_member(self.members[1]), part.rels.xml)
+        return buffer.getvalue()
+
+
+@lru_cache(maxsize=None)
+def compile_template(name):
+    """Compiled DOCX template ``name``, falling back to the default template"""
+    name = resolve_template(name)
+    return CompiledDocxTemplate(name, TEMPLATES[name], DOCX_BASE)
+
+
+def build_document(template, data):
+    """A python-docx Document of ``data`` (a Resume, or a dict validated into one) in a compiled template"""
+    resume = as_resume(data)
+    document = template.new_document()
+    template.add(document, 'title', resume.name)
+
+    contact_parts = [value for value in (getattr(resume, field, '') for field in template.contact_fields) if value]
+    if contact_parts:
+        template.add(document, 'contact', ' | '.join(contact_parts))
+
+    for section, heading in template.sections:
+        if not getattr(resume, section, None):
+            continue
+        template.add(document, 'heading', heading)
+
+        if section == 'summary':
+            template.add(document, 'body', resume.summary)
+        elif section == 'skills':
+            template.add(document, 'body', ' • '.join(resume.skills))
+        elif section == 'experience':
+            for exp in resume.experience:
+                template.add(document, 'job', exp.title)
+                template.add(document, 'company', f"{exp.company} | {exp.period}")
+                template.add(document, 'body', exp.description)
+        elif section == 'education':
+            for edu in resume.education:
+                template.add(document, 'degree', edu.degree)
+                template.add(document, 'institution', f"{edu.institution} | {edu.year}")
+    return document
+
+
+def render(data, template=DEFAULT_TEMPLATE):
+    """The DOCX bytes of ``data`` in ``template``"""
+    compiled = compile_template(template)
+    with stage('docx_build'):
+        document = build_document(compiled, data)
+    with stage('docx_save'):
+        return compiled.save(document)
+
+
+class DocxGenerator:
+    """Generate DOCX resumes"""
+
+    @staticmethod
+    def create_docx(data, template=DEFAULT_TEMPLATE):
+        """A python-docx Document, for callers that edit it further before saving"""
+        return build_document(compile_template(template), data)
@@ -0,0 +1,284 @@
+"""Near-duplicate detection for uploaded resumes with MinHash and LSH.
+
+A resume's text is cut into overlapping word shingles, and its MinHash
+signature estimates the Jaccard similarity of two shingle sets. Signatures
+are split into bands; resumes sharing any band are candidates, and only
+those are compared, so a lookup doesn't grow with the number of resumes
+seen. Everything is kept in flat arrays: about 750 bytes per resume.
+"""
+import hashlib
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from array import array
+
+import numpy as np
+
+SHINGLE_WORDS = 5
+# Longer documents are shingled up to this many words.
+MAX_SHINGLE_WORDS = 20000
+NUM_PERM = 128
+# 16 bands of 8 rows: resumes 80% similar are candidates 95% of the time,
+# resumes 50% similar 6% of the time.
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+# Signatures stored elsewhere are only comparable with the same hash functions.
+SEED = 1
+# Keys added since the table was last sorted; lookups scan these linearly.
+TAIL_SIZE = 4096
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def _hash_functions():
+    """Multipliers combining word hashes into shingle hashes, and the ``NUM_PERM`` multiply-shift hashes"""
+    rng = random.Random(SEED)
+
+    def words(count, odd=False):
+        return np.array([rng.getrandbits(64) | odd for _ in range(count)], dtype=np.uint64)
+
+    return words(SHINGLE_WORDS, odd=True), words(NUM_PERM, odd=True)[:, None], words(NUM_PERM)[:, None]
+
+
+SHINGLE_MULTIPLIERS, HASH_A, HASH_B = _hash_functions()
+SHIFT = np.uint64(32)
+
+
+def shingles(text):
+    """Distinct 32-bit hashes of the text's overlapping word shingles"""
+    words = WORD_PATTERN.findall(text.lower())[:MAX_SHINGLE_WORDS]
+    hashes = np.fromiter((zlib.crc32(word.encode('utf-8')) for word in words), dtype=np.uint64, count=len(words))
+    count = max(len(words) - SHINGLE_WORDS + 1, 1 if words else 0)
+    combined = np.zeros(count, dtype=np.uint64)
+    # uint64 arithmetic wraps, which is what the hashing wants.
+    for offset, multiplier in enumerate(SHINGLE_MULTIPLIERS[:len(words)]):
+        combined += hashes[offset:offset + count] * multiplier
+    return np.unique(combined >> SHIFT)
+
+
+def signature(text, chunk=2048):
+    """MinHash signature (``NUM_PERM`` uint32), or None for text without words"""
+    hashes = shingles(text)
+    if not len(hashes):
+        return None
+    minimum = np.full(NUM_PERM, 2 ** 32 - 1, dtype=np.uint64)
+    values = np.empty((NUM_PERM, min(chunk, len(hashes))), dtype=np.uint64)
+    for start in range(0, len(hashes), chunk):
+        part = hashes[start:start + chunk]
+        out = values[:, :len(part)]
+        # Multiply-add-shift: (a * x + b) >> 32 over 64-bit words.
+        np.multiply(HASH_A, part, out=out)
+        out += HASH_B
+        out >>= SHIFT
+        np.minimum(minimum, out.min(axis=1), out=minimum)
+    return minimum.astype(np.uint32)
+
+
+def band_keys(sig):
+    """One 64-bit key per band of a signature"""
+    rows = sig.reshape(BANDS, ROWS)
+    return [int.from_bytes(hashlib.blake2b(rows[band].tobytes(), digest_size=8, salt=bytes([band])).digest(), 'little')
+            for band in range(BANDS)]
+
+
+def digest_key(digest):
+    return int.from_bytes(digest[:8], 'little')
+
+
+class KeyTable:
+    """A uint64 key -> document multimap kept in sorted arrays.
+
+    New keys go to a short unsorted tail, merged into the sorted arrays
+    once it holds ``TAIL_SIZE`` keys.
+    """
+
+    def __init__(self):
+        self.keys = np.zeros(0, dtype=np.uint64)
+        self.documents = np.zeros(0, dtype=np.int32)
+        self.tail_keys = array('Q')
+        self.tail_documents = array('i')
+
+    def __len__(self):
+        return len(self.keys) + len(self.tail_keys)
+
+    def add(self, keys, document):
+        self.tail_keys.extend(keys)
+        self.tail_documents.extend([document] * len(keys))
+        if len(self.tail_keys) >= TAIL_SIZE:
+            self._merge()
+
+    def _merge(self):
+        keys = np.frombuffer(self.tail_keys, dtype=np.uint64)
+        order = np.argsort(keys, kind='stable')
+        keys, documents = keys[order], np.frombuffer(self.tail_documents, dtype=np.int32)[order]
+        at = np.searchsorted(self.keys, keys, side='right')
+        self.keys = np.insert(self.keys, at, keys)
+        self.documents = np.insert(self.documents, at, documents)
+        self.tail_keys, self.tail_documents = array('Q'), array('i')
+
+    def get(self, keys):
+        """Documents filed under any of ``keys``, possibly repeated"""
+        keys = np.asarray(keys, dtype=np.uint64)
+        starts = np.searchsorted(self.keys, keys, side='left')
+        ends = np.searchsorted(self.keys, keys, side='right')
+        found = [self.documents[start:end] for start, end in zip(starts, ends) if end > start]
+        if self.tail_keys:
+            tail = np.isin(np.frombuffer(self.tail_keys, dtype=np.uint64), keys)
+            found.append(np.frombuffer(self.tail_documents, dtype=np.int32)[tail])
+        return np.concatenate(found) if found else np.zeros(0, dtype=np.int32)
+
+
+class SignatureStore:
+    """Signatures in SQLite, shared by every worker"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.db_lock = threading.Lock()
+        self._db = None
+        self._db_pid = None
+
+    @property
+    def db(self):
+        """SQLite connection for this process, reopened after a fork"""
+        if self._db is None or self._db_pid != os.getpid():
+            db = sqlite3.connect(self.db_path, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS signatures (id INTEGER PRIMARY KEY, digest BLOB UNIQUE, '
+                       'signature BLOB NOT NULL, created REAL NOT NULL)')
+            db.commit()
+            self._db, self._db_pid = db, os.getpid()
+        return self._db
+
+    def put(self, digest, sig):
+        with self.db_lock:
+            self.db.execute('INSERT OR IGNORE INTO signatures (digest, signature, created) VALUES (?, ?, ?)',
+                            (digest, sig.tobytes(), time.time()))
+            self.db.commit()
+
+    def since(self, row_id, limit):
+        """``(id, digest, signature bytes)`` of up to ``limit`` rows added after ``row_id``"""
+        with self.db_lock:
+            return self.db.execute('SELECT id, digest, signature FROM signatures WHERE id > ? ORDER BY id LIMIT ?',
+                                   (row_id, limit)).fetchall()
+
+
+class NearDuplicates:
+    """Resumes seen so far, looked up by similarity to a new one.
+
+    Each process keeps its own index; with ``db_path`` the signatures are
+    also stored in SQLite and every process indexes the ones the others
+    added. At most ``max_entries`` signatures are indexed; later uploads are
+    still checked but no longer remembered.
+    """
+
+    def __init__(self, db_path=None, threshold=0.8, max_entries=100000):
+        self.store = SignatureStore(db_path) if db_path else None
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.signatures = array('I')
+        self.digests = bytearray()
+        self.table = KeyTable()
+        self.loaded_to = 0
+        self.lock = threading.Lock()
+        self.checks = self.matches = 0
+
+    def __len__(self):
+        return len(self.digests) // 32
+
+    def _add(self, digest, sig):
+        with self.lock:
+            document = len(self)
+            if document >= self.max_entries:
+                return
+            self.signatures.frombytes(sig.tobytes())
+            self.digests += digest
+            self.table.add(band_keys(sig) + [digest_key(digest)], document)
+
+    def sync(self):
+        """Index signatures other processes stored since the last sync"""
+        if self.store is None:
+            return
+        with self.lock:
+            if len(self) >= self.max_entries:
+                return
+            rows = self.store.since(self.loaded_to, self.max_entries - len(self))
+            for row_id, digest, sig in rows:
+                self.loaded_to = row_id
+                self.signatures.frombytes(sig)
+                self.table.add(band_keys(np.frombuffer(sig, dtype=np.uint32)) + [digest_key(digest)], len(self))
+                self.digests += digest
+
+    def _exact(self, digest):
+        for document in self.table.get([digest_key(digest)]):
+            start = int(document) * 32
+            if self.digests[start:start + 32] == digest:
+                return int(document)
+        return None
+
+    def _best(self, sig):
+        """``(document, similarity)`` of the most similar indexed signature, or None"""
+        documents = np.unique(self.table.get(band_keys(sig)))
+        if not len(documents):
+            return None
+        signatures = np.frombuffer(self.signatures, dtype=np.uint32).reshape(-1, NUM_PERM)
+        similarities = (signatures[documents] == sig).mean(axis=1)
+        del signatures
+        best = int(np.argmax(similarities))
+        return int(documents[best]), float(similarities[best])
+
+    def _match(self, document, similarity):
+        start = document * 32
+        return {'sha256': self.digests[start:start + 32].hex(), 'similarity': round(similarity, 3)}
+
+    def seen(self, hex_digest):
+        """The match for a file uploaded before, byte for byte, or None"""
+        digest = bytes.fromhex(hex_digest)
+        self.sync()
+        with self.lock:
+            document = self._exact(digest)
+            if document is None:
+                return None
+            self.checks += 1
+            self.matches += 1
+            return self._match(document, 1.0)
+
+    def check(self, hex_digest, text, remember=True):
+        """``{'sha256', 'similarity'}`` of the closest earlier upload at or above the threshold, or None.
+
+        With ``remember`` the upload is kept for later checks.
+        """
+        sig = signature(text)
+        if sig is None:
+            return None
+        digest = bytes.fromhex(hex_digest)
+        self.sync()
+        with self.lock:
+            self.checks += 1
+            if self._exact(digest) is not None:
+                self.matches += 1
+                return {'sha256': hex_digest, 'similarity': 1.0}
+            best = self._best(sig)
+            match = self._match(*best) if best and best[1] >= self.threshold else None
+            self.matches += match is not None
+
+        if not remember:
+            return match
+        if self.store is not None:
+            self.store.put(digest, sig)
+            self.sync()
+        else:
+            self._add(digest, sig)
+        return match
+
+    def stats(self):
+        with self.lock:
+            return {
+                'signatures': len(self),
+                'max_signatures': self.max_entries,
+                'checks': self.checks,
+                'matches': self.matches,
+                'bytes': len(self.signatures) * 4 + len(self.digests) + len(self.table) * 12
+            }
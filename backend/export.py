@@ -0,0 +1,215 @@
+"""Rendering resumes to files, singly or as a streamed zip archive.
+
+``render_document`` is the unit of work shared by the generate endpoints and
+bulk export. ``iter_export_zip`` renders many resumes in the process pool
+and yields the archive piece by piece as renders finish, so the first bytes
+go out long before the last resume is rendered and the whole archive never
+sits in memory.
+"""
+import importlib.util
+import io
+import json
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, wait
+from functools import lru_cache
+from concurrent.futures.process import BrokenProcessPool
+
+from werkzeug.utils import secure_filename
+
+from cache import RenderCache
+from ingest import BATCH_WINDOW_PER_WORKER, BATCH_WORKERS, get_executor, reset_executor
+from metrics import stage
+from models import as_resume
+from startup import lazy_import
+from template_specs import DEFAULT_TEMPLATE, resolve_profile
+
+FORMATS = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+}
+
+
+def render_pdf(resume_data, template, profile=None):
+    """Render a PDF resume and return its bytes; ``profile`` names an output profile"""
+    pdf_templates = lazy_import('pdf_templates')
+
+    buffer = io.BytesIO()
+    pdf_templates.EnhancedPDFGenerator.render(buffer, resume_data, template, profile=profile)
+    return buffer.getvalue()
+
+
+def render_docx(resume_data, template=DEFAULT_TEMPLATE):
+    """Render a DOCX resume and return its bytes"""
+    docx_generator = lazy_import('docx_generator')
+    return docx_generator.render(resume_data, template)
+
+
+def render_preview(resume_data, template):
+    """Render the first page of a PDF resume and return its bytes"""
+    pdf_templates = lazy_import('pdf_templates')
+
+    buffer = io.BytesIO()
+    pdf_templates.render(buffer, resume_data, template, first_page=True)
+    return buffer.getvalue()
+
+
+# Optional PDF rasterizers for thumbnails, in order of preference.
+RASTERIZERS = ('pypdfium2', 'fitz')
+
+
+class ThumbnailUnavailable(RuntimeError):
+    """No PDF rasterizer is installed"""
+
+
+@lru_cache(maxsize=1)
+def rasterizer():
+    """Module name of the first installed rasterizer, or None"""
+    return next((name for name in RASTERIZERS if importlib.util.find_spec(name)), None)
+
+
+def render_thumbnail(pdf, width):
+    """PNG of the first page of ``pdf``, ``width`` pixels wide"""
+    name = rasterizer()
+    if name is None:
+        raise ThumbnailUnavailable(f"Thumbnails need one of: {', '.join(RASTERIZERS)}")
+
+    with stage('thumbnail'):
+        if name == 'pypdfium2':
+            pdfium = lazy_import('pypdfium2')
+            document = pdfium.PdfDocument(pdf)
+            try:
+                page = document[0]
+                image = page.render(scale=width / page.get_width()).to_pil()
+            finally:
+                document.close()
+            buffer = io.BytesIO()
+            image.save(buffer, 'PNG')
+            return buffer.getvalue()
+
+        fitz = lazy_import('fitz')
+        with fitz.open(stream=pdf, filetype='pdf') as document:
+            page = document[0]
+            scale = width / page.rect.width
+            return page.get_pixmap(matrix=fitz.Matrix(scale, scale)).tobytes('png')
+
+
+def render_document(fmt, template, resume_data, profile=None):
+    if fmt == 'pdf':
+        return render_pdf(resume_data, template, profile)
+    return render_docx(resume_data, template)
+
+
+def cache_template(fmt, template, profile=None):
+    """Template part of the render cache key: template, and the output profile for PDF"""
+    return f"{template}:{resolve_profile(profile)}" if fmt == 'pdf' else template
+
+
+class ZipStream:
+    """Write-only sink for ``zipfile`` whose contents are drained as they arrive.
+
+    Without ``tell``/``seek`` zipfile writes each member's sizes in a data
+    descriptor after its data, so members can be sent as soon as they are
+    written.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def member_name(index, resume_data, fmt):
+    name = secure_filename(as_resume(resume_data).name) or 'Resume'
+    return f"{index + 1:04d}_{name}.{fmt}"
+
+
+def iter_rendered(jobs, template, cache=None, executor=None, window=None, profile=None):
+    """Render ``(index, fmt, resume_data)`` jobs in the process pool.
+
+    Yields ``(index, fmt, body, error)`` in completion order, with at most
+    ``window`` renders in flight. Cached renders are yielded without
+    touching the pool.
+    """
+    shared = executor is None
+    executor = executor or get_executor()
+    window = window or BATCH_WORKERS * BATCH_WINDOW_PER_WORKER
+    pending = {}
+    jobs = iter(jobs)
+    exhausted = False
+
+    while pending or not exhausted:
+        while not exhausted and len(pending) < window:
+            try:
+                index, fmt, resume_data = next(jobs)
+            except StopIteration:
+                exhausted = True
+                break
+            key = RenderCache.key(fmt, cache_template(fmt, template, profile), resume_data) if cache is not None else None
+            body = cache.get(key) if key else None
+            if body is not None:
+                yield index, fmt, body, None
+                continue
+            pending[executor.submit(render_document, fmt, template, resume_data, profile)] = (index, fmt, key, executor)
+
+        if not pending:
+            continue
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            index, fmt, key, pool = pending.pop(future)
+            try:
+                body = future.result()
+            except BrokenProcessPool:
+                yield index, fmt, None, 'Worker process crashed'
+                if shared:
+                    # Only the first future of a crashed pool replaces it.
+                    reset_executor(pool)
+                    executor = get_executor()
+                continue
+            except Exception as e:
+                yield index, fmt, None, str(e)
+                continue
+            if key:
+                cache.put(key, body)
+            yield index, fmt, body, None
+
+
+def iter_export_zip(resumes, formats, template, cache=None, executor=None, profile=None):
+    """Yield the bytes of a zip archive with every resume rendered in every format.
+
+    Members are stored uncompressed, since PDF and DOCX are compressed
+    already. A ``manifest.json`` listing each file, or the error that
+    prevented it, closes the archive.
+    """
+    jobs = ((index, fmt, resume_data) for index, resume_data in enumerate(resumes) for fmt in formats)
+    manifest = []
+    sink = ZipStream()
+
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for index, fmt, body, error in iter_rendered(jobs, template, cache=cache, executor=executor, profile=profile):
+            name = member_name(index, resumes[index], fmt)
+            if error:
+                manifest.append({'index': index, 'format': fmt, 'success': False, 'error': error})
+                continue
+            archive.writestr(name, body)
+            manifest.append({'index': index, 'format': fmt, 'success': True, 'file': name})
+            yield sink.drain()
+
+        manifest.sort(key=lambda entry: (entry['index'], entry['format']))
+        archive.writestr('manifest.json', json.dumps({
+            'template': template,
+            'profile': resolve_profile(profile),
+            'total': len(manifest),
+            'failed': sum(not entry['success'] for entry in manifest),
+            'files': manifest
+        }, indent=2))
+    yield sink.drain()
@@ -0,0 +1,40 @@
+"""JSON with orjson when it is installed, the standard library otherwise.
+
+Both backends write compact JSON and accept the ``models`` classes as
+objects. Their output differs (orjson writes non-ASCII characters as UTF-8,
+the standard library escapes them), so keys hashed from it (render cache
+keys) only agree within one deployment.
+"""
+import json
+
+from models import fields_dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def _default(obj):
+    if hasattr(type(obj), '__dataclass_fields__'):
+        return fields_dict(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def dumps(obj, sort_keys=False):
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default,
+                                option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)).decode()
+        except TypeError:
+            pass    # integers beyond 64 bits and the like
+    if hasattr(obj, 'to_dict'):
+        obj = obj.to_dict()     # the C encoder is much faster than a default= callback per object
+    return json.dumps(obj, default=_default, sort_keys=sort_keys, separators=(',', ':'))
+
+
+def loads(text):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
@@ -0,0 +1,37 @@
+"""gunicorn settings, overridable from the environment.
+
+Parsing and rendering are CPU-bound, so the default is one worker process
+per CPU. Each worker has a few threads for requests that mostly wait:
+long-polled render jobs and streamed batch responses.
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('GUNICORN_WORKERS', 0)) or multiprocessing.cpu_count()
+# The app reads this to share render jobs and sessions between workers.
+os.environ['GUNICORN_WORKERS'] = str(workers)
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() in ('1', 'true', 'yes')
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = 30
+keepalive = 5
+accesslog = '-'
+errorlog = '-'
+
+# Prometheus multi-process mode: every worker writes its metrics to files in
+# this directory. Files left by a previous run would be summed into the new
+# totals, so the directory is emptied before the app is loaded.
+PROMETHEUS_MULTIPROC_DIR = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+if PROMETHEUS_MULTIPROC_DIR:
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+    for name in os.listdir(PROMETHEUS_MULTIPROC_DIR):
+        if name.endswith('.db'):
+            os.remove(os.path.join(PROMETHEUS_MULTIPROC_DIR, name))
+
+
+def child_exit(server, worker):
+    if PROMETHEUS_MULTIPROC_DIR:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,247 @@
+"""Document ingestion: text extraction plus parsing, singly or in bulk.
+
+``parse_document`` is the unit of work shared by ``/api/upload``, the batch
+endpoint and the bulk CLI; ``/api/upload`` calls its two halves,
+``extract_document`` and ``parse_text``, to look at the text in between.
+``parse_many`` fans documents out to a process pool and yields results as
+they finish, keeping only a bounded window of documents in memory. In NER
+mode the pool only extracts text, and the texts are parsed here in batches
+of ``NER_BATCH_SIZE`` so that spaCy's ``nlp.pipe`` runs across documents.
+"""
+import io
+import multiprocessing
+import os
+import threading
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from docx_extract import DocxStats, extract_text
+from metrics import observe_document, stage
+from ner import NER_BATCH_SIZE, NER_PROCESSES, parse_resumes
+
+BATCH_WORKERS = int(os.environ.get('BATCH_WORKERS', 0)) or os.cpu_count() or 1
+# Documents submitted but not yet finished, per worker.
+BATCH_WINDOW_PER_WORKER = 2
+
+DOCUMENT_EXTENSIONS = ('.docx',)
+
+
+class EmptyDocumentError(ValueError):
+    """The document has no extractable text"""
+
+
+def extract_document(content):
+    """Text of one .docx given as bytes or a seekable binary file, such as a spooled upload"""
+    if isinstance(content, (bytes, bytearray)):
+        stream, size = io.BytesIO(content), len(content)
+    else:
+        stream, size = content, content.seek(0, os.SEEK_END)
+        stream.seek(0)
+    stats = DocxStats()
+    with stage('docx_extract'):
+        text = extract_text(stream, stats)
+    observe_document(size, stats)
+    if not text.strip():
+        raise EmptyDocumentError('Document appears to be empty')
+    return text
+
+
+def parse_texts(texts, ner=False, n_process=1):
+    """Parse texts from ``extract_document`` together, one result per text"""
+    with stage('parse'):
+        results, ner_applied = parse_resumes(texts, ner=ner, n_process=n_process)
+    return [{'data': data, 'raw_text': text[:500], 'ner': ner_applied} for text, data in zip(texts, results)]
+
+
+def parse_text(text, ner=False):
+    """Parse text from ``extract_document``"""
+    return parse_texts([text], ner)[0]
+
+
+def parse_document(content, ner=False):
+    """Extract and parse one .docx given as bytes"""
+    return parse_text(extract_document(content), ner)
+
+
+def cacheable(result, ner=False):
+    """Whether a ``parse_document`` result may be cached.
+
+    A NER request the model couldn't serve, or a parse that ran out of time,
+    isn't cached so it is retried later.
+    """
+    if ner and not result['ner']:
+        return False
+    partial = result['data'].get('partial')
+    return not (partial and partial['skipped'])
+
+
+def iter_zip_documents(stream, max_size):
+    """Yield ``(name, read)`` for the .docx members of a zip archive.
+
+    Members are read one at a time when ``read`` is called, so an archive of
+    any size never sits in memory. Oversized members raise on read.
+    """
+    with zipfile.ZipFile(stream) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not info.filename.lower().endswith(DOCUMENT_EXTENSIONS):
+                continue
+            if os.path.basename(info.filename).startswith(('~$', '._')):
+                continue
+
+            def read(info=info):
+                if info.file_size > max_size:
+                    raise ValueError(f'File exceeds the {max_size} byte limit')
+                return archive.read(info)
+
+            yield info.filename, read
+
+
+def error_reader(message):
+    """A ``read`` for a document that can't be read, raising ``ValueError(message)``"""
+    def read():
+        raise ValueError(message)
+    return read
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def mp_context():
+    """Start method for worker pools.
+
+    Forking a threaded web server can deadlock in the child, so workers
+    start from a clean interpreter.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def get_executor():
+    """The shared process pool, created on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=BATCH_WORKERS, mp_context=mp_context())
+        return _executor
+
+
+def reset_executor(broken=None):
+    """Drop the shared pool so the next call starts a fresh one.
+
+    With ``broken``, the pool a worker died in, the pool is dropped only if
+    it is still the shared one: a crash fails every future in flight, and
+    only the first to report it resets, leaving alone the new pool that
+    other requests may already be using. Returns whether a pool was dropped.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None or (broken is not None and _executor is not broken):
+            return False
+        executor, _executor = _executor, None
+    executor.shutdown(wait=False, cancel_futures=True)
+    return True
+
+
+def set_workers(count):
+    """Resize the shared pool; the next call starts one with ``count`` workers"""
+    global BATCH_WORKERS
+    BATCH_WORKERS = max(1, count)
+    reset_executor()
+
+
+def parse_many(documents, cache=None, ner=False, executor=None, window=None):
+    """Parse ``(name, read)`` documents in a process pool.
+
+    Yields one result dict per document in completion order: ``file``,
+    ``success`` and either the parse result or ``error``. A failing document
+    never affects the others. At most ``window`` documents are read but
+    unfinished at any time, plus up to ``NER_BATCH_SIZE`` extracted texts in
+    NER mode.
+    """
+    shared = executor is None
+    executor = executor or get_executor()
+    window = window or BATCH_WORKERS * BATCH_WINDOW_PER_WORKER
+    variant = 'ner' if ner else ''
+    pending = {}
+    extracted = []  # (name, key, text) waiting for a NER batch
+    documents = iter(documents)
+    exhausted = False
+
+    while pending or extracted or not exhausted:
+        while not exhausted and len(pending) < window:
+            try:
+                name, read = next(documents)
+            except StopIteration:
+                exhausted = True
+                break
+            try:
+                content = read()
+            except Exception as e:
+                yield {'file': name, 'success': False, 'error': str(e)}
+                continue
+
+            key = cache.key(content, variant) if cache is not None else None
+            cached = cache.get(key) if key else None
+            if cached is not None:
+                yield {'file': name, 'success': True, 'cached': True, **cached}
+                continue
+            if ner:
+                future = executor.submit(extract_document, content)
+            else:
+                future = executor.submit(parse_document, content)
+            pending[future] = (name, key, executor)
+
+        if len(extracted) >= NER_BATCH_SIZE or (extracted and exhausted and not pending):
+            yield from _parse_extracted(extracted, cache)
+            extracted = []
+            continue
+        if not pending:
+            continue
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            name, key, pool = pending.pop(future)
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                # A worker crashed; its document and everything in flight
+                # with it fail, later documents go to a new pool.
+                yield {'file': name, 'success': False, 'error': 'Worker process crashed'}
+                if shared:
+                    reset_executor(pool)
+                    executor = get_executor()
+                continue
+            except Exception as e:
+                yield {'file': name, 'success': False, 'error': str(e)}
+                continue
+            if ner:
+                extracted.append((name, key, result))
+                continue
+            if key and cacheable(result, ner):
+                cache.put(key, result)
+            yield {'file': name, 'success': True, 'cached': False, **result}
+
+
+def _parse_extracted(extracted, cache):
+    """Parse a NER batch of ``(name, key, text)`` in one pass through the model.
+
+    If the batch fails, its documents are parsed one at a time so only the
+    one at fault fails.
+    """
+    try:
+        results = parse_texts([text for _, _, text in extracted], ner=True, n_process=NER_PROCESSES)
+    except Exception:
+        results = None
+    for i, (name, key, text) in enumerate(extracted):
+        if results is not None:
+            result = results[i]
+        else:
+            try:
+                result = parse_text(text, ner=True)
+            except Exception as e:
+                yield {'file': name, 'success': False, 'error': str(e)}
+                continue
+        if key and cacheable(result, True):
+            cache.put(key, result)
+        yield {'file': name, 'success': True, 'cached': False, **result}
@@ -0,0 +1,325 @@
+"""Asynchronous render jobs.
+
+Renders submitted through ``RenderQueue`` run in a bounded process pool
+instead of the request thread. Callers get a job ID to poll (or long-poll),
+and once the number of unfinished jobs reaches the queue depth new
+submissions are refused with a suggested retry delay rather than piling up.
+
+A job is run by the worker process it was submitted to. With a ``db_path``
+its state and output are also written to a SQLite file, so a poll or a
+download that reaches another worker of the same host still finds it.
+"""
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from export import render_document
+from ingest import mp_context
+
+LATENCY_WINDOW = 1000
+# How often a long poll rereads a job run by another worker.
+POLL_INTERVAL = 0.1
+
+
+class QueueFullError(Exception):
+    """The queue is at its depth limit; ``retry_after`` is a suggested delay in seconds"""
+
+    def __init__(self, retry_after):
+        super().__init__('Render queue is full')
+        self.retry_after = retry_after
+
+
+def timed_render(fmt, template, resume_data, profile=None):
+    """Worker entry point: the rendered bytes plus when rendering started and ended"""
+    started = time.time()
+    body = render_document(fmt, template, resume_data, profile)
+    return body, started, time.time()
+
+
+class RenderJob:
+    def __init__(self, fmt, template, key, filename):
+        self.id = uuid.uuid4().hex
+        self.fmt = fmt
+        self.template = template
+        self.key = key
+        self.filename = filename
+        self.state = 'queued'
+        self.error = None
+        self.body = None
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.future = None
+        self.done = threading.Event()
+
+    @classmethod
+    def from_row(cls, row):
+        """A job read back from ``RenderQueue``'s SQLite table"""
+        job = cls.__new__(cls)
+        (job.id, job.state, job.fmt, job.template, job.key, job.filename, job.error,
+         job.body, job.submitted, job.started, job.finished) = row
+        job.future = None
+        job.done = threading.Event()
+        if job.finished is not None:
+            job.done.set()
+        return job
+
+    def as_dict(self):
+        state = self.state
+        if state == 'queued' and self.future is not None and self.future.running():
+            state = 'running'
+        job = {'id': self.id, 'state': state, 'format': self.fmt, 'template': self.template}
+        if self.error:
+            job['error'] = self.error
+        if self.finished is not None:
+            started = self.started or self.finished
+            job['latency'] = {
+                'queued_seconds': round(started - self.submitted, 4),
+                'render_seconds': round(self.finished - started, 4),
+                'total_seconds': round(self.finished - self.submitted, 4)
+            }
+        return job
+
+
+def _percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(q * len(values)))], 4)
+
+
+class RenderQueue:
+    """Bounded render job queue backed by a process pool.
+
+    At most ``depth`` jobs may be unfinished at once. Finished jobs keep
+    their output for ``ttl`` seconds, then are forgotten; past ``max_jobs``
+    retained jobs the oldest finished ones go early. Renders found in
+    ``cache`` complete at submission, and finished renders are added to it.
+    """
+
+    COLUMNS = 'id, state, format, template, key, filename, error, body, submitted, started, finished'
+
+    def __init__(self, workers=2, depth=64, ttl=600, cache=None, max_jobs=1000, db_path=None):
+        self.workers = workers
+        self.depth = depth
+        self.ttl = ttl
+        self.cache = cache
+        self.max_jobs = max(max_jobs, 1)
+        self.db_path = db_path
+        self.jobs = OrderedDict()
+        self.active = 0
+        self.submitted = 0
+        self.rejected = 0
+        self.failed = 0
+        self.evicted = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.lock = threading.Lock()
+        self.db_lock = threading.Lock()
+        self._db = None
+        self._db_pid = None
+        self._executor = None
+
+    @property
+    def db(self):
+        """SQLite connection for this process, reopened after a fork"""
+        if self._db is None or self._db_pid != os.getpid():
+            db = sqlite3.connect(self.db_path, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS render_jobs '
+                       '(id TEXT PRIMARY KEY, state TEXT NOT NULL, format TEXT NOT NULL, template TEXT NOT NULL, '
+                       'key TEXT NOT NULL, filename TEXT NOT NULL, error TEXT, body BLOB, '
+                       'submitted REAL NOT NULL, started REAL, finished REAL)')
+            db.execute('CREATE INDEX IF NOT EXISTS render_jobs_submitted ON render_jobs (submitted)')
+            db.commit()
+            self._db, self._db_pid = db, os.getpid()
+        return self._db
+
+    def _record(self, job):
+        """Write ``job`` to the shared table, dropping expired and surplus rows"""
+        if not self.db_path:
+            return
+        with self.db_lock:
+            self.db.execute(f'INSERT OR REPLACE INTO render_jobs ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                            (job.id, job.state, job.fmt, job.template, job.key, job.filename, job.error,
+                             job.body, job.submitted, job.started, job.finished))
+            self.db.execute('DELETE FROM render_jobs WHERE finished <= ?', (time.time() - self.ttl,))
+            self.db.execute('DELETE FROM render_jobs WHERE finished IS NOT NULL AND id IN '
+                            '(SELECT id FROM render_jobs ORDER BY submitted DESC LIMIT -1 OFFSET ?)',
+                            (self.max_jobs,))
+            self.db.commit()
+
+    def _load(self, job_id, body=False):
+        """A job from the shared table, with its output only if ``body``"""
+        columns = self.COLUMNS if body else self.COLUMNS.replace('body', 'NULL')
+        with self.db_lock:
+            row = self.db.execute(f'SELECT {columns} FROM render_jobs WHERE id = ? '
+                                  'AND (finished IS NULL OR finished > ?)',
+                                  (job_id, time.time() - self.ttl)).fetchone()
+        return RenderJob.from_row(row) if row else None
+
+    @property
+    def executor(self):
+        with self.lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=mp_context())
+            return self._executor
+
+    def _reset_executor(self, broken):
+        """Drop ``broken``, the pool a worker died in, if it is still the current one.
+
+        A crash fails every job in flight in that pool; only the first to
+        report it resets, leaving alone the new pool later jobs already use.
+        """
+        with self.lock:
+            if self._executor is not broken:
+                return False
+            self._executor = None
+        broken.shutdown(wait=False)
+        return True
+
+    def retry_after(self):
+        """Seconds until a slot is likely free, from recent render times"""
+        renders = [render for _, render in self.latencies]
+        average = sum(renders) / len(renders) if renders else 1.0
+        return max(1, round(average * self.active / self.workers))
+
+    def submit(self, fmt, template, resume_data, key, filename, profile=None):
+        """Queue a render and return its job; raises ``QueueFullError`` at the depth limit"""
+        job = RenderJob(fmt, template, key, filename)
+        body = self.cache.get(key) if self.cache is not None else None
+
+        with self.lock:
+            self._expire()
+            if body is None and self.active >= self.depth:
+                self.rejected += 1
+                raise QueueFullError(self.retry_after())
+            self._trim()
+            self.jobs[job.id] = job
+            self.submitted += 1
+            if body is None:
+                self.active += 1
+            else:
+                job.body, job.state = body, 'done'
+                job.finished = job.submitted
+                job.done.set()
+        self._record(job)
+        if body is not None:
+            return job
+
+        try:
+            executor = self.executor
+            future = executor.submit(timed_render, fmt, template, resume_data, profile)
+        except Exception as e:
+            self._finish(job, error=str(e))
+            return job
+        job.future = future
+        future.add_done_callback(lambda future: self._collect(job, future, executor))
+        return job
+
+    def _collect(self, job, future, executor):
+        try:
+            body, job.started, finished = future.result()
+        except BrokenProcessPool:
+            self._reset_executor(executor)
+            self._finish(job, error='Worker process crashed')
+            return
+        except Exception as e:
+            self._finish(job, error=str(e))
+            return
+        if self.cache is not None:
+            self.cache.put(job.key, body)
+        self._finish(job, body=body, finished=finished)
+
+    def _finish(self, job, body=None, error=None, finished=None):
+        with self.lock:
+            job.finished = finished or time.time()
+            if error is None:
+                job.body, job.state = body, 'done'
+                started = job.started or job.finished
+                self.latencies.append((job.finished - job.submitted, job.finished - started))
+            else:
+                job.error, job.state = error, 'failed'
+                self.failed += 1
+            self.active -= 1
+        self._record(job)
+        job.done.set()
+
+    def _expire(self):
+        cutoff = time.time() - self.ttl
+        expired = []
+        # Jobs are in submission order and finish after they are submitted,
+        # so nothing past the first job submitted after the cutoff is expired.
+        for job_id, job in self.jobs.items():
+            if job.submitted > cutoff:
+                break
+            if job.finished is not None and job.finished <= cutoff:
+                expired.append(job_id)
+        for job_id in expired:
+            del self.jobs[job_id]
+
+    def _trim(self):
+        """Forget the oldest finished jobs until there is room for one more.
+
+        Cache hits finish at submission and aren't bounded by ``depth``, so
+        without this nothing would bound the jobs retained within ``ttl``.
+        """
+        excess = len(self.jobs) - self.max_jobs + 1
+        if excess <= 0:
+            return
+        finished = (job_id for job_id, job in self.jobs.items() if job.finished is not None)
+        for job_id in list(islice(finished, excess)):
+            del self.jobs[job_id]
+            self.evicted += 1
+
+    def get(self, job_id, wait=0, body=False):
+        """The job with ``job_id`` or None, waiting up to ``wait`` seconds for it to finish.
+
+        A job submitted to another worker is read from the shared table, and
+        polled there while waiting; its output is read only if ``body``.
+        """
+        with self.lock:
+            self._expire()
+            job = self.jobs.get(job_id)
+        if job is not None:
+            if wait > 0:
+                job.done.wait(wait)
+            return job
+        if not self.db_path:
+            return None
+        deadline = time.monotonic() + wait
+        job = self._load(job_id, body)
+        while job is not None and job.finished is None and time.monotonic() < deadline:
+            time.sleep(min(POLL_INTERVAL, max(deadline - time.monotonic(), 0)))
+            job = self._load(job_id, body)
+        return job
+
+    def stats(self):
+        with self.lock:
+            totals = [total for total, _ in self.latencies]
+            renders = [render for _, render in self.latencies]
+            return {
+                'workers': self.workers,
+                'depth': self.depth,
+                'active': self.active,
+                'retained': len(self.jobs),
+                'max_jobs': self.max_jobs,
+                'evicted': self.evicted,
+                'shared_db': self.db_path,
+                'submitted': self.submitted,
+                'rejected': self.rejected,
+                'failed': self.failed,
+                'latency': {
+                    'samples': len(totals),
+                    'total_p50': _percentile(totals, 0.5),
+                    'total_p95': _percentile(totals, 0.95),
+                    'total_p99': _percentile(totals, 0.99),
+                    'render_p50': _percentile(renders, 0.5),
+                    'render_p95': _percentile(renders, 0.95)
+                }
+            }
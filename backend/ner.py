@@ -0,0 +1,140 @@
+"""Opt-in spaCy NER extraction for names, organizations, locations and dates.
+
+The regex parser guesses the name from the first line and the location from
+capitalization patterns. In NER mode the spaCy model reads the parts of the
+resume where those entities live (the header lines and the experience and
+education sections, never the whole document) and its entities override or
+fill in the regex results. Documents are batched through ``nlp.pipe``, so
+parsing many resumes together amortizes model overhead and can use several
+processes.
+"""
+import os
+
+import nlp_model
+from metrics import stage
+from resume_parser import (EDUCATION_KEYWORDS, EXPERIENCE_END_KEYWORDS, EXPERIENCE_KEYWORDS,
+                           EnhancedResumeParser)
+
+PARSER_NER = os.environ.get('PARSER_NER', 'false').lower() in ('1', 'true', 'yes')
+NER_BATCH_SIZE = int(os.environ.get('NER_BATCH_SIZE', 32))
+NER_PROCESSES = int(os.environ.get('NER_PROCESSES', 1))
+
+HEADER_LINES = 4
+SECTION_CHARS = 3000
+
+ORG_LABELS = {'ORG'}
+INSTITUTION_LABELS = {'ORG', 'FAC'}
+LOCATION_LABELS = {'GPE', 'LOC'}
+
+
+def ner_segments(parser):
+    """``(segment, text)`` pairs of a parsed document worth running NER on"""
+    text = parser.text
+    segments = [('header', '\n'.join(parser.lines[:HEADER_LINES]))]
+
+    span = parser.index.span(EXPERIENCE_KEYWORDS, EXPERIENCE_END_KEYWORDS)
+    if span:
+        start, end = span
+        segments.append(('experience', text[start:min(end, start + SECTION_CHARS)]))
+
+    start = parser.index.first(EDUCATION_KEYWORDS)
+    if start != -1:
+        segments.append(('education', text[start:start + 600]))
+
+    return [(segment, value) for segment, value in segments if value.strip()]
+
+
+def _empty_entities():
+    return {'name': '', 'location': '', 'companies': [], 'institutions': [], 'dates': []}
+
+
+def _add(values, value):
+    if value not in values:
+        values.append(value)
+
+
+class NERExtractor:
+    """Runs the spaCy pipeline over the relevant segments of many documents"""
+
+    def __init__(self, nlp, batch_size=NER_BATCH_SIZE, n_process=NER_PROCESSES):
+        self.nlp = nlp
+        self.batch_size = batch_size
+        self.n_process = n_process
+
+    def extract_many(self, parsers):
+        """One entity dict per parser, in order"""
+        results = [_empty_entities() for _ in parsers]
+        items = ((text, (i, segment))
+                 for i, parser in enumerate(parsers)
+                 for segment, text in ner_segments(parser))
+
+        for doc, (i, segment) in self.nlp.pipe(items, as_tuples=True, batch_size=self.batch_size,
+                                               n_process=self.n_process):
+            entities = results[i]
+            for ent in doc.ents:
+                value = ent.text.strip()
+                if not value:
+                    continue
+                label = ent.label_
+                if segment == 'header':
+                    if label == 'PERSON' and not entities['name']:
+                        entities['name'] = value
+                    elif label in LOCATION_LABELS and not entities['location']:
+                        entities['location'] = value
+                elif label == 'DATE':
+                    _add(entities['dates'], value)
+                elif segment == 'experience' and label in ORG_LABELS:
+                    _add(entities['companies'], value)
+                elif segment == 'education' and label in INSTITUTION_LABELS:
+                    _add(entities['institutions'], value)
+        return results
+
+    def extract(self, parser):
+        return self.extract_many([parser])[0]
+
+
+def apply_entities(data, entities):
+    """Merge NER results into parsed data, preferring entities over regex guesses.
+
+    Placeholder companies ("Company 2") and institutions ("University") are
+    filled in order from the organizations found in their sections.
+    """
+    if entities['name']:
+        data['name'] = entities['name']
+    if entities['location']:
+        data['location'] = entities['location']
+
+    companies = iter(entities['companies'])
+    for i, exp in enumerate(data.get('experience', [])):
+        if exp.get('company') == f"Company {i+1}":
+            exp['company'] = next(companies, exp['company'])
+
+    institutions = iter(entities['institutions'])
+    for edu in data.get('education', []):
+        if edu.get('institution') == 'University':
+            edu['institution'] = next(institutions, edu['institution'])
+
+    data['entities'] = entities
+    return data
+
+
+def parse_resumes(texts, ner=PARSER_NER, batch_size=NER_BATCH_SIZE, n_process=NER_PROCESSES):
+    """Parse many resume texts, optionally with NER.
+
+    Falls back to the regex-only results when the spaCy model is unavailable.
+    Returns ``(results, ner_applied)``.
+    """
+    parsers = [EnhancedResumeParser(text) for text in texts]
+    results = [parser.parse() for parser in parsers]
+
+    nlp = nlp_model.get_nlp() if ner else None
+    if nlp is None:
+        return results, False
+
+    extractor = NERExtractor(nlp, batch_size=batch_size, n_process=n_process)
+    with stage('ner'):
+        entities_list = extractor.extract_many(parsers)
+    for parser, data, entities in zip(parsers, results, entities_list):
+        apply_entities(data, entities)
+        data['score'] = parser.calculate_score(data)
+    return results, True
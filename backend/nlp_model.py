@@ -0,0 +1,51 @@
+"""Lazily loaded spaCy pipeline.
+
+The model costs seconds of import time and a few hundred MB of RSS, so it
+is loaded on first use rather than at startup, with the pipeline components
+nothing here uses excluded.
+"""
+import logging
+import os
+import threading
+
+from startup import lazy_import
+
+SPACY_MODEL = os.environ.get('SPACY_MODEL', 'en_core_web_sm')
+# Only the entity recognizer is used; its tok2vec is kept for models whose
+# ner listens to a shared one.
+SPACY_EXCLUDE = [name for name in os.environ.get(
+    'SPACY_EXCLUDE', 'tagger,parser,attribute_ruler,lemmatizer,senter').split(',') if name]
+SPACY_ENABLED = os.environ.get('SPACY_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+
+# request_log's logger, looked up by name so parse workers needn't import Flask.
+logger = logging.getLogger('resume_api')
+
+_nlp = None
+_error = None
+_lock = threading.Lock()
+
+
+def get_nlp():
+    """The spaCy pipeline, loading it on first call. None if unavailable."""
+    global _nlp, _error
+    if _nlp is not None or _error is not None or not SPACY_ENABLED:
+        return _nlp
+    with _lock:
+        if _nlp is None and _error is None:
+            try:
+                spacy = lazy_import('spacy')
+                _nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+                logger.info('spaCy model %s loaded (%s)', SPACY_MODEL, ', '.join(_nlp.pipe_names))
+            except Exception as e:
+                logger.warning('spaCy model %s not loaded: %s', SPACY_MODEL, e)
+                _error = str(e)
+    return _nlp
+
+
+def status():
+    """Load state without triggering a load"""
+    if _nlp is not None:
+        return 'loaded'
+    if _error is not None:
+        return 'unavailable'
+    return 'not loaded' if SPACY_ENABLED else 'disabled'
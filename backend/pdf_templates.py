@@ -0,0 +1,223 @@
+"""PDF resume rendering.
+
+Templates are plain data (see ``template_specs``). A template is compiled
+into ReportLab style objects the first time it is used and then shared by
+every render, and a single story builder lays out all of them.
+"""
+from functools import lru_cache
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
+from reportlab.lib.pagesizes import A4, letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfdoc import PDFBase85Encode, PDFStream, PDFZCompress
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+from metrics import stage
+from models import as_resume
+from template_specs import DEFAULT_TEMPLATE, PDF_PROFILES, TEMPLATES, resolve_profile, resolve_template
+
+PAGE_SIZES = {'letter': letter, 'A4': A4}
+ALIGNMENTS = {'left': TA_LEFT, 'center': TA_CENTER, 'right': TA_RIGHT, 'justify': TA_JUSTIFY}
+
+
+class BinaryStreamCanvas(Canvas):
+    """A canvas that writes compressed page streams as binary.
+
+    ReportLab picks binary or ASCII85 from the process-wide
+    ``rl_config.useA85``; this canvas sets each page's stream itself, so
+    the choice belongs to the document's output profile instead.
+    """
+
+    ascii85 = False
+
+    def showPage(self):
+        super().showPage()
+        page = self._doc.Pages.pages[-1]
+        stream = PDFStream(content=page.stream)
+        if page.compression:
+            stream.filters = [PDFBase85Encode, PDFZCompress] if self.ascii85 else [PDFZCompress]
+        stream.__Comment__ = 'page stream'
+        page.Contents = stream
+
+
+class ASCII85StreamCanvas(BinaryStreamCanvas):
+    """Compressed page streams in ASCII85, keeping the file 7-bit clean"""
+
+    ascii85 = True
+
+
+class CompiledTemplate:
+    """A template spec resolved into ReportLab objects, shared across renders"""
+
+    def __init__(self, name, spec):
+        sample = _sample_styles()
+        self.name = name
+        self.pagesize = PAGE_SIZES[spec.get('pagesize', 'letter')]
+        self.margins = dict(spec['margins'])
+        self.contact_fields = tuple(spec['contact_fields'])
+        self.sections = tuple((section, heading, space * inch) for section, heading, space in spec['sections'])
+
+        self.styles = {'body': sample['Normal']}
+        for role, style in spec['styles'].items():
+            if isinstance(style, str):
+                self.styles[role] = sample[style]
+                continue
+            options = dict(style)
+            parent = sample[options.pop('parent', 'Normal')]
+            if 'textColor' in options:
+                options['textColor'] = colors.HexColor(options['textColor'])
+            if 'alignment' in options:
+                options['alignment'] = ALIGNMENTS[options['alignment']]
+            self.styles[role] = ParagraphStyle(f'{name}-{role}', parent=parent, **options)
+
+
+@lru_cache(maxsize=1)
+def _sample_styles():
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=None)
+def compile_template(name):
+    """Compiled template ``name``, falling back to the default template"""
+    name = resolve_template(name)
+    return CompiledTemplate(name, TEMPLATES[name])
+
+
+def register_template(name, spec):
+    """Add or replace a template at runtime"""
+    TEMPLATES[name] = spec
+    compile_template.cache_clear()
+
+
+def iter_story(template, data):
+    """Flowables for ``data`` (a Resume, or a dict validated into one) laid out by a compiled template"""
+    resume = as_resume(data)
+    styles = template.styles
+    body = styles['body']
+    yield Paragraph(resume.name, styles['title'])
+
+    contact_parts = [value for value in (getattr(resume, field, '') for field in template.contact_fields) if value]
+    if contact_parts:
+        yield Paragraph(' | '.join(contact_parts), styles['contact'])
+
+    yield Spacer(1, 0.1*inch)
+
+    for section, heading, space_after in template.sections:
+        if not getattr(resume, section, None):
+            continue
+        yield Paragraph(heading, styles['heading'])
+
+        if section == 'summary':
+            yield Paragraph(resume.summary, body)
+        elif section == 'skills':
+            yield Paragraph(' • '.join(resume.skills), body)
+        elif section == 'experience':
+            for exp in resume.experience:
+                yield Paragraph(exp.title, styles['job'])
+                yield Paragraph(f"{exp.company} | {exp.period}", styles['company'])
+                yield Paragraph(exp.description, body)
+                yield Spacer(1, 0.12*inch)
+        elif section == 'education':
+            for edu in resume.education:
+                yield Paragraph(edu.degree, styles['degree'])
+                yield Paragraph(f"{edu.institution} | {edu.year}", styles['institution'])
+                yield Spacer(1, 0.12*inch)
+
+        if space_after:
+            yield Spacer(1, space_after)
+
+
+def build_story(template, data):
+    """Flowables for ``data`` laid out by a compiled template"""
+    return list(iter_story(template, data))
+
+
+def first_page_story(template, data, height):
+    """The flowables of ``build_story`` up to one that certainly ends past the first page.
+
+    Each paragraph takes at least one line and its space after (space
+    before may collapse), so once those lower bounds exceed the frame
+    ``height`` the page is full; later flowables are never built.
+    """
+    story = []
+    used = 0
+    for flowable in iter_story(template, data):
+        story.append(flowable)
+        if isinstance(flowable, Spacer):
+            used += flowable.height
+        else:
+            used += flowable.style.leading + flowable.getSpaceAfter()
+        if used > height:
+            break
+    return story
+
+
+class FirstPageDocTemplate(SimpleDocTemplate):
+    """Lays out the first page only; the rest of the story is dropped once it is full"""
+
+    def build(self, flowables, **kwargs):
+        self._story = flowables
+        super().build(flowables, **kwargs)
+
+    def afterPage(self):
+        # ReportLab's build loop works on this very list, so emptying it ends
+        # the layout; the page break left hanging is discarded without
+        # starting a second page.
+        del self._story[:]
+
+
+@lru_cache(maxsize=None)
+def profile_options(profile):
+    """``SimpleDocTemplate`` keyword arguments for an output profile"""
+    options = dict(PDF_PROFILES[resolve_profile(profile)])
+    options.pop('ascii85', None)
+    if options.pop('minimal_metadata', False):
+        options.update(title='', author='', subject='', creator='', producer='')
+    return options
+
+
+def profile_canvas(profile):
+    """The canvas class ``build`` uses for an output profile"""
+    if PDF_PROFILES[resolve_profile(profile)].get('ascii85'):
+        return ASCII85StreamCanvas
+    return BinaryStreamCanvas
+
+
+def render(buffer, data, template=DEFAULT_TEMPLATE, first_page=False, profile=None):
+    """Render ``data`` as a PDF into ``buffer`` using a registered template.
+
+    ``profile`` names an output profile (see ``PDF_PROFILES``). With
+    ``first_page`` only the first page is laid out, for previews.
+    """
+    compiled = compile_template(template)
+    doc_class = FirstPageDocTemplate if first_page else SimpleDocTemplate
+    doc = doc_class(buffer, pagesize=compiled.pagesize, **compiled.margins, **profile_options(profile))
+    with stage('pdf_story'):
+        story = first_page_story(compiled, data, doc.height) if first_page else build_story(compiled, data)
+    with stage('pdf_preview' if first_page else 'pdf_build'):
+        doc.build(story, canvasmaker=profile_canvas(profile))
+    return buffer
+
+
+class EnhancedPDFGenerator:
+    """Enhanced PDF generator with new templates"""
+
+    render = staticmethod(render)
+
+    @staticmethod
+    def create_modern_template(buffer, data):
+        """Modern template with blue accent"""
+        return render(buffer, data, 'modern')
+
+    @staticmethod
+    def create_professional_template(buffer, data):
+        """Professional centered template"""
+        return render(buffer, data, 'professional')
+
+    @staticmethod
+    def create_creative_template(buffer, data):
+        """Creative template with colorful design"""
+        return render(buffer, data, 'creative')
@@ -0,0 +1,90 @@
+"""Request IDs and structured logging.
+
+Every request gets an ID (the caller's ``X-Request-ID`` if it sends a sane
+one), echoed in the response and attached to every log record written while
+the request is handled. ``LOG_FORMAT=json`` (the default) writes one JSON
+object per line; ``text`` is friendlier on a terminal.
+"""
+import json
+import logging
+import os
+import re
+import sys
+import time
+import uuid
+
+from flask import g, has_request_context, request
+
+import metrics
+
+LOG_FORMAT = os.environ.get('LOG_FORMAT', 'json')
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+
+_REQUEST_ID = re.compile(r'^[A-Za-z0-9._-]{1,128}$')
+_RECORD_FIELDS = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime'}
+
+logger = logging.getLogger('resume_api')
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record):
+        if not hasattr(record, 'request_id'):
+            record.request_id = g.get('request_id') if has_request_context() else None
+        return True
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record, including any ``extra`` fields"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S') + f'.{int(record.msecs):03d}',
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in _RECORD_FIELDS)
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging():
+    handler = logging.StreamHandler(sys.stdout)
+    handler.addFilter(RequestIdFilter())
+    if LOG_FORMAT == 'json':
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s [%(request_id)s] %(message)s'))
+    logger.handlers[:] = [handler]
+    logger.setLevel(LOG_LEVEL)
+    logger.propagate = False
+
+
+def init_app(app):
+    """Assign request IDs, log each request and record request metrics"""
+
+    @app.before_request
+    def start_request():
+        incoming = request.headers.get('X-Request-ID', '')
+        g.request_id = incoming if _REQUEST_ID.match(incoming) else uuid.uuid4().hex
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def finish_request(response):
+        # For streamed responses this is the time to the first byte.
+        elapsed = time.perf_counter() - g.get('request_start', time.perf_counter())
+        endpoint = request.endpoint or 'unmatched'
+        metrics.REQUEST_SECONDS.labels(request.method, endpoint).observe(elapsed)
+        metrics.REQUESTS.labels(request.method, endpoint, str(response.status_code)).inc()
+
+        response.headers['X-Request-ID'] = g.get('request_id', '')
+        if endpoint != 'api.prometheus_metrics':
+            logger.info('request', extra={
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'duration_ms': round(elapsed * 1000, 2),
+                'bytes_in': request.content_length or 0,
+            })
+        return response
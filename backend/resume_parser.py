@@ -0,0 +1,402 @@
+import copy
+import os
+import re
+import time
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+from metrics import PARTIAL_PARSES, timed
+from skill_matcher import load_matcher, trie_pattern
+
+# Skill dictionary, compiled once. SKILLS_FILE points at an external
+# taxonomy (one skill per line, aliases separated by '|').
+SKILL_MATCHER = load_matcher(os.environ.get('SKILLS_FILE'))
+
+# Bump whenever a change alters parse() output, so cached results from the
+# previous parser are not served. The skill dictionary is part of it too.
+PARSER_VERSION = f"2.3-{SKILL_MATCHER.fingerprint}"
+
+# Longer text is no resume; only this much of it is parsed.
+MAX_PARSE_CHARS = int(os.environ.get('MAX_PARSE_CHARS', 500_000))
+# Extractors that haven't started once a parse has taken this many seconds
+# are skipped and their fields get fallback values. 0 disables the budget.
+# It is checked between extractors only: one already running finishes, so a
+# parse can overrun by one extractor's time, which the bounded patterns keep
+# to milliseconds.
+PARSE_TIME_BUDGET = float(os.environ.get('PARSE_TIME_BUDGET', 1.0))
+
+PARSE_FIELDS = ['name', 'email', 'phone', 'linkedin', 'location', 'summary', 'skills', 'experience', 'education']
+FALLBACKS = {
+    'name': 'Your Name',
+    'email': '',
+    'phone': '',
+    'linkedin': '',
+    'location': '',
+    'summary': 'Experienced professional with strong technical skills and a proven track record of delivering high-quality results.',
+    'skills': ["Communication", "Problem Solving", "Teamwork", "Leadership"],
+    'experience': [
+        {
+            'title': 'Software Developer',
+            'company': 'Tech Company',
+            'period': '2020 - Present',
+            'description': 'Developed and maintained web applications using modern technologies'
+        }
+    ],
+    'education': [{
+        'degree': 'Bachelor of Science in Computer Science',
+        'institution': 'University',
+        'year': '2020'
+    }],
+}
+
+# Completeness score: points a field earns when its check passes. Scores are
+# kept per field so an edit only rescores the fields it touches.
+SCORE_RULES = {
+    'name': (10, lambda value: value != 'Your Name'),
+    'email': (15, lambda value: True),
+    'phone': (10, lambda value: True),
+    'summary': (15, lambda value: len(value) > 50),
+    'skills': (20, lambda value: len(value) >= 5),
+    'experience': (20, lambda value: len(value) >= 1),
+    'education': (10, lambda value: len(value) >= 1),
+}
+MAX_SCORE = 100
+
+
+def field_score(field, value):
+    """Points ``value`` earns for ``field``; 0 for fields that don't score"""
+    if field not in SCORE_RULES or not value:
+        return 0
+    points, check = SCORE_RULES[field]
+    try:
+        return points if check(value) else 0
+    except TypeError:
+        return 0
+
+
+def score_parts(data):
+    return {field: field_score(field, data.get(field)) for field in SCORE_RULES}
+
+
+def total_score(parts):
+    return min(sum(parts.values()), MAX_SCORE)
+
+
+def fallback(field):
+    return copy.deepcopy(FALLBACKS[field])
+
+
+# Every pattern run over the whole document must stay linear in its length.
+# An unbounded repeat that can start anywhere inside the run it consumes (a
+# letter, whitespace or address-character run) rescans that run from every
+# position, which is quadratic on hostile input. Such repeats are anchored
+# to the start of their run by a lookbehind, which can't change the leftmost
+# match, or searched only near a required character.
+EMAIL_LOCAL_MAX = 64
+EMAIL_DOMAIN_MAX = 320
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Z|a-z]{2,63}\b')
+PHONE_PATTERNS = [
+    re.compile(r'\+?1?(?<!\s)\s*\(?(\d{3})\)?[\s.-]?(\d{3})[\s.-]?(\d{4})'),
+    re.compile(r'\+?\d{1,3}[\s.-]?\(?\d{2,4}\)?[\s.-]?\d{3,4}[\s.-]?\d{4}'),
+    re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+]
+# A month name may only start where a word starts; from inside a word it
+# would end at the same place anyway.
+DATE_RANGE_PATTERN = re.compile(r'(\d{4}|(?<![A-Z])[A-Z][a-z]+\s+\d{4})\s*[-–—]\s*(\d{4}|Present|Current|Now)',
+                                re.IGNORECASE)
+
+SKILLS_KEYWORDS = ['skills', 'technical skills', 'competencies', 'expertise', 'technologies', 'tools']
+EXPERIENCE_KEYWORDS = ['experience', 'work experience', 'employment', 'work history', 'professional experience']
+EXPERIENCE_END_KEYWORDS = ['education', 'skills', 'projects', 'certifications']
+EDUCATION_KEYWORDS = ['education', 'academic', 'qualification', 'degree']
+SUMMARY_KEYWORDS = ['summary', 'objective', 'profile', 'about', 'professional summary', 'overview']
+
+SECTION_KEYWORDS = list(dict.fromkeys(
+    SKILLS_KEYWORDS + EXPERIENCE_KEYWORDS + EXPERIENCE_END_KEYWORDS + EDUCATION_KEYWORDS + SUMMARY_KEYWORDS
+))
+
+
+class SectionIndex:
+    """Heading positions, line offsets and section spans for one document.
+
+    Built in a single pass over the lowercased text. Every occurrence of
+    every section keyword is recorded, so extractors answer "first
+    ``keyword`` after ``pos``" with a binary search instead of rescanning.
+    """
+
+    _pattern = re.compile(trie_pattern(SECTION_KEYWORDS))
+    # Matches don't overlap, so a keyword contained in a longer one (e.g.
+    # "skills" in "technical skills") is filled in from this table of
+    # (keyword, offset) pairs.
+    _contained = {kw: [(other, off) for other in SECTION_KEYWORDS if other != kw
+                       for off in range(len(kw) - len(other) + 1) if kw.startswith(other, off)]
+                  for kw in SECTION_KEYWORDS}
+
+    def __init__(self, text):
+        self.truncated = len(text) > MAX_PARSE_CHARS
+        if self.truncated:
+            text = text[:MAX_PARSE_CHARS]
+        self.text = text
+        self.lower = text.lower()
+        self.positions = {kw: [] for kw in SECTION_KEYWORDS}
+        for match in self._pattern.finditer(self.lower):
+            keyword = match.group(0)
+            start = match.start()
+            self.positions[keyword].append(start)
+            for other, offset in self._contained[keyword]:
+                self.positions[other].append(start + offset)
+        for positions in self.positions.values():
+            positions.sort()
+
+        self.line_starts = [0]
+        self.line_starts.extend(match.end() for match in re.finditer('\n', text))
+
+    def find(self, keyword, start=0):
+        """Offset of the first ``keyword`` at or after ``start``, or -1."""
+        positions = self.positions[keyword]
+        i = bisect_left(positions, start)
+        return positions[i] if i < len(positions) else -1
+
+    def first(self, keywords):
+        """Offset of the first keyword in ``keywords`` (in priority order) that occurs, or -1."""
+        for keyword in keywords:
+            positions = self.positions[keyword]
+            if positions:
+                return positions[0]
+        return -1
+
+    def span(self, start_keywords, end_keywords, min_length=50):
+        """``(start, end)`` of the section headed by ``start_keywords``, or None.
+
+        The section runs until the nearest ``end_keywords`` occurrence at least
+        ``min_length`` characters after its start, or to the end of the text.
+        """
+        start = self.first(start_keywords)
+        if start == -1:
+            return None
+        end = len(self.text)
+        for keyword in end_keywords:
+            idx = self.find(keyword, start + min_length)
+            if idx != -1 and idx < end:
+                end = idx
+        return start, end
+
+    def line_of(self, pos):
+        """Index of the line containing offset ``pos``."""
+        return bisect_right(self.line_starts, pos) - 1
+
+    def line(self, i, lo=0, hi=None):
+        """Text of line ``i`` clipped to the ``[lo, hi)`` range of the document."""
+        start = max(self.line_starts[i], lo)
+        end = self.line_starts[i + 1] - 1 if i + 1 < len(self.line_starts) else len(self.text)
+        if hi is not None:
+            end = min(end, hi)
+        return self.text[start:end]
+
+
+class EnhancedResumeParser:
+    """Enhanced resume parser with improved accuracy"""
+
+    def __init__(self, text):
+        self.truncated = len(text) > MAX_PARSE_CHARS
+        if self.truncated:
+            text = text[:MAX_PARSE_CHARS]
+        self.text = text
+        self.lines = [line.strip() for line in text.split('\n') if line.strip()]
+        self.index = SectionIndex(text)
+
+    @timed('extract_email')
+    def extract_email(self):
+        # Only the text around each '@' is searched, so runs of address
+        # characters are never rescanned from every position. An address
+        # holds a single '@', so the window stops at its neighbours.
+        text = self.text
+        previous = -1
+        at = text.find('@')
+        while at != -1:
+            following = text.find('@', at + 1)
+            end = at + EMAIL_DOMAIN_MAX + 2
+            if following != -1:
+                end = min(end, following)
+            match = EMAIL_PATTERN.search(text, max(previous + 1, at - EMAIL_LOCAL_MAX), end)
+            if match:
+                return match.group(0)
+            previous, at = at, following
+        return ""
+
+    @timed('extract_phone')
+    def extract_phone(self):
+        for pattern in PHONE_PATTERNS:
+            match = pattern.search(self.text)
+            if match:
+                return match.group(0)
+        return ""
+
+    @timed('extract_name')
+    def extract_name(self):
+        if self.lines:
+            first_line = self.lines[0]
+            first_line = re.sub(r'^(Resume|CV|Curriculum Vitae)[\s:]*', '', first_line, flags=re.IGNORECASE)
+            if first_line and len(first_line.split()) <= 5 and first_line[0].isupper():
+                return first_line
+        return fallback('name')
+
+    @timed('extract_linkedin')
+    def extract_linkedin(self):
+        """Extract LinkedIn profile URL"""
+        linkedin_pattern = r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+'
+        match = re.search(linkedin_pattern, self.text, re.IGNORECASE)
+        return match.group(0) if match else ""
+
+    @timed('extract_location')
+    def extract_location(self):
+        location_patterns = [
+            r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b',
+            r'\b[A-Z][a-z]+,\s*[A-Z][a-z]+\b'
+        ]
+        for pattern in location_patterns:
+            match = re.search(pattern, self.text)
+            if match:
+                return match.group(0)
+        return ""
+
+    @timed('extract_skills')
+    def extract_skills(self):
+        skills = []
+        idx = self.index.first(SKILLS_KEYWORDS)
+        if idx != -1:
+            skills = SKILL_MATCHER.find(self.text, idx, idx + 600)
+
+        if not skills:
+            # Nothing in the skills window, so only the text around it is
+            # left to scan; together that is a single pass over the document.
+            if idx == -1:
+                found = SKILL_MATCHER.find(self.text, max_rank=20)
+            else:
+                found = set(SKILL_MATCHER.find(self.text, 0, idx, max_rank=20))
+                found.update(SKILL_MATCHER.find(self.text, idx + 600, max_rank=20))
+            skills = SKILL_MATCHER.ordered(found)
+
+        skills = skills[:15]
+        return skills if skills else fallback('skills')
+
+    @timed('extract_experience')
+    def extract_experience(self):
+        experience = []
+        span = self.index.span(EXPERIENCE_KEYWORDS, EXPERIENCE_END_KEYWORDS)
+
+        if span:
+            exp_start_idx, exp_end_idx = span
+            matches = DATE_RANGE_PATTERN.finditer(self.text, exp_start_idx, exp_end_idx)
+            dates = [match.groups() for match in islice(matches, 4)]
+            first_line = self.index.line_of(exp_start_idx)
+
+            for i, date in enumerate(dates):
+                title = f"Position {i+1}"
+                company = f"Company {i+1}"
+
+                # The first section line containing the start date, and the
+                # two lines above it (never reaching above the section heading).
+                pos = self.text.find(date[0], exp_start_idx, exp_end_idx)
+                if pos != -1 and '\n' not in date[0]:
+                    line = self.index.line_of(pos)
+                    if line - 1 >= first_line:
+                        title = self.index.line(line - 1, exp_start_idx, exp_end_idx).strip()
+                    if line - 2 >= first_line:
+                        company = self.index.line(line - 2, exp_start_idx, exp_end_idx).strip()
+
+                experience.append({
+                    'title': title[:100],
+                    'company': company[:100],
+                    'period': f"{date[0]} - {date[1]}",
+                    'description': 'Responsible for key tasks and deliverables in the role'
+                })
+
+        if not experience:
+            experience = fallback('experience')
+
+        return experience[:4]
+
+    @timed('extract_education')
+    def extract_education(self):
+        education = []
+        edu_start_idx = self.index.first(EDUCATION_KEYWORDS)
+
+        if edu_start_idx != -1:
+            edu_section = self.text[edu_start_idx:edu_start_idx+600]
+
+            # Repeats are bounded so a run of name-like characters without an
+            # institution keyword costs a bounded scan from each start.
+            degree_patterns = [
+                r'(Bachelor|Master|PhD|Doctorate|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|B\.?Tech|M\.?Tech|MBA|BBA|BCA|MCA)[\s\w\.,\(\)]{0,120}',
+                r'(Diploma|Certificate|Associate)[\s\w]{0,120}'
+            ]
+
+            degrees = []
+            for pattern in degree_patterns:
+                matches = re.findall(pattern, edu_section, re.IGNORECASE)
+                degrees.extend(matches)
+
+            year_pattern = r'\b(19|20)\d{2}\b'
+            years = re.findall(year_pattern, edu_section)
+
+            institution_pattern = r'(?:at |from |,\s{0,20})([A-Z][A-Za-z\s&,\.]{1,120}(?:University|College|Institute|School|Academy))'
+            institutions = re.findall(institution_pattern, edu_section, re.IGNORECASE)
+
+            for i in range(min(len(degrees), 3)):
+                education.append({
+                    'degree': degrees[i].strip(),
+                    'institution': institutions[i].strip() if i < len(institutions) else 'University',
+                    'year': years[i] if i < len(years) else '2020'
+                })
+
+        if not education:
+            education = fallback('education')
+
+        return education
+
+    @timed('extract_summary')
+    def extract_summary(self):
+        for keyword in SUMMARY_KEYWORDS:
+            idx = self.index.find(keyword)
+            if idx != -1:
+                summary_start = idx + len(keyword)
+                summary_section = self.text[summary_start:summary_start+500]
+                sentences = re.split(r'[.!?]\s+', summary_section)
+                valid_sentences = [s.strip() for s in sentences if len(s.split()) > 5]
+                if valid_sentences:
+                    summary = '. '.join(valid_sentences[:3]) + '.'
+                    return summary[:400]
+
+        return fallback('summary')
+
+    @timed('score')
+    def calculate_score(self, data):
+        """Calculate resume completeness score"""
+        return total_score(score_parts(data))
+
+    def parse(self, budget=None):
+        """Extract every field and score the result.
+
+        Fields are extracted in order until ``budget`` seconds (default
+        ``PARSE_TIME_BUDGET``) have passed; the remaining ones get their
+        fallback values. The budget is checked before each extractor, not
+        inside one. A result that skipped fields or was parsed from
+        truncated text carries ``partial`` with the details.
+        """
+        budget = PARSE_TIME_BUDGET if budget is None else budget
+        deadline = time.perf_counter() + budget if budget else None
+        data = {}
+        skipped = []
+        for field in PARSE_FIELDS:
+            if deadline is not None and time.perf_counter() > deadline:
+                data[field] = fallback(field)
+                skipped.append(field)
+            else:
+                data[field] = getattr(self, f'extract_{field}')()
+
+        data['score'] = self.calculate_score(data)
+        if skipped or self.truncated:
+            data['partial'] = {'truncated': self.truncated, 'skipped': skipped}
+            PARTIAL_PARSES.labels('budget' if skipped else 'truncated').inc()
+        return data
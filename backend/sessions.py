@@ -0,0 +1,404 @@
+"""Server-side resume sessions edited with JSON Patch.
+
+``/api/upload`` opens a session holding the parsed resume. Clients then send
+RFC 6902 patches rather than the whole document, and the generate endpoints
+take a ``sessionId`` in place of ``resumeData``. Every patch bumps the
+session's version, which keys the render cache, so a session is never
+rehashed and an unchanged one is never re-rendered.
+
+Sessions live in this process (``MemorySessionStore``) or in a SQLite file
+shared by every worker on the host (``SQLiteSessionStore``); either way they
+expire ``ttl`` seconds after their last use.
+"""
+import copy
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import fast_json
+from models import Resume, ValidationError
+from resume_parser import field_score, score_parts, total_score
+
+# A patch that can't be applied because the session moved on is retried
+# this many times when the client didn't ask for a particular version.
+PATCH_RETRIES = 3
+
+
+class PatchError(ValueError):
+    """A patch that is malformed or doesn't apply to the document"""
+
+
+class VersionConflict(Exception):
+    """The session is no longer at the version the client patched"""
+
+    def __init__(self, version):
+        super().__init__(f'Session is at version {version}')
+        self.version = version
+
+
+def _tokens(path):
+    if not isinstance(path, str) or (path and not path.startswith('/')):
+        raise PatchError(f'Invalid JSON pointer: {path!r}')
+    if not path:
+        return []
+    return [token.replace('~1', '/').replace('~0', '~') for token in path[1:].split('/')]
+
+
+def _index(array, token, adding=False):
+    if adding and token == '-':
+        return len(array)
+    if not (token.isascii() and token.isdigit()) or (token != '0' and token.startswith('0')):
+        raise PatchError(f'Invalid array index: {token!r}')
+    index = int(token)
+    if index > len(array) or (index == len(array) and not adding):
+        raise PatchError(f'Array index out of range: {index}')
+    return index
+
+
+def _resolve(document, tokens):
+    for token in tokens:
+        if isinstance(document, list):
+            document = document[_index(document, token)]
+        elif isinstance(document, dict) and token in document:
+            document = document[token]
+        else:
+            raise PatchError(f'Path not found: /{"/".join(tokens)}')
+    return document
+
+
+def _add(document, tokens, value):
+    if not tokens:
+        return value
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, list):
+        parent.insert(_index(parent, tokens[-1], adding=True), value)
+    elif isinstance(parent, dict):
+        parent[tokens[-1]] = value
+    else:
+        raise PatchError(f'Cannot add to a scalar at /{"/".join(tokens[:-1])}')
+    return document
+
+
+def _remove(document, tokens):
+    if not tokens:
+        raise PatchError('Cannot remove the whole document')
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, list):
+        return parent.pop(_index(parent, tokens[-1]))
+    if isinstance(parent, dict) and tokens[-1] in parent:
+        return parent.pop(tokens[-1])
+    raise PatchError(f'Path not found: /{"/".join(tokens)}')
+
+
+def apply_patch(document, operations):
+    """Apply RFC 6902 ``operations`` to a copy of ``document``.
+
+    Returns ``(patched, fields)``: the new document and the top-level fields
+    the patch touched, or None for all of them when it replaced the root.
+    The patch applies entirely or not at all.
+    """
+    if not isinstance(operations, list):
+        raise PatchError('A patch must be a list of operations')
+    document = copy.deepcopy(document)
+    fields = set()
+    whole = False
+
+    for operation in operations:
+        if not isinstance(operation, dict) or 'op' not in operation or 'path' not in operation:
+            raise PatchError('Each operation needs "op" and "path"')
+        op = operation['op']
+        tokens = _tokens(operation['path'])
+        touched = [tokens]
+
+        if op in ('add', 'replace', 'test') and 'value' not in operation:
+            raise PatchError(f'"{op}" needs a "value"')
+        if op in ('move', 'copy'):
+            if 'from' not in operation:
+                raise PatchError(f'"{op}" needs a "from"')
+            source = _tokens(operation['from'])
+
+        if op == 'add':
+            document = _add(document, tokens, copy.deepcopy(operation['value']))
+        elif op == 'remove':
+            _remove(document, tokens)
+        elif op == 'replace':
+            _resolve(document, tokens)
+            if tokens:
+                _remove(document, tokens)
+            document = _add(document, tokens, copy.deepcopy(operation['value']))
+        elif op == 'move':
+            if tokens[:len(source)] == source and tokens != source:
+                raise PatchError('Cannot move a value into itself')
+            document = _add(document, tokens, _remove(document, source))
+            touched.append(source)
+        elif op == 'copy':
+            document = _add(document, tokens, copy.deepcopy(_resolve(document, source)))
+        elif op == 'test':
+            if _resolve(document, tokens) != operation['value']:
+                raise PatchError(f'Test failed at {operation["path"]}')
+            touched = []
+        else:
+            raise PatchError(f'Unknown operation: {op!r}')
+
+        for path in touched:
+            if path:
+                fields.add(path[0])
+            else:
+                whole = True
+
+    if not isinstance(document, dict):
+        raise PatchError('Resume data must be an object')
+    return document, None if whole else fields
+
+
+class MemorySessionStore:
+    """Sessions in this process, least recently used first.
+
+    Bounded by the total size of their JSON, evicting the least recently
+    used; sessions unused for ``ttl`` seconds are dropped.
+    """
+
+    def __init__(self, ttl=3600, max_bytes=64 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sessions = OrderedDict()  # id -> (expires, session, size)
+        self.bytes = 0
+        self.expired = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def _drop(self, session_id):
+        _, _, size = self.sessions.pop(session_id)
+        self.bytes -= size
+
+    def _expire(self, now):
+        # Every use moves a session to the end, so the first expires first.
+        while self.sessions:
+            session_id, (expires, _, _) = next(iter(self.sessions.items()))
+            if expires > now:
+                break
+            self._drop(session_id)
+            self.expired += 1
+
+    def get(self, session_id):
+        now = time.time()
+        with self.lock:
+            self._expire(now)
+            entry = self.sessions.get(session_id)
+            if entry is None:
+                return None
+            self.sessions[session_id] = (now + self.ttl, entry[1], entry[2])
+            self.sessions.move_to_end(session_id)
+            return entry[1]
+
+    def put(self, session, payload, expected_version=None):
+        """Store ``session``, whose JSON is ``payload``.
+
+        With ``expected_version`` the stored session must still be at that
+        version; otherwise nothing is stored and False is returned.
+        """
+        now = time.time()
+        with self.lock:
+            self._expire(now)
+            current = self.sessions.get(session['id'])
+            if expected_version is not None and (current is None or current[1]['version'] != expected_version):
+                return False
+            if current is not None:
+                self._drop(session['id'])
+            self.sessions[session['id']] = (now + self.ttl, session, len(payload))
+            self.bytes += len(payload)
+            while self.bytes > self.max_bytes and len(self.sessions) > 1:
+                self._drop(next(iter(self.sessions)))
+                self.evictions += 1
+            return True
+
+    def delete(self, session_id):
+        with self.lock:
+            if session_id not in self.sessions:
+                return False
+            self._drop(session_id)
+            return True
+
+    def stats(self):
+        with self.lock:
+            self._expire(time.time())
+            return {
+                'backend': 'memory',
+                'sessions': len(self.sessions),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'expired': self.expired,
+                'evictions': self.evictions
+            }
+
+
+class SQLiteSessionStore:
+    """Sessions in a SQLite file shared by every process on the host.
+
+    Bounded by ``max_sessions``, evicting the ones closest to expiry.
+    """
+
+    def __init__(self, db_path, ttl=3600, max_sessions=100000):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.db_lock = threading.Lock()
+        self._db = None
+        self._db_pid = None
+
+    @property
+    def db(self):
+        """SQLite connection for this process, reopened after a fork"""
+        if self._db is None or self._db_pid != os.getpid():
+            db = sqlite3.connect(self.db_path, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS sessions '
+                       '(id TEXT PRIMARY KEY, version INTEGER NOT NULL, payload TEXT NOT NULL, expires REAL NOT NULL)')
+            db.execute('CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires)')
+            db.commit()
+            self._db, self._db_pid = db, os.getpid()
+        return self._db
+
+    def get(self, session_id):
+        now = time.time()
+        with self.db_lock:
+            row = self.db.execute('SELECT payload FROM sessions WHERE id = ? AND expires > ?',
+                                  (session_id, now)).fetchone()
+            if row is None:
+                return None
+            self.db.execute('UPDATE sessions SET expires = ? WHERE id = ?', (now + self.ttl, session_id))
+            self.db.commit()
+        return fast_json.loads(row[0])
+
+    def put(self, session, payload, expected_version=None):
+        """Store ``session``; see ``MemorySessionStore.put``"""
+        now = time.time()
+        with self.db_lock:
+            if expected_version is None:
+                self.db.execute('INSERT OR REPLACE INTO sessions (id, version, payload, expires) VALUES (?, ?, ?, ?)',
+                                (session['id'], session['version'], payload, now + self.ttl))
+                self.db.execute('DELETE FROM sessions WHERE expires <= ?', (now,))
+                self.db.execute('DELETE FROM sessions WHERE id IN (SELECT id FROM sessions ORDER BY expires '
+                                'LIMIT max(0, (SELECT COUNT(*) FROM sessions) - ?))', (self.max_sessions,))
+                stored = True
+            else:
+                cursor = self.db.execute('UPDATE sessions SET version = ?, payload = ?, expires = ? '
+                                         'WHERE id = ? AND version = ? AND expires > ?',
+                                         (session['version'], payload, now + self.ttl,
+                                          session['id'], expected_version, now))
+                stored = cursor.rowcount == 1
+            self.db.commit()
+        return stored
+
+    def delete(self, session_id):
+        with self.db_lock:
+            cursor = self.db.execute('DELETE FROM sessions WHERE id = ?', (session_id,))
+            self.db.commit()
+        return cursor.rowcount > 0
+
+    def stats(self):
+        with self.db_lock:
+            count = self.db.execute('SELECT COUNT(*) FROM sessions WHERE expires > ?', (time.time(),)).fetchone()[0]
+        return {
+            'backend': 'sqlite',
+            'path': self.db_path,
+            'sessions': count,
+            'max_sessions': self.max_sessions,
+            'ttl': self.ttl
+        }
+
+
+class Sessions:
+    """Resume sessions on top of a store.
+
+    A session is ``{'id', 'version', 'data', 'scores', 'created', 'updated'}``
+    where ``scores`` holds each field's share of ``data['score']``. Stored
+    sessions are never modified; a patch stores a new one.
+    """
+
+    def __init__(self, store, max_size=1024 * 1024, max_operations=1000):
+        self.store = store
+        self.max_size = max_size
+        self.max_operations = max_operations
+
+    def _store(self, session, expected_version=None):
+        payload = fast_json.dumps(session)
+        if len(payload) > self.max_size:
+            raise PatchError(f'Resume data exceeds the {self.max_size} byte session limit')
+        return self.store.put(session, payload, expected_version)
+
+    @staticmethod
+    def _validate(data):
+        """Refuse data the renderers couldn't use, when it is sent rather than when it is rendered"""
+        try:
+            Resume.from_dict(data)
+        except ValidationError as e:
+            raise PatchError(str(e))
+
+    def create(self, data):
+        if not isinstance(data, dict):
+            raise PatchError('Resume data must be an object')
+        self._validate(data)
+        now = time.time()
+        scores = score_parts(data)
+        session = {
+            'id': uuid.uuid4().hex,
+            'version': 1,
+            'data': {**data, 'score': total_score(scores)},
+            'scores': scores,
+            'created': now,
+            'updated': now
+        }
+        self._store(session)
+        return session
+
+    def get(self, session_id):
+        return self.store.get(session_id)
+
+    def patch(self, session_id, operations, version=None):
+        """Apply a JSON Patch and return the new session, or None if there is no such session.
+
+        With ``version`` the patch applies only to that version and raises
+        ``VersionConflict`` otherwise; without it, to whichever is current.
+        Only the fields the patch touched are rescored.
+        """
+        if isinstance(operations, list) and len(operations) > self.max_operations:
+            raise PatchError(f'At most {self.max_operations} operations per patch')
+        for _ in range(PATCH_RETRIES):
+            session = self.store.get(session_id)
+            if session is None:
+                return None
+            if version is not None and session['version'] != version:
+                raise VersionConflict(session['version'])
+
+            data, fields = apply_patch(session['data'], operations)
+            self._validate(data)
+            if fields is None:
+                scores = score_parts(data)
+            else:
+                scores = dict(session['scores'])
+                for field in fields & scores.keys():
+                    scores[field] = field_score(field, data.get(field))
+            data['score'] = total_score(scores)
+
+            patched = {**session, 'version': session['version'] + 1, 'data': data, 'scores': scores,
+                       'updated': time.time()}
+            if self._store(patched, expected_version=session['version']):
+                return patched
+            # Another patch got in first.
+            if version is not None:
+                current = self.store.get(session_id)
+                if current is None:
+                    return None
+                raise VersionConflict(current['version'])
+        raise VersionConflict(session['version'])
+
+    def delete(self, session_id):
+        return self.store.delete(session_id)
+
+    def stats(self):
+        return self.store.stats()
@@ -0,0 +1,144 @@
+import hashlib
+import re
+
+
+# Built-in dictionary. Order matters: it is the rank used when reporting
+# matches, so the most commonly listed skills come first.
+DEFAULT_SKILLS = [
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'React', 'Angular', 'Vue',
+    'Node.js', 'Express', 'Django', 'Flask', 'FastAPI', 'Spring Boot',
+    'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Elasticsearch',
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins', 'Git',
+    'HTML', 'CSS', 'SCSS', 'Tailwind', 'Bootstrap', 'Material-UI',
+    'REST API', 'GraphQL', 'gRPC', 'WebSocket',
+    'Machine Learning', 'Deep Learning', 'AI', 'Data Science',
+    'TensorFlow', 'PyTorch', 'Scikit-learn', 'Pandas', 'NumPy',
+    'C++', 'C#', 'Ruby', 'PHP', 'Swift', 'Kotlin', 'Go', 'Rust',
+    'Agile', 'Scrum', 'DevOps', 'CI/CD', 'Microservices', 'Linux',
+    'Firebase', 'Supabase', 'Next.js', 'Svelte', 'Remix'
+]
+
+
+def trie_pattern(terms):
+    """Build a regex alternation for ``terms`` factored as a prefix trie.
+
+    A flat ``a|b|c`` alternation makes the regex engine retry every
+    alternative at every position. Sharing prefixes means each position
+    costs roughly one walk down the trie, which keeps matching fast with
+    thousands of terms.
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        end = '' in node
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not end:
+            return branches[0]
+        body = '(?:' + '|'.join(branches) + ')'
+        return body + '?' if end else body
+
+    return build(trie)
+
+
+class SkillMatcher:
+    """Finds every known skill in a text with one compiled regex.
+
+    Terms are matched case-insensitively on word boundaries, where a
+    boundary is any non-word character. Unlike ``\\b`` this also works for
+    terms that start or end with punctuation such as ``C++`` or ``C#``.
+    Aliases map onto a canonical name, e.g. ``nodejs`` -> ``Node.js``.
+    """
+
+    def __init__(self, skills=None, aliases=None):
+        skills = DEFAULT_SKILLS if skills is None else skills
+        self.skills = []
+        self.rank = {}
+        self.canonical = {}
+
+        for skill in skills:
+            self._add(skill, skill)
+        for alias, skill in (aliases or {}).items():
+            self._add(skill, skill)
+            self._add(alias, skill)
+
+        # Trie suffixes are greedy optionals, so the longest term wins and
+        # "Java" never shadows "JavaScript".
+        body = trie_pattern(self.canonical)
+        self.pattern = re.compile(r'(?<!\w)(' + body + r')(?!\w)', re.IGNORECASE) if body else None
+        # Identifies the dictionary contents, e.g. for cache keys.
+        self.fingerprint = hashlib.sha1(
+            '\n'.join(f'{term}={skill}' for term, skill in self.canonical.items()).encode('utf-8')
+        ).hexdigest()[:12]
+
+    def _add(self, term, skill):
+        term = term.strip()
+        if not term:
+            return
+        if skill not in self.rank:
+            self.rank[skill] = len(self.skills)
+            self.skills.append(skill)
+        self.canonical.setdefault(term.lower(), skill)
+
+    def __len__(self):
+        return len(self.skills)
+
+    @classmethod
+    def from_file(cls, path):
+        """Load a dictionary file.
+
+        One skill per line, optionally followed by ``|``-separated aliases.
+        Lines starting with ``#`` are ignored::
+
+            # comment
+            Node.js | nodejs | node js
+            Kubernetes | k8s
+        """
+        skills = []
+        aliases = {}
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                names = [name.strip() for name in line.split('|')]
+                skills.append(names[0])
+                for alias in names[1:]:
+                    if alias:
+                        aliases[alias] = names[0]
+        return cls(skills, aliases)
+
+    def finditer(self, text, pos=0, endpos=None):
+        """Yield ``(start, end, skill)`` for each match in one pass over ``text[pos:endpos]``."""
+        if self.pattern is None:
+            return
+        canonical = self.canonical
+        endpos = len(text) if endpos is None else endpos
+        for match in self.pattern.finditer(text, pos, endpos):
+            yield match.start(), match.end(), canonical[match.group(1).lower()]
+
+    def find(self, text, pos=0, endpos=None, max_rank=None):
+        """Return the distinct skills found in ``text[pos:endpos]`` in dictionary order."""
+        found = {skill for _, _, skill in self.finditer(text, pos, endpos)}
+        return self.ordered(found, max_rank)
+
+    def ordered(self, found, max_rank=None):
+        rank = self.rank
+        skills = sorted(found, key=rank.__getitem__)
+        if max_rank is not None:
+            skills = [skill for skill in skills if rank[skill] < max_rank]
+        return skills
+
+
+def load_matcher(path=None):
+    """Return a matcher for ``path`` or the built-in list if none is given."""
+    if path:
+        return SkillMatcher.from_file(path)
+    return SkillMatcher()
@@ -0,0 +1,122 @@
+"""Startup cost accounting.
+
+Heavy dependencies are imported on first use through ``lazy_import``, which
+records how long each import took. ``startup_report`` combines those timings
+with process RSS for the health endpoint. Run this file directly to measure
+cold import time and RSS of each dependency in fresh interpreters::
+
+    python startup.py
+"""
+import gc
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+
+PROCESS_START = time.time()
+IMPORT_TIMES = {}
+_lock = threading.Lock()
+
+HEAVY_MODULES = ['flask', 'docx', 'reportlab.platypus', 'spacy']
+RENDERERS = ['pdf_templates', 'docx_generator']
+
+
+def lazy_import(name):
+    """Import ``name`` and record the time of the first import"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    with _lock:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        IMPORT_TIMES.setdefault(name, round(time.perf_counter() - start, 4))
+    return module
+
+
+def rss_bytes():
+    """Resident set size of this process in bytes"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        # The peak, not current; the best available without /proc.
+        return peak_rss_bytes()
+
+
+def peak_rss_bytes():
+    """Highest resident set size this process has reached, in bytes"""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux and bytes on macOS.
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def startup_report(boot_seconds=None):
+    return {
+        'boot_seconds': boot_seconds,
+        'uptime_seconds': round(time.time() - PROCESS_START, 1),
+        'rss_bytes': rss_bytes(),
+        'lazy_imports': dict(IMPORT_TIMES),
+        'loaded': [name for name in HEAVY_MODULES + RENDERERS if name in sys.modules]
+    }
+
+
+def warm(nlp=False):
+    """Load renderers, compile every PDF and DOCX template and optionally the spaCy model.
+
+    Called before a pre-fork server forks its workers, so they start warm and
+    share these pages copy-on-write. Freezing the collected heap keeps the
+    garbage collector from touching (and so copying) the shared objects.
+    """
+    start = time.perf_counter()
+    for name in RENDERERS:
+        lazy_import(name)
+    pdf_templates = sys.modules['pdf_templates']
+    docx_generator = sys.modules['docx_generator']
+    for name in pdf_templates.TEMPLATES:
+        pdf_templates.compile_template(name)
+        docx_generator.compile_template(name)
+    if nlp:
+        import nlp_model
+        nlp_model.get_nlp()
+    gc.collect()
+    gc.freeze()
+    return round(time.perf_counter() - start, 4)
+
+
+_PROBE = '''
+import time, sys
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+sys.path.insert(0, {here!r})
+from startup import rss_bytes
+print(elapsed, rss_bytes())
+'''
+
+
+def measure(module):
+    """Cold import time and resulting RSS of ``module`` in a fresh interpreter"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, here=here)],
+                            capture_output=True, text=True, cwd=here)
+    if result.returncode != 0:
+        return None, None
+    elapsed, rss = result.stdout.split()[-2:]
+    return float(elapsed), int(rss)
+
+
+def main():
+    print(f"{'module':<20} {'import s':>9} {'RSS MB':>8}")
+    for module in ['json'] + HEAVY_MODULES + RENDERERS + ['app']:
+        elapsed, rss = measure(module)
+        if elapsed is None:
+            print(f"{module:<20} {'failed':>9}")
+        else:
+            print(f"{module:<20} {elapsed:>9.3f} {rss / 1e6:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+"""The built frontend (``frontend/build``), served from memory.
+
+``StaticFiles`` reads the whole build directory once, at startup; under
+gunicorn's ``preload_app`` that happens in the master and the workers share
+the pages. Text assets get gzip and, when the ``brotli`` module is
+installed, brotli variants, and each response uses the smallest one the
+client's ``Accept-Encoding`` allows. Compressing at startup takes a moment;
+running this file after ``npm run build`` writes ``.gz``/``.br`` files next
+to the assets, which are then read instead::
+
+    python static_files.py ../frontend/build
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import sys
+import time
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE = ('.html', '.js', '.css', '.json', '.map', '.svg', '.txt', '.xml', '.ico', '.webmanifest')
+MIN_COMPRESS_SIZE = 1024
+# Suffixes of the precompressed files, in order of preference.
+ENCODINGS = {'br': '.br', 'gzip': '.gz'}
+# Bundler output named after its content hash (main.06f703a2.js) never
+# changes, so browsers may keep it for a year without asking again.
+HASHED_NAME = re.compile(r'\.[0-9a-f]{8,}\.(?:chunk\.)?[a-z0-9]+$')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+INDEX = 'index.html'
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def encodings():
+    """The encodings this process can produce"""
+    return [encoding for encoding in ENCODINGS if encoding != 'br' or brotli is not None]
+
+
+def is_compressible(path, size):
+    return path.lower().endswith(COMPRESSIBLE) and size >= MIN_COMPRESS_SIZE
+
+
+def is_precompressed(path):
+    """A ``.gz``/``.br`` file written next to its asset"""
+    for suffix in ENCODINGS.values():
+        if path.endswith(suffix) and os.path.isfile(path[:-len(suffix)]):
+            return True
+    return False
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _precompressed(path, encoding):
+    """The ``.gz``/``.br`` file of ``path`` when it is at least as new as the asset"""
+    variant = path + ENCODINGS[encoding]
+    try:
+        if os.path.getmtime(variant) >= os.path.getmtime(path):
+            return _read(variant)
+    except OSError:
+        pass
+    return None
+
+
+class Asset:
+    """One file with its encoded variants, smallest first"""
+
+    __slots__ = ('mimetype', 'cache_control', 'etag', 'variants')
+
+    def __init__(self, name, path):
+        body = _read(path)
+        self.mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        if name.endswith('.map'):
+            self.mimetype = 'application/json'
+        self.cache_control = IMMUTABLE if HASHED_NAME.search(name) else REVALIDATE
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        variants = [(None, body)]
+        if is_compressible(name, len(body)):
+            for encoding in ENCODINGS:
+                data = _precompressed(path, encoding)
+                if data is None and encoding in encodings():
+                    data = compress(body, encoding)
+                if data is not None and len(data) < len(body):
+                    variants.append((encoding, data))
+        self.variants = sorted(variants, key=lambda variant: len(variant[1]))
+
+    def select(self, quality):
+        """``(encoding, body)`` of the smallest variant ``quality(encoding)`` accepts; ``None`` is identity"""
+        for encoding, body in self.variants:
+            if encoding is None or quality(encoding) > 0:
+                return encoding, body
+        return self.variants[-1]
+
+
+class StaticFiles:
+    """Every file under ``root``, keyed by its URL path"""
+
+    def __init__(self, root):
+        start = time.perf_counter()
+        self.root = os.path.abspath(root)
+        self.assets = {}
+        for directory, dirs, files in os.walk(self.root):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(directory, name)
+                if not is_precompressed(path):
+                    url = os.path.relpath(path, self.root).replace(os.sep, '/')
+                    self.assets[url] = Asset(url, path)
+        if INDEX not in self.assets:
+            raise FileNotFoundError(f'{os.path.join(self.root, INDEX)} not found; run npm run build first')
+        self.load_seconds = round(time.perf_counter() - start, 4)
+
+    def lookup(self, path):
+        """The asset for a URL path. Paths without a file extension are app routes and get ``index.html``."""
+        asset = self.assets.get(path or INDEX)
+        if asset is None and '.' not in path.rsplit('/', 1)[-1]:
+            asset = self.assets[INDEX]
+        return asset
+
+    def stats(self):
+        stats = {
+            'files': len(self.assets),
+            'bytes': 0,
+            'load_seconds': self.load_seconds
+        }
+        for encoding in ENCODINGS:
+            stats[f'{encoding}_bytes'] = 0
+        for asset in self.assets.values():
+            variants = dict(asset.variants)
+            stats['bytes'] += len(variants[None])
+            for encoding in ENCODINGS:
+                stats[f'{encoding}_bytes'] += len(variants.get(encoding, variants[None]))
+        return stats
+
+
+def precompress(root):
+    """Write the ``.gz`` (and with brotli, ``.br``) file of each text asset under ``root``"""
+    totals = dict.fromkeys([None, *encodings()], 0)
+    for directory, dirs, files in os.walk(root):
+        for name in files:
+            path = os.path.join(directory, name)
+            if is_precompressed(path):
+                continue
+            body = _read(path)
+            totals[None] += len(body)
+            for encoding in encodings():
+                size = len(body)
+                if is_compressible(name, len(body)):
+                    data = compress(body, encoding)
+                    if len(data) < len(body):
+                        with open(path + ENCODINGS[encoding], 'wb') as f:
+                            f.write(data)
+                        size = len(data)
+                totals[encoding] += size
+    return totals
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1 or not os.path.isdir(argv[0]):
+        sys.exit('usage: python static_files.py BUILD_DIRECTORY')
+    start = time.perf_counter()
+    totals = precompress(argv[0])
+    sizes = ', '.join(f'{encoding} {size / 1024:.0f} KB' for encoding, size in totals.items() if encoding)
+    print(f'{totals[None] / 1024:.0f} KB precompressed to {sizes} in {time.perf_counter() - start:.1f}s')
+    if brotli is None:
+        print('brotli is not installed; wrote gzip only')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""PDF template and output profile definitions.
+
+Each template is plain data: page margins, paragraph style overrides,
+which contact fields to show and the order of the sections. Kept apart from
+``pdf_templates`` so template names can be checked without importing
+ReportLab. Adding a template means adding an entry to ``TEMPLATES``.
+"""
+import os
+
+_ENTRY = {'parent': 'Normal', 'fontName': 'Helvetica-Bold', 'fontSize': 11}
+_ENTRY_DETAIL = {'parent': 'Normal', 'fontSize': 10, 'textColor': '#4b5563'}
+
+# Style roles: title, contact, heading, body, job, company, degree,
+# institution. Each is a ParagraphStyle keyword dict with ``parent`` naming a
+# sample stylesheet style; a role given as a plain string reuses that sample
+# style as-is. Sections are (section, heading text, space after in inches).
+TEMPLATES = {
+    'modern': {
+        'margins': {'rightMargin': 50, 'leftMargin': 50, 'topMargin': 50, 'bottomMargin': 30},
+        'styles': {
+            'title': {'parent': 'Heading1', 'fontSize': 28, 'textColor': '#1e40af', 'spaceAfter': 8,
+                      'fontName': 'Helvetica-Bold'},
+            'contact': {'parent': 'Normal', 'fontSize': 10, 'textColor': '#4b5563', 'spaceAfter': 16},
+            'heading': {'parent': 'Heading2', 'fontSize': 14, 'textColor': '#1e40af', 'spaceAfter': 8,
+                        'spaceBefore': 14, 'fontName': 'Helvetica-Bold'},
+            'job': _ENTRY,
+            'company': _ENTRY_DETAIL,
+            'degree': _ENTRY,
+            'institution': _ENTRY_DETAIL,
+        },
+        'contact_fields': ('email', 'phone', 'location'),
+        'sections': (
+            ('summary', 'PROFESSIONAL SUMMARY', 0.15),
+            ('experience', 'WORK EXPERIENCE', 0),
+            ('education', 'EDUCATION', 0),
+            ('skills', 'SKILLS', 0),
+        ),
+    },
+    'professional': {
+        'margins': {'rightMargin': 60, 'leftMargin': 60, 'topMargin': 60, 'bottomMargin': 30},
+        'styles': {
+            'title': {'parent': 'Heading1', 'fontSize': 26, 'textColor': '#000000', 'spaceAfter': 8,
+                      'alignment': 'center', 'fontName': 'Helvetica-Bold'},
+            'contact': {'parent': 'Normal', 'fontSize': 10, 'textColor': '#374151', 'spaceAfter': 20,
+                        'alignment': 'center'},
+            'heading': {'parent': 'Heading2', 'fontSize': 12, 'textColor': '#000000', 'spaceAfter': 6,
+                        'spaceBefore': 12, 'fontName': 'Helvetica-Bold'},
+            'job': _ENTRY,
+            'company': dict(_ENTRY_DETAIL, fontName='Helvetica-Oblique'),
+            'degree': _ENTRY,
+            'institution': _ENTRY_DETAIL,
+        },
+        'contact_fields': ('email', 'phone', 'location'),
+        'sections': (
+            ('summary', 'SUMMARY', 0.15),
+            ('experience', 'EXPERIENCE', 0),
+            ('education', 'EDUCATION', 0),
+            ('skills', 'SKILLS', 0),
+        ),
+    },
+    'creative': {
+        'margins': {'rightMargin': 50, 'leftMargin': 50, 'topMargin': 50, 'bottomMargin': 30},
+        'styles': {
+            'title': {'parent': 'Heading1', 'fontSize': 30, 'textColor': '#ec4899', 'spaceAfter': 8,
+                      'fontName': 'Helvetica-Bold'},
+            'contact': 'Normal',
+            'heading': {'parent': 'Heading2', 'fontSize': 14, 'textColor': '#f97316', 'spaceAfter': 8,
+                        'spaceBefore': 14, 'fontName': 'Helvetica-Bold'},
+            'job': {'parent': 'Normal', 'fontName': 'Helvetica-Bold'},
+            'company': 'Normal',
+            'degree': {'parent': 'Normal', 'fontName': 'Helvetica-Bold'},
+            'institution': 'Normal',
+        },
+        'contact_fields': ('email', 'phone'),
+        'sections': (
+            ('summary', 'ABOUT ME', 0.15),
+            ('skills', 'EXPERTISE', 0.15),
+            ('experience', 'EXPERIENCE', 0),
+            ('education', 'EDUCATION', 0),
+        ),
+    },
+}
+
+DEFAULT_TEMPLATE = 'modern'
+
+
+def resolve_template(name):
+    """``name`` if it is a known template, otherwise the default"""
+    return name if name in TEMPLATES else DEFAULT_TEMPLATE
+
+
+# Output profiles: how a PDF is written rather than how it looks. "standard"
+# compresses page streams; "compact" also writes deterministic output (fixed
+# timestamps and document ID, so equal resumes give equal bytes) with empty
+# metadata; "fast" skips compression for the quickest render. Compressed
+# streams are binary unless a profile sets "ascii85", which keeps the file
+# 7-bit clean at the cost of a quarter more bytes per stream.
+PDF_PROFILES = {
+    'standard': {'pageCompression': 1},
+    'compact': {'pageCompression': 1, 'invariant': 1, 'minimal_metadata': True},
+    'fast': {'pageCompression': 0},
+}
+
+DEFAULT_PDF_PROFILE = os.environ.get('PDF_PROFILE', 'standard')
+if DEFAULT_PDF_PROFILE not in PDF_PROFILES:
+    DEFAULT_PDF_PROFILE = 'standard'
+
+
+def resolve_profile(name):
+    """``name`` if it is a known output profile, otherwise the default"""
+    return name if name in PDF_PROFILES else DEFAULT_PDF_PROFILE
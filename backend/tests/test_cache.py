@@ -0,0 +1,121 @@
+import time
+
+from cache import LRUCache, ParseCache, RenderCache
+
+
+def test_lru_evicts_least_recently_used_by_bytes():
+    cache = LRUCache(10)
+    cache.put('a', b'aaaa')
+    cache.put('b', b'bbbb')
+    assert cache.get('a') == b'aaaa'
+    cache.put('c', b'cccc')
+    assert 'b' not in cache
+    assert cache.get('a') == b'aaaa' and cache.get('c') == b'cccc'
+    assert cache.stats()['bytes'] == 8
+    assert cache.stats()['evictions'] == 1
+
+
+def test_lru_replacing_a_key_recounts_its_size():
+    cache = LRUCache(10)
+    cache.put('a', b'aaaaaaaa')
+    cache.put('a', b'aa')
+    cache.put('b', b'bbbbbbbb')
+    assert len(cache) == 2
+    assert cache.stats()['bytes'] == 10
+
+
+def test_lru_does_not_store_values_larger_than_the_budget():
+    cache = LRUCache(4)
+    cache.put('small', b'ab')
+    cache.put('big', b'abcde')
+    assert 'big' not in cache
+    assert cache.get('small') == b'ab'
+
+
+def test_lru_pop_and_clear():
+    cache = LRUCache(10)
+    cache.put('a', b'aa')
+    cache.put('b', b'bbb')
+    assert cache.pop('a') == b'aa'
+    assert cache.pop('a') is None
+    assert cache.stats()['bytes'] == 3
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()['bytes'] == 0
+
+
+def test_lru_hit_rate():
+    cache = LRUCache(10)
+    cache.put('a', b'a')
+    cache.get('a')
+    cache.get('missing')
+    assert cache.stats()['hit_rate'] == 0.5
+
+
+def test_parse_cache_keys_separate_versions_and_variants():
+    data = b'resume bytes'
+    assert ParseCache('1').key(data) != ParseCache('2').key(data)
+    cache = ParseCache('1')
+    assert cache.key(data) != cache.key(data, 'ner')
+    assert cache.key(data, 'ner').endswith(':1:ner')
+
+
+def test_parse_cache_reads_back_from_sqlite(tmp_path):
+    db_path = str(tmp_path / 'parse.db')
+    writer = ParseCache('1', db_path=db_path)
+    key = writer.key(b'resume')
+    writer.put(key, {'name': 'Jane'})
+    reader = ParseCache('1', db_path=db_path)
+    assert reader.get(key) == {'name': 'Jane'}
+    assert reader.stats()['sqlite']['hits'] == 1
+
+
+def test_invalidate_digest_drops_every_variant_only(tmp_path):
+    cache = ParseCache('1', db_path=str(tmp_path / 'parse.db'))
+    for key in (cache.digest_key('abc'), cache.digest_key('abc', 'ner'),
+                ParseCache('0').digest_key('abc'), cache.digest_key('abcd')):
+        cache.put(key, {'key': key})
+    assert cache.invalidate_digest('abc') == 3
+    assert cache.get(cache.digest_key('abc')) is None
+    assert cache.get(cache.digest_key('abc', 'ner')) is None
+    assert cache.get(cache.digest_key('abcd')) == {'key': cache.digest_key('abcd')}
+    assert cache.stats()['sqlite']['entries'] == 1
+
+
+def test_invalidate_one_key_and_everything(tmp_path):
+    cache = ParseCache('1', db_path=str(tmp_path / 'parse.db'))
+    cache.put('a', {'n': 1})
+    cache.put('b', {'n': 2})
+    assert cache.invalidate('a') == 1
+    assert cache.get('a') is None
+    assert cache.invalidate() == 1
+    assert cache.get('b') is None
+
+
+def test_sqlite_tier_keeps_the_newest_rows(tmp_path):
+    cache = ParseCache('1', max_bytes=0, db_path=str(tmp_path / 'parse.db'), db_max_rows=3)
+    cache.PRUNE_EVERY = 5
+    for i in range(5):
+        cache.put(f'k{i}', {'n': i})
+    stats = cache.stats()['sqlite']
+    assert stats['entries'] == 3
+    assert stats['pruned'] == 2
+    assert cache.get('k0') is None
+    assert cache.get('k4') == {'n': 4}
+
+
+def test_sqlite_tier_ignores_and_prunes_stale_rows(tmp_path):
+    cache = ParseCache('1', max_bytes=0, db_path=str(tmp_path / 'parse.db'), db_max_age=60)
+    cache.PRUNE_EVERY = 2
+    cache.put('old', {'n': 1})
+    cache.db.execute('UPDATE parse_cache SET created = ?', (time.time() - 120,))
+    assert cache.get('old') is None
+    cache.put('new', {'n': 2})
+    assert cache.stats()['sqlite']['entries'] == 1
+    assert cache.get('new') == {'n': 2}
+
+
+def test_render_cache_key_ignores_key_order():
+    first = RenderCache.key('pdf', 'modern', {'name': 'Jane', 'skills': ['Go']})
+    second = RenderCache.key('pdf', 'modern', {'skills': ['Go'], 'name': 'Jane'})
+    assert first == second
+    assert first != RenderCache.key('docx', 'modern', {'name': 'Jane', 'skills': ['Go']})
@@ -0,0 +1,53 @@
+import copy
+
+from candidates import Candidates, without_fallbacks
+from resume_parser import FALLBACKS
+
+RESUME = {
+    'name': 'Jane Doe',
+    'email': 'jane@example.com',
+    'summary': 'Backend engineer running Python services on Kubernetes.',
+    'skills': ['Python', 'Kubernetes', 'AWS'],
+    'experience': [{'title': 'Backend Engineer', 'company': 'Initech', 'period': '2020 - 2024',
+                    'description': 'Built APIs'}],
+    'education': [{'degree': 'BSc', 'institution': 'TU', 'year': '2019'}],
+    'score': 90,
+}
+
+
+def parsed(**fields):
+    """A parse result whose unlisted fields hold the parser's fallbacks"""
+    data = copy.deepcopy(FALLBACKS)
+    data.update(fields)
+    return data
+
+
+def test_fallback_fields_are_dropped():
+    data = without_fallbacks(parsed(name='Jane Doe', skills=['Python']))
+    assert data == {'name': 'Jane Doe', 'skills': ['Python']}
+
+
+def test_a_parse_with_nothing_searchable_is_dropped():
+    assert without_fallbacks(parsed(name='Jane Doe', email='jane@example.com')) is None
+
+
+def test_real_data_is_kept():
+    assert without_fallbacks(RESUME) == RESUME
+
+
+def test_placeholders_never_reach_the_index(tmp_path):
+    candidates = Candidates(str(tmp_path / 'candidates.db'))
+    assert not candidates.add(parsed(name='Nobody'))
+    assert candidates.add(parsed(name='Jane Doe', skills=['Python', 'Go']))
+    assert candidates.add(RESUME)
+    assert len(candidates.index) == 2
+
+    assert candidates.search(['title:software', 'company:tech'])[1] == 0
+    assert candidates.search(['skill:communication'])[1] == 0
+    results, total = candidates.search(['skill:python'])
+    assert total == 2
+    assert all(result['titles'] in ([], ['Backend Engineer']) for result in results)
+
+    ranked = candidates.rank('Software Developer at a Tech Company, communication and teamwork')
+    assert ranked == []
+    assert candidates.rank('Python on Kubernetes')[0]['name'] == 'Jane Doe'
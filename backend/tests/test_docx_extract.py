@@ -0,0 +1,92 @@
+import io
+import zipfile
+
+from docx_extract import DocxStats, extract_text, iter_docx_text
+
+NAMESPACES = ('xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+              'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"')
+
+
+def paragraph(text):
+    return f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'
+
+
+def cell(content, merge=None):
+    properties = ''
+    if merge == 'restart':
+        properties = '<w:tcPr><w:vMerge w:val="restart"/></w:tcPr>'
+    elif merge == 'continue':
+        properties = '<w:tcPr><w:vMerge/></w:tcPr>'
+    return f'<w:tc>{properties}{content}</w:tc>'
+
+
+def table(*rows):
+    return '<w:tbl>' + ''.join('<w:tr>' + ''.join(row) + '</w:tr>' for row in rows) + '</w:tbl>'
+
+
+def docx(body, headers=(), footers=()):
+    parts = {'word/document.xml': f'<w:document {NAMESPACES}><w:body>{body}<w:sectPr/></w:body></w:document>'}
+    for i, content in enumerate(headers, 1):
+        parts[f'word/header{i}.xml'] = f'<w:hdr {NAMESPACES}>{content}</w:hdr>'
+    for i, content in enumerate(footers, 1):
+        parts[f'word/footer{i}.xml'] = f'<w:ftr {NAMESPACES}>{content}</w:ftr>'
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, xml in parts.items():
+            archive.writestr(name, xml)
+    buffer.seek(0)
+    return buffer
+
+
+def test_paragraphs_in_order_with_tabs_and_breaks():
+    body = paragraph('Jane Doe') + '<w:p><w:r><w:t>a</w:t><w:tab/><w:t>b</w:t><w:br/><w:t>c</w:t></w:r></w:p>'
+    assert list(iter_docx_text(docx(body))) == ['Jane Doe', 'a\tb\nc']
+
+
+def test_empty_paragraphs_are_skipped():
+    assert extract_text(docx(paragraph('A') + '<w:p/>' + paragraph('  ') + paragraph('B'))) == 'A\nB'
+
+
+def test_table_cells_are_blocks_and_merge_continuations_skipped():
+    body = table(
+        [cell(paragraph('Skills'), 'restart'), cell(paragraph('Python') + paragraph('Go'))],
+        [cell('<w:p/>', 'continue'), cell(paragraph('Docker'))],
+    )
+    stats = DocxStats()
+    assert list(iter_docx_text(docx(body), stats)) == ['Skills', 'Python\nGo', 'Docker']
+    assert stats.as_dict() == {'paragraphs': 5, 'tables': 1, 'cells': 4}
+
+
+def test_nested_table_text_joins_the_outer_cell():
+    inner = table([cell(paragraph('inner'))])
+    body = table([cell(paragraph('outer') + inner)])
+    assert list(iter_docx_text(docx(body))) == ['outer\ninner']
+
+
+def test_text_box_is_its_own_block_and_fallback_copy_ignored():
+    box = ('<w:p><w:r><w:t>Before</w:t></w:r><w:r><mc:AlternateContent>'
+           '<mc:Choice><w:txbxContent>' + paragraph('Boxed') + '</w:txbxContent></mc:Choice>'
+           '<mc:Fallback><w:txbxContent>' + paragraph('Boxed') + '</w:txbxContent></mc:Fallback>'
+           '</mc:AlternateContent></w:r></w:p>')
+    assert list(iter_docx_text(docx(box))) == ['Boxed', 'Before']
+
+
+def test_headers_and_footers_follow_the_body_once():
+    document = docx(paragraph('Jane Doe') + paragraph('Engineer'),
+                    headers=[paragraph('Confidential'), paragraph('Confidential')],
+                    footers=[paragraph('Page 1')])
+    assert list(iter_docx_text(document)) == ['Jane Doe', 'Engineer', 'Confidential', 'Page 1']
+
+
+def test_matches_python_docx_for_a_generated_document():
+    from docx import Document
+    document = Document()
+    document.add_paragraph('Jane Doe')
+    grid = document.add_table(rows=2, cols=2)
+    grid.cell(0, 0).text = 'Python'
+    grid.cell(0, 1).text = 'Go'
+    grid.cell(1, 0).merge(grid.cell(1, 1)).text = 'Docker'
+    buffer = io.BytesIO()
+    document.save(buffer)
+    buffer.seek(0)
+    assert extract_text(buffer) == 'Jane Doe\nPython\nGo\nDocker'
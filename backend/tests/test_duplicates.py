@@ -0,0 +1,92 @@
+import hashlib
+import random
+
+import numpy as np
+
+import duplicates
+from duplicates import NUM_PERM, KeyTable, NearDuplicates, signature
+
+
+def resume_text(seed, words=300):
+    rng = random.Random(seed)
+    vocabulary = [f'word{i}' for i in range(2000)]
+    return ' '.join(rng.choice(vocabulary) for _ in range(words))
+
+
+def sha(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def edited(text):
+    words = text.split()
+    words[150] = 'changed'
+    return ' '.join(words)
+
+
+def test_signature_estimates_similarity():
+    text = resume_text(1)
+    sig = signature(text)
+    assert sig.dtype == np.uint32 and len(sig) == NUM_PERM
+    assert (sig == signature(text.upper())).all()
+    assert (sig == signature(edited(text))).mean() > 0.85
+    assert (sig == signature(resume_text(2))).mean() < 0.2
+    assert signature('  ...  ') is None
+
+
+def test_short_texts_still_get_a_signature():
+    assert signature('Jane') is not None
+
+
+def test_edited_copy_is_found_and_unrelated_text_is_not():
+    index = NearDuplicates()
+    original = resume_text(1)
+    assert index.check(sha(original), original) is None
+    match = index.check(sha(edited(original)), edited(original))
+    assert match['sha256'] == sha(original)
+    assert 0.8 <= match['similarity'] < 1.0
+    assert index.check(sha(resume_text(2)), resume_text(2)) is None
+    assert index.stats()['matches'] == 1
+
+
+def test_exact_upload_is_seen_by_digest():
+    index = NearDuplicates()
+    text = resume_text(1)
+    assert index.seen(sha(text)) is None
+    index.check(sha(text), text)
+    assert index.seen(sha(text)) == {'sha256': sha(text), 'similarity': 1.0}
+
+
+def test_check_without_remember_keeps_nothing():
+    index = NearDuplicates()
+    text = resume_text(1)
+    index.check(sha(text), text, remember=False)
+    assert len(index) == 0
+
+
+def test_index_stops_growing_at_max_entries():
+    index = NearDuplicates(max_entries=2)
+    for seed in range(4):
+        index.check(sha(resume_text(seed)), resume_text(seed))
+    assert len(index) == 2
+    assert index.check(sha(edited(resume_text(3))), edited(resume_text(3))) is None
+
+
+def test_workers_share_signatures_through_sqlite(tmp_path):
+    db_path = str(tmp_path / 'signatures.db')
+    first, second = NearDuplicates(db_path), NearDuplicates(db_path)
+    original = resume_text(1)
+    first.check(sha(original), original)
+    assert second.check(sha(edited(original)), edited(original))['sha256'] == sha(original)
+    assert len(second) == 2
+
+
+def test_key_table_finds_keys_before_and_after_merging(monkeypatch):
+    monkeypatch.setattr(duplicates, 'TAIL_SIZE', 4)
+    table = KeyTable()
+    table.add([5, 7], 0)
+    table.add([7, 9], 1)
+    assert len(table.tail_keys) == 0 and len(table) == 4
+    table.add([7], 2)
+    assert sorted(table.get([7]).tolist()) == [0, 1, 2]
+    assert table.get([5, 9]).tolist() == [0, 1]
+    assert len(table.get([8])) == 0
@@ -0,0 +1,115 @@
+import io
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import ingest
+from cache import ParseCache
+
+
+class FakePool:
+    def __init__(self):
+        self.shut_down = False
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+@pytest.fixture
+def shared_pool(monkeypatch):
+    pool = FakePool()
+    monkeypatch.setattr(ingest, '_executor', pool)
+    return pool
+
+
+def docx_bytes(*paragraphs):
+    from docx import Document
+    document = Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def zip_bytes(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return buffer
+
+
+def test_reset_executor_drops_the_broken_shared_pool_once(shared_pool):
+    assert ingest.reset_executor(shared_pool)
+    assert shared_pool.shut_down
+    assert ingest._executor is None
+    assert not ingest.reset_executor(shared_pool)
+
+
+def test_reset_executor_leaves_a_newer_pool_alone(shared_pool, monkeypatch):
+    replacement = FakePool()
+    monkeypatch.setattr(ingest, '_executor', replacement)
+    assert not ingest.reset_executor(shared_pool)
+    assert ingest._executor is replacement
+    assert not replacement.shut_down
+
+
+def test_reset_executor_without_a_pool_drops_whatever_is_shared(shared_pool):
+    assert ingest.reset_executor()
+    assert shared_pool.shut_down
+
+
+def test_cacheable():
+    complete = {'data': {'name': 'Jane'}, 'ner': True}
+    assert ingest.cacheable(complete, ner=True)
+    assert not ingest.cacheable({**complete, 'ner': False}, ner=True)
+    assert ingest.cacheable({**complete, 'ner': False})
+    partial = {'data': {'partial': {'skipped': ['education']}}, 'ner': False}
+    assert not ingest.cacheable(partial)
+    assert ingest.cacheable({'data': {'partial': {'skipped': []}}, 'ner': False})
+
+
+def test_iter_zip_documents_skips_other_members_and_lock_files():
+    archive = zip_bytes({'a.docx': b'one', 'notes.txt': b'x', 'dir/B.DOCX': b'two',
+                         'dir/~$a.docx': b'lock', '__MACOSX/._a.docx': b'fork'})
+    documents = [(name, read()) for name, read in ingest.iter_zip_documents(archive, 100)]
+    assert documents == [('a.docx', b'one'), ('dir/B.DOCX', b'two')]
+
+
+def test_iter_zip_documents_rejects_oversized_members_on_read():
+    (name, read), = ingest.iter_zip_documents(zip_bytes({'big.docx': b'x' * 11}), 10)
+    with pytest.raises(ValueError, match='10 byte limit'):
+        read()
+
+
+def test_extract_document_rejects_empty_documents():
+    assert 'Jane Doe' in ingest.extract_document(docx_bytes('Jane Doe'))
+    with pytest.raises(ingest.EmptyDocumentError):
+        ingest.extract_document(docx_bytes())
+
+
+def test_parse_many_isolates_failures_and_fills_the_cache():
+    cache = ParseCache('test')
+    resume = docx_bytes('Jane Doe', 'jane@example.com')
+
+    def fail():
+        raise ValueError('unreadable')
+
+    documents = [('good.docx', lambda: resume), ('bad.docx', fail), ('broken.docx', lambda: b'not a zip')]
+    with ThreadPoolExecutor(2) as pool:
+        results = {result['file']: result for result in ingest.parse_many(documents, cache, executor=pool)}
+        assert results['good.docx']['success'] and not results['good.docx']['cached']
+        assert results['bad.docx'] == {'file': 'bad.docx', 'success': False, 'error': 'unreadable'}
+        assert not results['broken.docx']['success']
+
+        again, = ingest.parse_many([('good.docx', lambda: resume)], cache, executor=pool)
+    assert again['cached']
+    assert again['data'] == results['good.docx']['data']
+
+
+def test_error_reader_raises_its_message():
+    with pytest.raises(ValueError, match='^Invalid zip archive$'):
+        ingest.error_reader('Invalid zip archive')()
@@ -0,0 +1,60 @@
+import threading
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import jobs
+from jobs import RenderQueue
+
+
+class FakePool:
+    def __init__(self, max_workers=None, mp_context=None):
+        self.futures = []
+        self.shut_down = False
+
+    def submit(self, *args):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_a_crashed_pool_is_replaced_once(monkeypatch):
+    monkeypatch.setattr(jobs, 'ProcessPoolExecutor', FakePool)
+    queue = RenderQueue()
+    first = [queue.submit('pdf', 'modern', {}, f'key{i}', 'resume.pdf') for i in range(2)]
+    crashed = queue._executor
+    crashed.futures[0].set_exception(BrokenProcessPool())
+    assert crashed.shut_down and queue._executor is None
+
+    later = queue.submit('pdf', 'modern', {}, 'key2', 'resume.pdf')
+    replacement = queue._executor
+    assert replacement is not crashed
+    crashed.futures[1].set_exception(BrokenProcessPool())
+    assert queue._executor is replacement and not replacement.shut_down
+    assert [job.error for job in first] == ['Worker process crashed'] * 2
+
+    replacement.futures[0].set_result((b'%PDF', 1.0, 2.0))
+    assert later.state == 'done' and later.body == b'%PDF'
+
+
+def test_concurrent_submits_share_one_pool(monkeypatch):
+    created = []
+
+    class SlowPool(FakePool):
+        def __init__(self, *args, **kwargs):
+            super().__init__()
+            created.append(self)
+            threading.Event().wait(0.05)
+
+    monkeypatch.setattr(jobs, 'ProcessPoolExecutor', SlowPool)
+    queue = RenderQueue()
+    threads = [threading.Thread(target=queue.submit, args=('pdf', 'modern', {}, f'key{i}', 'resume.pdf'))
+               for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1
+    assert len(created[0].futures) == 4
@@ -0,0 +1,66 @@
+import pytest
+
+from models import Education, Experience, Resume, ValidationError, as_resume
+
+RESUME = {
+    'name': 'Jane Doe',
+    'email': 'jane@example.com',
+    'phone': '555-0100',
+    'linkedin': '',
+    'location': 'Berlin',
+    'summary': 'Builds things',
+    'skills': ['Python', 'Go'],
+    'experience': [{'title': 'Engineer', 'company': 'Acme', 'period': '2019-2023', 'description': 'Shipped'}],
+    'education': [{'degree': 'BSc', 'institution': 'TU', 'year': '2018'}],
+}
+
+
+def test_round_trip():
+    assert Resume.from_dict(RESUME).to_dict() == RESUME
+
+
+def test_missing_fields_default_and_unknown_keys_are_dropped():
+    resume = Resume.from_dict({'name': 'Jane', 'score': 40, 'partial': None, 'skills': None})
+    assert resume.email == '' and resume.skills == [] and resume.experience == []
+    assert 'score' not in resume.to_dict()
+
+
+def test_numbers_become_text():
+    resume = Resume.from_dict({'education': [{'degree': 'BSc', 'year': 2018}], 'phone': 5550100})
+    assert resume.education == [Education(degree='BSc', year='2018')]
+    assert resume.phone == '5550100'
+
+
+def test_nested_items_are_models():
+    resume = Resume.from_dict(RESUME)
+    assert resume.experience[0] == Experience('Engineer', 'Acme', '2019-2023', 'Shipped')
+    assert resume.education[0].institution == 'TU'
+
+
+@pytest.mark.parametrize('data, message', [
+    ([], 'Resume data must be an object'),
+    ({'name': ['Jane']}, 'name must be a string'),
+    ({'email': True}, 'email must be a string'),
+    ({'skills': 'Python'}, 'skills must be a list'),
+    ({'skills': ['Python', 3.5, {}]}, r'skills\[2\] must be a string'),
+    ({'experience': {}}, 'experience must be a list'),
+    ({'experience': ['Engineer']}, r'experience\[0\] must be an object'),
+    ({'experience': [{}, {'title': None, 'company': 1}, {'period': []}]}, r'experience\[2\]\.period must be a string'),
+    ({'education': [{'year': False}]}, r'education\[0\]\.year must be a string'),
+])
+def test_errors_name_the_field(data, message):
+    with pytest.raises(ValidationError, match=f'^{message}$'):
+        Resume.from_dict(data)
+
+
+def test_path_prefixes_error_messages():
+    with pytest.raises(ValidationError, match=r'^resumes\[1\]\.skills\[0\] must be a string$'):
+        Resume.from_dict({'skills': [['Go']]}, 'resumes[1]')
+    with pytest.raises(ValidationError, match=r'^resumes\[1\] must be an object$'):
+        Resume.from_dict('Jane', 'resumes[1]')
+
+
+def test_as_resume_validates_dicts_only():
+    resume = Resume(name='Jane')
+    assert as_resume(resume) is resume
+    assert as_resume({'name': 'Jane'}) == resume
@@ -0,0 +1,71 @@
+import base64
+import io
+import re
+import zlib
+
+import pytest
+
+import pdf_templates
+from template_specs import PDF_PROFILES
+
+RESUME = {
+    'name': 'Jane Doe',
+    'skills': ['Python', 'Go'],
+    'experience': [{'title': 'Engineer', 'company': 'Acme', 'period': '2020',
+                    'description': 'Built services. ' * 60}] * 6,
+}
+# BinaryStreamCanvas rebuilds page streams through ReportLab internals; these
+# tests read them back from the file to catch an upgrade that changes them.
+STREAM = re.compile(rb'<<\s*(?:/Filter \[ ([^\]]*) \] )?/Length (\d+)\s*>>\s*stream\r?\n')
+
+
+def page_streams(pdf):
+    """``(filters, decoded content)`` of every stream in ``pdf``"""
+    streams = []
+    for match in STREAM.finditer(pdf):
+        filters = (match.group(1) or b'').split()
+        content = pdf[match.end():match.end() + int(match.group(2))]
+        if b'/ASCII85Decode' in filters:
+            content = base64.a85decode(re.sub(rb'\s', b'', content).removesuffix(b'~>'))
+        if b'/FlateDecode' in filters:
+            content = zlib.decompress(content)
+        streams.append((filters, content))
+    return streams
+
+
+def render(profile):
+    return pdf_templates.render(io.BytesIO(), RESUME, profile=profile).getvalue()
+
+
+@pytest.fixture
+def ascii85_profile(monkeypatch):
+    monkeypatch.setitem(PDF_PROFILES, 'test-ascii85', dict(PDF_PROFILES['standard'], ascii85=True))
+    return 'test-ascii85'
+
+
+@pytest.mark.parametrize('profile, filters', [
+    ('standard', [b'/FlateDecode']),
+    ('fast', []),
+])
+def test_page_streams_are_binary(profile, filters):
+    pdf = render(profile)
+    streams = page_streams(pdf)
+    assert len(streams) == pdf.count(b'/Type /Page\n') > 1
+    for stream_filters, content in streams:
+        assert stream_filters == filters
+        assert b'BT' in content
+    assert b'(Jane Doe) Tj' in streams[0][1]
+
+
+def test_ascii85_profile_encodes_page_streams(ascii85_profile):
+    pdf = render(ascii85_profile)
+    streams = page_streams(pdf)
+    assert len(streams) == pdf.count(b'/Type /Page\n') > 1
+    assert all(filters == [b'/ASCII85Decode', b'/FlateDecode'] for filters, _ in streams)
+    assert b'(Jane Doe) Tj' in streams[0][1]
+    assert len(pdf) > len(render('standard'))
+
+
+def test_ascii85_choice_is_per_document(ascii85_profile):
+    render(ascii85_profile)
+    assert all(filters == [b'/FlateDecode'] for filters, _ in page_streams(render('standard')))
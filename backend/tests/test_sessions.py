@@ -0,0 +1,144 @@
+import pytest
+
+import fast_json
+from sessions import (MemorySessionStore, PatchError, Sessions, SQLiteSessionStore, VersionConflict,
+                      apply_patch)
+
+RESUME = {'name': 'Jane Doe', 'skills': ['Python', 'Go'], 'experience': [{'title': 'Engineer'}]}
+
+
+def test_add_replace_and_remove():
+    patched, fields = apply_patch(RESUME, [
+        {'op': 'add', 'path': '/summary', 'value': 'Builds things'},
+        {'op': 'replace', 'path': '/name', 'value': 'Jane Roe'},
+        {'op': 'remove', 'path': '/skills/0'},
+    ])
+    assert patched['summary'] == 'Builds things'
+    assert patched['name'] == 'Jane Roe'
+    assert patched['skills'] == ['Go']
+    assert fields == {'summary', 'name', 'skills'}
+
+
+def test_the_original_document_is_not_modified():
+    apply_patch(RESUME, [{'op': 'add', 'path': '/skills/-', 'value': 'Rust'}])
+    assert RESUME['skills'] == ['Python', 'Go']
+
+
+def test_array_append_and_insert():
+    patched, _ = apply_patch(RESUME, [
+        {'op': 'add', 'path': '/skills/-', 'value': 'Rust'},
+        {'op': 'add', 'path': '/skills/0', 'value': 'C'},
+    ])
+    assert patched['skills'] == ['C', 'Python', 'Go', 'Rust']
+
+
+def test_move_touches_both_fields_and_copy_only_its_target():
+    patched, fields = apply_patch(RESUME, [
+        {'op': 'copy', 'from': '/name', 'path': '/summary'},
+        {'op': 'move', 'from': '/skills/1', 'path': '/experience/0/title'},
+    ])
+    assert patched['summary'] == 'Jane Doe'
+    assert patched['skills'] == ['Python']
+    assert patched['experience'][0]['title'] == 'Go'
+    assert fields == {'summary', 'skills', 'experience'}
+
+
+def test_escaped_pointer_tokens():
+    patched, _ = apply_patch({'a/b': 1, 'c~d': 2}, [
+        {'op': 'replace', 'path': '/a~1b', 'value': 3},
+        {'op': 'remove', 'path': '/c~0d'},
+    ])
+    assert patched == {'a/b': 3}
+
+
+def test_test_operation_touches_nothing():
+    patched, fields = apply_patch(RESUME, [{'op': 'test', 'path': '/skills/1', 'value': 'Go'}])
+    assert patched == RESUME
+    assert fields == set()
+
+
+def test_root_replace_touches_every_field():
+    patched, fields = apply_patch(RESUME, [{'op': 'replace', 'path': '', 'value': {'name': 'New'}}])
+    assert patched == {'name': 'New'}
+    assert fields is None
+
+
+@pytest.mark.parametrize('operations, message', [
+    ({'op': 'add'}, 'list of operations'),
+    ([{'op': 'add', 'path': '/x'}], 'needs a "value"'),
+    ([{'op': 'move', 'path': '/x'}], 'needs a "from"'),
+    ([{'op': 'remove', 'path': 'name'}], 'Invalid JSON pointer'),
+    ([{'op': 'remove', 'path': '/missing'}], 'Path not found'),
+    ([{'op': 'add', 'path': '/skills/01', 'value': 'C'}], 'Invalid array index'),
+    ([{'op': 'remove', 'path': '/skills/²'}], 'Invalid array index'),
+    ([{'op': 'add', 'path': '/skills/١', 'value': 'C'}], 'Invalid array index'),
+    ([{'op': 'add', 'path': '/skills/3', 'value': 'C'}], 'out of range'),
+    ([{'op': 'move', 'from': '/experience', 'path': '/experience/0/x'}], 'into itself'),
+    ([{'op': 'test', 'path': '/name', 'value': 'Someone'}], 'Test failed'),
+    ([{'op': 'replace', 'path': '', 'value': []}], 'must be an object'),
+    ([{'op': 'frobnicate', 'path': '/name'}], 'Unknown operation'),
+])
+def test_invalid_patches(operations, message):
+    with pytest.raises(PatchError, match=message):
+        apply_patch(RESUME, operations)
+
+
+def test_a_failing_patch_applies_nothing():
+    document = {'name': 'Jane', 'skills': []}
+    with pytest.raises(PatchError):
+        apply_patch(document, [{'op': 'add', 'path': '/skills/-', 'value': 'Go'},
+                               {'op': 'remove', 'path': '/missing'}])
+    assert document == {'name': 'Jane', 'skills': []}
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def sessions(request, tmp_path):
+    if request.param == 'memory':
+        return Sessions(MemorySessionStore())
+    return Sessions(SQLiteSessionStore(str(tmp_path / 'sessions.db')))
+
+
+def test_patch_bumps_the_version_and_rescores(sessions):
+    session = sessions.create({'name': 'Jane Doe'})
+    assert session['version'] == 1
+    patched = sessions.patch(session['id'], [{'op': 'add', 'path': '/email', 'value': 'jane@example.com'}])
+    assert patched['version'] == 2
+    assert patched['scores']['email'] == 15
+    assert patched['data']['score'] == session['data']['score'] + 15
+    assert sessions.get(session['id']) == patched
+
+
+def test_patch_of_a_stale_version_conflicts(sessions):
+    session = sessions.create({'name': 'Jane Doe'})
+    sessions.patch(session['id'], [{'op': 'replace', 'path': '/name', 'value': 'Jane Roe'}], version=1)
+    with pytest.raises(VersionConflict) as conflict:
+        sessions.patch(session['id'], [{'op': 'replace', 'path': '/name', 'value': 'J'}], version=1)
+    assert conflict.value.version == 2
+    assert sessions.get(session['id'])['data']['name'] == 'Jane Roe'
+
+
+def test_store_put_is_compare_and_swap(sessions):
+    session = sessions.create({'name': 'Jane Doe'})
+    newer, stale = {**session, 'version': 2}, {**session, 'version': 3}
+    assert sessions.store.put(newer, fast_json.dumps(newer), expected_version=1)
+    assert not sessions.store.put(stale, fast_json.dumps(stale), expected_version=1)
+    assert sessions.get(session['id'])['version'] == 2
+
+
+def test_patch_rejects_data_the_renderers_cannot_use(sessions):
+    session = sessions.create({'name': 'Jane Doe'})
+    with pytest.raises(PatchError, match='skills must be a list'):
+        sessions.patch(session['id'], [{'op': 'add', 'path': '/skills', 'value': 'Python'}])
+    assert sessions.get(session['id'])['version'] == 1
+
+
+def test_missing_and_deleted_sessions(sessions):
+    assert sessions.patch('missing', []) is None
+    session = sessions.create({'name': 'Jane Doe'})
+    assert sessions.delete(session['id'])
+    assert sessions.get(session['id']) is None
+
+
+def test_sessions_over_the_size_limit_are_refused():
+    with pytest.raises(PatchError, match='byte session limit'):
+        Sessions(MemorySessionStore(), max_size=100).create({'name': 'x' * 200})
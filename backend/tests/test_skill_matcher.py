@@ -0,0 +1,42 @@
+from skill_matcher import SkillMatcher
+
+
+def test_aliases_map_to_canonical_skill():
+    matcher = SkillMatcher(['Node.js', 'Kubernetes'], {'nodejs': 'Node.js', 'k8s': 'Kubernetes'})
+    assert matcher.find('Ran NodeJS services on K8S') == ['Node.js', 'Kubernetes']
+
+
+def test_alias_of_unlisted_skill_adds_it():
+    matcher = SkillMatcher(['Python'], {'golang': 'Go'})
+    assert matcher.find('golang and python') == ['Python', 'Go']
+    assert len(matcher) == 2
+
+
+def test_longest_term_wins():
+    matcher = SkillMatcher(['Java', 'JavaScript'])
+    assert matcher.find('JavaScript only') == ['JavaScript']
+
+
+def test_punctuated_terms_match_on_boundaries():
+    matcher = SkillMatcher(['C++', 'C#', 'Go'])
+    assert matcher.find('C++, C# and Go.') == ['C++', 'C#', 'Go']
+    assert matcher.find('Google, Gopher and C') == []
+
+
+def test_results_follow_dictionary_order_and_max_rank():
+    matcher = SkillMatcher(['Python', 'SQL', 'Docker'])
+    assert matcher.find('docker sql python docker') == ['Python', 'SQL', 'Docker']
+    assert matcher.find('docker sql python', max_rank=2) == ['Python', 'SQL']
+
+
+def test_from_file_reads_aliases(tmp_path):
+    path = tmp_path / 'skills.txt'
+    path.write_text('# comment\nNode.js | nodejs | node js\n\nKubernetes | k8s\n', encoding='utf-8')
+    matcher = SkillMatcher.from_file(str(path))
+    assert matcher.skills == ['Node.js', 'Kubernetes']
+    assert matcher.find('node js on k8s') == ['Node.js', 'Kubernetes']
+
+
+def test_fingerprint_tracks_dictionary_contents():
+    assert SkillMatcher(['Python']).fingerprint == SkillMatcher(['Python']).fingerprint
+    assert SkillMatcher(['Python']).fingerprint != SkillMatcher(['Python'], {'py': 'Python'}).fingerprint
@@ -0,0 +1,46 @@
+import io
+
+import pytest
+
+import app
+
+
+def docx_bytes(text):
+    from docx import Document
+    document = Document()
+    document.add_paragraph(text)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+def test_streaming_batch_holds_its_bytes_until_the_stream_ends(client):
+    files = [(io.BytesIO(docx_bytes(f'Candidate {i}')), f'resume{i}.docx') for i in range(2)]
+    response = client.post('/api/upload-batch', data={'files': files}, buffered=False)
+    assert response.status_code == 200
+    assert app.upload_budget.stats()['in_flight_requests'] == 1
+    charged = app.upload_budget.stats()['in_flight_bytes']
+    assert charged > 0
+
+    lines = list(response.response)
+    assert app.upload_budget.stats()['in_flight_bytes'] == charged
+    assert b'"done": true' in lines[-1]
+    response.close()
+    assert app.upload_budget.stats()['in_flight_bytes'] == 0
+    assert app.upload_budget.stats()['in_flight_requests'] == 0
+
+
+def test_single_upload_releases_its_bytes_on_return(client):
+    response = client.post('/api/upload', data={'file': (io.BytesIO(docx_bytes('Jane Doe')), 'resume.docx')})
+    assert response.status_code == 200
+    assert app.upload_budget.stats()['in_flight_bytes'] == 0
+
+
+def test_chunked_uploads_are_refused(client):
+    response = client.post('/api/upload', data=b'x', headers={'Transfer-Encoding': 'chunked'})
+    assert response.status_code == 411
@@ -0,0 +1,133 @@
+"""Memory bounds for uploaded request bodies.
+
+``SpooledUpload`` holds an uploaded file in memory up to a threshold and
+moves it to an anonymous temporary file in the upload folder beyond that,
+so a large upload costs disk rather than worker memory; extraction then
+reads it from the file. ``UploadBudget`` bounds the bytes of the uploads a
+worker process is receiving and parsing at once: requests past the budget
+wait for room for a few seconds, then are turned away with a retry delay.
+"""
+import math
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+LATENCY_WINDOW = 100
+
+
+class UploadBudgetExceeded(Exception):
+    """No room in the upload budget; ``retry_after`` is a suggested delay in seconds"""
+
+    def __init__(self, retry_after):
+        super().__init__('Server is busy with other uploads')
+        self.retry_after = retry_after
+
+
+class UploadSpool:
+    """Creates ``SpooledUpload`` files and counts how many went to disk"""
+
+    def __init__(self, max_memory):
+        self.max_memory = max_memory
+        self.lock = threading.Lock()
+        self.files = 0
+        self.spooled = 0
+
+    def open(self, directory):
+        """A new upload file, spooled to ``directory``"""
+        with self.lock:
+            self.files += 1
+        return SpooledUpload(self, self.max_memory, directory)
+
+    def rolled_over(self):
+        with self.lock:
+            self.spooled += 1
+
+    def stats(self):
+        return {
+            'max_memory_bytes': self.max_memory,
+            'files': self.files,
+            'spooled_to_disk': self.spooled
+        }
+
+
+class SpooledUpload(tempfile.SpooledTemporaryFile):
+    """An uploaded file, in memory until it outgrows the spool's threshold"""
+
+    def __init__(self, spool, max_size, directory):
+        super().__init__(max_size=max_size, dir=directory, prefix='upload-')
+        self.spool = spool
+        self.on_disk = False
+
+    def rollover(self):
+        if not self.on_disk:
+            self.on_disk = True
+            self.spool.rolled_over()
+        super().rollover()
+
+
+class UploadBudget:
+    """In-flight upload bytes of this process, bounded by ``max_bytes`` (0: unbounded).
+
+    A request larger than the whole budget is charged the budget, so it
+    runs once nothing else is in flight.
+    """
+
+    def __init__(self, max_bytes, wait=5):
+        self.max_bytes = max_bytes
+        self.wait = wait
+        self.condition = threading.Condition()
+        self.in_flight = 0
+        self.requests = 0
+        self.peak = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.durations = deque(maxlen=LATENCY_WINDOW)
+
+    def retry_after(self):
+        """Seconds until room is likely, from how long recent uploads held theirs"""
+        average = sum(self.durations) / len(self.durations) if self.durations else 1.0
+        return max(1, math.ceil(average))
+
+    @contextmanager
+    def reserve(self, size):
+        """Hold ``size`` bytes of the budget; raises ``UploadBudgetExceeded`` if no room comes within ``wait``"""
+        if self.max_bytes:
+            size = min(size, self.max_bytes)
+        deadline = time.monotonic() + self.wait
+        with self.condition:
+            if self.max_bytes and self.in_flight + size > self.max_bytes:
+                self.queued += 1
+                while self.in_flight + size > self.max_bytes:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.rejected += 1
+                        raise UploadBudgetExceeded(self.retry_after())
+                    self.condition.wait(remaining)
+            self.in_flight += size
+            self.requests += 1
+            self.admitted += 1
+            self.peak = max(self.peak, self.in_flight)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.in_flight -= size
+                self.requests -= 1
+                self.durations.append(time.monotonic() - start)
+                self.condition.notify_all()
+
+    def stats(self):
+        with self.condition:
+            return {
+                'max_bytes': self.max_bytes,
+                'in_flight_bytes': self.in_flight,
+                'in_flight_requests': self.requests,
+                'peak_bytes': self.peak,
+                'admitted': self.admitted,
+                'queued': self.queued,
+                'rejected': self.rejected
+            }
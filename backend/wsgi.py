@@ -0,0 +1,19 @@
+"""Production WSGI entry point::
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+With ``preload_app`` (the default) gunicorn imports this module once in the
+master, so the app, renderers and templates are loaded before the workers
+fork. Set ``WARM_ON_LOAD=false`` to skip warming.
+"""
+import os
+
+from app import app, env_flag
+from ner import PARSER_NER
+from request_log import logger
+from startup import warm
+
+if env_flag('WARM_ON_LOAD', True):
+    WARM_SECONDS = warm(nlp=env_flag('SPACY_PRELOAD', PARSER_NER))
+    logger.info('Warmed renderers in %.2fs', WARM_SECONDS,
+                extra={'warm_seconds': round(WARM_SECONDS, 3), 'pid': os.getpid()})
@@ -1,3 +1,3 @@
-/*! For license information please see main.06f703a2.js.LICENSE.txt */
-(()=>{"use strict";var e={43:(e,n,t)=>{e.exports=t(202)},153:(e,n,t)=>{var r=t(43),l=Symbol.for("react.element"),a=Symbol.for("react.fragment"),o=Object.prototype.hasOwnProperty,i=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,u={key:!0,ref:!0,__self:!0,__source:!0};function s(e,n,t){var r,a={},s=null,c=null;for(r in void 0!==t&&(s=""+t),void 0!==n.key&&(s=""+n.key),void 0!==n.ref&&(c=n.ref),n)o.call(n,r)&&!u.hasOwnProperty(r)&&(a[r]=n[r]);if(e&&e.defaultProps)for(r in n=e.defaultProps)void 0===a[r]&&(a[r]=n[r]);return{$$typeof:l,type:e,key:s,ref:c,props:a,_owner:i.current}}n.jsx=s,n.jsxs=s},202:(e,n)=>{var t=Symbol.for("react.element"),r=Symbol.for("react.portal"),l=Symbol.for("react.fragment"),a=Symbol.for("react.strict_mode"),o=Symbol.for("react.profiler"),i=Symbol.for("react.provider"),u=Symbol.for("react.context"),s=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),f=Symbol.for("react.lazy"),p=Symbol.iterator;var m={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},h=Object.assign,g={};function v(e,n,t){this.props=e,this.context=n,this.refs=g,this.updater=t||m}function y(){}function b(e,n,t){this.props=e,this.context=n,this.refs=g,this.updater=t||m}v.prototype.isReactComponent={},v.prototype.setState=function(e,n){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,n,"setState")},v.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},y.prototype=v.prototype;var x=b.prototype=new y;x.constructor=b,h(x,v.prototype),x.isPureReactComponent=!0;var w=Array.isArray,k=Object.prototype.hasOwnProperty,S={current:null},N={key:!0,ref:!0,__self:!0,__source:!0};function E(e,n,r){var l,a={},o=null,i=null;if(null!=n)for(l in void 0!==n.ref&&(i=n.ref),void 0!==n.key&&(o=""+n.key),n)k.call(n,l)&&!N.hasOwnProperty(l)&&(a[l]=n[l]);var u=arguments.length-2;if(1===u)a.children=r;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];a.children=s}if(e&&e.defaultProps)for(l in u=e.defaultProps)void 0===a[l]&&(a[l]=u[l]);return{$$typeof:t,type:e,key:o,ref:i,props:a,_owner:S.current}}function C(e){return"object"===typeof e&&null!==e&&e.$$typeof===t}var _=/\/+/g;function j(e,n){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var n={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(e){return n[e]})}(""+e.key):n.toString(36)}function P(e,n,l,a,o){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var u=!1;if(null===e)u=!0;else switch(i){case"string":case"number":u=!0;break;case"object":switch(e.$$typeof){case t:case r:u=!0}}if(u)return o=o(u=e),e=""===a?"."+j(u,0):a,w(o)?(l="",null!=e&&(l=e.replace(_,"$&/")+"/"),P(o,n,l,"",function(e){return e})):null!=o&&(C(o)&&(o=function(e,n){return{$$typeof:t,type:e.type,key:n,ref:e.ref,props:e.props,_owner:e._owner}}(o,l+(!o.key||u&&u.key===o.key?"":(""+o.key).replace(_,"$&/")+"/")+e)),n.push(o)),1;if(u=0,a=""===a?".":a+":",w(e))for(var s=0;s<e.length;s++){var c=a+j(i=e[s],s);u+=P(i,n,l,c,o)}else if(c=function(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=p&&e[p]||e["@@iterator"])?e:null}(e),"function"===typeof c)for(e=c.call(e),s=0;!(i=e.next()).done;)u+=P(i=i.value,n,l,c=a+j(i,s++),o);else if("object"===i)throw n=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===n?"object with keys {"+Object.keys(e).join(", ")+"}":n)+"). If you meant to render a collection of children, use an array instead.");return u}function z(e,n,t){if(null==e)return e;var r=[],l=0;return P(e,r,"","",function(e){return n.call(t,e,l++)}),r}function L(e){if(-1===e._status){var n=e._result;(n=n()).then(function(n){0!==e._status&&-1!==e._status||(e._status=1,e._result=n)},function(n){0!==e._status&&-1!==e._status||(e._status=2,e._result=n)}),-1===e._status&&(e._status=0,e._result=n)}if(1===e._status)return e._result.default;throw e._result}var T={current:null},O={transition:null},R={ReactCurrentDispatcher:T,ReactCurrentBatchConfig:O,ReactCurrentOwner:S};function M(){throw Error("act(...) is not supported in production builds of React.")}n.Children={map:z,forEach:function(e,n,t){z(e,function(){n.apply(this,arguments)},t)},count:function(e){var n=0;return z(e,function(){n++}),n},toArray:function(e){return z(e,function(e){return e})||[]},only:function(e){if(!C(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},n.Component=v,n.Fragment=l,n.Profiler=o,n.PureComponent=b,n.StrictMode=a,n.Suspense=c,n.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=R,n.act=M,n.cloneElement=function(e,n,r){if(null===e||void 0===e)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var l=h({},e.props),a=e.key,o=e.ref,i=e._owner;if(null!=n){if(void 0!==n.ref&&(o=n.ref,i=S.current),void 0!==n.key&&(a=""+n.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in n)k.call(n,s)&&!N.hasOwnProperty(s)&&(l[s]=void 0===n[s]&&void 0!==u?u[s]:n[s])}var s=arguments.length-2;if(1===s)l.children=r;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];l.children=u}return{$$typeof:t,type:e.type,key:a,ref:o,props:l,_owner:i}},n.createContext=function(e){return(e={$$typeof:u,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:i,_context:e},e.Consumer=e},n.createElement=E,n.createFactory=function(e){var n=E.bind(null,e);return n.type=e,n},n.createRef=function(){return{current:null}},n.forwardRef=function(e){return{$$typeof:s,render:e}},n.isValidElement=C,n.lazy=function(e){return{$$typeof:f,_payload:{_status:-1,_result:e},_init:L}},n.memo=function(e,n){return{$$typeof:d,type:e,compare:void 0===n?null:n}},n.startTransition=function(e){var n=O.transition;O.transition={};try{e()}finally{O.transition=n}},n.unstable_act=M,n.useCallback=function(e,n){return T.current.useCallback(e,n)},n.useContext=function(e){return T.current.useContext(e)},n.useDebugValue=function(){},n.useDeferredValue=function(e){return T.current.useDeferredValue(e)},n.useEffect=function(e,n){return T.current.useEffect(e,n)},n.useId=function(){return T.current.useId()},n.useImperativeHandle=function(e,n,t){return T.current.useImperativeHandle(e,n,t)},n.useInsertionEffect=function(e,n){return T.current.useInsertionEffect(e,n)},n.useLayoutEffect=function(e,n){return T.current.useLayoutEffect(e,n)},n.useMemo=function(e,n){return T.current.useMemo(e,n)},n.useReducer=function(e,n,t){return T.current.useReducer(e,n,t)},n.useRef=function(e){return T.current.useRef(e)},n.useState=function(e){return T.current.useState(e)},n.useSyncExternalStore=function(e,n,t){return T.current.useSyncExternalStore(e,n,t)},n.useTransition=function(){return T.current.useTransition()},n.version="18.3.1"},234:(e,n)=>{function t(e,n){var t=e.length;e.push(n);e:for(;0<t;){var r=t-1>>>1,l=e[r];if(!(0<a(l,n)))break e;e[r]=n,e[t]=l,t=r}}function r(e){return 0===e.length?null:e[0]}function l(e){if(0===e.length)return null;var n=e[0],t=e.pop();if(t!==n){e[0]=t;e:for(var r=0,l=e.length,o=l>>>1;r<o;){var i=2*(r+1)-1,u=e[i],s=i+1,c=e[s];if(0>a(u,t))s<l&&0>a(c,u)?(e[r]=c,e[s]=t,r=s):(e[r]=u,e[i]=t,r=i);else{if(!(s<l&&0>a(c,t)))break e;e[r]=c,e[s]=t,r=s}}}return n}function a(e,n){var t=e.sortIndex-n.sortIndex;return 0!==t?t:e.id-n.id}if("object"===typeof performance&&"function"===typeof performance.now){var o=performance;n.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();n.unstable_now=function(){return i.now()-u}}var s=[],c=[],d=1,f=null,p=3,m=!1,h=!1,g=!1,v="function"===typeof setTimeout?setTimeout:null,y="function"===typeof clearTimeout?clearTimeout:null,b="undefined"!==typeof setImmediate?setImmediate:null;function x(e){for(var n=r(c);null!==n;){if(null===n.callback)l(c);else{if(!(n.startTime<=e))break;l(c),n.sortIndex=n.expirationTime,t(s,n)}n=r(c)}}function w(e){if(g=!1,x(e),!h)if(null!==r(s))h=!0,O(k);else{var n=r(c);null!==n&&R(w,n.startTime-e)}}function k(e,t){h=!1,g&&(g=!1,y(C),C=-1),m=!0;var a=p;try{for(x(t),f=r(s);null!==f&&(!(f.expirationTime>t)||e&&!P());){var o=f.callback;if("function"===typeof o){f.callback=null,p=f.priorityLevel;var i=o(f.expirationTime<=t);t=n.unstable_now(),"function"===typeof i?f.callback=i:f===r(s)&&l(s),x(t)}else l(s);f=r(s)}if(null!==f)var u=!0;else{var d=r(c);null!==d&&R(w,d.startTime-t),u=!1}return u}finally{f=null,p=a,m=!1}}"undefined"!==typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var S,N=!1,E=null,C=-1,_=5,j=-1;function P(){return!(n.unstable_now()-j<_)}function z(){if(null!==E){var e=n.unstable_now();j=e;var t=!0;try{t=E(!0,e)}finally{t?S():(N=!1,E=null)}}else N=!1}if("function"===typeof b)S=function(){b(z)};else if("undefined"!==typeof MessageChannel){var L=new MessageChannel,T=L.port2;L.port1.onmessage=z,S=function(){T.postMessage(null)}}else S=function(){v(z,0)};function O(e){E=e,N||(N=!0,S())}function R(e,t){C=v(function(){e(n.unstable_now())},t)}n.unstable_IdlePriority=5,n.unstable_ImmediatePriority=1,n.unstable_LowPriority=4,n.unstable_NormalPriority=3,n.unstable_Profiling=null,n.unstable_UserBlockingPriority=2,n.unstable_cancelCallback=function(e){e.callback=null},n.unstable_continueExecution=function(){h||m||(h=!0,O(k))},n.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):_=0<e?Math.floor(1e3/e):5},n.unstable_getCurrentPriorityLevel=function(){return p},n.unstable_getFirstCallbackNode=function(){return r(s)},n.unstable_next=function(e){switch(p){case 1:case 2:case 3:var n=3;break;default:n=p}var t=p;p=n;try{return e()}finally{p=t}},n.unstable_pauseExecution=function(){},n.unstable_requestPaint=function(){},n.unstable_runWithPriority=function(e,n){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var t=p;p=e;try{return n()}finally{p=t}},n.unstable_scheduleCallback=function(e,l,a){var o=n.unstable_now();switch("object"===typeof a&&null!==a?a="number"===typeof(a=a.delay)&&0<a?o+a:o:a=o,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:d++,callback:l,priorityLevel:e,startTime:a,expirationTime:i=a+i,sortIndex:-1},a>o?(e.sortIndex=a,t(c,e),null===r(s)&&e===r(c)&&(g?(y(C),C=-1):g=!0,R(w,a-o))):(e.sortIndex=i,t(s,e),h||m||(h=!0,O(k))),e},n.unstable_shouldYield=P,n.unstable_wrapCallback=function(e){var n=p;return function(){var t=p;p=n;try{return e.apply(this,arguments)}finally{p=t}}}},391:(e,n,t)=>{var r=t(950);n.createRoot=r.createRoot,n.hydrateRoot=r.hydrateRoot},579:(e,n,t)=>{e.exports=t(153)},730:(e,n,t)=>{var r=t(43),l=t(853);function a(e){for(var n="https://reactjs.org/docs/error-decoder.html?invariant="+e,t=1;t<arguments.length;t++)n+="&args[]="+encodeURIComponent(arguments[t]);return"Minified React error #"+e+"; visit "+n+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var o=new Set,i={};function u(e,n){s(e,n),s(e+"Capture",n)}function s(e,n){for(i[e]=n,e=0;e<n.length;e++)o.add(n[e])}var c=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),d=Object.prototype.hasOwnProperty,f=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,p={},m={};function h(e,n,t,r,l,a,o){this.acceptsBooleans=2===n||3===n||4===n,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=t,this.propertyName=e,this.type=n,this.sanitizeURL=a,this.removeEmptyString=o}var g={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){g[e]=new h(e,0,!1,e,null,!1,!1)}),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var n=e[0];g[n]=new h(n,1,!1,e[1],null,!1,!1)}),["contentEditable","draggable","spellCheck","value"].forEach(function(e){g[e]=new h(e,2,!1,e.toLowerCase(),null,!1,!1)}),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){g[e]=new h(e,2,!1,e,null,!1,!1)}),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){g[e]=new h(e,3,!1,e.toLowerCase(),null,!1,!1)}),["checked","multiple","muted","selected"].forEach(function(e){g[e]=new h(e,3,!0,e,null,!1,!1)}),["capture","download"].forEach(function(e){g[e]=new h(e,4,!1,e,null,!1,!1)}),["cols","rows","size","span"].forEach(function(e){g[e]=new h(e,6,!1,e,null,!1,!1)}),["rowSpan","start"].forEach(function(e){g[e]=new h(e,5,!1,e.toLowerCase(),null,!1,!1)});var v=/[\-:]([a-z])/g;function y(e){return e[1].toUpperCase()}function b(e,n,t,r){var l=g.hasOwnProperty(n)?g[n]:null;(null!==l?0!==l.type:r||!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&(function(e,n,t,r){if(null===n||"undefined"===typeof n||function(e,n,t,r){if(null!==t&&0===t.type)return!1;switch(typeof n){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==t?!t.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,n,t,r))return!0;if(r)return!1;if(null!==t)switch(t.type){case 3:return!n;case 4:return!1===n;case 5:return isNaN(n);case 6:return isNaN(n)||1>n}return!1}(n,t,l,r)&&(t=null),r||null===l?function(e){return!!d.call(m,e)||!d.call(p,e)&&(f.test(e)?m[e]=!0:(p[e]=!0,!1))}(n)&&(null===t?e.removeAttribute(n):e.setAttribute(n,""+t)):l.mustUseProperty?e[l.propertyName]=null===t?3!==l.type&&"":t:(n=l.attributeName,r=l.attributeNamespace,null===t?e.removeAttribute(n):(t=3===(l=l.type)||4===l&&!0===t?"":""+t,r?e.setAttributeNS(r,n,t):e.setAttribute(n,t))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var n=e.replace(v,y);g[n]=new h(n,1,!1,e,null,!1,!1)}),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var n=e.replace(v,y);g[n]=new h(n,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)}),["xml:base","xml:lang","xml:space"].forEach(function(e){var n=e.replace(v,y);g[n]=new h(n,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)}),["tabIndex","crossOrigin"].forEach(function(e){g[e]=new h(e,1,!1,e.toLowerCase(),null,!1,!1)}),g.xlinkHref=new h("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach(function(e){g[e]=new h(e,1,!1,e.toLowerCase(),null,!0,!0)});var x=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,w=Symbol.for("react.element"),k=Symbol.for("react.portal"),S=Symbol.for("react.fragment"),N=Symbol.for("react.strict_mode"),E=Symbol.for("react.profiler"),C=Symbol.for("react.provider"),_=Symbol.for("react.context"),j=Symbol.for("react.forward_ref"),P=Symbol.for("react.suspense"),z=Symbol.for("react.suspense_list"),L=Symbol.for("react.memo"),T=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var O=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var R=Symbol.iterator;function M(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=R&&e[R]||e["@@iterator"])?e:null}var D,F=Object.assign;function I(e){if(void 0===D)try{throw Error()}catch(t){var n=t.stack.trim().match(/\n( *(at )?)/);D=n&&n[1]||""}return"\n"+D+e}var U=!1;function A(e,n){if(!e||U)return"";U=!0;var t=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(n)if(n=function(){throw Error()},Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(s){var r=s}Reflect.construct(e,[],n)}else{try{n.call()}catch(s){r=s}e.call(n.prototype)}else{try{throw Error()}catch(s){r=s}e()}}catch(s){if(s&&r&&"string"===typeof s.stack){for(var l=s.stack.split("\n"),a=r.stack.split("\n"),o=l.length-1,i=a.length-1;1<=o&&0<=i&&l[o]!==a[i];)i--;for(;1<=o&&0<=i;o--,i--)if(l[o]!==a[i]){if(1!==o||1!==i)do{if(o--,0>--i||l[o]!==a[i]){var u="\n"+l[o].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}}while(1<=o&&0<=i);break}}}finally{U=!1,Error.prepareStackTrace=t}return(e=e?e.displayName||e.name:"")?I(e):""}function V(e){switch(e.tag){case 5:return I(e.type);case 16:return I("Lazy");case 13:return I("Suspense");case 19:return I("SuspenseList");case 0:case 2:case 15:return e=A(e.type,!1);case 11:return e=A(e.type.render,!1);case 1:return e=A(e.type,!0);default:return""}}function $(e){if(null==e)return null;if("function"===typeof e)return e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case S:return"Fragment";case k:return"Portal";case E:return"Profiler";case N:return"StrictMode";case P:return"Suspense";case z:return"SuspenseList"}if("object"===typeof e)switch(e.$$typeof){case _:return(e.displayName||"Context")+".Consumer";case C:return(e._context.displayName||"Context")+".Provider";case j:var n=e.render;return(e=e.displayName)||(e=""!==(e=n.displayName||n.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case L:return null!==(n=e.displayName||null)?n:$(e.type)||"Memo";case T:n=e._payload,e=e._init;try{return $(e(n))}catch(t){}}return null}function B(e){var n=e.type;switch(e.tag){case 24:return"Cache";case 9:return(n.displayName||"Context")+".Consumer";case 10:return(n._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=(e=n.render).displayName||e.name||"",n.displayName||(""!==e?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return n;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return $(n);case 8:return n===N?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"===typeof n)return n.displayName||n.name||null;if("string"===typeof n)return n}return null}function W(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function H(e){var n=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===n||"radio"===n)}function Q(e){e._valueTracker||(e._valueTracker=function(e){var n=H(e)?"checked":"value",t=Object.getOwnPropertyDescriptor(e.constructor.prototype,n),r=""+e[n];if(!e.hasOwnProperty(n)&&"undefined"!==typeof t&&"function"===typeof t.get&&"function"===typeof t.set){var l=t.get,a=t.set;return Object.defineProperty(e,n,{configurable:!0,get:function(){return l.call(this)},set:function(e){r=""+e,a.call(this,e)}}),Object.defineProperty(e,n,{enumerable:t.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[n]}}}}(e))}function q(e){if(!e)return!1;var n=e._valueTracker;if(!n)return!0;var t=n.getValue(),r="";return e&&(r=H(e)?e.checked?"true":"false":e.value),(e=r)!==t&&(n.setValue(e),!0)}function K(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(n){return e.body}}function Y(e,n){var t=n.checked;return F({},n,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=t?t:e._wrapperState.initialChecked})}function X(e,n){var t=null==n.defaultValue?"":n.defaultValue,r=null!=n.checked?n.checked:n.defaultChecked;t=W(null!=n.value?n.value:t),e._wrapperState={initialChecked:r,initialValue:t,controlled:"checkbox"===n.type||"radio"===n.type?null!=n.checked:null!=n.value}}function G(e,n){null!=(n=n.checked)&&b(e,"checked",n,!1)}function Z(e,n){G(e,n);var t=W(n.value),r=n.type;if(null!=t)"number"===r?(0===t&&""===e.value||e.value!=t)&&(e.value=""+t):e.value!==""+t&&(e.value=""+t);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");n.hasOwnProperty("value")?ee(e,n.type,t):n.hasOwnProperty("defaultValue")&&ee(e,n.type,W(n.defaultValue)),null==n.checked&&null!=n.defaultChecked&&(e.defaultChecked=!!n.defaultChecked)}function J(e,n,t){if(n.hasOwnProperty("value")||n.hasOwnProperty("defaultValue")){var r=n.type;if(!("submit"!==r&&"reset"!==r||void 0!==n.value&&null!==n.value))return;n=""+e._wrapperState.initialValue,t||n===e.value||(e.value=n),e.defaultValue=n}""!==(t=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==t&&(e.name=t)}function ee(e,n,t){"number"===n&&K(e.ownerDocument)===e||(null==t?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+t&&(e.defaultValue=""+t))}var ne=Array.isArray;function te(e,n,t,r){if(e=e.options,n){n={};for(var l=0;l<t.length;l++)n["$"+t[l]]=!0;for(t=0;t<e.length;t++)l=n.hasOwnProperty("$"+e[t].value),e[t].selected!==l&&(e[t].selected=l),l&&r&&(e[t].defaultSelected=!0)}else{for(t=""+W(t),n=null,l=0;l<e.length;l++){if(e[l].value===t)return e[l].selected=!0,void(r&&(e[l].defaultSelected=!0));null!==n||e[l].disabled||(n=e[l])}null!==n&&(n.selected=!0)}}function re(e,n){if(null!=n.dangerouslySetInnerHTML)throw Error(a(91));return F({},n,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function le(e,n){var t=n.value;if(null==t){if(t=n.children,n=n.defaultValue,null!=t){if(null!=n)throw Error(a(92));if(ne(t)){if(1<t.length)throw Error(a(93));t=t[0]}n=t}null==n&&(n=""),t=n}e._wrapperState={initialValue:W(t)}}function ae(e,n){var t=W(n.value),r=W(n.defaultValue);null!=t&&((t=""+t)!==e.value&&(e.value=t),null==n.defaultValue&&e.defaultValue!==t&&(e.defaultValue=t)),null!=r&&(e.defaultValue=""+r)}function oe(e){var n=e.textContent;n===e._wrapperState.initialValue&&""!==n&&null!==n&&(e.value=n)}function ie(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ue(e,n){return null==e||"http://www.w3.org/1999/xhtml"===e?ie(n):"http://www.w3.org/2000/svg"===e&&"foreignObject"===n?"http://www.w3.org/1999/xhtml":e}var se,ce,de=(ce=function(e,n){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=n;else{for((se=se||document.createElement("div")).innerHTML="<svg>"+n.valueOf().toString()+"</svg>",n=se.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;n.firstChild;)e.appendChild(n.firstChild)}},"undefined"!==typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,n,t,r){MSApp.execUnsafeLocalFunction(function(){return ce(e,n)})}:ce);function fe(e,n){if(n){var t=e.firstChild;if(t&&t===e.lastChild&&3===t.nodeType)return void(t.nodeValue=n)}e.textContent=n}var pe={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},me=["Webkit","ms","Moz","O"];function he(e,n,t){return null==n||"boolean"===typeof n||""===n?"":t||"number"!==typeof n||0===n||pe.hasOwnProperty(e)&&pe[e]?(""+n).trim():n+"px"}function ge(e,n){for(var t in e=e.style,n)if(n.hasOwnProperty(t)){var r=0===t.indexOf("--"),l=he(t,n[t],r);"float"===t&&(t="cssFloat"),r?e.setProperty(t,l):e[t]=l}}Object.keys(pe).forEach(function(e){me.forEach(function(n){n=n+e.charAt(0).toUpperCase()+e.substring(1),pe[n]=pe[e]})});var ve=F({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function ye(e,n){if(n){if(ve[e]&&(null!=n.children||null!=n.dangerouslySetInnerHTML))throw Error(a(137,e));if(null!=n.dangerouslySetInnerHTML){if(null!=n.children)throw Error(a(60));if("object"!==typeof n.dangerouslySetInnerHTML||!("__html"in n.dangerouslySetInnerHTML))throw Error(a(61))}if(null!=n.style&&"object"!==typeof n.style)throw Error(a(62))}}function be(e,n){if(-1===e.indexOf("-"))return"string"===typeof n.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var xe=null;function we(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var ke=null,Se=null,Ne=null;function Ee(e){if(e=bl(e)){if("function"!==typeof ke)throw Error(a(280));var n=e.stateNode;n&&(n=wl(n),ke(e.stateNode,e.type,n))}}function Ce(e){Se?Ne?Ne.push(e):Ne=[e]:Se=e}function _e(){if(Se){var e=Se,n=Ne;if(Ne=Se=null,Ee(e),n)for(e=0;e<n.length;e++)Ee(n[e])}}function je(e,n){return e(n)}function Pe(){}var ze=!1;function Le(e,n,t){if(ze)return e(n,t);ze=!0;try{return je(e,n,t)}finally{ze=!1,(null!==Se||null!==Ne)&&(Pe(),_e())}}function Te(e,n){var t=e.stateNode;if(null===t)return null;var r=wl(t);if(null===r)return null;t=r[n];e:switch(n){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(t&&"function"!==typeof t)throw Error(a(231,n,typeof t));return t}var Oe=!1;if(c)try{var Re={};Object.defineProperty(Re,"passive",{get:function(){Oe=!0}}),window.addEventListener("test",Re,Re),window.removeEventListener("test",Re,Re)}catch(ce){Oe=!1}function Me(e,n,t,r,l,a,o,i,u){var s=Array.prototype.slice.call(arguments,3);try{n.apply(t,s)}catch(c){this.onError(c)}}var De=!1,Fe=null,Ie=!1,Ue=null,Ae={onError:function(e){De=!0,Fe=e}};function Ve(e,n,t,r,l,a,o,i,u){De=!1,Fe=null,Me.apply(Ae,arguments)}function $e(e){var n=e,t=e;if(e.alternate)for(;n.return;)n=n.return;else{e=n;do{0!==(4098&(n=e).flags)&&(t=n.return),e=n.return}while(e)}return 3===n.tag?t:null}function Be(e){if(13===e.tag){var n=e.memoizedState;if(null===n&&(null!==(e=e.alternate)&&(n=e.memoizedState)),null!==n)return n.dehydrated}return null}function We(e){if($e(e)!==e)throw Error(a(188))}function He(e){return null!==(e=function(e){var n=e.alternate;if(!n){if(null===(n=$e(e)))throw Error(a(188));return n!==e?null:e}for(var t=e,r=n;;){var l=t.return;if(null===l)break;var o=l.alternate;if(null===o){if(null!==(r=l.return)){t=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===t)return We(l),e;if(o===r)return We(l),n;o=o.sibling}throw Error(a(188))}if(t.return!==r.return)t=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===t){i=!0,t=l,r=o;break}if(u===r){i=!0,r=l,t=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===t){i=!0,t=o,r=l;break}if(u===r){i=!0,r=o,t=l;break}u=u.sibling}if(!i)throw Error(a(189))}}if(t.alternate!==r)throw Error(a(190))}if(3!==t.tag)throw Error(a(188));return t.stateNode.current===t?e:n}(e))?Qe(e):null}function Qe(e){if(5===e.tag||6===e.tag)return e;for(e=e.child;null!==e;){var n=Qe(e);if(null!==n)return n;e=e.sibling}return null}var qe=l.unstable_scheduleCallback,Ke=l.unstable_cancelCallback,Ye=l.unstable_shouldYield,Xe=l.unstable_requestPaint,Ge=l.unstable_now,Ze=l.unstable_getCurrentPriorityLevel,Je=l.unstable_ImmediatePriority,en=l.unstable_UserBlockingPriority,nn=l.unstable_NormalPriority,tn=l.unstable_LowPriority,rn=l.unstable_IdlePriority,ln=null,an=null;var on=Math.clz32?Math.clz32:function(e){return e>>>=0,0===e?32:31-(un(e)/sn|0)|0},un=Math.log,sn=Math.LN2;var cn=64,dn=4194304;function fn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&e;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&e;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function pn(e,n){var t=e.pendingLanes;if(0===t)return 0;var r=0,l=e.suspendedLanes,a=e.pingedLanes,o=268435455&t;if(0!==o){var i=o&~l;0!==i?r=fn(i):0!==(a&=o)&&(r=fn(a))}else 0!==(o=t&~l)?r=fn(o):0!==a&&(r=fn(a));if(0===r)return 0;if(0!==n&&n!==r&&0===(n&l)&&((l=r&-r)>=(a=n&-n)||16===l&&0!==(4194240&a)))return n;if(0!==(4&r)&&(r|=16&t),0!==(n=e.entangledLanes))for(e=e.entanglements,n&=r;0<n;)l=1<<(t=31-on(n)),r|=e[t],n&=~l;return r}function mn(e,n){switch(e){case 1:case 2:case 4:return n+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return n+5e3;default:return-1}}function hn(e){return 0!==(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function gn(){var e=cn;return 0===(4194240&(cn<<=1))&&(cn=64),e}function vn(e){for(var n=[],t=0;31>t;t++)n.push(e);return n}function yn(e,n,t){e.pendingLanes|=n,536870912!==n&&(e.suspendedLanes=0,e.pingedLanes=0),(e=e.eventTimes)[n=31-on(n)]=t}function bn(e,n){var t=e.entangledLanes|=n;for(e=e.entanglements;t;){var r=31-on(t),l=1<<r;l&n|e[r]&n&&(e[r]|=n),t&=~l}}var xn=0;function wn(e){return 1<(e&=-e)?4<e?0!==(268435455&e)?16:536870912:4:1}var kn,Sn,Nn,En,Cn,_n=!1,jn=[],Pn=null,zn=null,Ln=null,Tn=new Map,On=new Map,Rn=[],Mn="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Dn(e,n){switch(e){case"focusin":case"focusout":Pn=null;break;case"dragenter":case"dragleave":zn=null;break;case"mouseover":case"mouseout":Ln=null;break;case"pointerover":case"pointerout":Tn.delete(n.pointerId);break;case"gotpointercapture":case"lostpointercapture":On.delete(n.pointerId)}}function Fn(e,n,t,r,l,a){return null===e||e.nativeEvent!==a?(e={blockedOn:n,domEventName:t,eventSystemFlags:r,nativeEvent:a,targetContainers:[l]},null!==n&&(null!==(n=bl(n))&&Sn(n)),e):(e.eventSystemFlags|=r,n=e.targetContainers,null!==l&&-1===n.indexOf(l)&&n.push(l),e)}function In(e){var n=yl(e.target);if(null!==n){var t=$e(n);if(null!==t)if(13===(n=t.tag)){if(null!==(n=Be(t)))return e.blockedOn=n,void Cn(e.priority,function(){Nn(t)})}else if(3===n&&t.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===t.tag?t.stateNode.containerInfo:null)}e.blockedOn=null}function Un(e){if(null!==e.blockedOn)return!1;for(var n=e.targetContainers;0<n.length;){var t=Xn(e.domEventName,e.eventSystemFlags,n[0],e.nativeEvent);if(null!==t)return null!==(n=bl(t))&&Sn(n),e.blockedOn=t,!1;var r=new(t=e.nativeEvent).constructor(t.type,t);xe=r,t.target.dispatchEvent(r),xe=null,n.shift()}return!0}function An(e,n,t){Un(e)&&t.delete(n)}function Vn(){_n=!1,null!==Pn&&Un(Pn)&&(Pn=null),null!==zn&&Un(zn)&&(zn=null),null!==Ln&&Un(Ln)&&(Ln=null),Tn.forEach(An),On.forEach(An)}function $n(e,n){e.blockedOn===n&&(e.blockedOn=null,_n||(_n=!0,l.unstable_scheduleCallback(l.unstable_NormalPriority,Vn)))}function Bn(e){function n(n){return $n(n,e)}if(0<jn.length){$n(jn[0],e);for(var t=1;t<jn.length;t++){var r=jn[t];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==Pn&&$n(Pn,e),null!==zn&&$n(zn,e),null!==Ln&&$n(Ln,e),Tn.forEach(n),On.forEach(n),t=0;t<Rn.length;t++)(r=Rn[t]).blockedOn===e&&(r.blockedOn=null);for(;0<Rn.length&&null===(t=Rn[0]).blockedOn;)In(t),null===t.blockedOn&&Rn.shift()}var Wn=x.ReactCurrentBatchConfig,Hn=!0;function Qn(e,n,t,r){var l=xn,a=Wn.transition;Wn.transition=null;try{xn=1,Kn(e,n,t,r)}finally{xn=l,Wn.transition=a}}function qn(e,n,t,r){var l=xn,a=Wn.transition;Wn.transition=null;try{xn=4,Kn(e,n,t,r)}finally{xn=l,Wn.transition=a}}function Kn(e,n,t,r){if(Hn){var l=Xn(e,n,t,r);if(null===l)Wr(e,n,r,Yn,t),Dn(e,r);else if(function(e,n,t,r,l){switch(n){case"focusin":return Pn=Fn(Pn,e,n,t,r,l),!0;case"dragenter":return zn=Fn(zn,e,n,t,r,l),!0;case"mouseover":return Ln=Fn(Ln,e,n,t,r,l),!0;case"pointerover":var a=l.pointerId;return Tn.set(a,Fn(Tn.get(a)||null,e,n,t,r,l)),!0;case"gotpointercapture":return a=l.pointerId,On.set(a,Fn(On.get(a)||null,e,n,t,r,l)),!0}return!1}(l,e,n,t,r))r.stopPropagation();else if(Dn(e,r),4&n&&-1<Mn.indexOf(e)){for(;null!==l;){var a=bl(l);if(null!==a&&kn(a),null===(a=Xn(e,n,t,r))&&Wr(e,n,r,Yn,t),a===l)break;l=a}null!==l&&r.stopPropagation()}else Wr(e,n,r,null,t)}}var Yn=null;function Xn(e,n,t,r){if(Yn=null,null!==(e=yl(e=we(r))))if(null===(n=$e(e)))e=null;else if(13===(t=n.tag)){if(null!==(e=Be(n)))return e;e=null}else if(3===t){if(n.stateNode.current.memoizedState.isDehydrated)return 3===n.tag?n.stateNode.containerInfo:null;e=null}else n!==e&&(e=null);return Yn=e,null}function Gn(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Ze()){case Je:return 1;case en:return 4;case nn:case tn:return 16;case rn:return 536870912;default:return 16}default:return 16}}var Zn=null,Jn=null,et=null;function nt(){if(et)return et;var e,n,t=Jn,r=t.length,l="value"in Zn?Zn.value:Zn.textContent,a=l.length;for(e=0;e<r&&t[e]===l[e];e++);var o=r-e;for(n=1;n<=o&&t[r-n]===l[a-n];n++);return et=l.slice(e,1<n?1-n:void 0)}function tt(e){var n=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===n&&(e=13):e=n,10===e&&(e=13),32<=e||13===e?e:0}function rt(){return!0}function lt(){return!1}function at(e){function n(n,t,r,l,a){for(var o in this._reactName=n,this._targetInst=r,this.type=t,this.nativeEvent=l,this.target=a,this.currentTarget=null,e)e.hasOwnProperty(o)&&(n=e[o],this[o]=n?n(l):l[o]);return this.isDefaultPrevented=(null!=l.defaultPrevented?l.defaultPrevented:!1===l.returnValue)?rt:lt,this.isPropagationStopped=lt,this}return F(n.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=rt)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=rt)},persist:function(){},isPersistent:rt}),n}var ot,it,ut,st={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},ct=at(st),dt=F({},st,{view:0,detail:0}),ft=at(dt),pt=F({},dt,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Et,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==ut&&(ut&&"mousemove"===e.type?(ot=e.screenX-ut.screenX,it=e.screenY-ut.screenY):it=ot=0,ut=e),ot)},movementY:function(e){return"movementY"in e?e.movementY:it}}),mt=at(pt),ht=at(F({},pt,{dataTransfer:0})),gt=at(F({},dt,{relatedTarget:0})),vt=at(F({},st,{animationName:0,elapsedTime:0,pseudoElement:0})),yt=F({},st,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),bt=at(yt),xt=at(F({},st,{data:0})),wt={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},kt={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},St={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Nt(e){var n=this.nativeEvent;return n.getModifierState?n.getModifierState(e):!!(e=St[e])&&!!n[e]}function Et(){return Nt}var Ct=F({},dt,{key:function(e){if(e.key){var n=wt[e.key]||e.key;if("Unidentified"!==n)return n}return"keypress"===e.type?13===(e=tt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?kt[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Et,charCode:function(e){return"keypress"===e.type?tt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?tt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),_t=at(Ct),jt=at(F({},pt,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),Pt=at(F({},dt,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Et})),zt=at(F({},st,{propertyName:0,elapsedTime:0,pseudoElement:0})),Lt=F({},pt,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Tt=at(Lt),Ot=[9,13,27,32],Rt=c&&"CompositionEvent"in window,Mt=null;c&&"documentMode"in document&&(Mt=document.documentMode);var Dt=c&&"TextEvent"in window&&!Mt,Ft=c&&(!Rt||Mt&&8<Mt&&11>=Mt),It=String.fromCharCode(32),Ut=!1;function At(e,n){switch(e){case"keyup":return-1!==Ot.indexOf(n.keyCode);case"keydown":return 229!==n.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Vt(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var $t=!1;var Bt={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Wt(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===n?!!Bt[e.type]:"textarea"===n}function Ht(e,n,t,r){Ce(r),0<(n=Qr(n,"onChange")).length&&(t=new ct("onChange","change",null,t,r),e.push({event:t,listeners:n}))}var Qt=null,qt=null;function Kt(e){Ir(e,0)}function Yt(e){if(q(xl(e)))return e}function Xt(e,n){if("change"===e)return n}var Gt=!1;if(c){var Zt;if(c){var Jt="oninput"in document;if(!Jt){var er=document.createElement("div");er.setAttribute("oninput","return;"),Jt="function"===typeof er.oninput}Zt=Jt}else Zt=!1;Gt=Zt&&(!document.documentMode||9<document.documentMode)}function nr(){Qt&&(Qt.detachEvent("onpropertychange",tr),qt=Qt=null)}function tr(e){if("value"===e.propertyName&&Yt(qt)){var n=[];Ht(n,qt,e,we(e)),Le(Kt,n)}}function rr(e,n,t){"focusin"===e?(nr(),qt=t,(Qt=n).attachEvent("onpropertychange",tr)):"focusout"===e&&nr()}function lr(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Yt(qt)}function ar(e,n){if("click"===e)return Yt(n)}function or(e,n){if("input"===e||"change"===e)return Yt(n)}var ir="function"===typeof Object.is?Object.is:function(e,n){return e===n&&(0!==e||1/e===1/n)||e!==e&&n!==n};function ur(e,n){if(ir(e,n))return!0;if("object"!==typeof e||null===e||"object"!==typeof n||null===n)return!1;var t=Object.keys(e),r=Object.keys(n);if(t.length!==r.length)return!1;for(r=0;r<t.length;r++){var l=t[r];if(!d.call(n,l)||!ir(e[l],n[l]))return!1}return!0}function sr(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function cr(e,n){var t,r=sr(e);for(e=0;r;){if(3===r.nodeType){if(t=e+r.textContent.length,e<=n&&t>=n)return{node:r,offset:n-e};e=t}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=sr(r)}}function dr(e,n){return!(!e||!n)&&(e===n||(!e||3!==e.nodeType)&&(n&&3===n.nodeType?dr(e,n.parentNode):"contains"in e?e.contains(n):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(n))))}function fr(){for(var e=window,n=K();n instanceof e.HTMLIFrameElement;){try{var t="string"===typeof n.contentWindow.location.href}catch(r){t=!1}if(!t)break;n=K((e=n.contentWindow).document)}return n}function pr(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return n&&("input"===n&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===n||"true"===e.contentEditable)}function mr(e){var n=fr(),t=e.focusedElem,r=e.selectionRange;if(n!==t&&t&&t.ownerDocument&&dr(t.ownerDocument.documentElement,t)){if(null!==r&&pr(t))if(n=r.start,void 0===(e=r.end)&&(e=n),"selectionStart"in t)t.selectionStart=n,t.selectionEnd=Math.min(e,t.value.length);else if((e=(n=t.ownerDocument||document)&&n.defaultView||window).getSelection){e=e.getSelection();var l=t.textContent.length,a=Math.min(r.start,l);r=void 0===r.end?a:Math.min(r.end,l),!e.extend&&a>r&&(l=r,r=a,a=l),l=cr(t,a);var o=cr(t,r);l&&o&&(1!==e.rangeCount||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&((n=n.createRange()).setStart(l.node,l.offset),e.removeAllRanges(),a>r?(e.addRange(n),e.extend(o.node,o.offset)):(n.setEnd(o.node,o.offset),e.addRange(n)))}for(n=[],e=t;e=e.parentNode;)1===e.nodeType&&n.push({element:e,left:e.scrollLeft,top:e.scrollTop});for("function"===typeof t.focus&&t.focus(),t=0;t<n.length;t++)(e=n[t]).element.scrollLeft=e.left,e.element.scrollTop=e.top}}var hr=c&&"documentMode"in document&&11>=document.documentMode,gr=null,vr=null,yr=null,br=!1;function xr(e,n,t){var r=t.window===t?t.document:9===t.nodeType?t:t.ownerDocument;br||null==gr||gr!==K(r)||("selectionStart"in(r=gr)&&pr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},yr&&ur(yr,r)||(yr=r,0<(r=Qr(vr,"onSelect")).length&&(n=new ct("onSelect","select",null,n,t),e.push({event:n,listeners:r}),n.target=gr)))}function wr(e,n){var t={};return t[e.toLowerCase()]=n.toLowerCase(),t["Webkit"+e]="webkit"+n,t["Moz"+e]="moz"+n,t}var kr={animationend:wr("Animation","AnimationEnd"),animationiteration:wr("Animation","AnimationIteration"),animationstart:wr("Animation","AnimationStart"),transitionend:wr("Transition","TransitionEnd")},Sr={},Nr={};function Er(e){if(Sr[e])return Sr[e];if(!kr[e])return e;var n,t=kr[e];for(n in t)if(t.hasOwnProperty(n)&&n in Nr)return Sr[e]=t[n];return e}c&&(Nr=document.createElement("div").style,"AnimationEvent"in window||(delete kr.animationend.animation,delete kr.animationiteration.animation,delete kr.animationstart.animation),"TransitionEvent"in window||delete kr.transitionend.transition);var Cr=Er("animationend"),_r=Er("animationiteration"),jr=Er("animationstart"),Pr=Er("transitionend"),zr=new Map,Lr="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Tr(e,n){zr.set(e,n),u(n,[e])}for(var Or=0;Or<Lr.length;Or++){var Rr=Lr[Or];Tr(Rr.toLowerCase(),"on"+(Rr[0].toUpperCase()+Rr.slice(1)))}Tr(Cr,"onAnimationEnd"),Tr(_r,"onAnimationIteration"),Tr(jr,"onAnimationStart"),Tr("dblclick","onDoubleClick"),Tr("focusin","onFocus"),Tr("focusout","onBlur"),Tr(Pr,"onTransitionEnd"),s("onMouseEnter",["mouseout","mouseover"]),s("onMouseLeave",["mouseout","mouseover"]),s("onPointerEnter",["pointerout","pointerover"]),s("onPointerLeave",["pointerout","pointerover"]),u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),u("onBeforeInput",["compositionend","keypress","textInput","paste"]),u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Mr="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Dr=new Set("cancel close invalid load scroll toggle".split(" ").concat(Mr));function Fr(e,n,t){var r=e.type||"unknown-event";e.currentTarget=t,function(e,n,t,r,l,o,i,u,s){if(Ve.apply(this,arguments),De){if(!De)throw Error(a(198));var c=Fe;De=!1,Fe=null,Ie||(Ie=!0,Ue=c)}}(r,n,void 0,e),e.currentTarget=null}function Ir(e,n){n=0!==(4&n);for(var t=0;t<e.length;t++){var r=e[t],l=r.event;r=r.listeners;e:{var a=void 0;if(n)for(var o=r.length-1;0<=o;o--){var i=r[o],u=i.instance,s=i.currentTarget;if(i=i.listener,u!==a&&l.isPropagationStopped())break e;Fr(l,i,s),a=u}else for(o=0;o<r.length;o++){if(u=(i=r[o]).instance,s=i.currentTarget,i=i.listener,u!==a&&l.isPropagationStopped())break e;Fr(l,i,s),a=u}}}if(Ie)throw e=Ue,Ie=!1,Ue=null,e}function Ur(e,n){var t=n[hl];void 0===t&&(t=n[hl]=new Set);var r=e+"__bubble";t.has(r)||(Br(n,e,2,!1),t.add(r))}function Ar(e,n,t){var r=0;n&&(r|=4),Br(t,e,r,n)}var Vr="_reactListening"+Math.random().toString(36).slice(2);function $r(e){if(!e[Vr]){e[Vr]=!0,o.forEach(function(n){"selectionchange"!==n&&(Dr.has(n)||Ar(n,!1,e),Ar(n,!0,e))});var n=9===e.nodeType?e:e.ownerDocument;null===n||n[Vr]||(n[Vr]=!0,Ar("selectionchange",!1,n))}}function Br(e,n,t,r){switch(Gn(n)){case 1:var l=Qn;break;case 4:l=qn;break;default:l=Kn}t=l.bind(null,n,t,e),l=void 0,!Oe||"touchstart"!==n&&"touchmove"!==n&&"wheel"!==n||(l=!0),r?void 0!==l?e.addEventListener(n,t,{capture:!0,passive:l}):e.addEventListener(n,t,!0):void 0!==l?e.addEventListener(n,t,{passive:l}):e.addEventListener(n,t,!1)}function Wr(e,n,t,r,l){var a=r;if(0===(1&n)&&0===(2&n)&&null!==r)e:for(;;){if(null===r)return;var o=r.tag;if(3===o||4===o){var i=r.stateNode.containerInfo;if(i===l||8===i.nodeType&&i.parentNode===l)break;if(4===o)for(o=r.return;null!==o;){var u=o.tag;if((3===u||4===u)&&((u=o.stateNode.containerInfo)===l||8===u.nodeType&&u.parentNode===l))return;o=o.return}for(;null!==i;){if(null===(o=yl(i)))return;if(5===(u=o.tag)||6===u){r=a=o;continue e}i=i.parentNode}}r=r.return}Le(function(){var r=a,l=we(t),o=[];e:{var i=zr.get(e);if(void 0!==i){var u=ct,s=e;switch(e){case"keypress":if(0===tt(t))break e;case"keydown":case"keyup":u=_t;break;case"focusin":s="focus",u=gt;break;case"focusout":s="blur",u=gt;break;case"beforeblur":case"afterblur":u=gt;break;case"click":if(2===t.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":u=mt;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":u=ht;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":u=Pt;break;case Cr:case _r:case jr:u=vt;break;case Pr:u=zt;break;case"scroll":u=ft;break;case"wheel":u=Tt;break;case"copy":case"cut":case"paste":u=bt;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":u=jt}var c=0!==(4&n),d=!c&&"scroll"===e,f=c?null!==i?i+"Capture":null:i;c=[];for(var p,m=r;null!==m;){var h=(p=m).stateNode;if(5===p.tag&&null!==h&&(p=h,null!==f&&(null!=(h=Te(m,f))&&c.push(Hr(m,h,p)))),d)break;m=m.return}0<c.length&&(i=new u(i,s,null,t,l),o.push({event:i,listeners:c}))}}if(0===(7&n)){if(u="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||t===xe||!(s=t.relatedTarget||t.fromElement)||!yl(s)&&!s[ml])&&(u||i)&&(i=l.window===l?l:(i=l.ownerDocument)?i.defaultView||i.parentWindow:window,u?(u=r,null!==(s=(s=t.relatedTarget||t.toElement)?yl(s):null)&&(s!==(d=$e(s))||5!==s.tag&&6!==s.tag)&&(s=null)):(u=null,s=r),u!==s)){if(c=mt,h="onMouseLeave",f="onMouseEnter",m="mouse","pointerout"!==e&&"pointerover"!==e||(c=jt,h="onPointerLeave",f="onPointerEnter",m="pointer"),d=null==u?i:xl(u),p=null==s?i:xl(s),(i=new c(h,m+"leave",u,t,l)).target=d,i.relatedTarget=p,h=null,yl(l)===r&&((c=new c(f,m+"enter",s,t,l)).target=p,c.relatedTarget=d,h=c),d=h,u&&s)e:{for(f=s,m=0,p=c=u;p;p=qr(p))m++;for(p=0,h=f;h;h=qr(h))p++;for(;0<m-p;)c=qr(c),m--;for(;0<p-m;)f=qr(f),p--;for(;m--;){if(c===f||null!==f&&c===f.alternate)break e;c=qr(c),f=qr(f)}c=null}else c=null;null!==u&&Kr(o,i,u,c,!1),null!==s&&null!==d&&Kr(o,d,s,c,!0)}if("select"===(u=(i=r?xl(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===u&&"file"===i.type)var g=Xt;else if(Wt(i))if(Gt)g=or;else{g=lr;var v=rr}else(u=i.nodeName)&&"input"===u.toLowerCase()&&("checkbox"===i.type||"radio"===i.type)&&(g=ar);switch(g&&(g=g(e,r))?Ht(o,g,t,l):(v&&v(e,i,r),"focusout"===e&&(v=i._wrapperState)&&v.controlled&&"number"===i.type&&ee(i,"number",i.value)),v=r?xl(r):window,e){case"focusin":(Wt(v)||"true"===v.contentEditable)&&(gr=v,vr=r,yr=null);break;case"focusout":yr=vr=gr=null;break;case"mousedown":br=!0;break;case"contextmenu":case"mouseup":case"dragend":br=!1,xr(o,t,l);break;case"selectionchange":if(hr)break;case"keydown":case"keyup":xr(o,t,l)}var y;if(Rt)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else $t?At(e,t)&&(b="onCompositionEnd"):"keydown"===e&&229===t.keyCode&&(b="onCompositionStart");b&&(Ft&&"ko"!==t.locale&&($t||"onCompositionStart"!==b?"onCompositionEnd"===b&&$t&&(y=nt()):(Jn="value"in(Zn=l)?Zn.value:Zn.textContent,$t=!0)),0<(v=Qr(r,b)).length&&(b=new xt(b,e,null,t,l),o.push({event:b,listeners:v}),y?b.data=y:null!==(y=Vt(t))&&(b.data=y))),(y=Dt?function(e,n){switch(e){case"compositionend":return Vt(n);case"keypress":return 32!==n.which?null:(Ut=!0,It);case"textInput":return(e=n.data)===It&&Ut?null:e;default:return null}}(e,t):function(e,n){if($t)return"compositionend"===e||!Rt&&At(e,n)?(e=nt(),et=Jn=Zn=null,$t=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(n.ctrlKey||n.altKey||n.metaKey)||n.ctrlKey&&n.altKey){if(n.char&&1<n.char.length)return n.char;if(n.which)return String.fromCharCode(n.which)}return null;case"compositionend":return Ft&&"ko"!==n.locale?null:n.data}}(e,t))&&(0<(r=Qr(r,"onBeforeInput")).length&&(l=new xt("onBeforeInput","beforeinput",null,t,l),o.push({event:l,listeners:r}),l.data=y))}Ir(o,n)})}function Hr(e,n,t){return{instance:e,listener:n,currentTarget:t}}function Qr(e,n){for(var t=n+"Capture",r=[];null!==e;){var l=e,a=l.stateNode;5===l.tag&&null!==a&&(l=a,null!=(a=Te(e,t))&&r.unshift(Hr(e,a,l)),null!=(a=Te(e,n))&&r.push(Hr(e,a,l))),e=e.return}return r}function qr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Kr(e,n,t,r,l){for(var a=n._reactName,o=[];null!==t&&t!==r;){var i=t,u=i.alternate,s=i.stateNode;if(null!==u&&u===r)break;5===i.tag&&null!==s&&(i=s,l?null!=(u=Te(t,a))&&o.unshift(Hr(t,u,i)):l||null!=(u=Te(t,a))&&o.push(Hr(t,u,i))),t=t.return}0!==o.length&&e.push({event:n,listeners:o})}var Yr=/\r\n?/g,Xr=/\u0000|\uFFFD/g;function Gr(e){return("string"===typeof e?e:""+e).replace(Yr,"\n").replace(Xr,"")}function Zr(e,n,t){if(n=Gr(n),Gr(e)!==n&&t)throw Error(a(425))}function Jr(){}var el=null,nl=null;function tl(e,n){return"textarea"===e||"noscript"===e||"string"===typeof n.children||"number"===typeof n.children||"object"===typeof n.dangerouslySetInnerHTML&&null!==n.dangerouslySetInnerHTML&&null!=n.dangerouslySetInnerHTML.__html}var rl="function"===typeof setTimeout?setTimeout:void 0,ll="function"===typeof clearTimeout?clearTimeout:void 0,al="function"===typeof Promise?Promise:void 0,ol="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof al?function(e){return al.resolve(null).then(e).catch(il)}:rl;function il(e){setTimeout(function(){throw e})}function ul(e,n){var t=n,r=0;do{var l=t.nextSibling;if(e.removeChild(t),l&&8===l.nodeType)if("/$"===(t=l.data)){if(0===r)return e.removeChild(l),void Bn(n);r--}else"$"!==t&&"$?"!==t&&"$!"!==t||r++;t=l}while(t);Bn(n)}function sl(e){for(;null!=e;e=e.nextSibling){var n=e.nodeType;if(1===n||3===n)break;if(8===n){if("$"===(n=e.data)||"$!"===n||"$?"===n)break;if("/$"===n)return null}}return e}function cl(e){e=e.previousSibling;for(var n=0;e;){if(8===e.nodeType){var t=e.data;if("$"===t||"$!"===t||"$?"===t){if(0===n)return e;n--}else"/$"===t&&n++}e=e.previousSibling}return null}var dl=Math.random().toString(36).slice(2),fl="__reactFiber$"+dl,pl="__reactProps$"+dl,ml="__reactContainer$"+dl,hl="__reactEvents$"+dl,gl="__reactListeners$"+dl,vl="__reactHandles$"+dl;function yl(e){var n=e[fl];if(n)return n;for(var t=e.parentNode;t;){if(n=t[ml]||t[fl]){if(t=n.alternate,null!==n.child||null!==t&&null!==t.child)for(e=cl(e);null!==e;){if(t=e[fl])return t;e=cl(e)}return n}t=(e=t).parentNode}return null}function bl(e){return!(e=e[fl]||e[ml])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function xl(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(a(33))}function wl(e){return e[pl]||null}var kl=[],Sl=-1;function Nl(e){return{current:e}}function El(e){0>Sl||(e.current=kl[Sl],kl[Sl]=null,Sl--)}function Cl(e,n){Sl++,kl[Sl]=e.current,e.current=n}var _l={},jl=Nl(_l),Pl=Nl(!1),zl=_l;function Ll(e,n){var t=e.type.contextTypes;if(!t)return _l;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===n)return r.__reactInternalMemoizedMaskedChildContext;var l,a={};for(l in t)a[l]=n[l];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=n,e.__reactInternalMemoizedMaskedChildContext=a),a}function Tl(e){return null!==(e=e.childContextTypes)&&void 0!==e}function Ol(){El(Pl),El(jl)}function Rl(e,n,t){if(jl.current!==_l)throw Error(a(168));Cl(jl,n),Cl(Pl,t)}function Ml(e,n,t){var r=e.stateNode;if(n=n.childContextTypes,"function"!==typeof r.getChildContext)return t;for(var l in r=r.getChildContext())if(!(l in n))throw Error(a(108,B(e)||"Unknown",l));return F({},t,r)}function Dl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||_l,zl=jl.current,Cl(jl,e),Cl(Pl,Pl.current),!0}function Fl(e,n,t){var r=e.stateNode;if(!r)throw Error(a(169));t?(e=Ml(e,n,zl),r.__reactInternalMemoizedMergedChildContext=e,El(Pl),El(jl),Cl(jl,e)):El(Pl),Cl(Pl,t)}var Il=null,Ul=!1,Al=!1;function Vl(e){null===Il?Il=[e]:Il.push(e)}function $l(){if(!Al&&null!==Il){Al=!0;var e=0,n=xn;try{var t=Il;for(xn=1;e<t.length;e++){var r=t[e];do{r=r(!0)}while(null!==r)}Il=null,Ul=!1}catch(l){throw null!==Il&&(Il=Il.slice(e+1)),qe(Je,$l),l}finally{xn=n,Al=!1}}return null}var Bl=[],Wl=0,Hl=null,Ql=0,ql=[],Kl=0,Yl=null,Xl=1,Gl="";function Zl(e,n){Bl[Wl++]=Ql,Bl[Wl++]=Hl,Hl=e,Ql=n}function Jl(e,n,t){ql[Kl++]=Xl,ql[Kl++]=Gl,ql[Kl++]=Yl,Yl=e;var r=Xl;e=Gl;var l=32-on(r)-1;r&=~(1<<l),t+=1;var a=32-on(n)+l;if(30<a){var o=l-l%5;a=(r&(1<<o)-1).toString(32),r>>=o,l-=o,Xl=1<<32-on(n)+l|t<<l|r,Gl=a+e}else Xl=1<<a|t<<l|r,Gl=e}function ea(e){null!==e.return&&(Zl(e,1),Jl(e,1,0))}function na(e){for(;e===Hl;)Hl=Bl[--Wl],Bl[Wl]=null,Ql=Bl[--Wl],Bl[Wl]=null;for(;e===Yl;)Yl=ql[--Kl],ql[Kl]=null,Gl=ql[--Kl],ql[Kl]=null,Xl=ql[--Kl],ql[Kl]=null}var ta=null,ra=null,la=!1,aa=null;function oa(e,n){var t=Ls(5,null,null,0);t.elementType="DELETED",t.stateNode=n,t.return=e,null===(n=e.deletions)?(e.deletions=[t],e.flags|=16):n.push(t)}function ia(e,n){switch(e.tag){case 5:var t=e.type;return null!==(n=1!==n.nodeType||t.toLowerCase()!==n.nodeName.toLowerCase()?null:n)&&(e.stateNode=n,ta=e,ra=sl(n.firstChild),!0);case 6:return null!==(n=""===e.pendingProps||3!==n.nodeType?null:n)&&(e.stateNode=n,ta=e,ra=null,!0);case 13:return null!==(n=8!==n.nodeType?null:n)&&(t=null!==Yl?{id:Xl,overflow:Gl}:null,e.memoizedState={dehydrated:n,treeContext:t,retryLane:1073741824},(t=Ls(18,null,null,0)).stateNode=n,t.return=e,e.child=t,ta=e,ra=null,!0);default:return!1}}function ua(e){return 0!==(1&e.mode)&&0===(128&e.flags)}function sa(e){if(la){var n=ra;if(n){var t=n;if(!ia(e,n)){if(ua(e))throw Error(a(418));n=sl(t.nextSibling);var r=ta;n&&ia(e,n)?oa(r,t):(e.flags=-4097&e.flags|2,la=!1,ta=e)}}else{if(ua(e))throw Error(a(418));e.flags=-4097&e.flags|2,la=!1,ta=e}}}function ca(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;ta=e}function da(e){if(e!==ta)return!1;if(!la)return ca(e),la=!0,!1;var n;if((n=3!==e.tag)&&!(n=5!==e.tag)&&(n="head"!==(n=e.type)&&"body"!==n&&!tl(e.type,e.memoizedProps)),n&&(n=ra)){if(ua(e))throw fa(),Error(a(418));for(;n;)oa(e,n),n=sl(n.nextSibling)}if(ca(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(a(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType){var t=e.data;if("/$"===t){if(0===n){ra=sl(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++}e=e.nextSibling}ra=null}}else ra=ta?sl(e.stateNode.nextSibling):null;return!0}function fa(){for(var e=ra;e;)e=sl(e.nextSibling)}function pa(){ra=ta=null,la=!1}function ma(e){null===aa?aa=[e]:aa.push(e)}var ha=x.ReactCurrentBatchConfig;function ga(e,n,t){if(null!==(e=t.ref)&&"function"!==typeof e&&"object"!==typeof e){if(t._owner){if(t=t._owner){if(1!==t.tag)throw Error(a(309));var r=t.stateNode}if(!r)throw Error(a(147,e));var l=r,o=""+e;return null!==n&&null!==n.ref&&"function"===typeof n.ref&&n.ref._stringRef===o?n.ref:(n=function(e){var n=l.refs;null===e?delete n[o]:n[o]=e},n._stringRef=o,n)}if("string"!==typeof e)throw Error(a(284));if(!t._owner)throw Error(a(290,e))}return e}function va(e,n){throw e=Object.prototype.toString.call(n),Error(a(31,"[object Object]"===e?"object with keys {"+Object.keys(n).join(", ")+"}":e))}function ya(e){return(0,e._init)(e._payload)}function ba(e){function n(n,t){if(e){var r=n.deletions;null===r?(n.deletions=[t],n.flags|=16):r.push(t)}}function t(t,r){if(!e)return null;for(;null!==r;)n(t,r),r=r.sibling;return null}function r(e,n){for(e=new Map;null!==n;)null!==n.key?e.set(n.key,n):e.set(n.index,n),n=n.sibling;return e}function l(e,n){return(e=Os(e,n)).index=0,e.sibling=null,e}function o(n,t,r){return n.index=r,e?null!==(r=n.alternate)?(r=r.index)<t?(n.flags|=2,t):r:(n.flags|=2,t):(n.flags|=1048576,t)}function i(n){return e&&null===n.alternate&&(n.flags|=2),n}function u(e,n,t,r){return null===n||6!==n.tag?((n=Fs(t,e.mode,r)).return=e,n):((n=l(n,t)).return=e,n)}function s(e,n,t,r){var a=t.type;return a===S?d(e,n,t.props.children,r,t.key):null!==n&&(n.elementType===a||"object"===typeof a&&null!==a&&a.$$typeof===T&&ya(a)===n.type)?((r=l(n,t.props)).ref=ga(e,n,t),r.return=e,r):((r=Rs(t.type,t.key,t.props,null,e.mode,r)).ref=ga(e,n,t),r.return=e,r)}function c(e,n,t,r){return null===n||4!==n.tag||n.stateNode.containerInfo!==t.containerInfo||n.stateNode.implementation!==t.implementation?((n=Is(t,e.mode,r)).return=e,n):((n=l(n,t.children||[])).return=e,n)}function d(e,n,t,r,a){return null===n||7!==n.tag?((n=Ms(t,e.mode,r,a)).return=e,n):((n=l(n,t)).return=e,n)}function f(e,n,t){if("string"===typeof n&&""!==n||"number"===typeof n)return(n=Fs(""+n,e.mode,t)).return=e,n;if("object"===typeof n&&null!==n){switch(n.$$typeof){case w:return(t=Rs(n.type,n.key,n.props,null,e.mode,t)).ref=ga(e,null,n),t.return=e,t;case k:return(n=Is(n,e.mode,t)).return=e,n;case T:return f(e,(0,n._init)(n._payload),t)}if(ne(n)||M(n))return(n=Ms(n,e.mode,t,null)).return=e,n;va(e,n)}return null}function p(e,n,t,r){var l=null!==n?n.key:null;if("string"===typeof t&&""!==t||"number"===typeof t)return null!==l?null:u(e,n,""+t,r);if("object"===typeof t&&null!==t){switch(t.$$typeof){case w:return t.key===l?s(e,n,t,r):null;case k:return t.key===l?c(e,n,t,r):null;case T:return p(e,n,(l=t._init)(t._payload),r)}if(ne(t)||M(t))return null!==l?null:d(e,n,t,r,null);va(e,t)}return null}function m(e,n,t,r,l){if("string"===typeof r&&""!==r||"number"===typeof r)return u(n,e=e.get(t)||null,""+r,l);if("object"===typeof r&&null!==r){switch(r.$$typeof){case w:return s(n,e=e.get(null===r.key?t:r.key)||null,r,l);case k:return c(n,e=e.get(null===r.key?t:r.key)||null,r,l);case T:return m(e,n,t,(0,r._init)(r._payload),l)}if(ne(r)||M(r))return d(n,e=e.get(t)||null,r,l,null);va(n,r)}return null}function h(l,a,i,u){for(var s=null,c=null,d=a,h=a=0,g=null;null!==d&&h<i.length;h++){d.index>h?(g=d,d=null):g=d.sibling;var v=p(l,d,i[h],u);if(null===v){null===d&&(d=g);break}e&&d&&null===v.alternate&&n(l,d),a=o(v,a,h),null===c?s=v:c.sibling=v,c=v,d=g}if(h===i.length)return t(l,d),la&&Zl(l,h),s;if(null===d){for(;h<i.length;h++)null!==(d=f(l,i[h],u))&&(a=o(d,a,h),null===c?s=d:c.sibling=d,c=d);return la&&Zl(l,h),s}for(d=r(l,d);h<i.length;h++)null!==(g=m(d,l,h,i[h],u))&&(e&&null!==g.alternate&&d.delete(null===g.key?h:g.key),a=o(g,a,h),null===c?s=g:c.sibling=g,c=g);return e&&d.forEach(function(e){return n(l,e)}),la&&Zl(l,h),s}function g(l,i,u,s){var c=M(u);if("function"!==typeof c)throw Error(a(150));if(null==(u=c.call(u)))throw Error(a(151));for(var d=c=null,h=i,g=i=0,v=null,y=u.next();null!==h&&!y.done;g++,y=u.next()){h.index>g?(v=h,h=null):v=h.sibling;var b=p(l,h,y.value,s);if(null===b){null===h&&(h=v);break}e&&h&&null===b.alternate&&n(l,h),i=o(b,i,g),null===d?c=b:d.sibling=b,d=b,h=v}if(y.done)return t(l,h),la&&Zl(l,g),c;if(null===h){for(;!y.done;g++,y=u.next())null!==(y=f(l,y.value,s))&&(i=o(y,i,g),null===d?c=y:d.sibling=y,d=y);return la&&Zl(l,g),c}for(h=r(l,h);!y.done;g++,y=u.next())null!==(y=m(h,l,g,y.value,s))&&(e&&null!==y.alternate&&h.delete(null===y.key?g:y.key),i=o(y,i,g),null===d?c=y:d.sibling=y,d=y);return e&&h.forEach(function(e){return n(l,e)}),la&&Zl(l,g),c}return function e(r,a,o,u){if("object"===typeof o&&null!==o&&o.type===S&&null===o.key&&(o=o.props.children),"object"===typeof o&&null!==o){switch(o.$$typeof){case w:e:{for(var s=o.key,c=a;null!==c;){if(c.key===s){if((s=o.type)===S){if(7===c.tag){t(r,c.sibling),(a=l(c,o.props.children)).return=r,r=a;break e}}else if(c.elementType===s||"object"===typeof s&&null!==s&&s.$$typeof===T&&ya(s)===c.type){t(r,c.sibling),(a=l(c,o.props)).ref=ga(r,c,o),a.return=r,r=a;break e}t(r,c);break}n(r,c),c=c.sibling}o.type===S?((a=Ms(o.props.children,r.mode,u,o.key)).return=r,r=a):((u=Rs(o.type,o.key,o.props,null,r.mode,u)).ref=ga(r,a,o),u.return=r,r=u)}return i(r);case k:e:{for(c=o.key;null!==a;){if(a.key===c){if(4===a.tag&&a.stateNode.containerInfo===o.containerInfo&&a.stateNode.implementation===o.implementation){t(r,a.sibling),(a=l(a,o.children||[])).return=r,r=a;break e}t(r,a);break}n(r,a),a=a.sibling}(a=Is(o,r.mode,u)).return=r,r=a}return i(r);case T:return e(r,a,(c=o._init)(o._payload),u)}if(ne(o))return h(r,a,o,u);if(M(o))return g(r,a,o,u);va(r,o)}return"string"===typeof o&&""!==o||"number"===typeof o?(o=""+o,null!==a&&6===a.tag?(t(r,a.sibling),(a=l(a,o)).return=r,r=a):(t(r,a),(a=Fs(o,r.mode,u)).return=r,r=a),i(r)):t(r,a)}}var xa=ba(!0),wa=ba(!1),ka=Nl(null),Sa=null,Na=null,Ea=null;function Ca(){Ea=Na=Sa=null}function _a(e){var n=ka.current;El(ka),e._currentValue=n}function ja(e,n,t){for(;null!==e;){var r=e.alternate;if((e.childLanes&n)!==n?(e.childLanes|=n,null!==r&&(r.childLanes|=n)):null!==r&&(r.childLanes&n)!==n&&(r.childLanes|=n),e===t)break;e=e.return}}function Pa(e,n){Sa=e,Ea=Na=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!==(e.lanes&n)&&(bi=!0),e.firstContext=null)}function za(e){var n=e._currentValue;if(Ea!==e)if(e={context:e,memoizedValue:n,next:null},null===Na){if(null===Sa)throw Error(a(308));Na=e,Sa.dependencies={lanes:0,firstContext:e}}else Na=Na.next=e;return n}var La=null;function Ta(e){null===La?La=[e]:La.push(e)}function Oa(e,n,t,r){var l=n.interleaved;return null===l?(t.next=t,Ta(n)):(t.next=l.next,l.next=t),n.interleaved=t,Ra(e,r)}function Ra(e,n){e.lanes|=n;var t=e.alternate;for(null!==t&&(t.lanes|=n),t=e,e=e.return;null!==e;)e.childLanes|=n,null!==(t=e.alternate)&&(t.childLanes|=n),t=e,e=e.return;return 3===t.tag?t.stateNode:null}var Ma=!1;function Da(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Fa(e,n){e=e.updateQueue,n.updateQueue===e&&(n.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Ia(e,n){return{eventTime:e,lane:n,tag:0,payload:null,callback:null,next:null}}function Ua(e,n,t){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&ju)){var l=r.pending;return null===l?n.next=n:(n.next=l.next,l.next=n),r.pending=n,Ra(e,t)}return null===(l=r.interleaved)?(n.next=n,Ta(r)):(n.next=l.next,l.next=n),r.interleaved=n,Ra(e,t)}function Aa(e,n,t){if(null!==(n=n.updateQueue)&&(n=n.shared,0!==(4194240&t))){var r=n.lanes;t|=r&=e.pendingLanes,n.lanes=t,bn(e,t)}}function Va(e,n){var t=e.updateQueue,r=e.alternate;if(null!==r&&t===(r=r.updateQueue)){var l=null,a=null;if(null!==(t=t.firstBaseUpdate)){do{var o={eventTime:t.eventTime,lane:t.lane,tag:t.tag,payload:t.payload,callback:t.callback,next:null};null===a?l=a=o:a=a.next=o,t=t.next}while(null!==t);null===a?l=a=n:a=a.next=n}else l=a=n;return t={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:a,shared:r.shared,effects:r.effects},void(e.updateQueue=t)}null===(e=t.lastBaseUpdate)?t.firstBaseUpdate=n:e.next=n,t.lastBaseUpdate=n}function $a(e,n,t,r){var l=e.updateQueue;Ma=!1;var a=l.firstBaseUpdate,o=l.lastBaseUpdate,i=l.shared.pending;if(null!==i){l.shared.pending=null;var u=i,s=u.next;u.next=null,null===o?a=s:o.next=s,o=u;var c=e.alternate;null!==c&&((i=(c=c.updateQueue).lastBaseUpdate)!==o&&(null===i?c.firstBaseUpdate=s:i.next=s,c.lastBaseUpdate=u))}if(null!==a){var d=l.baseState;for(o=0,c=s=u=null,i=a;;){var f=i.lane,p=i.eventTime;if((r&f)===f){null!==c&&(c=c.next={eventTime:p,lane:0,tag:i.tag,payload:i.payload,callback:i.callback,next:null});e:{var m=e,h=i;switch(f=n,p=t,h.tag){case 1:if("function"===typeof(m=h.payload)){d=m.call(p,d,f);break e}d=m;break e;case 3:m.flags=-65537&m.flags|128;case 0:if(null===(f="function"===typeof(m=h.payload)?m.call(p,d,f):m)||void 0===f)break e;d=F({},d,f);break e;case 2:Ma=!0}}null!==i.callback&&0!==i.lane&&(e.flags|=64,null===(f=l.effects)?l.effects=[i]:f.push(i))}else p={eventTime:p,lane:f,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===c?(s=c=p,u=d):c=c.next=p,o|=f;if(null===(i=i.next)){if(null===(i=l.shared.pending))break;i=(f=i).next,f.next=null,l.lastBaseUpdate=f,l.shared.pending=null}}if(null===c&&(u=d),l.baseState=u,l.firstBaseUpdate=s,l.lastBaseUpdate=c,null!==(n=l.shared.interleaved)){l=n;do{o|=l.lane,l=l.next}while(l!==n)}else null===a&&(l.shared.lanes=0);Du|=o,e.lanes=o,e.memoizedState=d}}function Ba(e,n,t){if(e=n.effects,n.effects=null,null!==e)for(n=0;n<e.length;n++){var r=e[n],l=r.callback;if(null!==l){if(r.callback=null,r=t,"function"!==typeof l)throw Error(a(191,l));l.call(r)}}}var Wa={},Ha=Nl(Wa),Qa=Nl(Wa),qa=Nl(Wa);function Ka(e){if(e===Wa)throw Error(a(174));return e}function Ya(e,n){switch(Cl(qa,n),Cl(Qa,e),Cl(Ha,Wa),e=n.nodeType){case 9:case 11:n=(n=n.documentElement)?n.namespaceURI:ue(null,"");break;default:n=ue(n=(e=8===e?n.parentNode:n).namespaceURI||null,e=e.tagName)}El(Ha),Cl(Ha,n)}function Xa(){El(Ha),El(Qa),El(qa)}function Ga(e){Ka(qa.current);var n=Ka(Ha.current),t=ue(n,e.type);n!==t&&(Cl(Qa,e),Cl(Ha,t))}function Za(e){Qa.current===e&&(El(Ha),El(Qa))}var Ja=Nl(0);function eo(e){for(var n=e;null!==n;){if(13===n.tag){var t=n.memoizedState;if(null!==t&&(null===(t=t.dehydrated)||"$?"===t.data||"$!"===t.data))return n}else if(19===n.tag&&void 0!==n.memoizedProps.revealOrder){if(0!==(128&n.flags))return n}else if(null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return null;n=n.return}n.sibling.return=n.return,n=n.sibling}return null}var no=[];function to(){for(var e=0;e<no.length;e++)no[e]._workInProgressVersionPrimary=null;no.length=0}var ro=x.ReactCurrentDispatcher,lo=x.ReactCurrentBatchConfig,ao=0,oo=null,io=null,uo=null,so=!1,co=!1,fo=0,po=0;function mo(){throw Error(a(321))}function ho(e,n){if(null===n)return!1;for(var t=0;t<n.length&&t<e.length;t++)if(!ir(e[t],n[t]))return!1;return!0}function go(e,n,t,r,l,o){if(ao=o,oo=n,n.memoizedState=null,n.updateQueue=null,n.lanes=0,ro.current=null===e||null===e.memoizedState?Jo:ei,e=t(r,l),co){o=0;do{if(co=!1,fo=0,25<=o)throw Error(a(301));o+=1,uo=io=null,n.updateQueue=null,ro.current=ni,e=t(r,l)}while(co)}if(ro.current=Zo,n=null!==io&&null!==io.next,ao=0,uo=io=oo=null,so=!1,n)throw Error(a(300));return e}function vo(){var e=0!==fo;return fo=0,e}function yo(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===uo?oo.memoizedState=uo=e:uo=uo.next=e,uo}function bo(){if(null===io){var e=oo.alternate;e=null!==e?e.memoizedState:null}else e=io.next;var n=null===uo?oo.memoizedState:uo.next;if(null!==n)uo=n,io=e;else{if(null===e)throw Error(a(310));e={memoizedState:(io=e).memoizedState,baseState:io.baseState,baseQueue:io.baseQueue,queue:io.queue,next:null},null===uo?oo.memoizedState=uo=e:uo=uo.next=e}return uo}function xo(e,n){return"function"===typeof n?n(e):n}function wo(e){var n=bo(),t=n.queue;if(null===t)throw Error(a(311));t.lastRenderedReducer=e;var r=io,l=r.baseQueue,o=t.pending;if(null!==o){if(null!==l){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,t.pending=null}if(null!==l){o=l.next,r=r.baseState;var u=i=null,s=null,c=o;do{var d=c.lane;if((ao&d)===d)null!==s&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var f={lane:d,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};null===s?(u=s=f,i=r):s=s.next=f,oo.lanes|=d,Du|=d}c=c.next}while(null!==c&&c!==o);null===s?i=r:s.next=u,ir(r,n.memoizedState)||(bi=!0),n.memoizedState=r,n.baseState=i,n.baseQueue=s,t.lastRenderedState=r}if(null!==(e=t.interleaved)){l=e;do{o=l.lane,oo.lanes|=o,Du|=o,l=l.next}while(l!==e)}else null===l&&(t.lanes=0);return[n.memoizedState,t.dispatch]}function ko(e){var n=bo(),t=n.queue;if(null===t)throw Error(a(311));t.lastRenderedReducer=e;var r=t.dispatch,l=t.pending,o=n.memoizedState;if(null!==l){t.pending=null;var i=l=l.next;do{o=e(o,i.action),i=i.next}while(i!==l);ir(o,n.memoizedState)||(bi=!0),n.memoizedState=o,null===n.baseQueue&&(n.baseState=o),t.lastRenderedState=o}return[o,r]}function So(){}function No(e,n){var t=oo,r=bo(),l=n(),o=!ir(r.memoizedState,l);if(o&&(r.memoizedState=l,bi=!0),r=r.queue,Do(_o.bind(null,t,r,e),[e]),r.getSnapshot!==n||o||null!==uo&&1&uo.memoizedState.tag){if(t.flags|=2048,Lo(9,Co.bind(null,t,r,l,n),void 0,null),null===Pu)throw Error(a(349));0!==(30&ao)||Eo(t,n,l)}return l}function Eo(e,n,t){e.flags|=16384,e={getSnapshot:n,value:t},null===(n=oo.updateQueue)?(n={lastEffect:null,stores:null},oo.updateQueue=n,n.stores=[e]):null===(t=n.stores)?n.stores=[e]:t.push(e)}function Co(e,n,t,r){n.value=t,n.getSnapshot=r,jo(n)&&Po(e)}function _o(e,n,t){return t(function(){jo(n)&&Po(e)})}function jo(e){var n=e.getSnapshot;e=e.value;try{var t=n();return!ir(e,t)}catch(r){return!0}}function Po(e){var n=Ra(e,1);null!==n&&ts(n,e,1,-1)}function zo(e){var n=yo();return"function"===typeof e&&(e=e()),n.memoizedState=n.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:xo,lastRenderedState:e},n.queue=e,e=e.dispatch=Ko.bind(null,oo,e),[n.memoizedState,e]}function Lo(e,n,t,r){return e={tag:e,create:n,destroy:t,deps:r,next:null},null===(n=oo.updateQueue)?(n={lastEffect:null,stores:null},oo.updateQueue=n,n.lastEffect=e.next=e):null===(t=n.lastEffect)?n.lastEffect=e.next=e:(r=t.next,t.next=e,e.next=r,n.lastEffect=e),e}function To(){return bo().memoizedState}function Oo(e,n,t,r){var l=yo();oo.flags|=e,l.memoizedState=Lo(1|n,t,void 0,void 0===r?null:r)}function Ro(e,n,t,r){var l=bo();r=void 0===r?null:r;var a=void 0;if(null!==io){var o=io.memoizedState;if(a=o.destroy,null!==r&&ho(r,o.deps))return void(l.memoizedState=Lo(n,t,a,r))}oo.flags|=e,l.memoizedState=Lo(1|n,t,a,r)}function Mo(e,n){return Oo(8390656,8,e,n)}function Do(e,n){return Ro(2048,8,e,n)}function Fo(e,n){return Ro(4,2,e,n)}function Io(e,n){return Ro(4,4,e,n)}function Uo(e,n){return"function"===typeof n?(e=e(),n(e),function(){n(null)}):null!==n&&void 0!==n?(e=e(),n.current=e,function(){n.current=null}):void 0}function Ao(e,n,t){return t=null!==t&&void 0!==t?t.concat([e]):null,Ro(4,4,Uo.bind(null,n,e),t)}function Vo(){}function $o(e,n){var t=bo();n=void 0===n?null:n;var r=t.memoizedState;return null!==r&&null!==n&&ho(n,r[1])?r[0]:(t.memoizedState=[e,n],e)}function Bo(e,n){var t=bo();n=void 0===n?null:n;var r=t.memoizedState;return null!==r&&null!==n&&ho(n,r[1])?r[0]:(e=e(),t.memoizedState=[e,n],e)}function Wo(e,n,t){return 0===(21&ao)?(e.baseState&&(e.baseState=!1,bi=!0),e.memoizedState=t):(ir(t,n)||(t=gn(),oo.lanes|=t,Du|=t,e.baseState=!0),n)}function Ho(e,n){var t=xn;xn=0!==t&&4>t?t:4,e(!0);var r=lo.transition;lo.transition={};try{e(!1),n()}finally{xn=t,lo.transition=r}}function Qo(){return bo().memoizedState}function qo(e,n,t){var r=ns(e);if(t={lane:r,action:t,hasEagerState:!1,eagerState:null,next:null},Yo(e))Xo(n,t);else if(null!==(t=Oa(e,n,t,r))){ts(t,e,r,es()),Go(t,n,r)}}function Ko(e,n,t){var r=ns(e),l={lane:r,action:t,hasEagerState:!1,eagerState:null,next:null};if(Yo(e))Xo(n,l);else{var a=e.alternate;if(0===e.lanes&&(null===a||0===a.lanes)&&null!==(a=n.lastRenderedReducer))try{var o=n.lastRenderedState,i=a(o,t);if(l.hasEagerState=!0,l.eagerState=i,ir(i,o)){var u=n.interleaved;return null===u?(l.next=l,Ta(n)):(l.next=u.next,u.next=l),void(n.interleaved=l)}}catch(s){}null!==(t=Oa(e,n,l,r))&&(ts(t,e,r,l=es()),Go(t,n,r))}}function Yo(e){var n=e.alternate;return e===oo||null!==n&&n===oo}function Xo(e,n){co=so=!0;var t=e.pending;null===t?n.next=n:(n.next=t.next,t.next=n),e.pending=n}function Go(e,n,t){if(0!==(4194240&t)){var r=n.lanes;t|=r&=e.pendingLanes,n.lanes=t,bn(e,t)}}var Zo={readContext:za,useCallback:mo,useContext:mo,useEffect:mo,useImperativeHandle:mo,useInsertionEffect:mo,useLayoutEffect:mo,useMemo:mo,useReducer:mo,useRef:mo,useState:mo,useDebugValue:mo,useDeferredValue:mo,useTransition:mo,useMutableSource:mo,useSyncExternalStore:mo,useId:mo,unstable_isNewReconciler:!1},Jo={readContext:za,useCallback:function(e,n){return yo().memoizedState=[e,void 0===n?null:n],e},useContext:za,useEffect:Mo,useImperativeHandle:function(e,n,t){return t=null!==t&&void 0!==t?t.concat([e]):null,Oo(4194308,4,Uo.bind(null,n,e),t)},useLayoutEffect:function(e,n){return Oo(4194308,4,e,n)},useInsertionEffect:function(e,n){return Oo(4,2,e,n)},useMemo:function(e,n){var t=yo();return n=void 0===n?null:n,e=e(),t.memoizedState=[e,n],e},useReducer:function(e,n,t){var r=yo();return n=void 0!==t?t(n):n,r.memoizedState=r.baseState=n,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:n},r.queue=e,e=e.dispatch=qo.bind(null,oo,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},yo().memoizedState=e},useState:zo,useDebugValue:Vo,useDeferredValue:function(e){return yo().memoizedState=e},useTransition:function(){var e=zo(!1),n=e[0];return e=Ho.bind(null,e[1]),yo().memoizedState=e,[n,e]},useMutableSource:function(){},useSyncExternalStore:function(e,n,t){var r=oo,l=yo();if(la){if(void 0===t)throw Error(a(407));t=t()}else{if(t=n(),null===Pu)throw Error(a(349));0!==(30&ao)||Eo(r,n,t)}l.memoizedState=t;var o={value:t,getSnapshot:n};return l.queue=o,Mo(_o.bind(null,r,o,e),[e]),r.flags|=2048,Lo(9,Co.bind(null,r,o,t,n),void 0,null),t},useId:function(){var e=yo(),n=Pu.identifierPrefix;if(la){var t=Gl;n=":"+n+"R"+(t=(Xl&~(1<<32-on(Xl)-1)).toString(32)+t),0<(t=fo++)&&(n+="H"+t.toString(32)),n+=":"}else n=":"+n+"r"+(t=po++).toString(32)+":";return e.memoizedState=n},unstable_isNewReconciler:!1},ei={readContext:za,useCallback:$o,useContext:za,useEffect:Do,useImperativeHandle:Ao,useInsertionEffect:Fo,useLayoutEffect:Io,useMemo:Bo,useReducer:wo,useRef:To,useState:function(){return wo(xo)},useDebugValue:Vo,useDeferredValue:function(e){return Wo(bo(),io.memoizedState,e)},useTransition:function(){return[wo(xo)[0],bo().memoizedState]},useMutableSource:So,useSyncExternalStore:No,useId:Qo,unstable_isNewReconciler:!1},ni={readContext:za,useCallback:$o,useContext:za,useEffect:Do,useImperativeHandle:Ao,useInsertionEffect:Fo,useLayoutEffect:Io,useMemo:Bo,useReducer:ko,useRef:To,useState:function(){return ko(xo)},useDebugValue:Vo,useDeferredValue:function(e){var n=bo();return null===io?n.memoizedState=e:Wo(n,io.memoizedState,e)},useTransition:function(){return[ko(xo)[0],bo().memoizedState]},useMutableSource:So,useSyncExternalStore:No,useId:Qo,unstable_isNewReconciler:!1};function ti(e,n){if(e&&e.defaultProps){for(var t in n=F({},n),e=e.defaultProps)void 0===n[t]&&(n[t]=e[t]);return n}return n}function ri(e,n,t,r){t=null===(t=t(r,n=e.memoizedState))||void 0===t?n:F({},n,t),e.memoizedState=t,0===e.lanes&&(e.updateQueue.baseState=t)}var li={isMounted:function(e){return!!(e=e._reactInternals)&&$e(e)===e},enqueueSetState:function(e,n,t){e=e._reactInternals;var r=es(),l=ns(e),a=Ia(r,l);a.payload=n,void 0!==t&&null!==t&&(a.callback=t),null!==(n=Ua(e,a,l))&&(ts(n,e,l,r),Aa(n,e,l))},enqueueReplaceState:function(e,n,t){e=e._reactInternals;var r=es(),l=ns(e),a=Ia(r,l);a.tag=1,a.payload=n,void 0!==t&&null!==t&&(a.callback=t),null!==(n=Ua(e,a,l))&&(ts(n,e,l,r),Aa(n,e,l))},enqueueForceUpdate:function(e,n){e=e._reactInternals;var t=es(),r=ns(e),l=Ia(t,r);l.tag=2,void 0!==n&&null!==n&&(l.callback=n),null!==(n=Ua(e,l,r))&&(ts(n,e,r,t),Aa(n,e,r))}};function ai(e,n,t,r,l,a,o){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,a,o):!n.prototype||!n.prototype.isPureReactComponent||(!ur(t,r)||!ur(l,a))}function oi(e,n,t){var r=!1,l=_l,a=n.contextType;return"object"===typeof a&&null!==a?a=za(a):(l=Tl(n)?zl:jl.current,a=(r=null!==(r=n.contextTypes)&&void 0!==r)?Ll(e,l):_l),n=new n(t,a),e.memoizedState=null!==n.state&&void 0!==n.state?n.state:null,n.updater=li,e.stateNode=n,n._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=a),n}function ii(e,n,t,r){e=n.state,"function"===typeof n.componentWillReceiveProps&&n.componentWillReceiveProps(t,r),"function"===typeof n.UNSAFE_componentWillReceiveProps&&n.UNSAFE_componentWillReceiveProps(t,r),n.state!==e&&li.enqueueReplaceState(n,n.state,null)}function ui(e,n,t,r){var l=e.stateNode;l.props=t,l.state=e.memoizedState,l.refs={},Da(e);var a=n.contextType;"object"===typeof a&&null!==a?l.context=za(a):(a=Tl(n)?zl:jl.current,l.context=Ll(e,a)),l.state=e.memoizedState,"function"===typeof(a=n.getDerivedStateFromProps)&&(ri(e,n,a,t),l.state=e.memoizedState),"function"===typeof n.getDerivedStateFromProps||"function"===typeof l.getSnapshotBeforeUpdate||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||(n=l.state,"function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount(),n!==l.state&&li.enqueueReplaceState(l,l.state,null),$a(e,t,l,r),l.state=e.memoizedState),"function"===typeof l.componentDidMount&&(e.flags|=4194308)}function si(e,n){try{var t="",r=n;do{t+=V(r),r=r.return}while(r);var l=t}catch(a){l="\nError generating stack: "+a.message+"\n"+a.stack}return{value:e,source:n,stack:l,digest:null}}function ci(e,n,t){return{value:e,source:null,stack:null!=t?t:null,digest:null!=n?n:null}}function di(e,n){try{console.error(n.value)}catch(t){setTimeout(function(){throw t})}}var fi="function"===typeof WeakMap?WeakMap:Map;function pi(e,n,t){(t=Ia(-1,t)).tag=3,t.payload={element:null};var r=n.value;return t.callback=function(){Wu||(Wu=!0,Hu=r),di(0,n)},t}function mi(e,n,t){(t=Ia(-1,t)).tag=3;var r=e.type.getDerivedStateFromError;if("function"===typeof r){var l=n.value;t.payload=function(){return r(l)},t.callback=function(){di(0,n)}}var a=e.stateNode;return null!==a&&"function"===typeof a.componentDidCatch&&(t.callback=function(){di(0,n),"function"!==typeof r&&(null===Qu?Qu=new Set([this]):Qu.add(this));var e=n.stack;this.componentDidCatch(n.value,{componentStack:null!==e?e:""})}),t}function hi(e,n,t){var r=e.pingCache;if(null===r){r=e.pingCache=new fi;var l=new Set;r.set(n,l)}else void 0===(l=r.get(n))&&(l=new Set,r.set(n,l));l.has(t)||(l.add(t),e=Es.bind(null,e,n,t),n.then(e,e))}function gi(e){do{var n;if((n=13===e.tag)&&(n=null===(n=e.memoizedState)||null!==n.dehydrated),n)return e;e=e.return}while(null!==e);return null}function vi(e,n,t,r,l){return 0===(1&e.mode)?(e===n?e.flags|=65536:(e.flags|=128,t.flags|=131072,t.flags&=-52805,1===t.tag&&(null===t.alternate?t.tag=17:((n=Ia(-1,1)).tag=2,Ua(t,n,1))),t.lanes|=1),e):(e.flags|=65536,e.lanes=l,e)}var yi=x.ReactCurrentOwner,bi=!1;function xi(e,n,t,r){n.child=null===e?wa(n,null,t,r):xa(n,e.child,t,r)}function wi(e,n,t,r,l){t=t.render;var a=n.ref;return Pa(n,l),r=go(e,n,t,r,a,l),t=vo(),null===e||bi?(la&&t&&ea(n),n.flags|=1,xi(e,n,r,l),n.child):(n.updateQueue=e.updateQueue,n.flags&=-2053,e.lanes&=~l,Wi(e,n,l))}function ki(e,n,t,r,l){if(null===e){var a=t.type;return"function"!==typeof a||Ts(a)||void 0!==a.defaultProps||null!==t.compare||void 0!==t.defaultProps?((e=Rs(t.type,null,r,n,n.mode,l)).ref=n.ref,e.return=n,n.child=e):(n.tag=15,n.type=a,Si(e,n,a,r,l))}if(a=e.child,0===(e.lanes&l)){var o=a.memoizedProps;if((t=null!==(t=t.compare)?t:ur)(o,r)&&e.ref===n.ref)return Wi(e,n,l)}return n.flags|=1,(e=Os(a,r)).ref=n.ref,e.return=n,n.child=e}function Si(e,n,t,r,l){if(null!==e){var a=e.memoizedProps;if(ur(a,r)&&e.ref===n.ref){if(bi=!1,n.pendingProps=r=a,0===(e.lanes&l))return n.lanes=e.lanes,Wi(e,n,l);0!==(131072&e.flags)&&(bi=!0)}}return Ci(e,n,t,r,l)}function Ni(e,n,t){var r=n.pendingProps,l=r.children,a=null!==e?e.memoizedState:null;if("hidden"===r.mode)if(0===(1&n.mode))n.memoizedState={baseLanes:0,cachePool:null,transitions:null},Cl(Ou,Tu),Tu|=t;else{if(0===(1073741824&t))return e=null!==a?a.baseLanes|t:t,n.lanes=n.childLanes=1073741824,n.memoizedState={baseLanes:e,cachePool:null,transitions:null},n.updateQueue=null,Cl(Ou,Tu),Tu|=e,null;n.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==a?a.baseLanes:t,Cl(Ou,Tu),Tu|=r}else null!==a?(r=a.baseLanes|t,n.memoizedState=null):r=t,Cl(Ou,Tu),Tu|=r;return xi(e,n,l,t),n.child}function Ei(e,n){var t=n.ref;(null===e&&null!==t||null!==e&&e.ref!==t)&&(n.flags|=512,n.flags|=2097152)}function Ci(e,n,t,r,l){var a=Tl(t)?zl:jl.current;return a=Ll(n,a),Pa(n,l),t=go(e,n,t,r,a,l),r=vo(),null===e||bi?(la&&r&&ea(n),n.flags|=1,xi(e,n,t,l),n.child):(n.updateQueue=e.updateQueue,n.flags&=-2053,e.lanes&=~l,Wi(e,n,l))}function _i(e,n,t,r,l){if(Tl(t)){var a=!0;Dl(n)}else a=!1;if(Pa(n,l),null===n.stateNode)Bi(e,n),oi(n,t,r),ui(n,t,r,l),r=!0;else if(null===e){var o=n.stateNode,i=n.memoizedProps;o.props=i;var u=o.context,s=t.contextType;"object"===typeof s&&null!==s?s=za(s):s=Ll(n,s=Tl(t)?zl:jl.current);var c=t.getDerivedStateFromProps,d="function"===typeof c||"function"===typeof o.getSnapshotBeforeUpdate;d||"function"!==typeof o.UNSAFE_componentWillReceiveProps&&"function"!==typeof o.componentWillReceiveProps||(i!==r||u!==s)&&ii(n,o,r,s),Ma=!1;var f=n.memoizedState;o.state=f,$a(n,r,o,l),u=n.memoizedState,i!==r||f!==u||Pl.current||Ma?("function"===typeof c&&(ri(n,t,c,r),u=n.memoizedState),(i=Ma||ai(n,t,i,r,f,u,s))?(d||"function"!==typeof o.UNSAFE_componentWillMount&&"function"!==typeof o.componentWillMount||("function"===typeof o.componentWillMount&&o.componentWillMount(),"function"===typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount()),"function"===typeof o.componentDidMount&&(n.flags|=4194308)):("function"===typeof o.componentDidMount&&(n.flags|=4194308),n.memoizedProps=r,n.memoizedState=u),o.props=r,o.state=u,o.context=s,r=i):("function"===typeof o.componentDidMount&&(n.flags|=4194308),r=!1)}else{o=n.stateNode,Fa(e,n),i=n.memoizedProps,s=n.type===n.elementType?i:ti(n.type,i),o.props=s,d=n.pendingProps,f=o.context,"object"===typeof(u=t.contextType)&&null!==u?u=za(u):u=Ll(n,u=Tl(t)?zl:jl.current);var p=t.getDerivedStateFromProps;(c="function"===typeof p||"function"===typeof o.getSnapshotBeforeUpdate)||"function"!==typeof o.UNSAFE_componentWillReceiveProps&&"function"!==typeof o.componentWillReceiveProps||(i!==d||f!==u)&&ii(n,o,r,u),Ma=!1,f=n.memoizedState,o.state=f,$a(n,r,o,l);var m=n.memoizedState;i!==d||f!==m||Pl.current||Ma?("function"===typeof p&&(ri(n,t,p,r),m=n.memoizedState),(s=Ma||ai(n,t,s,r,f,m,u)||!1)?(c||"function"!==typeof o.UNSAFE_componentWillUpdate&&"function"!==typeof o.componentWillUpdate||("function"===typeof o.componentWillUpdate&&o.componentWillUpdate(r,m,u),"function"===typeof o.UNSAFE_componentWillUpdate&&o.UNSAFE_componentWillUpdate(r,m,u)),"function"===typeof o.componentDidUpdate&&(n.flags|=4),"function"===typeof o.getSnapshotBeforeUpdate&&(n.flags|=1024)):("function"!==typeof o.componentDidUpdate||i===e.memoizedProps&&f===e.memoizedState||(n.flags|=4),"function"!==typeof o.getSnapshotBeforeUpdate||i===e.memoizedProps&&f===e.memoizedState||(n.flags|=1024),n.memoizedProps=r,n.memoizedState=m),o.props=r,o.state=m,o.context=u,r=s):("function"!==typeof o.componentDidUpdate||i===e.memoizedProps&&f===e.memoizedState||(n.flags|=4),"function"!==typeof o.getSnapshotBeforeUpdate||i===e.memoizedProps&&f===e.memoizedState||(n.flags|=1024),r=!1)}return ji(e,n,t,r,a,l)}function ji(e,n,t,r,l,a){Ei(e,n);var o=0!==(128&n.flags);if(!r&&!o)return l&&Fl(n,t,!1),Wi(e,n,a);r=n.stateNode,yi.current=n;var i=o&&"function"!==typeof t.getDerivedStateFromError?null:r.render();return n.flags|=1,null!==e&&o?(n.child=xa(n,e.child,null,a),n.child=xa(n,null,i,a)):xi(e,n,i,a),n.memoizedState=r.state,l&&Fl(n,t,!0),n.child}function Pi(e){var n=e.stateNode;n.pendingContext?Rl(0,n.pendingContext,n.pendingContext!==n.context):n.context&&Rl(0,n.context,!1),Ya(e,n.containerInfo)}function zi(e,n,t,r,l){return pa(),ma(l),n.flags|=256,xi(e,n,t,r),n.child}var Li,Ti,Oi,Ri,Mi={dehydrated:null,treeContext:null,retryLane:0};function Di(e){return{baseLanes:e,cachePool:null,transitions:null}}function Fi(e,n,t){var r,l=n.pendingProps,o=Ja.current,i=!1,u=0!==(128&n.flags);if((r=u)||(r=(null===e||null!==e.memoizedState)&&0!==(2&o)),r?(i=!0,n.flags&=-129):null!==e&&null===e.memoizedState||(o|=1),Cl(Ja,1&o),null===e)return sa(n),null!==(e=n.memoizedState)&&null!==(e=e.dehydrated)?(0===(1&n.mode)?n.lanes=1:"$!"===e.data?n.lanes=8:n.lanes=1073741824,null):(u=l.children,e=l.fallback,i?(l=n.mode,i=n.child,u={mode:"hidden",children:u},0===(1&l)&&null!==i?(i.childLanes=0,i.pendingProps=u):i=Ds(u,l,0,null),e=Ms(e,l,t,null),i.return=n,e.return=n,i.sibling=e,n.child=i,n.child.memoizedState=Di(t),n.memoizedState=Mi,e):Ii(n,u));if(null!==(o=e.memoizedState)&&null!==(r=o.dehydrated))return function(e,n,t,r,l,o,i){if(t)return 256&n.flags?(n.flags&=-257,Ui(e,n,i,r=ci(Error(a(422))))):null!==n.memoizedState?(n.child=e.child,n.flags|=128,null):(o=r.fallback,l=n.mode,r=Ds({mode:"visible",children:r.children},l,0,null),(o=Ms(o,l,i,null)).flags|=2,r.return=n,o.return=n,r.sibling=o,n.child=r,0!==(1&n.mode)&&xa(n,e.child,null,i),n.child.memoizedState=Di(i),n.memoizedState=Mi,o);if(0===(1&n.mode))return Ui(e,n,i,null);if("$!"===l.data){if(r=l.nextSibling&&l.nextSibling.dataset)var u=r.dgst;return r=u,Ui(e,n,i,r=ci(o=Error(a(419)),r,void 0))}if(u=0!==(i&e.childLanes),bi||u){if(null!==(r=Pu)){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}0!==(l=0!==(l&(r.suspendedLanes|i))?0:l)&&l!==o.retryLane&&(o.retryLane=l,Ra(e,l),ts(r,e,l,-1))}return hs(),Ui(e,n,i,r=ci(Error(a(421))))}return"$?"===l.data?(n.flags|=128,n.child=e.child,n=_s.bind(null,e),l._reactRetry=n,null):(e=o.treeContext,ra=sl(l.nextSibling),ta=n,la=!0,aa=null,null!==e&&(ql[Kl++]=Xl,ql[Kl++]=Gl,ql[Kl++]=Yl,Xl=e.id,Gl=e.overflow,Yl=n),n=Ii(n,r.children),n.flags|=4096,n)}(e,n,u,l,r,o,t);if(i){i=l.fallback,u=n.mode,r=(o=e.child).sibling;var s={mode:"hidden",children:l.children};return 0===(1&u)&&n.child!==o?((l=n.child).childLanes=0,l.pendingProps=s,n.deletions=null):(l=Os(o,s)).subtreeFlags=14680064&o.subtreeFlags,null!==r?i=Os(r,i):(i=Ms(i,u,t,null)).flags|=2,i.return=n,l.return=n,l.sibling=i,n.child=l,l=i,i=n.child,u=null===(u=e.child.memoizedState)?Di(t):{baseLanes:u.baseLanes|t,cachePool:null,transitions:u.transitions},i.memoizedState=u,i.childLanes=e.childLanes&~t,n.memoizedState=Mi,l}return e=(i=e.child).sibling,l=Os(i,{mode:"visible",children:l.children}),0===(1&n.mode)&&(l.lanes=t),l.return=n,l.sibling=null,null!==e&&(null===(t=n.deletions)?(n.deletions=[e],n.flags|=16):t.push(e)),n.child=l,n.memoizedState=null,l}function Ii(e,n){return(n=Ds({mode:"visible",children:n},e.mode,0,null)).return=e,e.child=n}function Ui(e,n,t,r){return null!==r&&ma(r),xa(n,e.child,null,t),(e=Ii(n,n.pendingProps.children)).flags|=2,n.memoizedState=null,e}function Ai(e,n,t){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n),ja(e.return,n,t)}function Vi(e,n,t,r,l){var a=e.memoizedState;null===a?e.memoizedState={isBackwards:n,rendering:null,renderingStartTime:0,last:r,tail:t,tailMode:l}:(a.isBackwards=n,a.rendering=null,a.renderingStartTime=0,a.last=r,a.tail=t,a.tailMode=l)}function $i(e,n,t){var r=n.pendingProps,l=r.revealOrder,a=r.tail;if(xi(e,n,r.children,t),0!==(2&(r=Ja.current)))r=1&r|2,n.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=n.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Ai(e,t,n);else if(19===e.tag)Ai(e,t,n);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===n)break e;for(;null===e.sibling;){if(null===e.return||e.return===n)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(Cl(Ja,r),0===(1&n.mode))n.memoizedState=null;else switch(l){case"forwards":for(t=n.child,l=null;null!==t;)null!==(e=t.alternate)&&null===eo(e)&&(l=t),t=t.sibling;null===(t=l)?(l=n.child,n.child=null):(l=t.sibling,t.sibling=null),Vi(n,!1,l,t,a);break;case"backwards":for(t=null,l=n.child,n.child=null;null!==l;){if(null!==(e=l.alternate)&&null===eo(e)){n.child=l;break}e=l.sibling,l.sibling=t,t=l,l=e}Vi(n,!0,t,null,a);break;case"together":Vi(n,!1,null,null,void 0);break;default:n.memoizedState=null}return n.child}function Bi(e,n){0===(1&n.mode)&&null!==e&&(e.alternate=null,n.alternate=null,n.flags|=2)}function Wi(e,n,t){if(null!==e&&(n.dependencies=e.dependencies),Du|=n.lanes,0===(t&n.childLanes))return null;if(null!==e&&n.child!==e.child)throw Error(a(153));if(null!==n.child){for(t=Os(e=n.child,e.pendingProps),n.child=t,t.return=n;null!==e.sibling;)e=e.sibling,(t=t.sibling=Os(e,e.pendingProps)).return=n;t.sibling=null}return n.child}function Hi(e,n){if(!la)switch(e.tailMode){case"hidden":n=e.tail;for(var t=null;null!==n;)null!==n.alternate&&(t=n),n=n.sibling;null===t?e.tail=null:t.sibling=null;break;case"collapsed":t=e.tail;for(var r=null;null!==t;)null!==t.alternate&&(r=t),t=t.sibling;null===r?n||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Qi(e){var n=null!==e.alternate&&e.alternate.child===e.child,t=0,r=0;if(n)for(var l=e.child;null!==l;)t|=l.lanes|l.childLanes,r|=14680064&l.subtreeFlags,r|=14680064&l.flags,l.return=e,l=l.sibling;else for(l=e.child;null!==l;)t|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=t,n}function qi(e,n,t){var r=n.pendingProps;switch(na(n),n.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Qi(n),null;case 1:case 17:return Tl(n.type)&&Ol(),Qi(n),null;case 3:return r=n.stateNode,Xa(),El(Pl),El(jl),to(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(da(n)?n.flags|=4:null===e||e.memoizedState.isDehydrated&&0===(256&n.flags)||(n.flags|=1024,null!==aa&&(os(aa),aa=null))),Ti(e,n),Qi(n),null;case 5:Za(n);var l=Ka(qa.current);if(t=n.type,null!==e&&null!=n.stateNode)Oi(e,n,t,r,l),e.ref!==n.ref&&(n.flags|=512,n.flags|=2097152);else{if(!r){if(null===n.stateNode)throw Error(a(166));return Qi(n),null}if(e=Ka(Ha.current),da(n)){r=n.stateNode,t=n.type;var o=n.memoizedProps;switch(r[fl]=n,r[pl]=o,e=0!==(1&n.mode),t){case"dialog":Ur("cancel",r),Ur("close",r);break;case"iframe":case"object":case"embed":Ur("load",r);break;case"video":case"audio":for(l=0;l<Mr.length;l++)Ur(Mr[l],r);break;case"source":Ur("error",r);break;case"img":case"image":case"link":Ur("error",r),Ur("load",r);break;case"details":Ur("toggle",r);break;case"input":X(r,o),Ur("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},Ur("invalid",r);break;case"textarea":le(r,o),Ur("invalid",r)}for(var u in ye(t,o),l=null,o)if(o.hasOwnProperty(u)){var s=o[u];"children"===u?"string"===typeof s?r.textContent!==s&&(!0!==o.suppressHydrationWarning&&Zr(r.textContent,s,e),l=["children",s]):"number"===typeof s&&r.textContent!==""+s&&(!0!==o.suppressHydrationWarning&&Zr(r.textContent,s,e),l=["children",""+s]):i.hasOwnProperty(u)&&null!=s&&"onScroll"===u&&Ur("scroll",r)}switch(t){case"input":Q(r),J(r,o,!0);break;case"textarea":Q(r),oe(r);break;case"select":case"option":break;default:"function"===typeof o.onClick&&(r.onclick=Jr)}r=l,n.updateQueue=r,null!==r&&(n.flags|=4)}else{u=9===l.nodeType?l:l.ownerDocument,"http://www.w3.org/1999/xhtml"===e&&(e=ie(t)),"http://www.w3.org/1999/xhtml"===e?"script"===t?((e=u.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"===typeof r.is?e=u.createElement(t,{is:r.is}):(e=u.createElement(t),"select"===t&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,t),e[fl]=n,e[pl]=r,Li(e,n,!1,!1),n.stateNode=e;e:{switch(u=be(t,r),t){case"dialog":Ur("cancel",e),Ur("close",e),l=r;break;case"iframe":case"object":case"embed":Ur("load",e),l=r;break;case"video":case"audio":for(l=0;l<Mr.length;l++)Ur(Mr[l],e);l=r;break;case"source":Ur("error",e),l=r;break;case"img":case"image":case"link":Ur("error",e),Ur("load",e),l=r;break;case"details":Ur("toggle",e),l=r;break;case"input":X(e,r),l=Y(e,r),Ur("invalid",e);break;case"option":default:l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=F({},r,{value:void 0}),Ur("invalid",e);break;case"textarea":le(e,r),l=re(e,r),Ur("invalid",e)}for(o in ye(t,l),s=l)if(s.hasOwnProperty(o)){var c=s[o];"style"===o?ge(e,c):"dangerouslySetInnerHTML"===o?null!=(c=c?c.__html:void 0)&&de(e,c):"children"===o?"string"===typeof c?("textarea"!==t||""!==c)&&fe(e,c):"number"===typeof c&&fe(e,""+c):"suppressContentEditableWarning"!==o&&"suppressHydrationWarning"!==o&&"autoFocus"!==o&&(i.hasOwnProperty(o)?null!=c&&"onScroll"===o&&Ur("scroll",e):null!=c&&b(e,o,c,u))}switch(t){case"input":Q(e),J(e,r,!1);break;case"textarea":Q(e),oe(e);break;case"option":null!=r.value&&e.setAttribute("value",""+W(r.value));break;case"select":e.multiple=!!r.multiple,null!=(o=r.value)?te(e,!!r.multiple,o,!1):null!=r.defaultValue&&te(e,!!r.multiple,r.defaultValue,!0);break;default:"function"===typeof l.onClick&&(e.onclick=Jr)}switch(t){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(n.flags|=4)}null!==n.ref&&(n.flags|=512,n.flags|=2097152)}return Qi(n),null;case 6:if(e&&null!=n.stateNode)Ri(e,n,e.memoizedProps,r);else{if("string"!==typeof r&&null===n.stateNode)throw Error(a(166));if(t=Ka(qa.current),Ka(Ha.current),da(n)){if(r=n.stateNode,t=n.memoizedProps,r[fl]=n,(o=r.nodeValue!==t)&&null!==(e=ta))switch(e.tag){case 3:Zr(r.nodeValue,t,0!==(1&e.mode));break;case 5:!0!==e.memoizedProps.suppressHydrationWarning&&Zr(r.nodeValue,t,0!==(1&e.mode))}o&&(n.flags|=4)}else(r=(9===t.nodeType?t:t.ownerDocument).createTextNode(r))[fl]=n,n.stateNode=r}return Qi(n),null;case 13:if(El(Ja),r=n.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(la&&null!==ra&&0!==(1&n.mode)&&0===(128&n.flags))fa(),pa(),n.flags|=98560,o=!1;else if(o=da(n),null!==r&&null!==r.dehydrated){if(null===e){if(!o)throw Error(a(318));if(!(o=null!==(o=n.memoizedState)?o.dehydrated:null))throw Error(a(317));o[fl]=n}else pa(),0===(128&n.flags)&&(n.memoizedState=null),n.flags|=4;Qi(n),o=!1}else null!==aa&&(os(aa),aa=null),o=!0;if(!o)return 65536&n.flags?n:null}return 0!==(128&n.flags)?(n.lanes=t,n):((r=null!==r)!==(null!==e&&null!==e.memoizedState)&&r&&(n.child.flags|=8192,0!==(1&n.mode)&&(null===e||0!==(1&Ja.current)?0===Ru&&(Ru=3):hs())),null!==n.updateQueue&&(n.flags|=4),Qi(n),null);case 4:return Xa(),Ti(e,n),null===e&&$r(n.stateNode.containerInfo),Qi(n),null;case 10:return _a(n.type._context),Qi(n),null;case 19:if(El(Ja),null===(o=n.memoizedState))return Qi(n),null;if(r=0!==(128&n.flags),null===(u=o.rendering))if(r)Hi(o,!1);else{if(0!==Ru||null!==e&&0!==(128&e.flags))for(e=n.child;null!==e;){if(null!==(u=eo(e))){for(n.flags|=128,Hi(o,!1),null!==(r=u.updateQueue)&&(n.updateQueue=r,n.flags|=4),n.subtreeFlags=0,r=t,t=n.child;null!==t;)e=r,(o=t).flags&=14680066,null===(u=o.alternate)?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=u.childLanes,o.lanes=u.lanes,o.child=u.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=u.memoizedProps,o.memoizedState=u.memoizedState,o.updateQueue=u.updateQueue,o.type=u.type,e=u.dependencies,o.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),t=t.sibling;return Cl(Ja,1&Ja.current|2),n.child}e=e.sibling}null!==o.tail&&Ge()>$u&&(n.flags|=128,r=!0,Hi(o,!1),n.lanes=4194304)}else{if(!r)if(null!==(e=eo(u))){if(n.flags|=128,r=!0,null!==(t=e.updateQueue)&&(n.updateQueue=t,n.flags|=4),Hi(o,!0),null===o.tail&&"hidden"===o.tailMode&&!u.alternate&&!la)return Qi(n),null}else 2*Ge()-o.renderingStartTime>$u&&1073741824!==t&&(n.flags|=128,r=!0,Hi(o,!1),n.lanes=4194304);o.isBackwards?(u.sibling=n.child,n.child=u):(null!==(t=o.last)?t.sibling=u:n.child=u,o.last=u)}return null!==o.tail?(n=o.tail,o.rendering=n,o.tail=n.sibling,o.renderingStartTime=Ge(),n.sibling=null,t=Ja.current,Cl(Ja,r?1&t|2:1&t),n):(Qi(n),null);case 22:case 23:return ds(),r=null!==n.memoizedState,null!==e&&null!==e.memoizedState!==r&&(n.flags|=8192),r&&0!==(1&n.mode)?0!==(1073741824&Tu)&&(Qi(n),6&n.subtreeFlags&&(n.flags|=8192)):Qi(n),null;case 24:case 25:return null}throw Error(a(156,n.tag))}function Ki(e,n){switch(na(n),n.tag){case 1:return Tl(n.type)&&Ol(),65536&(e=n.flags)?(n.flags=-65537&e|128,n):null;case 3:return Xa(),El(Pl),El(jl),to(),0!==(65536&(e=n.flags))&&0===(128&e)?(n.flags=-65537&e|128,n):null;case 5:return Za(n),null;case 13:if(El(Ja),null!==(e=n.memoizedState)&&null!==e.dehydrated){if(null===n.alternate)throw Error(a(340));pa()}return 65536&(e=n.flags)?(n.flags=-65537&e|128,n):null;case 19:return El(Ja),null;case 4:return Xa(),null;case 10:return _a(n.type._context),null;case 22:case 23:return ds(),null;default:return null}}Li=function(e,n){for(var t=n.child;null!==t;){if(5===t.tag||6===t.tag)e.appendChild(t.stateNode);else if(4!==t.tag&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===n)break;for(;null===t.sibling;){if(null===t.return||t.return===n)return;t=t.return}t.sibling.return=t.return,t=t.sibling}},Ti=function(){},Oi=function(e,n,t,r){var l=e.memoizedProps;if(l!==r){e=n.stateNode,Ka(Ha.current);var a,o=null;switch(t){case"input":l=Y(e,l),r=Y(e,r),o=[];break;case"select":l=F({},l,{value:void 0}),r=F({},r,{value:void 0}),o=[];break;case"textarea":l=re(e,l),r=re(e,r),o=[];break;default:"function"!==typeof l.onClick&&"function"===typeof r.onClick&&(e.onclick=Jr)}for(c in ye(t,r),t=null,l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&null!=l[c])if("style"===c){var u=l[c];for(a in u)u.hasOwnProperty(a)&&(t||(t={}),t[a]="")}else"dangerouslySetInnerHTML"!==c&&"children"!==c&&"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&"autoFocus"!==c&&(i.hasOwnProperty(c)?o||(o=[]):(o=o||[]).push(c,null));for(c in r){var s=r[c];if(u=null!=l?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(null!=s||null!=u))if("style"===c)if(u){for(a in u)!u.hasOwnProperty(a)||s&&s.hasOwnProperty(a)||(t||(t={}),t[a]="");for(a in s)s.hasOwnProperty(a)&&u[a]!==s[a]&&(t||(t={}),t[a]=s[a])}else t||(o||(o=[]),o.push(c,t)),t=s;else"dangerouslySetInnerHTML"===c?(s=s?s.__html:void 0,u=u?u.__html:void 0,null!=s&&u!==s&&(o=o||[]).push(c,s)):"children"===c?"string"!==typeof s&&"number"!==typeof s||(o=o||[]).push(c,""+s):"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&(i.hasOwnProperty(c)?(null!=s&&"onScroll"===c&&Ur("scroll",e),o||u===s||(o=[])):(o=o||[]).push(c,s))}t&&(o=o||[]).push("style",t);var c=o;(n.updateQueue=c)&&(n.flags|=4)}},Ri=function(e,n,t,r){t!==r&&(n.flags|=4)};var Yi=!1,Xi=!1,Gi="function"===typeof WeakSet?WeakSet:Set,Zi=null;function Ji(e,n){var t=e.ref;if(null!==t)if("function"===typeof t)try{t(null)}catch(r){Ns(e,n,r)}else t.current=null}function eu(e,n,t){try{t()}catch(r){Ns(e,n,r)}}var nu=!1;function tu(e,n,t){var r=n.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var l=r=r.next;do{if((l.tag&e)===e){var a=l.destroy;l.destroy=void 0,void 0!==a&&eu(n,t,a)}l=l.next}while(l!==r)}}function ru(e,n){if(null!==(n=null!==(n=n.updateQueue)?n.lastEffect:null)){var t=n=n.next;do{if((t.tag&e)===e){var r=t.create;t.destroy=r()}t=t.next}while(t!==n)}}function lu(e){var n=e.ref;if(null!==n){var t=e.stateNode;e.tag,e=t,"function"===typeof n?n(e):n.current=e}}function au(e){var n=e.alternate;null!==n&&(e.alternate=null,au(n)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(n=e.stateNode)&&(delete n[fl],delete n[pl],delete n[hl],delete n[gl],delete n[vl])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function ou(e){return 5===e.tag||3===e.tag||4===e.tag}function iu(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||ou(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function uu(e,n,t){var r=e.tag;if(5===r||6===r)e=e.stateNode,n?8===t.nodeType?t.parentNode.insertBefore(e,n):t.insertBefore(e,n):(8===t.nodeType?(n=t.parentNode).insertBefore(e,t):(n=t).appendChild(e),null!==(t=t._reactRootContainer)&&void 0!==t||null!==n.onclick||(n.onclick=Jr));else if(4!==r&&null!==(e=e.child))for(uu(e,n,t),e=e.sibling;null!==e;)uu(e,n,t),e=e.sibling}function su(e,n,t){var r=e.tag;if(5===r||6===r)e=e.stateNode,n?t.insertBefore(e,n):t.appendChild(e);else if(4!==r&&null!==(e=e.child))for(su(e,n,t),e=e.sibling;null!==e;)su(e,n,t),e=e.sibling}var cu=null,du=!1;function fu(e,n,t){for(t=t.child;null!==t;)pu(e,n,t),t=t.sibling}function pu(e,n,t){if(an&&"function"===typeof an.onCommitFiberUnmount)try{an.onCommitFiberUnmount(ln,t)}catch(i){}switch(t.tag){case 5:Xi||Ji(t,n);case 6:var r=cu,l=du;cu=null,fu(e,n,t),du=l,null!==(cu=r)&&(du?(e=cu,t=t.stateNode,8===e.nodeType?e.parentNode.removeChild(t):e.removeChild(t)):cu.removeChild(t.stateNode));break;case 18:null!==cu&&(du?(e=cu,t=t.stateNode,8===e.nodeType?ul(e.parentNode,t):1===e.nodeType&&ul(e,t),Bn(e)):ul(cu,t.stateNode));break;case 4:r=cu,l=du,cu=t.stateNode.containerInfo,du=!0,fu(e,n,t),cu=r,du=l;break;case 0:case 11:case 14:case 15:if(!Xi&&(null!==(r=t.updateQueue)&&null!==(r=r.lastEffect))){l=r=r.next;do{var a=l,o=a.destroy;a=a.tag,void 0!==o&&(0!==(2&a)||0!==(4&a))&&eu(t,n,o),l=l.next}while(l!==r)}fu(e,n,t);break;case 1:if(!Xi&&(Ji(t,n),"function"===typeof(r=t.stateNode).componentWillUnmount))try{r.props=t.memoizedProps,r.state=t.memoizedState,r.componentWillUnmount()}catch(i){Ns(t,n,i)}fu(e,n,t);break;case 21:fu(e,n,t);break;case 22:1&t.mode?(Xi=(r=Xi)||null!==t.memoizedState,fu(e,n,t),Xi=r):fu(e,n,t);break;default:fu(e,n,t)}}function mu(e){var n=e.updateQueue;if(null!==n){e.updateQueue=null;var t=e.stateNode;null===t&&(t=e.stateNode=new Gi),n.forEach(function(n){var r=js.bind(null,e,n);t.has(n)||(t.add(n),n.then(r,r))})}}function hu(e,n){var t=n.deletions;if(null!==t)for(var r=0;r<t.length;r++){var l=t[r];try{var o=e,i=n,u=i;e:for(;null!==u;){switch(u.tag){case 5:cu=u.stateNode,du=!1;break e;case 3:case 4:cu=u.stateNode.containerInfo,du=!0;break e}u=u.return}if(null===cu)throw Error(a(160));pu(o,i,l),cu=null,du=!1;var s=l.alternate;null!==s&&(s.return=null),l.return=null}catch(c){Ns(l,n,c)}}if(12854&n.subtreeFlags)for(n=n.child;null!==n;)gu(n,e),n=n.sibling}function gu(e,n){var t=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(hu(n,e),vu(e),4&r){try{tu(3,e,e.return),ru(3,e)}catch(g){Ns(e,e.return,g)}try{tu(5,e,e.return)}catch(g){Ns(e,e.return,g)}}break;case 1:hu(n,e),vu(e),512&r&&null!==t&&Ji(t,t.return);break;case 5:if(hu(n,e),vu(e),512&r&&null!==t&&Ji(t,t.return),32&e.flags){var l=e.stateNode;try{fe(l,"")}catch(g){Ns(e,e.return,g)}}if(4&r&&null!=(l=e.stateNode)){var o=e.memoizedProps,i=null!==t?t.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,null!==s)try{"input"===u&&"radio"===o.type&&null!=o.name&&G(l,o),be(u,i);var c=be(u,o);for(i=0;i<s.length;i+=2){var d=s[i],f=s[i+1];"style"===d?ge(l,f):"dangerouslySetInnerHTML"===d?de(l,f):"children"===d?fe(l,f):b(l,d,f,c)}switch(u){case"input":Z(l,o);break;case"textarea":ae(l,o);break;case"select":var p=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var m=o.value;null!=m?te(l,!!o.multiple,m,!1):p!==!!o.multiple&&(null!=o.defaultValue?te(l,!!o.multiple,o.defaultValue,!0):te(l,!!o.multiple,o.multiple?[]:"",!1))}l[pl]=o}catch(g){Ns(e,e.return,g)}}break;case 6:if(hu(n,e),vu(e),4&r){if(null===e.stateNode)throw Error(a(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(g){Ns(e,e.return,g)}}break;case 3:if(hu(n,e),vu(e),4&r&&null!==t&&t.memoizedState.isDehydrated)try{Bn(n.containerInfo)}catch(g){Ns(e,e.return,g)}break;case 4:default:hu(n,e),vu(e);break;case 13:hu(n,e),vu(e),8192&(l=e.child).flags&&(o=null!==l.memoizedState,l.stateNode.isHidden=o,!o||null!==l.alternate&&null!==l.alternate.memoizedState||(Vu=Ge())),4&r&&mu(e);break;case 22:if(d=null!==t&&null!==t.memoizedState,1&e.mode?(Xi=(c=Xi)||d,hu(n,e),Xi=c):hu(n,e),vu(e),8192&r){if(c=null!==e.memoizedState,(e.stateNode.isHidden=c)&&!d&&0!==(1&e.mode))for(Zi=e,d=e.child;null!==d;){for(f=Zi=d;null!==Zi;){switch(m=(p=Zi).child,p.tag){case 0:case 11:case 14:case 15:tu(4,p,p.return);break;case 1:Ji(p,p.return);var h=p.stateNode;if("function"===typeof h.componentWillUnmount){r=p,t=p.return;try{n=r,h.props=n.memoizedProps,h.state=n.memoizedState,h.componentWillUnmount()}catch(g){Ns(r,t,g)}}break;case 5:Ji(p,p.return);break;case 22:if(null!==p.memoizedState){wu(f);continue}}null!==m?(m.return=p,Zi=m):wu(f)}d=d.sibling}e:for(d=null,f=e;;){if(5===f.tag){if(null===d){d=f;try{l=f.stateNode,c?"function"===typeof(o=l.style).setProperty?o.setProperty("display","none","important"):o.display="none":(u=f.stateNode,i=void 0!==(s=f.memoizedProps.style)&&null!==s&&s.hasOwnProperty("display")?s.display:null,u.style.display=he("display",i))}catch(g){Ns(e,e.return,g)}}}else if(6===f.tag){if(null===d)try{f.stateNode.nodeValue=c?"":f.memoizedProps}catch(g){Ns(e,e.return,g)}}else if((22!==f.tag&&23!==f.tag||null===f.memoizedState||f===e)&&null!==f.child){f.child.return=f,f=f.child;continue}if(f===e)break e;for(;null===f.sibling;){if(null===f.return||f.return===e)break e;d===f&&(d=null),f=f.return}d===f&&(d=null),f.sibling.return=f.return,f=f.sibling}}break;case 19:hu(n,e),vu(e),4&r&&mu(e);case 21:}}function vu(e){var n=e.flags;if(2&n){try{e:{for(var t=e.return;null!==t;){if(ou(t)){var r=t;break e}t=t.return}throw Error(a(160))}switch(r.tag){case 5:var l=r.stateNode;32&r.flags&&(fe(l,""),r.flags&=-33),su(e,iu(e),l);break;case 3:case 4:var o=r.stateNode.containerInfo;uu(e,iu(e),o);break;default:throw Error(a(161))}}catch(i){Ns(e,e.return,i)}e.flags&=-3}4096&n&&(e.flags&=-4097)}function yu(e,n,t){Zi=e,bu(e,n,t)}function bu(e,n,t){for(var r=0!==(1&e.mode);null!==Zi;){var l=Zi,a=l.child;if(22===l.tag&&r){var o=null!==l.memoizedState||Yi;if(!o){var i=l.alternate,u=null!==i&&null!==i.memoizedState||Xi;i=Yi;var s=Xi;if(Yi=o,(Xi=u)&&!s)for(Zi=l;null!==Zi;)u=(o=Zi).child,22===o.tag&&null!==o.memoizedState?ku(l):null!==u?(u.return=o,Zi=u):ku(l);for(;null!==a;)Zi=a,bu(a,n,t),a=a.sibling;Zi=l,Yi=i,Xi=s}xu(e)}else 0!==(8772&l.subtreeFlags)&&null!==a?(a.return=l,Zi=a):xu(e)}}function xu(e){for(;null!==Zi;){var n=Zi;if(0!==(8772&n.flags)){var t=n.alternate;try{if(0!==(8772&n.flags))switch(n.tag){case 0:case 11:case 15:Xi||ru(5,n);break;case 1:var r=n.stateNode;if(4&n.flags&&!Xi)if(null===t)r.componentDidMount();else{var l=n.elementType===n.type?t.memoizedProps:ti(n.type,t.memoizedProps);r.componentDidUpdate(l,t.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=n.updateQueue;null!==o&&Ba(n,o,r);break;case 3:var i=n.updateQueue;if(null!==i){if(t=null,null!==n.child)switch(n.child.tag){case 5:case 1:t=n.child.stateNode}Ba(n,i,t)}break;case 5:var u=n.stateNode;if(null===t&&4&n.flags){t=u;var s=n.memoizedProps;switch(n.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&t.focus();break;case"img":s.src&&(t.src=s.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===n.memoizedState){var c=n.alternate;if(null!==c){var d=c.memoizedState;if(null!==d){var f=d.dehydrated;null!==f&&Bn(f)}}}break;default:throw Error(a(163))}Xi||512&n.flags&&lu(n)}catch(p){Ns(n,n.return,p)}}if(n===e){Zi=null;break}if(null!==(t=n.sibling)){t.return=n.return,Zi=t;break}Zi=n.return}}function wu(e){for(;null!==Zi;){var n=Zi;if(n===e){Zi=null;break}var t=n.sibling;if(null!==t){t.return=n.return,Zi=t;break}Zi=n.return}}function ku(e){for(;null!==Zi;){var n=Zi;try{switch(n.tag){case 0:case 11:case 15:var t=n.return;try{ru(4,n)}catch(u){Ns(n,t,u)}break;case 1:var r=n.stateNode;if("function"===typeof r.componentDidMount){var l=n.return;try{r.componentDidMount()}catch(u){Ns(n,l,u)}}var a=n.return;try{lu(n)}catch(u){Ns(n,a,u)}break;case 5:var o=n.return;try{lu(n)}catch(u){Ns(n,o,u)}}}catch(u){Ns(n,n.return,u)}if(n===e){Zi=null;break}var i=n.sibling;if(null!==i){i.return=n.return,Zi=i;break}Zi=n.return}}var Su,Nu=Math.ceil,Eu=x.ReactCurrentDispatcher,Cu=x.ReactCurrentOwner,_u=x.ReactCurrentBatchConfig,ju=0,Pu=null,zu=null,Lu=0,Tu=0,Ou=Nl(0),Ru=0,Mu=null,Du=0,Fu=0,Iu=0,Uu=null,Au=null,Vu=0,$u=1/0,Bu=null,Wu=!1,Hu=null,Qu=null,qu=!1,Ku=null,Yu=0,Xu=0,Gu=null,Zu=-1,Ju=0;function es(){return 0!==(6&ju)?Ge():-1!==Zu?Zu:Zu=Ge()}function ns(e){return 0===(1&e.mode)?1:0!==(2&ju)&&0!==Lu?Lu&-Lu:null!==ha.transition?(0===Ju&&(Ju=gn()),Ju):0!==(e=xn)?e:e=void 0===(e=window.event)?16:Gn(e.type)}function ts(e,n,t,r){if(50<Xu)throw Xu=0,Gu=null,Error(a(185));yn(e,t,r),0!==(2&ju)&&e===Pu||(e===Pu&&(0===(2&ju)&&(Fu|=t),4===Ru&&is(e,Lu)),rs(e,r),1===t&&0===ju&&0===(1&n.mode)&&($u=Ge()+500,Ul&&$l()))}function rs(e,n){var t=e.callbackNode;!function(e,n){for(var t=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,a=e.pendingLanes;0<a;){var o=31-on(a),i=1<<o,u=l[o];-1===u?0!==(i&t)&&0===(i&r)||(l[o]=mn(i,n)):u<=n&&(e.expiredLanes|=i),a&=~i}}(e,n);var r=pn(e,e===Pu?Lu:0);if(0===r)null!==t&&Ke(t),e.callbackNode=null,e.callbackPriority=0;else if(n=r&-r,e.callbackPriority!==n){if(null!=t&&Ke(t),1===n)0===e.tag?function(e){Ul=!0,Vl(e)}(us.bind(null,e)):Vl(us.bind(null,e)),ol(function(){0===(6&ju)&&$l()}),t=null;else{switch(wn(r)){case 1:t=Je;break;case 4:t=en;break;case 16:default:t=nn;break;case 536870912:t=rn}t=Ps(t,ls.bind(null,e))}e.callbackPriority=n,e.callbackNode=t}}function ls(e,n){if(Zu=-1,Ju=0,0!==(6&ju))throw Error(a(327));var t=e.callbackNode;if(ks()&&e.callbackNode!==t)return null;var r=pn(e,e===Pu?Lu:0);if(0===r)return null;if(0!==(30&r)||0!==(r&e.expiredLanes)||n)n=gs(e,r);else{n=r;var l=ju;ju|=2;var o=ms();for(Pu===e&&Lu===n||(Bu=null,$u=Ge()+500,fs(e,n));;)try{ys();break}catch(u){ps(e,u)}Ca(),Eu.current=o,ju=l,null!==zu?n=0:(Pu=null,Lu=0,n=Ru)}if(0!==n){if(2===n&&(0!==(l=hn(e))&&(r=l,n=as(e,l))),1===n)throw t=Mu,fs(e,0),is(e,r),rs(e,Ge()),t;if(6===n)is(e,r);else{if(l=e.current.alternate,0===(30&r)&&!function(e){for(var n=e;;){if(16384&n.flags){var t=n.updateQueue;if(null!==t&&null!==(t=t.stores))for(var r=0;r<t.length;r++){var l=t[r],a=l.getSnapshot;l=l.value;try{if(!ir(a(),l))return!1}catch(i){return!1}}}if(t=n.child,16384&n.subtreeFlags&&null!==t)t.return=n,n=t;else{if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return!0;n=n.return}n.sibling.return=n.return,n=n.sibling}}return!0}(l)&&(2===(n=gs(e,r))&&(0!==(o=hn(e))&&(r=o,n=as(e,o))),1===n))throw t=Mu,fs(e,0),is(e,r),rs(e,Ge()),t;switch(e.finishedWork=l,e.finishedLanes=r,n){case 0:case 1:throw Error(a(345));case 2:case 5:ws(e,Au,Bu);break;case 3:if(is(e,r),(130023424&r)===r&&10<(n=Vu+500-Ge())){if(0!==pn(e,0))break;if(((l=e.suspendedLanes)&r)!==r){es(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=rl(ws.bind(null,e,Au,Bu),n);break}ws(e,Au,Bu);break;case 4:if(is(e,r),(4194240&r)===r)break;for(n=e.eventTimes,l=-1;0<r;){var i=31-on(r);o=1<<i,(i=n[i])>l&&(l=i),r&=~o}if(r=l,10<(r=(120>(r=Ge()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Nu(r/1960))-r)){e.timeoutHandle=rl(ws.bind(null,e,Au,Bu),r);break}ws(e,Au,Bu);break;default:throw Error(a(329))}}}return rs(e,Ge()),e.callbackNode===t?ls.bind(null,e):null}function as(e,n){var t=Uu;return e.current.memoizedState.isDehydrated&&(fs(e,n).flags|=256),2!==(e=gs(e,n))&&(n=Au,Au=t,null!==n&&os(n)),e}function os(e){null===Au?Au=e:Au.push.apply(Au,e)}function is(e,n){for(n&=~Iu,n&=~Fu,e.suspendedLanes|=n,e.pingedLanes&=~n,e=e.expirationTimes;0<n;){var t=31-on(n),r=1<<t;e[t]=-1,n&=~r}}function us(e){if(0!==(6&ju))throw Error(a(327));ks();var n=pn(e,0);if(0===(1&n))return rs(e,Ge()),null;var t=gs(e,n);if(0!==e.tag&&2===t){var r=hn(e);0!==r&&(n=r,t=as(e,r))}if(1===t)throw t=Mu,fs(e,0),is(e,n),rs(e,Ge()),t;if(6===t)throw Error(a(345));return e.finishedWork=e.current.alternate,e.finishedLanes=n,ws(e,Au,Bu),rs(e,Ge()),null}function ss(e,n){var t=ju;ju|=1;try{return e(n)}finally{0===(ju=t)&&($u=Ge()+500,Ul&&$l())}}function cs(e){null!==Ku&&0===Ku.tag&&0===(6&ju)&&ks();var n=ju;ju|=1;var t=_u.transition,r=xn;try{if(_u.transition=null,xn=1,e)return e()}finally{xn=r,_u.transition=t,0===(6&(ju=n))&&$l()}}function ds(){Tu=Ou.current,El(Ou)}function fs(e,n){e.finishedWork=null,e.finishedLanes=0;var t=e.timeoutHandle;if(-1!==t&&(e.timeoutHandle=-1,ll(t)),null!==zu)for(t=zu.return;null!==t;){var r=t;switch(na(r),r.tag){case 1:null!==(r=r.type.childContextTypes)&&void 0!==r&&Ol();break;case 3:Xa(),El(Pl),El(jl),to();break;case 5:Za(r);break;case 4:Xa();break;case 13:case 19:El(Ja);break;case 10:_a(r.type._context);break;case 22:case 23:ds()}t=t.return}if(Pu=e,zu=e=Os(e.current,null),Lu=Tu=n,Ru=0,Mu=null,Iu=Fu=Du=0,Au=Uu=null,null!==La){for(n=0;n<La.length;n++)if(null!==(r=(t=La[n]).interleaved)){t.interleaved=null;var l=r.next,a=t.pending;if(null!==a){var o=a.next;a.next=l,r.next=o}t.pending=r}La=null}return e}function ps(e,n){for(;;){var t=zu;try{if(Ca(),ro.current=Zo,so){for(var r=oo.memoizedState;null!==r;){var l=r.queue;null!==l&&(l.pending=null),r=r.next}so=!1}if(ao=0,uo=io=oo=null,co=!1,fo=0,Cu.current=null,null===t||null===t.return){Ru=1,Mu=n,zu=null;break}e:{var o=e,i=t.return,u=t,s=n;if(n=Lu,u.flags|=32768,null!==s&&"object"===typeof s&&"function"===typeof s.then){var c=s,d=u,f=d.tag;if(0===(1&d.mode)&&(0===f||11===f||15===f)){var p=d.alternate;p?(d.updateQueue=p.updateQueue,d.memoizedState=p.memoizedState,d.lanes=p.lanes):(d.updateQueue=null,d.memoizedState=null)}var m=gi(i);if(null!==m){m.flags&=-257,vi(m,i,u,0,n),1&m.mode&&hi(o,c,n),s=c;var h=(n=m).updateQueue;if(null===h){var g=new Set;g.add(s),n.updateQueue=g}else h.add(s);break e}if(0===(1&n)){hi(o,c,n),hs();break e}s=Error(a(426))}else if(la&&1&u.mode){var v=gi(i);if(null!==v){0===(65536&v.flags)&&(v.flags|=256),vi(v,i,u,0,n),ma(si(s,u));break e}}o=s=si(s,u),4!==Ru&&(Ru=2),null===Uu?Uu=[o]:Uu.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,n&=-n,o.lanes|=n,Va(o,pi(0,s,n));break e;case 1:u=s;var y=o.type,b=o.stateNode;if(0===(128&o.flags)&&("function"===typeof y.getDerivedStateFromError||null!==b&&"function"===typeof b.componentDidCatch&&(null===Qu||!Qu.has(b)))){o.flags|=65536,n&=-n,o.lanes|=n,Va(o,mi(o,u,n));break e}}o=o.return}while(null!==o)}xs(t)}catch(x){n=x,zu===t&&null!==t&&(zu=t=t.return);continue}break}}function ms(){var e=Eu.current;return Eu.current=Zo,null===e?Zo:e}function hs(){0!==Ru&&3!==Ru&&2!==Ru||(Ru=4),null===Pu||0===(268435455&Du)&&0===(268435455&Fu)||is(Pu,Lu)}function gs(e,n){var t=ju;ju|=2;var r=ms();for(Pu===e&&Lu===n||(Bu=null,fs(e,n));;)try{vs();break}catch(l){ps(e,l)}if(Ca(),ju=t,Eu.current=r,null!==zu)throw Error(a(261));return Pu=null,Lu=0,Ru}function vs(){for(;null!==zu;)bs(zu)}function ys(){for(;null!==zu&&!Ye();)bs(zu)}function bs(e){var n=Su(e.alternate,e,Tu);e.memoizedProps=e.pendingProps,null===n?xs(e):zu=n,Cu.current=null}function xs(e){var n=e;do{var t=n.alternate;if(e=n.return,0===(32768&n.flags)){if(null!==(t=qi(t,n,Tu)))return void(zu=t)}else{if(null!==(t=Ki(t,n)))return t.flags&=32767,void(zu=t);if(null===e)return Ru=6,void(zu=null);e.flags|=32768,e.subtreeFlags=0,e.deletions=null}if(null!==(n=n.sibling))return void(zu=n);zu=n=e}while(null!==n);0===Ru&&(Ru=5)}function ws(e,n,t){var r=xn,l=_u.transition;try{_u.transition=null,xn=1,function(e,n,t,r){do{ks()}while(null!==Ku);if(0!==(6&ju))throw Error(a(327));t=e.finishedWork;var l=e.finishedLanes;if(null===t)return null;if(e.finishedWork=null,e.finishedLanes=0,t===e.current)throw Error(a(177));e.callbackNode=null,e.callbackPriority=0;var o=t.lanes|t.childLanes;if(function(e,n){var t=e.pendingLanes&~n;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=n,e.mutableReadLanes&=n,e.entangledLanes&=n,n=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<t;){var l=31-on(t),a=1<<l;n[l]=0,r[l]=-1,e[l]=-1,t&=~a}}(e,o),e===Pu&&(zu=Pu=null,Lu=0),0===(2064&t.subtreeFlags)&&0===(2064&t.flags)||qu||(qu=!0,Ps(nn,function(){return ks(),null})),o=0!==(15990&t.flags),0!==(15990&t.subtreeFlags)||o){o=_u.transition,_u.transition=null;var i=xn;xn=1;var u=ju;ju|=4,Cu.current=null,function(e,n){if(el=Hn,pr(e=fr())){if("selectionStart"in e)var t={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(t=(t=e.ownerDocument)&&t.defaultView||window).getSelection&&t.getSelection();if(r&&0!==r.rangeCount){t=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{t.nodeType,o.nodeType}catch(w){t=null;break e}var i=0,u=-1,s=-1,c=0,d=0,f=e,p=null;n:for(;;){for(var m;f!==t||0!==l&&3!==f.nodeType||(u=i+l),f!==o||0!==r&&3!==f.nodeType||(s=i+r),3===f.nodeType&&(i+=f.nodeValue.length),null!==(m=f.firstChild);)p=f,f=m;for(;;){if(f===e)break n;if(p===t&&++c===l&&(u=i),p===o&&++d===r&&(s=i),null!==(m=f.nextSibling))break;p=(f=p).parentNode}f=m}t=-1===u||-1===s?null:{start:u,end:s}}else t=null}t=t||{start:0,end:0}}else t=null;for(nl={focusedElem:e,selectionRange:t},Hn=!1,Zi=n;null!==Zi;)if(e=(n=Zi).child,0!==(1028&n.subtreeFlags)&&null!==e)e.return=n,Zi=e;else for(;null!==Zi;){n=Zi;try{var h=n.alternate;if(0!==(1024&n.flags))switch(n.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==h){var g=h.memoizedProps,v=h.memoizedState,y=n.stateNode,b=y.getSnapshotBeforeUpdate(n.elementType===n.type?g:ti(n.type,g),v);y.__reactInternalSnapshotBeforeUpdate=b}break;case 3:var x=n.stateNode.containerInfo;1===x.nodeType?x.textContent="":9===x.nodeType&&x.documentElement&&x.removeChild(x.documentElement);break;default:throw Error(a(163))}}catch(w){Ns(n,n.return,w)}if(null!==(e=n.sibling)){e.return=n.return,Zi=e;break}Zi=n.return}h=nu,nu=!1}(e,t),gu(t,e),mr(nl),Hn=!!el,nl=el=null,e.current=t,yu(t,e,l),Xe(),ju=u,xn=i,_u.transition=o}else e.current=t;if(qu&&(qu=!1,Ku=e,Yu=l),o=e.pendingLanes,0===o&&(Qu=null),function(e){if(an&&"function"===typeof an.onCommitFiberRoot)try{an.onCommitFiberRoot(ln,e,void 0,128===(128&e.current.flags))}catch(n){}}(t.stateNode),rs(e,Ge()),null!==n)for(r=e.onRecoverableError,t=0;t<n.length;t++)l=n[t],r(l.value,{componentStack:l.stack,digest:l.digest});if(Wu)throw Wu=!1,e=Hu,Hu=null,e;0!==(1&Yu)&&0!==e.tag&&ks(),o=e.pendingLanes,0!==(1&o)?e===Gu?Xu++:(Xu=0,Gu=e):Xu=0,$l()}(e,n,t,r)}finally{_u.transition=l,xn=r}return null}function ks(){if(null!==Ku){var e=wn(Yu),n=_u.transition,t=xn;try{if(_u.transition=null,xn=16>e?16:e,null===Ku)var r=!1;else{if(e=Ku,Ku=null,Yu=0,0!==(6&ju))throw Error(a(331));var l=ju;for(ju|=4,Zi=e.current;null!==Zi;){var o=Zi,i=o.child;if(0!==(16&Zi.flags)){var u=o.deletions;if(null!==u){for(var s=0;s<u.length;s++){var c=u[s];for(Zi=c;null!==Zi;){var d=Zi;switch(d.tag){case 0:case 11:case 15:tu(8,d,o)}var f=d.child;if(null!==f)f.return=d,Zi=f;else for(;null!==Zi;){var p=(d=Zi).sibling,m=d.return;if(au(d),d===c){Zi=null;break}if(null!==p){p.return=m,Zi=p;break}Zi=m}}}var h=o.alternate;if(null!==h){var g=h.child;if(null!==g){h.child=null;do{var v=g.sibling;g.sibling=null,g=v}while(null!==g)}}Zi=o}}if(0!==(2064&o.subtreeFlags)&&null!==i)i.return=o,Zi=i;else e:for(;null!==Zi;){if(0!==(2048&(o=Zi).flags))switch(o.tag){case 0:case 11:case 15:tu(9,o,o.return)}var y=o.sibling;if(null!==y){y.return=o.return,Zi=y;break e}Zi=o.return}}var b=e.current;for(Zi=b;null!==Zi;){var x=(i=Zi).child;if(0!==(2064&i.subtreeFlags)&&null!==x)x.return=i,Zi=x;else e:for(i=b;null!==Zi;){if(0!==(2048&(u=Zi).flags))try{switch(u.tag){case 0:case 11:case 15:ru(9,u)}}catch(k){Ns(u,u.return,k)}if(u===i){Zi=null;break e}var w=u.sibling;if(null!==w){w.return=u.return,Zi=w;break e}Zi=u.return}}if(ju=l,$l(),an&&"function"===typeof an.onPostCommitFiberRoot)try{an.onPostCommitFiberRoot(ln,e)}catch(k){}r=!0}return r}finally{xn=t,_u.transition=n}}return!1}function Ss(e,n,t){e=Ua(e,n=pi(0,n=si(t,n),1),1),n=es(),null!==e&&(yn(e,1,n),rs(e,n))}function Ns(e,n,t){if(3===e.tag)Ss(e,e,t);else for(;null!==n;){if(3===n.tag){Ss(n,e,t);break}if(1===n.tag){var r=n.stateNode;if("function"===typeof n.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Qu||!Qu.has(r))){n=Ua(n,e=mi(n,e=si(t,e),1),1),e=es(),null!==n&&(yn(n,1,e),rs(n,e));break}}n=n.return}}function Es(e,n,t){var r=e.pingCache;null!==r&&r.delete(n),n=es(),e.pingedLanes|=e.suspendedLanes&t,Pu===e&&(Lu&t)===t&&(4===Ru||3===Ru&&(130023424&Lu)===Lu&&500>Ge()-Vu?fs(e,0):Iu|=t),rs(e,n)}function Cs(e,n){0===n&&(0===(1&e.mode)?n=1:(n=dn,0===(130023424&(dn<<=1))&&(dn=4194304)));var t=es();null!==(e=Ra(e,n))&&(yn(e,n,t),rs(e,t))}function _s(e){var n=e.memoizedState,t=0;null!==n&&(t=n.retryLane),Cs(e,t)}function js(e,n){var t=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;null!==l&&(t=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(a(314))}null!==r&&r.delete(n),Cs(e,t)}function Ps(e,n){return qe(e,n)}function zs(e,n,t,r){this.tag=e,this.key=t,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=n,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ls(e,n,t,r){return new zs(e,n,t,r)}function Ts(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Os(e,n){var t=e.alternate;return null===t?((t=Ls(e.tag,n,e.key,e.mode)).elementType=e.elementType,t.type=e.type,t.stateNode=e.stateNode,t.alternate=e,e.alternate=t):(t.pendingProps=n,t.type=e.type,t.flags=0,t.subtreeFlags=0,t.deletions=null),t.flags=14680064&e.flags,t.childLanes=e.childLanes,t.lanes=e.lanes,t.child=e.child,t.memoizedProps=e.memoizedProps,t.memoizedState=e.memoizedState,t.updateQueue=e.updateQueue,n=e.dependencies,t.dependencies=null===n?null:{lanes:n.lanes,firstContext:n.firstContext},t.sibling=e.sibling,t.index=e.index,t.ref=e.ref,t}function Rs(e,n,t,r,l,o){var i=2;if(r=e,"function"===typeof e)Ts(e)&&(i=1);else if("string"===typeof e)i=5;else e:switch(e){case S:return Ms(t.children,l,o,n);case N:i=8,l|=8;break;case E:return(e=Ls(12,t,n,2|l)).elementType=E,e.lanes=o,e;case P:return(e=Ls(13,t,n,l)).elementType=P,e.lanes=o,e;case z:return(e=Ls(19,t,n,l)).elementType=z,e.lanes=o,e;case O:return Ds(t,l,o,n);default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case C:i=10;break e;case _:i=9;break e;case j:i=11;break e;case L:i=14;break e;case T:i=16,r=null;break e}throw Error(a(130,null==e?e:typeof e,""))}return(n=Ls(i,t,n,l)).elementType=e,n.type=r,n.lanes=o,n}function Ms(e,n,t,r){return(e=Ls(7,e,r,n)).lanes=t,e}function Ds(e,n,t,r){return(e=Ls(22,e,r,n)).elementType=O,e.lanes=t,e.stateNode={isHidden:!1},e}function Fs(e,n,t){return(e=Ls(6,e,null,n)).lanes=t,e}function Is(e,n,t){return(n=Ls(4,null!==e.children?e.children:[],e.key,n)).lanes=t,n.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},n}function Us(e,n,t,r,l){this.tag=n,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=vn(0),this.expirationTimes=vn(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=vn(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function As(e,n,t,r,l,a,o,i,u){return e=new Us(e,n,t,i,u),1===n?(n=1,!0===a&&(n|=8)):n=0,a=Ls(3,null,null,n),e.current=a,a.stateNode=e,a.memoizedState={element:r,isDehydrated:t,cache:null,transitions:null,pendingSuspenseBoundaries:null},Da(a),e}function Vs(e){if(!e)return _l;e:{if($e(e=e._reactInternals)!==e||1!==e.tag)throw Error(a(170));var n=e;do{switch(n.tag){case 3:n=n.stateNode.context;break e;case 1:if(Tl(n.type)){n=n.stateNode.__reactInternalMemoizedMergedChildContext;break e}}n=n.return}while(null!==n);throw Error(a(171))}if(1===e.tag){var t=e.type;if(Tl(t))return Ml(e,t,n)}return n}function $s(e,n,t,r,l,a,o,i,u){return(e=As(t,r,!0,e,0,a,0,i,u)).context=Vs(null),t=e.current,(a=Ia(r=es(),l=ns(t))).callback=void 0!==n&&null!==n?n:null,Ua(t,a,l),e.current.lanes=l,yn(e,l,r),rs(e,r),e}function Bs(e,n,t,r){var l=n.current,a=es(),o=ns(l);return t=Vs(t),null===n.context?n.context=t:n.pendingContext=t,(n=Ia(a,o)).payload={element:e},null!==(r=void 0===r?null:r)&&(n.callback=r),null!==(e=Ua(l,n,o))&&(ts(e,l,o,a),Aa(e,l,o)),o}function Ws(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function Hs(e,n){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var t=e.retryLane;e.retryLane=0!==t&&t<n?t:n}}function Qs(e,n){Hs(e,n),(e=e.alternate)&&Hs(e,n)}Su=function(e,n,t){if(null!==e)if(e.memoizedProps!==n.pendingProps||Pl.current)bi=!0;else{if(0===(e.lanes&t)&&0===(128&n.flags))return bi=!1,function(e,n,t){switch(n.tag){case 3:Pi(n),pa();break;case 5:Ga(n);break;case 1:Tl(n.type)&&Dl(n);break;case 4:Ya(n,n.stateNode.containerInfo);break;case 10:var r=n.type._context,l=n.memoizedProps.value;Cl(ka,r._currentValue),r._currentValue=l;break;case 13:if(null!==(r=n.memoizedState))return null!==r.dehydrated?(Cl(Ja,1&Ja.current),n.flags|=128,null):0!==(t&n.child.childLanes)?Fi(e,n,t):(Cl(Ja,1&Ja.current),null!==(e=Wi(e,n,t))?e.sibling:null);Cl(Ja,1&Ja.current);break;case 19:if(r=0!==(t&n.childLanes),0!==(128&e.flags)){if(r)return $i(e,n,t);n.flags|=128}if(null!==(l=n.memoizedState)&&(l.rendering=null,l.tail=null,l.lastEffect=null),Cl(Ja,Ja.current),r)break;return null;case 22:case 23:return n.lanes=0,Ni(e,n,t)}return Wi(e,n,t)}(e,n,t);bi=0!==(131072&e.flags)}else bi=!1,la&&0!==(1048576&n.flags)&&Jl(n,Ql,n.index);switch(n.lanes=0,n.tag){case 2:var r=n.type;Bi(e,n),e=n.pendingProps;var l=Ll(n,jl.current);Pa(n,t),l=go(null,n,r,e,l,t);var o=vo();return n.flags|=1,"object"===typeof l&&null!==l&&"function"===typeof l.render&&void 0===l.$$typeof?(n.tag=1,n.memoizedState=null,n.updateQueue=null,Tl(r)?(o=!0,Dl(n)):o=!1,n.memoizedState=null!==l.state&&void 0!==l.state?l.state:null,Da(n),l.updater=li,n.stateNode=l,l._reactInternals=n,ui(n,r,e,t),n=ji(null,n,r,!0,o,t)):(n.tag=0,la&&o&&ea(n),xi(null,n,l,t),n=n.child),n;case 16:r=n.elementType;e:{switch(Bi(e,n),e=n.pendingProps,r=(l=r._init)(r._payload),n.type=r,l=n.tag=function(e){if("function"===typeof e)return Ts(e)?1:0;if(void 0!==e&&null!==e){if((e=e.$$typeof)===j)return 11;if(e===L)return 14}return 2}(r),e=ti(r,e),l){case 0:n=Ci(null,n,r,e,t);break e;case 1:n=_i(null,n,r,e,t);break e;case 11:n=wi(null,n,r,e,t);break e;case 14:n=ki(null,n,r,ti(r.type,e),t);break e}throw Error(a(306,r,""))}return n;case 0:return r=n.type,l=n.pendingProps,Ci(e,n,r,l=n.elementType===r?l:ti(r,l),t);case 1:return r=n.type,l=n.pendingProps,_i(e,n,r,l=n.elementType===r?l:ti(r,l),t);case 3:e:{if(Pi(n),null===e)throw Error(a(387));r=n.pendingProps,l=(o=n.memoizedState).element,Fa(e,n),$a(n,r,null,t);var i=n.memoizedState;if(r=i.element,o.isDehydrated){if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},n.updateQueue.baseState=o,n.memoizedState=o,256&n.flags){n=zi(e,n,r,t,l=si(Error(a(423)),n));break e}if(r!==l){n=zi(e,n,r,t,l=si(Error(a(424)),n));break e}for(ra=sl(n.stateNode.containerInfo.firstChild),ta=n,la=!0,aa=null,t=wa(n,null,r,t),n.child=t;t;)t.flags=-3&t.flags|4096,t=t.sibling}else{if(pa(),r===l){n=Wi(e,n,t);break e}xi(e,n,r,t)}n=n.child}return n;case 5:return Ga(n),null===e&&sa(n),r=n.type,l=n.pendingProps,o=null!==e?e.memoizedProps:null,i=l.children,tl(r,l)?i=null:null!==o&&tl(r,o)&&(n.flags|=32),Ei(e,n),xi(e,n,i,t),n.child;case 6:return null===e&&sa(n),null;case 13:return Fi(e,n,t);case 4:return Ya(n,n.stateNode.containerInfo),r=n.pendingProps,null===e?n.child=xa(n,null,r,t):xi(e,n,r,t),n.child;case 11:return r=n.type,l=n.pendingProps,wi(e,n,r,l=n.elementType===r?l:ti(r,l),t);case 7:return xi(e,n,n.pendingProps,t),n.child;case 8:case 12:return xi(e,n,n.pendingProps.children,t),n.child;case 10:e:{if(r=n.type._context,l=n.pendingProps,o=n.memoizedProps,i=l.value,Cl(ka,r._currentValue),r._currentValue=i,null!==o)if(ir(o.value,i)){if(o.children===l.children&&!Pl.current){n=Wi(e,n,t);break e}}else for(null!==(o=n.child)&&(o.return=n);null!==o;){var u=o.dependencies;if(null!==u){i=o.child;for(var s=u.firstContext;null!==s;){if(s.context===r){if(1===o.tag){(s=Ia(-1,t&-t)).tag=2;var c=o.updateQueue;if(null!==c){var d=(c=c.shared).pending;null===d?s.next=s:(s.next=d.next,d.next=s),c.pending=s}}o.lanes|=t,null!==(s=o.alternate)&&(s.lanes|=t),ja(o.return,t,n),u.lanes|=t;break}s=s.next}}else if(10===o.tag)i=o.type===n.type?null:o.child;else if(18===o.tag){if(null===(i=o.return))throw Error(a(341));i.lanes|=t,null!==(u=i.alternate)&&(u.lanes|=t),ja(i,t,n),i=o.sibling}else i=o.child;if(null!==i)i.return=o;else for(i=o;null!==i;){if(i===n){i=null;break}if(null!==(o=i.sibling)){o.return=i.return,i=o;break}i=i.return}o=i}xi(e,n,l.children,t),n=n.child}return n;case 9:return l=n.type,r=n.pendingProps.children,Pa(n,t),r=r(l=za(l)),n.flags|=1,xi(e,n,r,t),n.child;case 14:return l=ti(r=n.type,n.pendingProps),ki(e,n,r,l=ti(r.type,l),t);case 15:return Si(e,n,n.type,n.pendingProps,t);case 17:return r=n.type,l=n.pendingProps,l=n.elementType===r?l:ti(r,l),Bi(e,n),n.tag=1,Tl(r)?(e=!0,Dl(n)):e=!1,Pa(n,t),oi(n,r,l),ui(n,r,l,t),ji(null,n,r,!0,e,t);case 19:return $i(e,n,t);case 22:return Ni(e,n,t)}throw Error(a(156,n.tag))};var qs="function"===typeof reportError?reportError:function(e){console.error(e)};function Ks(e){this._internalRoot=e}function Ys(e){this._internalRoot=e}function Xs(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function Gs(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Zs(){}function Js(e,n,t,r,l){var a=t._reactRootContainer;if(a){var o=a;if("function"===typeof l){var i=l;l=function(){var e=Ws(o);i.call(e)}}Bs(n,o,e,l)}else o=function(e,n,t,r,l){if(l){if("function"===typeof r){var a=r;r=function(){var e=Ws(o);a.call(e)}}var o=$s(n,r,e,0,null,!1,0,"",Zs);return e._reactRootContainer=o,e[ml]=o.current,$r(8===e.nodeType?e.parentNode:e),cs(),o}for(;l=e.lastChild;)e.removeChild(l);if("function"===typeof r){var i=r;r=function(){var e=Ws(u);i.call(e)}}var u=As(e,0,!1,null,0,!1,0,"",Zs);return e._reactRootContainer=u,e[ml]=u.current,$r(8===e.nodeType?e.parentNode:e),cs(function(){Bs(n,u,t,r)}),u}(t,n,e,l,r);return Ws(o)}Ys.prototype.render=Ks.prototype.render=function(e){var n=this._internalRoot;if(null===n)throw Error(a(409));Bs(e,n,null,null)},Ys.prototype.unmount=Ks.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var n=e.containerInfo;cs(function(){Bs(null,e,null,null)}),n[ml]=null}},Ys.prototype.unstable_scheduleHydration=function(e){if(e){var n=En();e={blockedOn:null,target:e,priority:n};for(var t=0;t<Rn.length&&0!==n&&n<Rn[t].priority;t++);Rn.splice(t,0,e),0===t&&In(e)}},kn=function(e){switch(e.tag){case 3:var n=e.stateNode;if(n.current.memoizedState.isDehydrated){var t=fn(n.pendingLanes);0!==t&&(bn(n,1|t),rs(n,Ge()),0===(6&ju)&&($u=Ge()+500,$l()))}break;case 13:cs(function(){var n=Ra(e,1);if(null!==n){var t=es();ts(n,e,1,t)}}),Qs(e,1)}},Sn=function(e){if(13===e.tag){var n=Ra(e,134217728);if(null!==n)ts(n,e,134217728,es());Qs(e,134217728)}},Nn=function(e){if(13===e.tag){var n=ns(e),t=Ra(e,n);if(null!==t)ts(t,e,n,es());Qs(e,n)}},En=function(){return xn},Cn=function(e,n){var t=xn;try{return xn=e,n()}finally{xn=t}},ke=function(e,n,t){switch(n){case"input":if(Z(e,t),n=t.name,"radio"===t.type&&null!=n){for(t=e;t.parentNode;)t=t.parentNode;for(t=t.querySelectorAll("input[name="+JSON.stringify(""+n)+'][type="radio"]'),n=0;n<t.length;n++){var r=t[n];if(r!==e&&r.form===e.form){var l=wl(r);if(!l)throw Error(a(90));q(r),Z(r,l)}}}break;case"textarea":ae(e,t);break;case"select":null!=(n=t.value)&&te(e,!!t.multiple,n,!1)}},je=ss,Pe=cs;var ec={usingClientEntryPoint:!1,Events:[bl,xl,wl,Ce,_e,ss]},nc={findFiberByHostInstance:yl,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},tc={bundleType:nc.bundleType,version:nc.version,rendererPackageName:nc.rendererPackageName,rendererConfig:nc.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:x.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=He(e))?null:e.stateNode},findFiberByHostInstance:nc.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var rc=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!rc.isDisabled&&rc.supportsFiber)try{ln=rc.inject(tc),an=rc}catch(ce){}}n.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=ec,n.createPortal=function(e,n){var t=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Xs(n))throw Error(a(200));return function(e,n,t){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:k,key:null==r?null:""+r,children:e,containerInfo:n,implementation:t}}(e,n,null,t)},n.createRoot=function(e,n){if(!Xs(e))throw Error(a(299));var t=!1,r="",l=qs;return null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(t=!0),void 0!==n.identifierPrefix&&(r=n.identifierPrefix),void 0!==n.onRecoverableError&&(l=n.onRecoverableError)),n=As(e,1,!1,null,0,t,0,r,l),e[ml]=n.current,$r(8===e.nodeType?e.parentNode:e),new Ks(n)},n.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var n=e._reactInternals;if(void 0===n){if("function"===typeof e.render)throw Error(a(188));throw e=Object.keys(e).join(","),Error(a(268,e))}return e=null===(e=He(n))?null:e.stateNode},n.flushSync=function(e){return cs(e)},n.hydrate=function(e,n,t){if(!Gs(n))throw Error(a(200));return Js(null,e,n,!0,t)},n.hydrateRoot=function(e,n,t){if(!Xs(e))throw Error(a(405));var r=null!=t&&t.hydratedSources||null,l=!1,o="",i=qs;if(null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(l=!0),void 0!==t.identifierPrefix&&(o=t.identifierPrefix),void 0!==t.onRecoverableError&&(i=t.onRecoverableError)),n=$s(n,null,e,1,null!=t?t:null,l,0,o,i),e[ml]=n.current,$r(e),r)for(e=0;e<r.length;e++)l=(l=(t=r[e])._getVersion)(t._source),null==n.mutableSourceEagerHydrationData?n.mutableSourceEagerHydrationData=[t,l]:n.mutableSourceEagerHydrationData.push(t,l);return new Ys(n)},n.render=function(e,n,t){if(!Gs(n))throw Error(a(200));return Js(null,e,n,!1,t)},n.unmountComponentAtNode=function(e){if(!Gs(e))throw Error(a(40));return!!e._reactRootContainer&&(cs(function(){Js(null,null,e,!1,function(){e._reactRootContainer=null,e[ml]=null})}),!0)},n.unstable_batchedUpdates=ss,n.unstable_renderSubtreeIntoContainer=function(e,n,t,r){if(!Gs(t))throw Error(a(200));if(null==e||void 0===e._reactInternals)throw Error(a(38));return Js(e,n,t,!1,r)},n.version="18.3.1-next-f1338f8080-20240426"},853:(e,n,t)=>{e.exports=t(234)},950:(e,n,t)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(n){console.error(n)}}(),e.exports=t(730)}},n={};function t(r){var l=n[r];if(void 0!==l)return l.exports;var a=n[r]={exports:{}};return e[r](a,a.exports,t),a.exports}var r=t(43),l=t(391);function a(e){return a="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},a(e)}function o(e){var n=function(e,n){if("object"!=a(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var r=t.call(e,n||"default");if("object"!=a(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===n?String:Number)(e)}(e,"string");return"symbol"==a(n)?n:n+""}function i(e,n,t){return(n=o(n))in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}function u(e,n){var t=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);n&&(r=r.filter(function(n){return Object.getOwnPropertyDescriptor(e,n).enumerable})),t.push.apply(t,r)}return t}function s(e){for(var n=1;n<arguments.length;n++){var t=null!=arguments[n]?arguments[n]:{};n%2?u(Object(t),!0).forEach(function(n){i(e,n,t[n])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(t)):u(Object(t)).forEach(function(n){Object.defineProperty(e,n,Object.getOwnPropertyDescriptor(t,n))})}return e}var c={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};const d=["color","size","strokeWidth","absoluteStrokeWidth","children"];var f=(e,n)=>{const t=(0,r.forwardRef)((t,l)=>{let{color:a="currentColor",size:o=24,strokeWidth:i=2,absoluteStrokeWidth:u,children:f}=t,p=function(e,n){if(null==e)return{};var t,r,l=function(e,n){if(null==e)return{};var t={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(-1!==n.indexOf(r))continue;t[r]=e[r]}return t}(e,n);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)t=a[r],-1===n.indexOf(t)&&{}.propertyIsEnumerable.call(e,t)&&(l[t]=e[t])}return l}(t,d);return(0,r.createElement)("svg",s(s({ref:l},c),{},{width:o,height:o,stroke:a,strokeWidth:u?24*Number(i)/Number(o):i,className:"lucide lucide-".concat((m=e,m.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase()))},p),[...n.map(e=>{let[n,t]=e;return(0,r.createElement)(n,t)}),...(Array.isArray(f)?f:[f])||[]]);var m});return t.displayName="".concat(e),t};const p=f("Sparkles",[["path",{d:"m12 3-1.912 5.813a2 2 0 0 1-1.275 1.275L3 12l5.813 1.912a2 2 0 0 1 1.275 1.275L12 21l1.912-5.813a2 2 0 0 1 1.275-1.275L21 12l-5.813-1.912a2 2 0 0 1-1.275-1.275L12 3Z",key:"17u4zn"}],["path",{d:"M5 3v4",key:"bklmnn"}],["path",{d:"M19 17v4",key:"iiml17"}],["path",{d:"M3 5h4",key:"nem4j1"}],["path",{d:"M17 19h4",key:"lbex7p"}]]),m=f("CheckCircle",[["path",{d:"M22 11.08V12a10 10 0 1 1-5.93-9.14",key:"g774vq"}],["polyline",{points:"22 4 12 14.01 9 11.01",key:"6xbx8j"}]]),h=f("Loader2",[["path",{d:"M21 12a9 9 0 1 1-6.219-8.56",key:"13zald"}]]),g=f("Upload",[["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["polyline",{points:"17 8 12 3 7 8",key:"t8dd8p"}],["line",{x1:"12",x2:"12",y1:"3",y2:"15",key:"widbto"}]]),v=f("FileText",[["path",{d:"M14.5 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V7.5L14.5 2z",key:"1nnpy2"}],["polyline",{points:"14 2 14 8 20 8",key:"1ew0cm"}],["line",{x1:"16",x2:"8",y1:"13",y2:"13",key:"14keom"}],["line",{x1:"16",x2:"8",y1:"17",y2:"17",key:"17nazh"}],["line",{x1:"10",x2:"8",y1:"9",y2:"9",key:"1a5vjj"}]]),y=f("Save",[["path",{d:"M19 21H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h11l5 5v11a2 2 0 0 1-2 2z",key:"1owoqh"}],["polyline",{points:"17 21 17 13 7 13 7 21",key:"1md35c"}],["polyline",{points:"7 3 7 8 15 8",key:"8nz8an"}]]),b=f("Pen",[["path",{d:"M17 3a2.85 2.83 0 1 1 4 4L7.5 20.5 2 22l1.5-5.5Z",key:"5qss01"}]]),x=f("Download",[["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["polyline",{points:"7 10 12 15 17 10",key:"2ggqvy"}],["line",{x1:"12",x2:"12",y1:"15",y2:"3",key:"1vk2je"}]]),w=f("FileDown",[["path",{d:"M14.5 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V7.5L14.5 2z",key:"1nnpy2"}],["polyline",{points:"14 2 14 8 20 8",key:"1ew0cm"}],["path",{d:"M12 18v-6",key:"17g6i2"}],["path",{d:"m9 15 3 3 3-3",key:"1npd3o"}]]);var k=t(579);const S="http://localhost:5000/api";function N(){const[e,n]=(0,r.useState)(null),[t,l]=(0,r.useState)(null),[a,o]=(0,r.useState)(null),[i,u]=(0,r.useState)("modern"),[c,d]=(0,r.useState)(!1),[f,N]=(0,r.useState)(1),[E,C]=(0,r.useState)(""),[_,j]=(0,r.useState)(!1),P=async e=>{const t=e.target.files[0];if(!t)return;if(!t.name.endsWith(".docx")&&!t.name.endsWith(".doc"))return void C("Please upload a .doc or .docx file");n(t),d(!0),C("");const r=new FormData;r.append("file",t);try{const e=await fetch("".concat(S,"/upload"),{method:"POST",body:r}),n=await e.json();n.success?(l(n.data),o(n.data),N(2)):C(n.error||"Failed to process document")}catch(a){C("Failed to connect to server. Make sure the Python backend is running on port 5000."),console.error(a)}finally{d(!1)}},z=(e,n)=>{o(t=>s(s({},t),{},{[e]:n}))},L=async function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"pdf";const n="pdf"===e?"generate-pdf":"generate-docx";try{const t=await fetch("".concat(S,"/").concat(n),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({resumeData:a,template:i})});if(t.ok){const n=await t.blob(),r=window.URL.createObjectURL(n),l=document.createElement("a");l.href=r,l.download="resume_".concat((new Date).getTime(),".").concat(e),document.body.appendChild(l),l.click(),window.URL.revokeObjectURL(r),document.body.removeChild(l)}else C("Failed to generate ".concat(e.toUpperCase()))}catch(t){C("Failed to download resume"),console.error(t)}},T=e=>{let{data:n}=e;return(0,k.jsxs)("div",{className:"bg-white text-gray-900 p-8 rounded-lg shadow-2xl",children:[(0,k.jsxs)("div",{className:"border-l-4 border-blue-600 pl-6 mb-6",children:[(0,k.jsx)("h1",{className:"text-4xl font-bold text-gray-900 mb-2",children:n.name}),(0,k.jsxs)("div",{className:"text-sm text-gray-600 space-y-1",children:[n.email&&(0,k.jsx)("p",{children:n.email}),n.phone&&(0,k.jsx)("p",{children:n.phone}),n.location&&(0,k.jsx)("p",{children:n.location}),n.linkedin&&(0,k.jsx)("p",{className:"text-blue-600",children:n.linkedin})]})]}),n.summary&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-xl font-bold text-blue-600 mb-3 border-b-2 border-blue-600 pb-1",children:"PROFESSIONAL SUMMARY"}),(0,k.jsx)("p",{className:"text-gray-700 leading-relaxed",children:n.summary})]}),n.skills&&n.skills.length>0&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-xl font-bold text-blue-600 mb-3 border-b-2 border-blue-600 pb-1",children:"SKILLS"}),(0,k.jsx)("div",{className:"flex flex-wrap gap-2",children:n.skills.map((e,n)=>(0,k.jsx)("span",{className:"bg-blue-100 text-blue-800 px-3 py-1 rounded-full text-sm font-medium",children:e},n))})]}),n.experience&&n.experience.length>0&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-xl font-bold text-blue-600 mb-3 border-b-2 border-blue-600 pb-1",children:"EXPERIENCE"}),n.experience.map((e,n)=>(0,k.jsxs)("div",{className:"mb-4",children:[(0,k.jsx)("h3",{className:"font-bold text-lg",children:e.title}),(0,k.jsxs)("p",{className:"text-gray-600 text-sm",children:[e.company," | ",e.period]}),(0,k.jsx)("p",{className:"text-gray-700 mt-1",children:e.description})]},n))]}),n.education&&n.education.length>0&&(0,k.jsxs)("div",{children:[(0,k.jsx)("h2",{className:"text-xl font-bold text-blue-600 mb-3 border-b-2 border-blue-600 pb-1",children:"EDUCATION"}),n.education.map((e,n)=>(0,k.jsxs)("div",{className:"mb-2",children:[(0,k.jsx)("h3",{className:"font-bold",children:e.degree}),(0,k.jsxs)("p",{className:"text-gray-600 text-sm",children:[e.institution," | ",e.year]})]},n))]})]})},O=e=>{let{data:n}=e;return(0,k.jsxs)("div",{className:"bg-white text-gray-900 p-8 rounded-lg shadow-2xl",children:[(0,k.jsxs)("div",{className:"text-center mb-6 pb-4 border-b-2 border-gray-800",children:[(0,k.jsx)("h1",{className:"text-4xl font-bold text-gray-900 mb-2",children:n.name}),(0,k.jsxs)("div",{className:"text-sm text-gray-600 space-x-2",children:[n.email&&(0,k.jsx)("span",{children:n.email}),n.phone&&(0,k.jsx)("span",{children:"\u2022"}),n.phone&&(0,k.jsx)("span",{children:n.phone}),n.location&&(0,k.jsx)("span",{children:"\u2022"}),n.location&&(0,k.jsx)("span",{children:n.location})]})]}),n.summary&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-lg font-bold text-gray-900 mb-2 uppercase tracking-wide",children:"Professional Summary"}),(0,k.jsx)("p",{className:"text-gray-700 leading-relaxed",children:n.summary})]}),n.experience&&n.experience.length>0&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-lg font-bold text-gray-900 mb-2 uppercase tracking-wide",children:"Experience"}),n.experience.map((e,n)=>(0,k.jsxs)("div",{className:"mb-4",children:[(0,k.jsxs)("div",{className:"flex justify-between items-start",children:[(0,k.jsx)("h3",{className:"font-bold",children:e.title}),(0,k.jsx)("span",{className:"text-gray-600 text-sm",children:e.period})]}),(0,k.jsx)("p",{className:"text-gray-600 text-sm italic",children:e.company}),(0,k.jsx)("p",{className:"text-gray-700 mt-1",children:e.description})]},n))]}),n.education&&n.education.length>0&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-lg font-bold text-gray-900 mb-2 uppercase tracking-wide",children:"Education"}),n.education.map((e,n)=>(0,k.jsxs)("div",{className:"mb-2",children:[(0,k.jsxs)("div",{className:"flex justify-between",children:[(0,k.jsx)("h3",{className:"font-semibold",children:e.degree}),(0,k.jsx)("span",{className:"text-gray-600 text-sm",children:e.year})]}),(0,k.jsx)("p",{className:"text-gray-600 text-sm",children:e.institution})]},n))]}),n.skills&&n.skills.length>0&&(0,k.jsxs)("div",{children:[(0,k.jsx)("h2",{className:"text-lg font-bold text-gray-900 mb-2 uppercase tracking-wide",children:"Skills"}),(0,k.jsx)("p",{className:"text-gray-700",children:n.skills.join(" \u2022 ")})]})]})};return(0,k.jsx)("div",{className:"min-h-screen bg-gradient-to-br from-indigo-900 via-purple-900 to-pink-900 p-6",children:(0,k.jsxs)("div",{className:"max-w-6xl mx-auto",children:[(0,k.jsxs)("div",{className:"text-center mb-8",children:[(0,k.jsxs)("h1",{className:"text-5xl font-bold text-white mb-2 flex items-center justify-center gap-3",children:[(0,k.jsx)(p,{className:"w-12 h-12 animate-pulse"}),"AI Resume Generator"]}),(0,k.jsx)("p",{className:"text-purple-200 text-lg",children:"Upload your document and create a professional resume in minutes"})]}),E&&(0,k.jsx)("div",{className:"bg-red-500 text-white px-6 py-4 rounded-lg mb-6 text-center shadow-lg animate-shake",children:(0,k.jsx)("p",{className:"font-semibold",children:E})}),(0,k.jsx)("div",{className:"flex gap-4 mb-8 justify-center flex-wrap",children:[1,2,3].map(e=>(0,k.jsxs)("div",{className:"flex items-center gap-2",children:[(0,k.jsx)("div",{className:"w-10 h-10 rounded-full flex items-center justify-center font-bold transition-all ".concat(f>=e?"bg-white text-purple-900 shadow-lg scale-110":"bg-purple-700 text-white"),children:f>e?(0,k.jsx)(m,{className:"w-6 h-6"}):e}),(0,k.jsx)("span",{className:"text-white text-sm font-medium",children:1===e?"Upload":2===e?"Customize":"Generate"}),e<3&&(0,k.jsx)("div",{className:"w-16 h-1 bg-purple-700 rounded"})]},e))}),1===f&&(0,k.jsx)("div",{className:"bg-white rounded-2xl shadow-2xl p-8 animate-fadeIn",children:(0,k.jsx)("div",{className:"max-w-2xl mx-auto",children:(0,k.jsx)("label",{className:"block w-full",children:(0,k.jsxs)("div",{onDragOver:e=>{e.preventDefault(),e.stopPropagation()},onDrop:e=>{e.preventDefault(),e.stopPropagation();const n=e.dataTransfer.files[0];if(n){P({target:{files:[n]}})}},className:"border-4 border-dashed rounded-2xl p-16 text-center cursor-pointer transition-all duration-300 ".concat(e?"border-green-500 bg-green-50":"border-gray-300 hover:border-purple-500 hover:bg-purple-50"),children:[c?(0,k.jsxs)("div",{className:"space-y-4",children:[(0,k.jsx)(h,{className:"w-20 h-20 mx-auto text-purple-600 animate-spin"}),(0,k.jsx)("p",{className:"text-xl font-bold text-gray-700",children:"Processing your document..."}),(0,k.jsx)("p",{className:"text-sm text-gray-500",children:"AI is analyzing your resume data"}),(0,k.jsx)("div",{className:"w-64 h-2 bg-gray-200 rounded-full mx-auto overflow-hidden",children:(0,k.jsx)("div",{className:"h-full bg-purple-600 animate-progress"})})]}):e?(0,k.jsxs)("div",{className:"space-y-4",children:[(0,k.jsx)(m,{className:"w-20 h-20 mx-auto text-green-600"}),(0,k.jsx)("p",{className:"text-xl font-bold text-gray-700",children:e.name}),(0,k.jsx)("p",{className:"text-sm text-green-600 font-medium",children:"\u2713 File uploaded successfully"})]}):(0,k.jsxs)("div",{className:"space-y-6",children:[(0,k.jsx)(g,{className:"w-20 h-20 mx-auto text-gray-400"}),(0,k.jsxs)("div",{children:[(0,k.jsx)("p",{className:"text-2xl font-bold text-gray-700 mb-2",children:"Drop your resume here"}),(0,k.jsx)("p",{className:"text-gray-500",children:"or click to browse"})]}),(0,k.jsxs)("div",{className:"flex items-center justify-center gap-4 text-xs text-gray-400",children:[(0,k.jsxs)("span",{className:"flex items-center gap-1",children:[(0,k.jsx)(v,{className:"w-4 h-4"}),".DOC"]}),(0,k.jsx)("span",{children:"\u2022"}),(0,k.jsxs)("span",{className:"flex items-center gap-1",children:[(0,k.jsx)(v,{className:"w-4 h-4"}),".DOCX"]}),(0,k.jsx)("span",{children:"\u2022"}),(0,k.jsx)("span",{children:"Max 16MB"})]})]}),(0,k.jsx)("input",{type:"file",accept:".doc,.docx",onChange:P,className:"hidden",disabled:c})]})})})}),2===f&&a&&(0,k.jsxs)("div",{className:"bg-white rounded-2xl shadow-2xl p-8 animate-fadeIn",children:[(0,k.jsxs)("div",{className:"flex justify-between items-center mb-6",children:[(0,k.jsx)("h2",{className:"text-3xl font-bold text-gray-900",children:"Customize Your Resume"}),(0,k.jsxs)("div",{className:"flex items-center gap-4",children:[t.score&&(0,k.jsxs)("div",{className:"text-right",children:[(0,k.jsx)("p",{className:"text-sm text-gray-600",children:"Resume Score"}),(0,k.jsxs)("p",{className:"text-3xl font-bold ".concat((R=t.score,R>=80?"text-green-600":R>=60?"text-yellow-600":"text-red-600")),children:[t.score,"%"]})]}),(0,k.jsxs)("button",{onClick:()=>j(!_),className:"bg-blue-600 text-white px-4 py-2 rounded-lg font-bold hover:bg-blue-700 transition-all flex items-center gap-2",children:[_?(0,k.jsx)(y,{className:"w-4 h-4"}):(0,k.jsx)(b,{className:"w-4 h-4"}),_?"Save":"Edit"]})]})]}),_?(0,k.jsxs)("div",{className:"space-y-6 mb-8",children:[(0,k.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:[(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Full Name"}),(0,k.jsx)("input",{type:"text",value:a.name,onChange:e=>z("name",e.target.value),className:"w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"})]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Email"}),(0,k.jsx)("input",{type:"email",value:a.email,onChange:e=>z("email",e.target.value),className:"w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"})]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Phone"}),(0,k.jsx)("input",{type:"tel",value:a.phone,onChange:e=>z("phone",e.target.value),className:"w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"})]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Location"}),(0,k.jsx)("input",{type:"text",value:a.location,onChange:e=>z("location",e.target.value),className:"w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"})]})]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Professional Summary"}),(0,k.jsx)("textarea",{value:a.summary,onChange:e=>z("summary",e.target.value),rows:"4",className:"w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"})]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Skills"}),(0,k.jsx)("div",{className:"flex flex-wrap gap-2 mb-2",children:a.skills.map((e,n)=>(0,k.jsxs)("span",{className:"bg-blue-100 text-blue-800 px-3 py-1 rounded-full text-sm font-medium flex items-center gap-2",children:[e,(0,k.jsx)("button",{onClick:()=>{return e=n,void o(n=>s(s({},n),{},{skills:n.skills.filter((n,t)=>t!==e)}));var e},className:"text-red-600 hover:text-red-800",children:"\xd7"})]},n))})]}),(0,k.jsxs)("button",{onClick:()=>{l(a),j(!1)},className:"w-full bg-green-600 text-white py-3 rounded-lg font-bold hover:bg-green-700 transition-all flex items-center justify-center gap-2",children:[(0,k.jsx)(y,{className:"w-5 h-5"}),"Save Changes"]})]}):(0,k.jsxs)("div",{className:"bg-gray-50 rounded-lg p-6 mb-8",children:[(0,k.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4 text-sm",children:[(0,k.jsxs)("div",{children:[(0,k.jsx)("strong",{children:"Name:"})," ",a.name]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("strong",{children:"Email:"})," ",a.email||"Not provided"]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("strong",{children:"Phone:"})," ",a.phone||"Not provided"]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("strong",{children:"Location:"})," ",a.location||"Not provided"]})]}),a.skills&&a.skills.length>0&&(0,k.jsxs)("div",{className:"mt-4",children:[(0,k.jsxs)("strong",{className:"text-sm",children:["Skills (",a.skills.length,"):"]}),(0,k.jsx)("div",{className:"flex flex-wrap gap-2 mt-2",children:a.skills.map((e,n)=>(0,k.jsx)("span",{className:"bg-blue-100 text-blue-800 px-3 py-1 rounded-full text-xs font-medium",children:e},n))})]})]}),(0,k.jsxs)("div",{className:"mb-8",children:[(0,k.jsx)("h3",{className:"text-xl font-bold text-gray-900 mb-4",children:"Choose Your Template"}),(0,k.jsx)("div",{className:"grid grid-cols-2 md:grid-cols-3 lg:grid-cols-6 gap-4",children:[{id:"modern",name:"Modern",color:"bg-gradient-to-br from-blue-600 to-purple-600",desc:"Clean and contemporary"},{id:"professional",name:"Professional",color:"bg-gradient-to-br from-gray-700 to-gray-900",desc:"Classic business style"},{id:"creative",name:"Creative",color:"bg-gradient-to-br from-pink-500 to-orange-500",desc:"Bold and colorful"},{id:"minimal",name:"Minimal",color:"bg-gradient-to-br from-teal-500 to-green-600",desc:"Simple and elegant"},{id:"executive",name:"Executive",color:"bg-gradient-to-br from-indigo-600 to-blue-700",desc:"Senior professional"},{id:"tech",name:"Tech",color:"bg-gradient-to-br from-cyan-500 to-blue-500",desc:"Tech-focused design"}].map(e=>(0,k.jsx)("div",{onClick:()=>u(e.id),className:"".concat(e.color," rounded-xl p-4 cursor-pointer transition-all transform hover:scale-105 ").concat(i===e.id?"ring-4 ring-white shadow-2xl scale-105":"hover:shadow-xl"),children:(0,k.jsxs)("div",{className:"text-white text-center",children:[(0,k.jsx)("div",{className:"w-full h-20 bg-white/20 rounded-lg mb-2 flex items-center justify-center",children:(0,k.jsx)(v,{className:"w-8 h-8"})}),(0,k.jsx)("p",{className:"font-bold text-sm",children:e.name}),(0,k.jsx)("p",{className:"text-xs opacity-80 mt-1",children:e.desc})]})},e.id))})]}),(0,k.jsxs)("button",{onClick:()=>{N(3)},className:"w-full bg-gradient-to-r from-purple-600 to-pink-600 text-white py-4 rounded-xl font-bold text-lg hover:from-purple-700 hover:to-pink-700 transition-all flex items-center justify-center gap-3 shadow-xl",children:[(0,k.jsx)(p,{className:"w-6 h-6"}),"Generate My Resume"]})]}),3===f&&a&&(0,k.jsxs)("div",{className:"space-y-6 animate-fadeIn",children:[(0,k.jsxs)("div",{className:"bg-white rounded-2xl shadow-2xl p-6",children:[(0,k.jsxs)("div",{className:"flex justify-between items-center mb-6 flex-wrap gap-4",children:[(0,k.jsx)("h2",{className:"text-3xl font-bold text-gray-900",children:"Your Professional Resume"}),(0,k.jsxs)("div",{className:"flex gap-3",children:[(0,k.jsxs)("button",{onClick:()=>L("pdf"),className:"bg-red-600 text-white px-6 py-3 rounded-lg font-bold hover:bg-red-700 transition-all flex items-center gap-2 shadow-lg",children:[(0,k.jsx)(x,{className:"w-5 h-5"}),"Download PDF"]}),(0,k.jsxs)("button",{onClick:()=>L("docx"),className:"bg-blue-600 text-white px-6 py-3 rounded-lg font-bold hover:bg-blue-700 transition-all flex items-center gap-2 shadow-lg",children:[(0,k.jsx)(w,{className:"w-5 h-5"}),"Download DOCX"]})]})]}),(0,k.jsxs)("div",{id:"resume-preview",className:"bg-gray-100 p-8 rounded-xl overflow-auto max-h-screen shadow-inner",children:[("modern"===i||"executive"===i||"tech"===i)&&(0,k.jsx)(T,{data:a}),("professional"===i||"minimal"===i||"creative"===i)&&(0,k.jsx)(O,{data:a})]})]}),(0,k.jsxs)("div",{className:"flex gap-4",children:[(0,k.jsx)("button",{onClick:()=>N(2),className:"flex-1 bg-gray-600 text-white py-3 rounded-xl font-bold hover:bg-gray-700 transition-all",children:"\u2190 Back to Edit"}),(0,k.jsx)("button",{onClick:()=>{N(1),n(null),l(null),o(null),C(""),j(!1)},className:"flex-1 bg-purple-600 text-white py-3 rounded-xl font-bold hover:bg-purple-700 transition-all",children:"Create Another Resume"})]})]})]})});var R}l.createRoot(document.getElementById("root")).render((0,k.jsx)(r.StrictMode,{children:(0,k.jsx)(N,{})}))})();
-//# sourceMappingURL=main.06f703a2.js.map
\ No newline at end of file
+/*! For license information please see main.d852ff98.js.LICENSE.txt */
+(()=>{"use strict";var e={43:(e,n,t)=>{e.exports=t(202)},153:(e,n,t)=>{var r=t(43),l=Symbol.for("react.element"),a=Symbol.for("react.fragment"),o=Object.prototype.hasOwnProperty,i=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,u={key:!0,ref:!0,__self:!0,__source:!0};function s(e,n,t){var r,a={},s=null,c=null;for(r in void 0!==t&&(s=""+t),void 0!==n.key&&(s=""+n.key),void 0!==n.ref&&(c=n.ref),n)o.call(n,r)&&!u.hasOwnProperty(r)&&(a[r]=n[r]);if(e&&e.defaultProps)for(r in n=e.defaultProps)void 0===a[r]&&(a[r]=n[r]);return{$$typeof:l,type:e,key:s,ref:c,props:a,_owner:i.current}}n.jsx=s,n.jsxs=s},202:(e,n)=>{var t=Symbol.for("react.element"),r=Symbol.for("react.portal"),l=Symbol.for("react.fragment"),a=Symbol.for("react.strict_mode"),o=Symbol.for("react.profiler"),i=Symbol.for("react.provider"),u=Symbol.for("react.context"),s=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),f=Symbol.for("react.lazy"),p=Symbol.iterator;var m={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},h=Object.assign,g={};function v(e,n,t){this.props=e,this.context=n,this.refs=g,this.updater=t||m}function y(){}function b(e,n,t){this.props=e,this.context=n,this.refs=g,this.updater=t||m}v.prototype.isReactComponent={},v.prototype.setState=function(e,n){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,n,"setState")},v.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},y.prototype=v.prototype;var x=b.prototype=new y;x.constructor=b,h(x,v.prototype),x.isPureReactComponent=!0;var w=Array.isArray,k=Object.prototype.hasOwnProperty,S={current:null},N={key:!0,ref:!0,__self:!0,__source:!0};function E(e,n,r){var l,a={},o=null,i=null;if(null!=n)for(l in void 0!==n.ref&&(i=n.ref),void 0!==n.key&&(o=""+n.key),n)k.call(n,l)&&!N.hasOwnProperty(l)&&(a[l]=n[l]);var u=arguments.length-2;if(1===u)a.children=r;else if(1<u){for(var s=Array(u),c=0;c<u;c++)s[c]=arguments[c+2];a.children=s}if(e&&e.defaultProps)for(l in u=e.defaultProps)void 0===a[l]&&(a[l]=u[l]);return{$$typeof:t,type:e,key:o,ref:i,props:a,_owner:S.current}}function C(e){return"object"===typeof e&&null!==e&&e.$$typeof===t}var _=/\/+/g;function j(e,n){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var n={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(e){return n[e]})}(""+e.key):n.toString(36)}function P(e,n,l,a,o){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var u=!1;if(null===e)u=!0;else switch(i){case"string":case"number":u=!0;break;case"object":switch(e.$$typeof){case t:case r:u=!0}}if(u)return o=o(u=e),e=""===a?"."+j(u,0):a,w(o)?(l="",null!=e&&(l=e.replace(_,"$&/")+"/"),P(o,n,l,"",function(e){return e})):null!=o&&(C(o)&&(o=function(e,n){return{$$typeof:t,type:e.type,key:n,ref:e.ref,props:e.props,_owner:e._owner}}(o,l+(!o.key||u&&u.key===o.key?"":(""+o.key).replace(_,"$&/")+"/")+e)),n.push(o)),1;if(u=0,a=""===a?".":a+":",w(e))for(var s=0;s<e.length;s++){var c=a+j(i=e[s],s);u+=P(i,n,l,c,o)}else if(c=function(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=p&&e[p]||e["@@iterator"])?e:null}(e),"function"===typeof c)for(e=c.call(e),s=0;!(i=e.next()).done;)u+=P(i=i.value,n,l,c=a+j(i,s++),o);else if("object"===i)throw n=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===n?"object with keys {"+Object.keys(e).join(", ")+"}":n)+"). If you meant to render a collection of children, use an array instead.");return u}function z(e,n,t){if(null==e)return e;var r=[],l=0;return P(e,r,"","",function(e){return n.call(t,e,l++)}),r}function T(e){if(-1===e._status){var n=e._result;(n=n()).then(function(n){0!==e._status&&-1!==e._status||(e._status=1,e._result=n)},function(n){0!==e._status&&-1!==e._status||(e._status=2,e._result=n)}),-1===e._status&&(e._status=0,e._result=n)}if(1===e._status)return e._result.default;throw e._result}var L={current:null},O={transition:null},R={ReactCurrentDispatcher:L,ReactCurrentBatchConfig:O,ReactCurrentOwner:S};function M(){throw Error("act(...) is not supported in production builds of React.")}n.Children={map:z,forEach:function(e,n,t){z(e,function(){n.apply(this,arguments)},t)},count:function(e){var n=0;return z(e,function(){n++}),n},toArray:function(e){return z(e,function(e){return e})||[]},only:function(e){if(!C(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},n.Component=v,n.Fragment=l,n.Profiler=o,n.PureComponent=b,n.StrictMode=a,n.Suspense=c,n.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=R,n.act=M,n.cloneElement=function(e,n,r){if(null===e||void 0===e)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var l=h({},e.props),a=e.key,o=e.ref,i=e._owner;if(null!=n){if(void 0!==n.ref&&(o=n.ref,i=S.current),void 0!==n.key&&(a=""+n.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(s in n)k.call(n,s)&&!N.hasOwnProperty(s)&&(l[s]=void 0===n[s]&&void 0!==u?u[s]:n[s])}var s=arguments.length-2;if(1===s)l.children=r;else if(1<s){u=Array(s);for(var c=0;c<s;c++)u[c]=arguments[c+2];l.children=u}return{$$typeof:t,type:e.type,key:a,ref:o,props:l,_owner:i}},n.createContext=function(e){return(e={$$typeof:u,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:i,_context:e},e.Consumer=e},n.createElement=E,n.createFactory=function(e){var n=E.bind(null,e);return n.type=e,n},n.createRef=function(){return{current:null}},n.forwardRef=function(e){return{$$typeof:s,render:e}},n.isValidElement=C,n.lazy=function(e){return{$$typeof:f,_payload:{_status:-1,_result:e},_init:T}},n.memo=function(e,n){return{$$typeof:d,type:e,compare:void 0===n?null:n}},n.startTransition=function(e){var n=O.transition;O.transition={};try{e()}finally{O.transition=n}},n.unstable_act=M,n.useCallback=function(e,n){return L.current.useCallback(e,n)},n.useContext=function(e){return L.current.useContext(e)},n.useDebugValue=function(){},n.useDeferredValue=function(e){return L.current.useDeferredValue(e)},n.useEffect=function(e,n){return L.current.useEffect(e,n)},n.useId=function(){return L.current.useId()},n.useImperativeHandle=function(e,n,t){return L.current.useImperativeHandle(e,n,t)},n.useInsertionEffect=function(e,n){return L.current.useInsertionEffect(e,n)},n.useLayoutEffect=function(e,n){return L.current.useLayoutEffect(e,n)},n.useMemo=function(e,n){return L.current.useMemo(e,n)},n.useReducer=function(e,n,t){return L.current.useReducer(e,n,t)},n.useRef=function(e){return L.current.useRef(e)},n.useState=function(e){return L.current.useState(e)},n.useSyncExternalStore=function(e,n,t){return L.current.useSyncExternalStore(e,n,t)},n.useTransition=function(){return L.current.useTransition()},n.version="18.3.1"},234:(e,n)=>{function t(e,n){var t=e.length;e.push(n);e:for(;0<t;){var r=t-1>>>1,l=e[r];if(!(0<a(l,n)))break e;e[r]=n,e[t]=l,t=r}}function r(e){return 0===e.length?null:e[0]}function l(e){if(0===e.length)return null;var n=e[0],t=e.pop();if(t!==n){e[0]=t;e:for(var r=0,l=e.length,o=l>>>1;r<o;){var i=2*(r+1)-1,u=e[i],s=i+1,c=e[s];if(0>a(u,t))s<l&&0>a(c,u)?(e[r]=c,e[s]=t,r=s):(e[r]=u,e[i]=t,r=i);else{if(!(s<l&&0>a(c,t)))break e;e[r]=c,e[s]=t,r=s}}}return n}function a(e,n){var t=e.sortIndex-n.sortIndex;return 0!==t?t:e.id-n.id}if("object"===typeof performance&&"function"===typeof performance.now){var o=performance;n.unstable_now=function(){return o.now()}}else{var i=Date,u=i.now();n.unstable_now=function(){return i.now()-u}}var s=[],c=[],d=1,f=null,p=3,m=!1,h=!1,g=!1,v="function"===typeof setTimeout?setTimeout:null,y="function"===typeof clearTimeout?clearTimeout:null,b="undefined"!==typeof setImmediate?setImmediate:null;function x(e){for(var n=r(c);null!==n;){if(null===n.callback)l(c);else{if(!(n.startTime<=e))break;l(c),n.sortIndex=n.expirationTime,t(s,n)}n=r(c)}}function w(e){if(g=!1,x(e),!h)if(null!==r(s))h=!0,O(k);else{var n=r(c);null!==n&&R(w,n.startTime-e)}}function k(e,t){h=!1,g&&(g=!1,y(C),C=-1),m=!0;var a=p;try{for(x(t),f=r(s);null!==f&&(!(f.expirationTime>t)||e&&!P());){var o=f.callback;if("function"===typeof o){f.callback=null,p=f.priorityLevel;var i=o(f.expirationTime<=t);t=n.unstable_now(),"function"===typeof i?f.callback=i:f===r(s)&&l(s),x(t)}else l(s);f=r(s)}if(null!==f)var u=!0;else{var d=r(c);null!==d&&R(w,d.startTime-t),u=!1}return u}finally{f=null,p=a,m=!1}}"undefined"!==typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var S,N=!1,E=null,C=-1,_=5,j=-1;function P(){return!(n.unstable_now()-j<_)}function z(){if(null!==E){var e=n.unstable_now();j=e;var t=!0;try{t=E(!0,e)}finally{t?S():(N=!1,E=null)}}else N=!1}if("function"===typeof b)S=function(){b(z)};else if("undefined"!==typeof MessageChannel){var T=new MessageChannel,L=T.port2;T.port1.onmessage=z,S=function(){L.postMessage(null)}}else S=function(){v(z,0)};function O(e){E=e,N||(N=!0,S())}function R(e,t){C=v(function(){e(n.unstable_now())},t)}n.unstable_IdlePriority=5,n.unstable_ImmediatePriority=1,n.unstable_LowPriority=4,n.unstable_NormalPriority=3,n.unstable_Profiling=null,n.unstable_UserBlockingPriority=2,n.unstable_cancelCallback=function(e){e.callback=null},n.unstable_continueExecution=function(){h||m||(h=!0,O(k))},n.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):_=0<e?Math.floor(1e3/e):5},n.unstable_getCurrentPriorityLevel=function(){return p},n.unstable_getFirstCallbackNode=function(){return r(s)},n.unstable_next=function(e){switch(p){case 1:case 2:case 3:var n=3;break;default:n=p}var t=p;p=n;try{return e()}finally{p=t}},n.unstable_pauseExecution=function(){},n.unstable_requestPaint=function(){},n.unstable_runWithPriority=function(e,n){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var t=p;p=e;try{return n()}finally{p=t}},n.unstable_scheduleCallback=function(e,l,a){var o=n.unstable_now();switch("object"===typeof a&&null!==a?a="number"===typeof(a=a.delay)&&0<a?o+a:o:a=o,e){case 1:var i=-1;break;case 2:i=250;break;case 5:i=1073741823;break;case 4:i=1e4;break;default:i=5e3}return e={id:d++,callback:l,priorityLevel:e,startTime:a,expirationTime:i=a+i,sortIndex:-1},a>o?(e.sortIndex=a,t(c,e),null===r(s)&&e===r(c)&&(g?(y(C),C=-1):g=!0,R(w,a-o))):(e.sortIndex=i,t(s,e),h||m||(h=!0,O(k))),e},n.unstable_shouldYield=P,n.unstable_wrapCallback=function(e){var n=p;return function(){var t=p;p=n;try{return e.apply(this,arguments)}finally{p=t}}}},391:(e,n,t)=>{var r=t(950);n.createRoot=r.createRoot,n.hydrateRoot=r.hydrateRoot},579:(e,n,t)=>{e.exports=t(153)},730:(e,n,t)=>{var r=t(43),l=t(853);function a(e){for(var n="https://reactjs.org/docs/error-decoder.html?invariant="+e,t=1;t<arguments.length;t++)n+="&args[]="+encodeURIComponent(arguments[t]);return"Minified React error #"+e+"; visit "+n+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var o=new Set,i={};function u(e,n){s(e,n),s(e+"Capture",n)}function s(e,n){for(i[e]=n,e=0;e<n.length;e++)o.add(n[e])}var c=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),d=Object.prototype.hasOwnProperty,f=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,p={},m={};function h(e,n,t,r,l,a,o){this.acceptsBooleans=2===n||3===n||4===n,this.attributeName=r,this.attributeNamespace=l,this.mustUseProperty=t,this.propertyName=e,this.type=n,this.sanitizeURL=a,this.removeEmptyString=o}var g={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){g[e]=new h(e,0,!1,e,null,!1,!1)}),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var n=e[0];g[n]=new h(n,1,!1,e[1],null,!1,!1)}),["contentEditable","draggable","spellCheck","value"].forEach(function(e){g[e]=new h(e,2,!1,e.toLowerCase(),null,!1,!1)}),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){g[e]=new h(e,2,!1,e,null,!1,!1)}),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){g[e]=new h(e,3,!1,e.toLowerCase(),null,!1,!1)}),["checked","multiple","muted","selected"].forEach(function(e){g[e]=new h(e,3,!0,e,null,!1,!1)}),["capture","download"].forEach(function(e){g[e]=new h(e,4,!1,e,null,!1,!1)}),["cols","rows","size","span"].forEach(function(e){g[e]=new h(e,6,!1,e,null,!1,!1)}),["rowSpan","start"].forEach(function(e){g[e]=new h(e,5,!1,e.toLowerCase(),null,!1,!1)});var v=/[\-:]([a-z])/g;function y(e){return e[1].toUpperCase()}function b(e,n,t,r){var l=g.hasOwnProperty(n)?g[n]:null;(null!==l?0!==l.type:r||!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&(function(e,n,t,r){if(null===n||"undefined"===typeof n||function(e,n,t,r){if(null!==t&&0===t.type)return!1;switch(typeof n){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==t?!t.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,n,t,r))return!0;if(r)return!1;if(null!==t)switch(t.type){case 3:return!n;case 4:return!1===n;case 5:return isNaN(n);case 6:return isNaN(n)||1>n}return!1}(n,t,l,r)&&(t=null),r||null===l?function(e){return!!d.call(m,e)||!d.call(p,e)&&(f.test(e)?m[e]=!0:(p[e]=!0,!1))}(n)&&(null===t?e.removeAttribute(n):e.setAttribute(n,""+t)):l.mustUseProperty?e[l.propertyName]=null===t?3!==l.type&&"":t:(n=l.attributeName,r=l.attributeNamespace,null===t?e.removeAttribute(n):(t=3===(l=l.type)||4===l&&!0===t?"":""+t,r?e.setAttributeNS(r,n,t):e.setAttribute(n,t))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var n=e.replace(v,y);g[n]=new h(n,1,!1,e,null,!1,!1)}),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var n=e.replace(v,y);g[n]=new h(n,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)}),["xml:base","xml:lang","xml:space"].forEach(function(e){var n=e.replace(v,y);g[n]=new h(n,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)}),["tabIndex","crossOrigin"].forEach(function(e){g[e]=new h(e,1,!1,e.toLowerCase(),null,!1,!1)}),g.xlinkHref=new h("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach(function(e){g[e]=new h(e,1,!1,e.toLowerCase(),null,!0,!0)});var x=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,w=Symbol.for("react.element"),k=Symbol.for("react.portal"),S=Symbol.for("react.fragment"),N=Symbol.for("react.strict_mode"),E=Symbol.for("react.profiler"),C=Symbol.for("react.provider"),_=Symbol.for("react.context"),j=Symbol.for("react.forward_ref"),P=Symbol.for("react.suspense"),z=Symbol.for("react.suspense_list"),T=Symbol.for("react.memo"),L=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var O=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var R=Symbol.iterator;function M(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=R&&e[R]||e["@@iterator"])?e:null}var D,F=Object.assign;function I(e){if(void 0===D)try{throw Error()}catch(t){var n=t.stack.trim().match(/\n( *(at )?)/);D=n&&n[1]||""}return"\n"+D+e}var U=!1;function A(e,n){if(!e||U)return"";U=!0;var t=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(n)if(n=function(){throw Error()},Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(s){var r=s}Reflect.construct(e,[],n)}else{try{n.call()}catch(s){r=s}e.call(n.prototype)}else{try{throw Error()}catch(s){r=s}e()}}catch(s){if(s&&r&&"string"===typeof s.stack){for(var l=s.stack.split("\n"),a=r.stack.split("\n"),o=l.length-1,i=a.length-1;1<=o&&0<=i&&l[o]!==a[i];)i--;for(;1<=o&&0<=i;o--,i--)if(l[o]!==a[i]){if(1!==o||1!==i)do{if(o--,0>--i||l[o]!==a[i]){var u="\n"+l[o].replace(" at new "," at ");return e.displayName&&u.includes("<anonymous>")&&(u=u.replace("<anonymous>",e.displayName)),u}}while(1<=o&&0<=i);break}}}finally{U=!1,Error.prepareStackTrace=t}return(e=e?e.displayName||e.name:"")?I(e):""}function V(e){switch(e.tag){case 5:return I(e.type);case 16:return I("Lazy");case 13:return I("Suspense");case 19:return I("SuspenseList");case 0:case 2:case 15:return e=A(e.type,!1);case 11:return e=A(e.type.render,!1);case 1:return e=A(e.type,!0);default:return""}}function $(e){if(null==e)return null;if("function"===typeof e)return e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case S:return"Fragment";case k:return"Portal";case E:return"Profiler";case N:return"StrictMode";case P:return"Suspense";case z:return"SuspenseList"}if("object"===typeof e)switch(e.$$typeof){case _:return(e.displayName||"Context")+".Consumer";case C:return(e._context.displayName||"Context")+".Provider";case j:var n=e.render;return(e=e.displayName)||(e=""!==(e=n.displayName||n.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case T:return null!==(n=e.displayName||null)?n:$(e.type)||"Memo";case L:n=e._payload,e=e._init;try{return $(e(n))}catch(t){}}return null}function W(e){var n=e.type;switch(e.tag){case 24:return"Cache";case 9:return(n.displayName||"Context")+".Consumer";case 10:return(n._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=(e=n.render).displayName||e.name||"",n.displayName||(""!==e?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return n;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return $(n);case 8:return n===N?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"===typeof n)return n.displayName||n.name||null;if("string"===typeof n)return n}return null}function B(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function H(e){var n=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===n||"radio"===n)}function Q(e){e._valueTracker||(e._valueTracker=function(e){var n=H(e)?"checked":"value",t=Object.getOwnPropertyDescriptor(e.constructor.prototype,n),r=""+e[n];if(!e.hasOwnProperty(n)&&"undefined"!==typeof t&&"function"===typeof t.get&&"function"===typeof t.set){var l=t.get,a=t.set;return Object.defineProperty(e,n,{configurable:!0,get:function(){return l.call(this)},set:function(e){r=""+e,a.call(this,e)}}),Object.defineProperty(e,n,{enumerable:t.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[n]}}}}(e))}function q(e){if(!e)return!1;var n=e._valueTracker;if(!n)return!0;var t=n.getValue(),r="";return e&&(r=H(e)?e.checked?"true":"false":e.value),(e=r)!==t&&(n.setValue(e),!0)}function K(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(n){return e.body}}function Y(e,n){var t=n.checked;return F({},n,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=t?t:e._wrapperState.initialChecked})}function X(e,n){var t=null==n.defaultValue?"":n.defaultValue,r=null!=n.checked?n.checked:n.defaultChecked;t=B(null!=n.value?n.value:t),e._wrapperState={initialChecked:r,initialValue:t,controlled:"checkbox"===n.type||"radio"===n.type?null!=n.checked:null!=n.value}}function G(e,n){null!=(n=n.checked)&&b(e,"checked",n,!1)}function Z(e,n){G(e,n);var t=B(n.value),r=n.type;if(null!=t)"number"===r?(0===t&&""===e.value||e.value!=t)&&(e.value=""+t):e.value!==""+t&&(e.value=""+t);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");n.hasOwnProperty("value")?ee(e,n.type,t):n.hasOwnProperty("defaultValue")&&ee(e,n.type,B(n.defaultValue)),null==n.checked&&null!=n.defaultChecked&&(e.defaultChecked=!!n.defaultChecked)}function J(e,n,t){if(n.hasOwnProperty("value")||n.hasOwnProperty("defaultValue")){var r=n.type;if(!("submit"!==r&&"reset"!==r||void 0!==n.value&&null!==n.value))return;n=""+e._wrapperState.initialValue,t||n===e.value||(e.value=n),e.defaultValue=n}""!==(t=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==t&&(e.name=t)}function ee(e,n,t){"number"===n&&K(e.ownerDocument)===e||(null==t?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+t&&(e.defaultValue=""+t))}var ne=Array.isArray;function te(e,n,t,r){if(e=e.options,n){n={};for(var l=0;l<t.length;l++)n["$"+t[l]]=!0;for(t=0;t<e.length;t++)l=n.hasOwnProperty("$"+e[t].value),e[t].selected!==l&&(e[t].selected=l),l&&r&&(e[t].defaultSelected=!0)}else{for(t=""+B(t),n=null,l=0;l<e.length;l++){if(e[l].value===t)return e[l].selected=!0,void(r&&(e[l].defaultSelected=!0));null!==n||e[l].disabled||(n=e[l])}null!==n&&(n.selected=!0)}}function re(e,n){if(null!=n.dangerouslySetInnerHTML)throw Error(a(91));return F({},n,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function le(e,n){var t=n.value;if(null==t){if(t=n.children,n=n.defaultValue,null!=t){if(null!=n)throw Error(a(92));if(ne(t)){if(1<t.length)throw Error(a(93));t=t[0]}n=t}null==n&&(n=""),t=n}e._wrapperState={initialValue:B(t)}}function ae(e,n){var t=B(n.value),r=B(n.defaultValue);null!=t&&((t=""+t)!==e.value&&(e.value=t),null==n.defaultValue&&e.defaultValue!==t&&(e.defaultValue=t)),null!=r&&(e.defaultValue=""+r)}function oe(e){var n=e.textContent;n===e._wrapperState.initialValue&&""!==n&&null!==n&&(e.value=n)}function ie(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function ue(e,n){return null==e||"http://www.w3.org/1999/xhtml"===e?ie(n):"http://www.w3.org/2000/svg"===e&&"foreignObject"===n?"http://www.w3.org/1999/xhtml":e}var se,ce,de=(ce=function(e,n){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=n;else{for((se=se||document.createElement("div")).innerHTML="<svg>"+n.valueOf().toString()+"</svg>",n=se.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;n.firstChild;)e.appendChild(n.firstChild)}},"undefined"!==typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,n,t,r){MSApp.execUnsafeLocalFunction(function(){return ce(e,n)})}:ce);function fe(e,n){if(n){var t=e.firstChild;if(t&&t===e.lastChild&&3===t.nodeType)return void(t.nodeValue=n)}e.textContent=n}var pe={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},me=["Webkit","ms","Moz","O"];function he(e,n,t){return null==n||"boolean"===typeof n||""===n?"":t||"number"!==typeof n||0===n||pe.hasOwnProperty(e)&&pe[e]?(""+n).trim():n+"px"}function ge(e,n){for(var t in e=e.style,n)if(n.hasOwnProperty(t)){var r=0===t.indexOf("--"),l=he(t,n[t],r);"float"===t&&(t="cssFloat"),r?e.setProperty(t,l):e[t]=l}}Object.keys(pe).forEach(function(e){me.forEach(function(n){n=n+e.charAt(0).toUpperCase()+e.substring(1),pe[n]=pe[e]})});var ve=F({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function ye(e,n){if(n){if(ve[e]&&(null!=n.children||null!=n.dangerouslySetInnerHTML))throw Error(a(137,e));if(null!=n.dangerouslySetInnerHTML){if(null!=n.children)throw Error(a(60));if("object"!==typeof n.dangerouslySetInnerHTML||!("__html"in n.dangerouslySetInnerHTML))throw Error(a(61))}if(null!=n.style&&"object"!==typeof n.style)throw Error(a(62))}}function be(e,n){if(-1===e.indexOf("-"))return"string"===typeof n.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var xe=null;function we(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var ke=null,Se=null,Ne=null;function Ee(e){if(e=bl(e)){if("function"!==typeof ke)throw Error(a(280));var n=e.stateNode;n&&(n=wl(n),ke(e.stateNode,e.type,n))}}function Ce(e){Se?Ne?Ne.push(e):Ne=[e]:Se=e}function _e(){if(Se){var e=Se,n=Ne;if(Ne=Se=null,Ee(e),n)for(e=0;e<n.length;e++)Ee(n[e])}}function je(e,n){return e(n)}function Pe(){}var ze=!1;function Te(e,n,t){if(ze)return e(n,t);ze=!0;try{return je(e,n,t)}finally{ze=!1,(null!==Se||null!==Ne)&&(Pe(),_e())}}function Le(e,n){var t=e.stateNode;if(null===t)return null;var r=wl(t);if(null===r)return null;t=r[n];e:switch(n){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(t&&"function"!==typeof t)throw Error(a(231,n,typeof t));return t}var Oe=!1;if(c)try{var Re={};Object.defineProperty(Re,"passive",{get:function(){Oe=!0}}),window.addEventListener("test",Re,Re),window.removeEventListener("test",Re,Re)}catch(ce){Oe=!1}function Me(e,n,t,r,l,a,o,i,u){var s=Array.prototype.slice.call(arguments,3);try{n.apply(t,s)}catch(c){this.onError(c)}}var De=!1,Fe=null,Ie=!1,Ue=null,Ae={onError:function(e){De=!0,Fe=e}};function Ve(e,n,t,r,l,a,o,i,u){De=!1,Fe=null,Me.apply(Ae,arguments)}function $e(e){var n=e,t=e;if(e.alternate)for(;n.return;)n=n.return;else{e=n;do{0!==(4098&(n=e).flags)&&(t=n.return),e=n.return}while(e)}return 3===n.tag?t:null}function We(e){if(13===e.tag){var n=e.memoizedState;if(null===n&&(null!==(e=e.alternate)&&(n=e.memoizedState)),null!==n)return n.dehydrated}return null}function Be(e){if($e(e)!==e)throw Error(a(188))}function He(e){return null!==(e=function(e){var n=e.alternate;if(!n){if(null===(n=$e(e)))throw Error(a(188));return n!==e?null:e}for(var t=e,r=n;;){var l=t.return;if(null===l)break;var o=l.alternate;if(null===o){if(null!==(r=l.return)){t=r;continue}break}if(l.child===o.child){for(o=l.child;o;){if(o===t)return Be(l),e;if(o===r)return Be(l),n;o=o.sibling}throw Error(a(188))}if(t.return!==r.return)t=l,r=o;else{for(var i=!1,u=l.child;u;){if(u===t){i=!0,t=l,r=o;break}if(u===r){i=!0,r=l,t=o;break}u=u.sibling}if(!i){for(u=o.child;u;){if(u===t){i=!0,t=o,r=l;break}if(u===r){i=!0,r=o,t=l;break}u=u.sibling}if(!i)throw Error(a(189))}}if(t.alternate!==r)throw Error(a(190))}if(3!==t.tag)throw Error(a(188));return t.stateNode.current===t?e:n}(e))?Qe(e):null}function Qe(e){if(5===e.tag||6===e.tag)return e;for(e=e.child;null!==e;){var n=Qe(e);if(null!==n)return n;e=e.sibling}return null}var qe=l.unstable_scheduleCallback,Ke=l.unstable_cancelCallback,Ye=l.unstable_shouldYield,Xe=l.unstable_requestPaint,Ge=l.unstable_now,Ze=l.unstable_getCurrentPriorityLevel,Je=l.unstable_ImmediatePriority,en=l.unstable_UserBlockingPriority,nn=l.unstable_NormalPriority,tn=l.unstable_LowPriority,rn=l.unstable_IdlePriority,ln=null,an=null;var on=Math.clz32?Math.clz32:function(e){return e>>>=0,0===e?32:31-(un(e)/sn|0)|0},un=Math.log,sn=Math.LN2;var cn=64,dn=4194304;function fn(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&e;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&e;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function pn(e,n){var t=e.pendingLanes;if(0===t)return 0;var r=0,l=e.suspendedLanes,a=e.pingedLanes,o=268435455&t;if(0!==o){var i=o&~l;0!==i?r=fn(i):0!==(a&=o)&&(r=fn(a))}else 0!==(o=t&~l)?r=fn(o):0!==a&&(r=fn(a));if(0===r)return 0;if(0!==n&&n!==r&&0===(n&l)&&((l=r&-r)>=(a=n&-n)||16===l&&0!==(4194240&a)))return n;if(0!==(4&r)&&(r|=16&t),0!==(n=e.entangledLanes))for(e=e.entanglements,n&=r;0<n;)l=1<<(t=31-on(n)),r|=e[t],n&=~l;return r}function mn(e,n){switch(e){case 1:case 2:case 4:return n+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return n+5e3;default:return-1}}function hn(e){return 0!==(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function gn(){var e=cn;return 0===(4194240&(cn<<=1))&&(cn=64),e}function vn(e){for(var n=[],t=0;31>t;t++)n.push(e);return n}function yn(e,n,t){e.pendingLanes|=n,536870912!==n&&(e.suspendedLanes=0,e.pingedLanes=0),(e=e.eventTimes)[n=31-on(n)]=t}function bn(e,n){var t=e.entangledLanes|=n;for(e=e.entanglements;t;){var r=31-on(t),l=1<<r;l&n|e[r]&n&&(e[r]|=n),t&=~l}}var xn=0;function wn(e){return 1<(e&=-e)?4<e?0!==(268435455&e)?16:536870912:4:1}var kn,Sn,Nn,En,Cn,_n=!1,jn=[],Pn=null,zn=null,Tn=null,Ln=new Map,On=new Map,Rn=[],Mn="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function Dn(e,n){switch(e){case"focusin":case"focusout":Pn=null;break;case"dragenter":case"dragleave":zn=null;break;case"mouseover":case"mouseout":Tn=null;break;case"pointerover":case"pointerout":Ln.delete(n.pointerId);break;case"gotpointercapture":case"lostpointercapture":On.delete(n.pointerId)}}function Fn(e,n,t,r,l,a){return null===e||e.nativeEvent!==a?(e={blockedOn:n,domEventName:t,eventSystemFlags:r,nativeEvent:a,targetContainers:[l]},null!==n&&(null!==(n=bl(n))&&Sn(n)),e):(e.eventSystemFlags|=r,n=e.targetContainers,null!==l&&-1===n.indexOf(l)&&n.push(l),e)}function In(e){var n=yl(e.target);if(null!==n){var t=$e(n);if(null!==t)if(13===(n=t.tag)){if(null!==(n=We(t)))return e.blockedOn=n,void Cn(e.priority,function(){Nn(t)})}else if(3===n&&t.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===t.tag?t.stateNode.containerInfo:null)}e.blockedOn=null}function Un(e){if(null!==e.blockedOn)return!1;for(var n=e.targetContainers;0<n.length;){var t=Xn(e.domEventName,e.eventSystemFlags,n[0],e.nativeEvent);if(null!==t)return null!==(n=bl(t))&&Sn(n),e.blockedOn=t,!1;var r=new(t=e.nativeEvent).constructor(t.type,t);xe=r,t.target.dispatchEvent(r),xe=null,n.shift()}return!0}function An(e,n,t){Un(e)&&t.delete(n)}function Vn(){_n=!1,null!==Pn&&Un(Pn)&&(Pn=null),null!==zn&&Un(zn)&&(zn=null),null!==Tn&&Un(Tn)&&(Tn=null),Ln.forEach(An),On.forEach(An)}function $n(e,n){e.blockedOn===n&&(e.blockedOn=null,_n||(_n=!0,l.unstable_scheduleCallback(l.unstable_NormalPriority,Vn)))}function Wn(e){function n(n){return $n(n,e)}if(0<jn.length){$n(jn[0],e);for(var t=1;t<jn.length;t++){var r=jn[t];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==Pn&&$n(Pn,e),null!==zn&&$n(zn,e),null!==Tn&&$n(Tn,e),Ln.forEach(n),On.forEach(n),t=0;t<Rn.length;t++)(r=Rn[t]).blockedOn===e&&(r.blockedOn=null);for(;0<Rn.length&&null===(t=Rn[0]).blockedOn;)In(t),null===t.blockedOn&&Rn.shift()}var Bn=x.ReactCurrentBatchConfig,Hn=!0;function Qn(e,n,t,r){var l=xn,a=Bn.transition;Bn.transition=null;try{xn=1,Kn(e,n,t,r)}finally{xn=l,Bn.transition=a}}function qn(e,n,t,r){var l=xn,a=Bn.transition;Bn.transition=null;try{xn=4,Kn(e,n,t,r)}finally{xn=l,Bn.transition=a}}function Kn(e,n,t,r){if(Hn){var l=Xn(e,n,t,r);if(null===l)Br(e,n,r,Yn,t),Dn(e,r);else if(function(e,n,t,r,l){switch(n){case"focusin":return Pn=Fn(Pn,e,n,t,r,l),!0;case"dragenter":return zn=Fn(zn,e,n,t,r,l),!0;case"mouseover":return Tn=Fn(Tn,e,n,t,r,l),!0;case"pointerover":var a=l.pointerId;return Ln.set(a,Fn(Ln.get(a)||null,e,n,t,r,l)),!0;case"gotpointercapture":return a=l.pointerId,On.set(a,Fn(On.get(a)||null,e,n,t,r,l)),!0}return!1}(l,e,n,t,r))r.stopPropagation();else if(Dn(e,r),4&n&&-1<Mn.indexOf(e)){for(;null!==l;){var a=bl(l);if(null!==a&&kn(a),null===(a=Xn(e,n,t,r))&&Br(e,n,r,Yn,t),a===l)break;l=a}null!==l&&r.stopPropagation()}else Br(e,n,r,null,t)}}var Yn=null;function Xn(e,n,t,r){if(Yn=null,null!==(e=yl(e=we(r))))if(null===(n=$e(e)))e=null;else if(13===(t=n.tag)){if(null!==(e=We(n)))return e;e=null}else if(3===t){if(n.stateNode.current.memoizedState.isDehydrated)return 3===n.tag?n.stateNode.containerInfo:null;e=null}else n!==e&&(e=null);return Yn=e,null}function Gn(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Ze()){case Je:return 1;case en:return 4;case nn:case tn:return 16;case rn:return 536870912;default:return 16}default:return 16}}var Zn=null,Jn=null,et=null;function nt(){if(et)return et;var e,n,t=Jn,r=t.length,l="value"in Zn?Zn.value:Zn.textContent,a=l.length;for(e=0;e<r&&t[e]===l[e];e++);var o=r-e;for(n=1;n<=o&&t[r-n]===l[a-n];n++);return et=l.slice(e,1<n?1-n:void 0)}function tt(e){var n=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===n&&(e=13):e=n,10===e&&(e=13),32<=e||13===e?e:0}function rt(){return!0}function lt(){return!1}function at(e){function n(n,t,r,l,a){for(var o in this._reactName=n,this._targetInst=r,this.type=t,this.nativeEvent=l,this.target=a,this.currentTarget=null,e)e.hasOwnProperty(o)&&(n=e[o],this[o]=n?n(l):l[o]);return this.isDefaultPrevented=(null!=l.defaultPrevented?l.defaultPrevented:!1===l.returnValue)?rt:lt,this.isPropagationStopped=lt,this}return F(n.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=rt)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=rt)},persist:function(){},isPersistent:rt}),n}var ot,it,ut,st={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},ct=at(st),dt=F({},st,{view:0,detail:0}),ft=at(dt),pt=F({},dt,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Et,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==ut&&(ut&&"mousemove"===e.type?(ot=e.screenX-ut.screenX,it=e.screenY-ut.screenY):it=ot=0,ut=e),ot)},movementY:function(e){return"movementY"in e?e.movementY:it}}),mt=at(pt),ht=at(F({},pt,{dataTransfer:0})),gt=at(F({},dt,{relatedTarget:0})),vt=at(F({},st,{animationName:0,elapsedTime:0,pseudoElement:0})),yt=F({},st,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),bt=at(yt),xt=at(F({},st,{data:0})),wt={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},kt={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},St={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Nt(e){var n=this.nativeEvent;return n.getModifierState?n.getModifierState(e):!!(e=St[e])&&!!n[e]}function Et(){return Nt}var Ct=F({},dt,{key:function(e){if(e.key){var n=wt[e.key]||e.key;if("Unidentified"!==n)return n}return"keypress"===e.type?13===(e=tt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?kt[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Et,charCode:function(e){return"keypress"===e.type?tt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?tt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),_t=at(Ct),jt=at(F({},pt,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),Pt=at(F({},dt,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Et})),zt=at(F({},st,{propertyName:0,elapsedTime:0,pseudoElement:0})),Tt=F({},pt,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Lt=at(Tt),Ot=[9,13,27,32],Rt=c&&"CompositionEvent"in window,Mt=null;c&&"documentMode"in document&&(Mt=document.documentMode);var Dt=c&&"TextEvent"in window&&!Mt,Ft=c&&(!Rt||Mt&&8<Mt&&11>=Mt),It=String.fromCharCode(32),Ut=!1;function At(e,n){switch(e){case"keyup":return-1!==Ot.indexOf(n.keyCode);case"keydown":return 229!==n.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Vt(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var $t=!1;var Wt={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Bt(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===n?!!Wt[e.type]:"textarea"===n}function Ht(e,n,t,r){Ce(r),0<(n=Qr(n,"onChange")).length&&(t=new ct("onChange","change",null,t,r),e.push({event:t,listeners:n}))}var Qt=null,qt=null;function Kt(e){Ir(e,0)}function Yt(e){if(q(xl(e)))return e}function Xt(e,n){if("change"===e)return n}var Gt=!1;if(c){var Zt;if(c){var Jt="oninput"in document;if(!Jt){var er=document.createElement("div");er.setAttribute("oninput","return;"),Jt="function"===typeof er.oninput}Zt=Jt}else Zt=!1;Gt=Zt&&(!document.documentMode||9<document.documentMode)}function nr(){Qt&&(Qt.detachEvent("onpropertychange",tr),qt=Qt=null)}function tr(e){if("value"===e.propertyName&&Yt(qt)){var n=[];Ht(n,qt,e,we(e)),Te(Kt,n)}}function rr(e,n,t){"focusin"===e?(nr(),qt=t,(Qt=n).attachEvent("onpropertychange",tr)):"focusout"===e&&nr()}function lr(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Yt(qt)}function ar(e,n){if("click"===e)return Yt(n)}function or(e,n){if("input"===e||"change"===e)return Yt(n)}var ir="function"===typeof Object.is?Object.is:function(e,n){return e===n&&(0!==e||1/e===1/n)||e!==e&&n!==n};function ur(e,n){if(ir(e,n))return!0;if("object"!==typeof e||null===e||"object"!==typeof n||null===n)return!1;var t=Object.keys(e),r=Object.keys(n);if(t.length!==r.length)return!1;for(r=0;r<t.length;r++){var l=t[r];if(!d.call(n,l)||!ir(e[l],n[l]))return!1}return!0}function sr(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function cr(e,n){var t,r=sr(e);for(e=0;r;){if(3===r.nodeType){if(t=e+r.textContent.length,e<=n&&t>=n)return{node:r,offset:n-e};e=t}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=sr(r)}}function dr(e,n){return!(!e||!n)&&(e===n||(!e||3!==e.nodeType)&&(n&&3===n.nodeType?dr(e,n.parentNode):"contains"in e?e.contains(n):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(n))))}function fr(){for(var e=window,n=K();n instanceof e.HTMLIFrameElement;){try{var t="string"===typeof n.contentWindow.location.href}catch(r){t=!1}if(!t)break;n=K((e=n.contentWindow).document)}return n}function pr(e){var n=e&&e.nodeName&&e.nodeName.toLowerCase();return n&&("input"===n&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===n||"true"===e.contentEditable)}function mr(e){var n=fr(),t=e.focusedElem,r=e.selectionRange;if(n!==t&&t&&t.ownerDocument&&dr(t.ownerDocument.documentElement,t)){if(null!==r&&pr(t))if(n=r.start,void 0===(e=r.end)&&(e=n),"selectionStart"in t)t.selectionStart=n,t.selectionEnd=Math.min(e,t.value.length);else if((e=(n=t.ownerDocument||document)&&n.defaultView||window).getSelection){e=e.getSelection();var l=t.textContent.length,a=Math.min(r.start,l);r=void 0===r.end?a:Math.min(r.end,l),!e.extend&&a>r&&(l=r,r=a,a=l),l=cr(t,a);var o=cr(t,r);l&&o&&(1!==e.rangeCount||e.anchorNode!==l.node||e.anchorOffset!==l.offset||e.focusNode!==o.node||e.focusOffset!==o.offset)&&((n=n.createRange()).setStart(l.node,l.offset),e.removeAllRanges(),a>r?(e.addRange(n),e.extend(o.node,o.offset)):(n.setEnd(o.node,o.offset),e.addRange(n)))}for(n=[],e=t;e=e.parentNode;)1===e.nodeType&&n.push({element:e,left:e.scrollLeft,top:e.scrollTop});for("function"===typeof t.focus&&t.focus(),t=0;t<n.length;t++)(e=n[t]).element.scrollLeft=e.left,e.element.scrollTop=e.top}}var hr=c&&"documentMode"in document&&11>=document.documentMode,gr=null,vr=null,yr=null,br=!1;function xr(e,n,t){var r=t.window===t?t.document:9===t.nodeType?t:t.ownerDocument;br||null==gr||gr!==K(r)||("selectionStart"in(r=gr)&&pr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},yr&&ur(yr,r)||(yr=r,0<(r=Qr(vr,"onSelect")).length&&(n=new ct("onSelect","select",null,n,t),e.push({event:n,listeners:r}),n.target=gr)))}function wr(e,n){var t={};return t[e.toLowerCase()]=n.toLowerCase(),t["Webkit"+e]="webkit"+n,t["Moz"+e]="moz"+n,t}var kr={animationend:wr("Animation","AnimationEnd"),animationiteration:wr("Animation","AnimationIteration"),animationstart:wr("Animation","AnimationStart"),transitionend:wr("Transition","TransitionEnd")},Sr={},Nr={};function Er(e){if(Sr[e])return Sr[e];if(!kr[e])return e;var n,t=kr[e];for(n in t)if(t.hasOwnProperty(n)&&n in Nr)return Sr[e]=t[n];return e}c&&(Nr=document.createElement("div").style,"AnimationEvent"in window||(delete kr.animationend.animation,delete kr.animationiteration.animation,delete kr.animationstart.animation),"TransitionEvent"in window||delete kr.transitionend.transition);var Cr=Er("animationend"),_r=Er("animationiteration"),jr=Er("animationstart"),Pr=Er("transitionend"),zr=new Map,Tr="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Lr(e,n){zr.set(e,n),u(n,[e])}for(var Or=0;Or<Tr.length;Or++){var Rr=Tr[Or];Lr(Rr.toLowerCase(),"on"+(Rr[0].toUpperCase()+Rr.slice(1)))}Lr(Cr,"onAnimationEnd"),Lr(_r,"onAnimationIteration"),Lr(jr,"onAnimationStart"),Lr("dblclick","onDoubleClick"),Lr("focusin","onFocus"),Lr("focusout","onBlur"),Lr(Pr,"onTransitionEnd"),s("onMouseEnter",["mouseout","mouseover"]),s("onMouseLeave",["mouseout","mouseover"]),s("onPointerEnter",["pointerout","pointerover"]),s("onPointerLeave",["pointerout","pointerover"]),u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),u("onBeforeInput",["compositionend","keypress","textInput","paste"]),u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Mr="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Dr=new Set("cancel close invalid load scroll toggle".split(" ").concat(Mr));function Fr(e,n,t){var r=e.type||"unknown-event";e.currentTarget=t,function(e,n,t,r,l,o,i,u,s){if(Ve.apply(this,arguments),De){if(!De)throw Error(a(198));var c=Fe;De=!1,Fe=null,Ie||(Ie=!0,Ue=c)}}(r,n,void 0,e),e.currentTarget=null}function Ir(e,n){n=0!==(4&n);for(var t=0;t<e.length;t++){var r=e[t],l=r.event;r=r.listeners;e:{var a=void 0;if(n)for(var o=r.length-1;0<=o;o--){var i=r[o],u=i.instance,s=i.currentTarget;if(i=i.listener,u!==a&&l.isPropagationStopped())break e;Fr(l,i,s),a=u}else for(o=0;o<r.length;o++){if(u=(i=r[o]).instance,s=i.currentTarget,i=i.listener,u!==a&&l.isPropagationStopped())break e;Fr(l,i,s),a=u}}}if(Ie)throw e=Ue,Ie=!1,Ue=null,e}function Ur(e,n){var t=n[hl];void 0===t&&(t=n[hl]=new Set);var r=e+"__bubble";t.has(r)||(Wr(n,e,2,!1),t.add(r))}function Ar(e,n,t){var r=0;n&&(r|=4),Wr(t,e,r,n)}var Vr="_reactListening"+Math.random().toString(36).slice(2);function $r(e){if(!e[Vr]){e[Vr]=!0,o.forEach(function(n){"selectionchange"!==n&&(Dr.has(n)||Ar(n,!1,e),Ar(n,!0,e))});var n=9===e.nodeType?e:e.ownerDocument;null===n||n[Vr]||(n[Vr]=!0,Ar("selectionchange",!1,n))}}function Wr(e,n,t,r){switch(Gn(n)){case 1:var l=Qn;break;case 4:l=qn;break;default:l=Kn}t=l.bind(null,n,t,e),l=void 0,!Oe||"touchstart"!==n&&"touchmove"!==n&&"wheel"!==n||(l=!0),r?void 0!==l?e.addEventListener(n,t,{capture:!0,passive:l}):e.addEventListener(n,t,!0):void 0!==l?e.addEventListener(n,t,{passive:l}):e.addEventListener(n,t,!1)}function Br(e,n,t,r,l){var a=r;if(0===(1&n)&&0===(2&n)&&null!==r)e:for(;;){if(null===r)return;var o=r.tag;if(3===o||4===o){var i=r.stateNode.containerInfo;if(i===l||8===i.nodeType&&i.parentNode===l)break;if(4===o)for(o=r.return;null!==o;){var u=o.tag;if((3===u||4===u)&&((u=o.stateNode.containerInfo)===l||8===u.nodeType&&u.parentNode===l))return;o=o.return}for(;null!==i;){if(null===(o=yl(i)))return;if(5===(u=o.tag)||6===u){r=a=o;continue e}i=i.parentNode}}r=r.return}Te(function(){var r=a,l=we(t),o=[];e:{var i=zr.get(e);if(void 0!==i){var u=ct,s=e;switch(e){case"keypress":if(0===tt(t))break e;case"keydown":case"keyup":u=_t;break;case"focusin":s="focus",u=gt;break;case"focusout":s="blur",u=gt;break;case"beforeblur":case"afterblur":u=gt;break;case"click":if(2===t.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":u=mt;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":u=ht;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":u=Pt;break;case Cr:case _r:case jr:u=vt;break;case Pr:u=zt;break;case"scroll":u=ft;break;case"wheel":u=Lt;break;case"copy":case"cut":case"paste":u=bt;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":u=jt}var c=0!==(4&n),d=!c&&"scroll"===e,f=c?null!==i?i+"Capture":null:i;c=[];for(var p,m=r;null!==m;){var h=(p=m).stateNode;if(5===p.tag&&null!==h&&(p=h,null!==f&&(null!=(h=Le(m,f))&&c.push(Hr(m,h,p)))),d)break;m=m.return}0<c.length&&(i=new u(i,s,null,t,l),o.push({event:i,listeners:c}))}}if(0===(7&n)){if(u="mouseout"===e||"pointerout"===e,(!(i="mouseover"===e||"pointerover"===e)||t===xe||!(s=t.relatedTarget||t.fromElement)||!yl(s)&&!s[ml])&&(u||i)&&(i=l.window===l?l:(i=l.ownerDocument)?i.defaultView||i.parentWindow:window,u?(u=r,null!==(s=(s=t.relatedTarget||t.toElement)?yl(s):null)&&(s!==(d=$e(s))||5!==s.tag&&6!==s.tag)&&(s=null)):(u=null,s=r),u!==s)){if(c=mt,h="onMouseLeave",f="onMouseEnter",m="mouse","pointerout"!==e&&"pointerover"!==e||(c=jt,h="onPointerLeave",f="onPointerEnter",m="pointer"),d=null==u?i:xl(u),p=null==s?i:xl(s),(i=new c(h,m+"leave",u,t,l)).target=d,i.relatedTarget=p,h=null,yl(l)===r&&((c=new c(f,m+"enter",s,t,l)).target=p,c.relatedTarget=d,h=c),d=h,u&&s)e:{for(f=s,m=0,p=c=u;p;p=qr(p))m++;for(p=0,h=f;h;h=qr(h))p++;for(;0<m-p;)c=qr(c),m--;for(;0<p-m;)f=qr(f),p--;for(;m--;){if(c===f||null!==f&&c===f.alternate)break e;c=qr(c),f=qr(f)}c=null}else c=null;null!==u&&Kr(o,i,u,c,!1),null!==s&&null!==d&&Kr(o,d,s,c,!0)}if("select"===(u=(i=r?xl(r):window).nodeName&&i.nodeName.toLowerCase())||"input"===u&&"file"===i.type)var g=Xt;else if(Bt(i))if(Gt)g=or;else{g=lr;var v=rr}else(u=i.nodeName)&&"input"===u.toLowerCase()&&("checkbox"===i.type||"radio"===i.type)&&(g=ar);switch(g&&(g=g(e,r))?Ht(o,g,t,l):(v&&v(e,i,r),"focusout"===e&&(v=i._wrapperState)&&v.controlled&&"number"===i.type&&ee(i,"number",i.value)),v=r?xl(r):window,e){case"focusin":(Bt(v)||"true"===v.contentEditable)&&(gr=v,vr=r,yr=null);break;case"focusout":yr=vr=gr=null;break;case"mousedown":br=!0;break;case"contextmenu":case"mouseup":case"dragend":br=!1,xr(o,t,l);break;case"selectionchange":if(hr)break;case"keydown":case"keyup":xr(o,t,l)}var y;if(Rt)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else $t?At(e,t)&&(b="onCompositionEnd"):"keydown"===e&&229===t.keyCode&&(b="onCompositionStart");b&&(Ft&&"ko"!==t.locale&&($t||"onCompositionStart"!==b?"onCompositionEnd"===b&&$t&&(y=nt()):(Jn="value"in(Zn=l)?Zn.value:Zn.textContent,$t=!0)),0<(v=Qr(r,b)).length&&(b=new xt(b,e,null,t,l),o.push({event:b,listeners:v}),y?b.data=y:null!==(y=Vt(t))&&(b.data=y))),(y=Dt?function(e,n){switch(e){case"compositionend":return Vt(n);case"keypress":return 32!==n.which?null:(Ut=!0,It);case"textInput":return(e=n.data)===It&&Ut?null:e;default:return null}}(e,t):function(e,n){if($t)return"compositionend"===e||!Rt&&At(e,n)?(e=nt(),et=Jn=Zn=null,$t=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(n.ctrlKey||n.altKey||n.metaKey)||n.ctrlKey&&n.altKey){if(n.char&&1<n.char.length)return n.char;if(n.which)return String.fromCharCode(n.which)}return null;case"compositionend":return Ft&&"ko"!==n.locale?null:n.data}}(e,t))&&(0<(r=Qr(r,"onBeforeInput")).length&&(l=new xt("onBeforeInput","beforeinput",null,t,l),o.push({event:l,listeners:r}),l.data=y))}Ir(o,n)})}function Hr(e,n,t){return{instance:e,listener:n,currentTarget:t}}function Qr(e,n){for(var t=n+"Capture",r=[];null!==e;){var l=e,a=l.stateNode;5===l.tag&&null!==a&&(l=a,null!=(a=Le(e,t))&&r.unshift(Hr(e,a,l)),null!=(a=Le(e,n))&&r.push(Hr(e,a,l))),e=e.return}return r}function qr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Kr(e,n,t,r,l){for(var a=n._reactName,o=[];null!==t&&t!==r;){var i=t,u=i.alternate,s=i.stateNode;if(null!==u&&u===r)break;5===i.tag&&null!==s&&(i=s,l?null!=(u=Le(t,a))&&o.unshift(Hr(t,u,i)):l||null!=(u=Le(t,a))&&o.push(Hr(t,u,i))),t=t.return}0!==o.length&&e.push({event:n,listeners:o})}var Yr=/\r\n?/g,Xr=/\u0000|\uFFFD/g;function Gr(e){return("string"===typeof e?e:""+e).replace(Yr,"\n").replace(Xr,"")}function Zr(e,n,t){if(n=Gr(n),Gr(e)!==n&&t)throw Error(a(425))}function Jr(){}var el=null,nl=null;function tl(e,n){return"textarea"===e||"noscript"===e||"string"===typeof n.children||"number"===typeof n.children||"object"===typeof n.dangerouslySetInnerHTML&&null!==n.dangerouslySetInnerHTML&&null!=n.dangerouslySetInnerHTML.__html}var rl="function"===typeof setTimeout?setTimeout:void 0,ll="function"===typeof clearTimeout?clearTimeout:void 0,al="function"===typeof Promise?Promise:void 0,ol="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof al?function(e){return al.resolve(null).then(e).catch(il)}:rl;function il(e){setTimeout(function(){throw e})}function ul(e,n){var t=n,r=0;do{var l=t.nextSibling;if(e.removeChild(t),l&&8===l.nodeType)if("/$"===(t=l.data)){if(0===r)return e.removeChild(l),void Wn(n);r--}else"$"!==t&&"$?"!==t&&"$!"!==t||r++;t=l}while(t);Wn(n)}function sl(e){for(;null!=e;e=e.nextSibling){var n=e.nodeType;if(1===n||3===n)break;if(8===n){if("$"===(n=e.data)||"$!"===n||"$?"===n)break;if("/$"===n)return null}}return e}function cl(e){e=e.previousSibling;for(var n=0;e;){if(8===e.nodeType){var t=e.data;if("$"===t||"$!"===t||"$?"===t){if(0===n)return e;n--}else"/$"===t&&n++}e=e.previousSibling}return null}var dl=Math.random().toString(36).slice(2),fl="__reactFiber$"+dl,pl="__reactProps$"+dl,ml="__reactContainer$"+dl,hl="__reactEvents$"+dl,gl="__reactListeners$"+dl,vl="__reactHandles$"+dl;function yl(e){var n=e[fl];if(n)return n;for(var t=e.parentNode;t;){if(n=t[ml]||t[fl]){if(t=n.alternate,null!==n.child||null!==t&&null!==t.child)for(e=cl(e);null!==e;){if(t=e[fl])return t;e=cl(e)}return n}t=(e=t).parentNode}return null}function bl(e){return!(e=e[fl]||e[ml])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function xl(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(a(33))}function wl(e){return e[pl]||null}var kl=[],Sl=-1;function Nl(e){return{current:e}}function El(e){0>Sl||(e.current=kl[Sl],kl[Sl]=null,Sl--)}function Cl(e,n){Sl++,kl[Sl]=e.current,e.current=n}var _l={},jl=Nl(_l),Pl=Nl(!1),zl=_l;function Tl(e,n){var t=e.type.contextTypes;if(!t)return _l;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===n)return r.__reactInternalMemoizedMaskedChildContext;var l,a={};for(l in t)a[l]=n[l];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=n,e.__reactInternalMemoizedMaskedChildContext=a),a}function Ll(e){return null!==(e=e.childContextTypes)&&void 0!==e}function Ol(){El(Pl),El(jl)}function Rl(e,n,t){if(jl.current!==_l)throw Error(a(168));Cl(jl,n),Cl(Pl,t)}function Ml(e,n,t){var r=e.stateNode;if(n=n.childContextTypes,"function"!==typeof r.getChildContext)return t;for(var l in r=r.getChildContext())if(!(l in n))throw Error(a(108,W(e)||"Unknown",l));return F({},t,r)}function Dl(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||_l,zl=jl.current,Cl(jl,e),Cl(Pl,Pl.current),!0}function Fl(e,n,t){var r=e.stateNode;if(!r)throw Error(a(169));t?(e=Ml(e,n,zl),r.__reactInternalMemoizedMergedChildContext=e,El(Pl),El(jl),Cl(jl,e)):El(Pl),Cl(Pl,t)}var Il=null,Ul=!1,Al=!1;function Vl(e){null===Il?Il=[e]:Il.push(e)}function $l(){if(!Al&&null!==Il){Al=!0;var e=0,n=xn;try{var t=Il;for(xn=1;e<t.length;e++){var r=t[e];do{r=r(!0)}while(null!==r)}Il=null,Ul=!1}catch(l){throw null!==Il&&(Il=Il.slice(e+1)),qe(Je,$l),l}finally{xn=n,Al=!1}}return null}var Wl=[],Bl=0,Hl=null,Ql=0,ql=[],Kl=0,Yl=null,Xl=1,Gl="";function Zl(e,n){Wl[Bl++]=Ql,Wl[Bl++]=Hl,Hl=e,Ql=n}function Jl(e,n,t){ql[Kl++]=Xl,ql[Kl++]=Gl,ql[Kl++]=Yl,Yl=e;var r=Xl;e=Gl;var l=32-on(r)-1;r&=~(1<<l),t+=1;var a=32-on(n)+l;if(30<a){var o=l-l%5;a=(r&(1<<o)-1).toString(32),r>>=o,l-=o,Xl=1<<32-on(n)+l|t<<l|r,Gl=a+e}else Xl=1<<a|t<<l|r,Gl=e}function ea(e){null!==e.return&&(Zl(e,1),Jl(e,1,0))}function na(e){for(;e===Hl;)Hl=Wl[--Bl],Wl[Bl]=null,Ql=Wl[--Bl],Wl[Bl]=null;for(;e===Yl;)Yl=ql[--Kl],ql[Kl]=null,Gl=ql[--Kl],ql[Kl]=null,Xl=ql[--Kl],ql[Kl]=null}var ta=null,ra=null,la=!1,aa=null;function oa(e,n){var t=Ts(5,null,null,0);t.elementType="DELETED",t.stateNode=n,t.return=e,null===(n=e.deletions)?(e.deletions=[t],e.flags|=16):n.push(t)}function ia(e,n){switch(e.tag){case 5:var t=e.type;return null!==(n=1!==n.nodeType||t.toLowerCase()!==n.nodeName.toLowerCase()?null:n)&&(e.stateNode=n,ta=e,ra=sl(n.firstChild),!0);case 6:return null!==(n=""===e.pendingProps||3!==n.nodeType?null:n)&&(e.stateNode=n,ta=e,ra=null,!0);case 13:return null!==(n=8!==n.nodeType?null:n)&&(t=null!==Yl?{id:Xl,overflow:Gl}:null,e.memoizedState={dehydrated:n,treeContext:t,retryLane:1073741824},(t=Ts(18,null,null,0)).stateNode=n,t.return=e,e.child=t,ta=e,ra=null,!0);default:return!1}}function ua(e){return 0!==(1&e.mode)&&0===(128&e.flags)}function sa(e){if(la){var n=ra;if(n){var t=n;if(!ia(e,n)){if(ua(e))throw Error(a(418));n=sl(t.nextSibling);var r=ta;n&&ia(e,n)?oa(r,t):(e.flags=-4097&e.flags|2,la=!1,ta=e)}}else{if(ua(e))throw Error(a(418));e.flags=-4097&e.flags|2,la=!1,ta=e}}}function ca(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;ta=e}function da(e){if(e!==ta)return!1;if(!la)return ca(e),la=!0,!1;var n;if((n=3!==e.tag)&&!(n=5!==e.tag)&&(n="head"!==(n=e.type)&&"body"!==n&&!tl(e.type,e.memoizedProps)),n&&(n=ra)){if(ua(e))throw fa(),Error(a(418));for(;n;)oa(e,n),n=sl(n.nextSibling)}if(ca(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(a(317));e:{for(e=e.nextSibling,n=0;e;){if(8===e.nodeType){var t=e.data;if("/$"===t){if(0===n){ra=sl(e.nextSibling);break e}n--}else"$"!==t&&"$!"!==t&&"$?"!==t||n++}e=e.nextSibling}ra=null}}else ra=ta?sl(e.stateNode.nextSibling):null;return!0}function fa(){for(var e=ra;e;)e=sl(e.nextSibling)}function pa(){ra=ta=null,la=!1}function ma(e){null===aa?aa=[e]:aa.push(e)}var ha=x.ReactCurrentBatchConfig;function ga(e,n,t){if(null!==(e=t.ref)&&"function"!==typeof e&&"object"!==typeof e){if(t._owner){if(t=t._owner){if(1!==t.tag)throw Error(a(309));var r=t.stateNode}if(!r)throw Error(a(147,e));var l=r,o=""+e;return null!==n&&null!==n.ref&&"function"===typeof n.ref&&n.ref._stringRef===o?n.ref:(n=function(e){var n=l.refs;null===e?delete n[o]:n[o]=e},n._stringRef=o,n)}if("string"!==typeof e)throw Error(a(284));if(!t._owner)throw Error(a(290,e))}return e}function va(e,n){throw e=Object.prototype.toString.call(n),Error(a(31,"[object Object]"===e?"object with keys {"+Object.keys(n).join(", ")+"}":e))}function ya(e){return(0,e._init)(e._payload)}function ba(e){function n(n,t){if(e){var r=n.deletions;null===r?(n.deletions=[t],n.flags|=16):r.push(t)}}function t(t,r){if(!e)return null;for(;null!==r;)n(t,r),r=r.sibling;return null}function r(e,n){for(e=new Map;null!==n;)null!==n.key?e.set(n.key,n):e.set(n.index,n),n=n.sibling;return e}function l(e,n){return(e=Os(e,n)).index=0,e.sibling=null,e}function o(n,t,r){return n.index=r,e?null!==(r=n.alternate)?(r=r.index)<t?(n.flags|=2,t):r:(n.flags|=2,t):(n.flags|=1048576,t)}function i(n){return e&&null===n.alternate&&(n.flags|=2),n}function u(e,n,t,r){return null===n||6!==n.tag?((n=Fs(t,e.mode,r)).return=e,n):((n=l(n,t)).return=e,n)}function s(e,n,t,r){var a=t.type;return a===S?d(e,n,t.props.children,r,t.key):null!==n&&(n.elementType===a||"object"===typeof a&&null!==a&&a.$$typeof===L&&ya(a)===n.type)?((r=l(n,t.props)).ref=ga(e,n,t),r.return=e,r):((r=Rs(t.type,t.key,t.props,null,e.mode,r)).ref=ga(e,n,t),r.return=e,r)}function c(e,n,t,r){return null===n||4!==n.tag||n.stateNode.containerInfo!==t.containerInfo||n.stateNode.implementation!==t.implementation?((n=Is(t,e.mode,r)).return=e,n):((n=l(n,t.children||[])).return=e,n)}function d(e,n,t,r,a){return null===n||7!==n.tag?((n=Ms(t,e.mode,r,a)).return=e,n):((n=l(n,t)).return=e,n)}function f(e,n,t){if("string"===typeof n&&""!==n||"number"===typeof n)return(n=Fs(""+n,e.mode,t)).return=e,n;if("object"===typeof n&&null!==n){switch(n.$$typeof){case w:return(t=Rs(n.type,n.key,n.props,null,e.mode,t)).ref=ga(e,null,n),t.return=e,t;case k:return(n=Is(n,e.mode,t)).return=e,n;case L:return f(e,(0,n._init)(n._payload),t)}if(ne(n)||M(n))return(n=Ms(n,e.mode,t,null)).return=e,n;va(e,n)}return null}function p(e,n,t,r){var l=null!==n?n.key:null;if("string"===typeof t&&""!==t||"number"===typeof t)return null!==l?null:u(e,n,""+t,r);if("object"===typeof t&&null!==t){switch(t.$$typeof){case w:return t.key===l?s(e,n,t,r):null;case k:return t.key===l?c(e,n,t,r):null;case L:return p(e,n,(l=t._init)(t._payload),r)}if(ne(t)||M(t))return null!==l?null:d(e,n,t,r,null);va(e,t)}return null}function m(e,n,t,r,l){if("string"===typeof r&&""!==r||"number"===typeof r)return u(n,e=e.get(t)||null,""+r,l);if("object"===typeof r&&null!==r){switch(r.$$typeof){case w:return s(n,e=e.get(null===r.key?t:r.key)||null,r,l);case k:return c(n,e=e.get(null===r.key?t:r.key)||null,r,l);case L:return m(e,n,t,(0,r._init)(r._payload),l)}if(ne(r)||M(r))return d(n,e=e.get(t)||null,r,l,null);va(n,r)}return null}function h(l,a,i,u){for(var s=null,c=null,d=a,h=a=0,g=null;null!==d&&h<i.length;h++){d.index>h?(g=d,d=null):g=d.sibling;var v=p(l,d,i[h],u);if(null===v){null===d&&(d=g);break}e&&d&&null===v.alternate&&n(l,d),a=o(v,a,h),null===c?s=v:c.sibling=v,c=v,d=g}if(h===i.length)return t(l,d),la&&Zl(l,h),s;if(null===d){for(;h<i.length;h++)null!==(d=f(l,i[h],u))&&(a=o(d,a,h),null===c?s=d:c.sibling=d,c=d);return la&&Zl(l,h),s}for(d=r(l,d);h<i.length;h++)null!==(g=m(d,l,h,i[h],u))&&(e&&null!==g.alternate&&d.delete(null===g.key?h:g.key),a=o(g,a,h),null===c?s=g:c.sibling=g,c=g);return e&&d.forEach(function(e){return n(l,e)}),la&&Zl(l,h),s}function g(l,i,u,s){var c=M(u);if("function"!==typeof c)throw Error(a(150));if(null==(u=c.call(u)))throw Error(a(151));for(var d=c=null,h=i,g=i=0,v=null,y=u.next();null!==h&&!y.done;g++,y=u.next()){h.index>g?(v=h,h=null):v=h.sibling;var b=p(l,h,y.value,s);if(null===b){null===h&&(h=v);break}e&&h&&null===b.alternate&&n(l,h),i=o(b,i,g),null===d?c=b:d.sibling=b,d=b,h=v}if(y.done)return t(l,h),la&&Zl(l,g),c;if(null===h){for(;!y.done;g++,y=u.next())null!==(y=f(l,y.value,s))&&(i=o(y,i,g),null===d?c=y:d.sibling=y,d=y);return la&&Zl(l,g),c}for(h=r(l,h);!y.done;g++,y=u.next())null!==(y=m(h,l,g,y.value,s))&&(e&&null!==y.alternate&&h.delete(null===y.key?g:y.key),i=o(y,i,g),null===d?c=y:d.sibling=y,d=y);return e&&h.forEach(function(e){return n(l,e)}),la&&Zl(l,g),c}return function e(r,a,o,u){if("object"===typeof o&&null!==o&&o.type===S&&null===o.key&&(o=o.props.children),"object"===typeof o&&null!==o){switch(o.$$typeof){case w:e:{for(var s=o.key,c=a;null!==c;){if(c.key===s){if((s=o.type)===S){if(7===c.tag){t(r,c.sibling),(a=l(c,o.props.children)).return=r,r=a;break e}}else if(c.elementType===s||"object"===typeof s&&null!==s&&s.$$typeof===L&&ya(s)===c.type){t(r,c.sibling),(a=l(c,o.props)).ref=ga(r,c,o),a.return=r,r=a;break e}t(r,c);break}n(r,c),c=c.sibling}o.type===S?((a=Ms(o.props.children,r.mode,u,o.key)).return=r,r=a):((u=Rs(o.type,o.key,o.props,null,r.mode,u)).ref=ga(r,a,o),u.return=r,r=u)}return i(r);case k:e:{for(c=o.key;null!==a;){if(a.key===c){if(4===a.tag&&a.stateNode.containerInfo===o.containerInfo&&a.stateNode.implementation===o.implementation){t(r,a.sibling),(a=l(a,o.children||[])).return=r,r=a;break e}t(r,a);break}n(r,a),a=a.sibling}(a=Is(o,r.mode,u)).return=r,r=a}return i(r);case L:return e(r,a,(c=o._init)(o._payload),u)}if(ne(o))return h(r,a,o,u);if(M(o))return g(r,a,o,u);va(r,o)}return"string"===typeof o&&""!==o||"number"===typeof o?(o=""+o,null!==a&&6===a.tag?(t(r,a.sibling),(a=l(a,o)).return=r,r=a):(t(r,a),(a=Fs(o,r.mode,u)).return=r,r=a),i(r)):t(r,a)}}var xa=ba(!0),wa=ba(!1),ka=Nl(null),Sa=null,Na=null,Ea=null;function Ca(){Ea=Na=Sa=null}function _a(e){var n=ka.current;El(ka),e._currentValue=n}function ja(e,n,t){for(;null!==e;){var r=e.alternate;if((e.childLanes&n)!==n?(e.childLanes|=n,null!==r&&(r.childLanes|=n)):null!==r&&(r.childLanes&n)!==n&&(r.childLanes|=n),e===t)break;e=e.return}}function Pa(e,n){Sa=e,Ea=Na=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!==(e.lanes&n)&&(bi=!0),e.firstContext=null)}function za(e){var n=e._currentValue;if(Ea!==e)if(e={context:e,memoizedValue:n,next:null},null===Na){if(null===Sa)throw Error(a(308));Na=e,Sa.dependencies={lanes:0,firstContext:e}}else Na=Na.next=e;return n}var Ta=null;function La(e){null===Ta?Ta=[e]:Ta.push(e)}function Oa(e,n,t,r){var l=n.interleaved;return null===l?(t.next=t,La(n)):(t.next=l.next,l.next=t),n.interleaved=t,Ra(e,r)}function Ra(e,n){e.lanes|=n;var t=e.alternate;for(null!==t&&(t.lanes|=n),t=e,e=e.return;null!==e;)e.childLanes|=n,null!==(t=e.alternate)&&(t.childLanes|=n),t=e,e=e.return;return 3===t.tag?t.stateNode:null}var Ma=!1;function Da(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Fa(e,n){e=e.updateQueue,n.updateQueue===e&&(n.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Ia(e,n){return{eventTime:e,lane:n,tag:0,payload:null,callback:null,next:null}}function Ua(e,n,t){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&ju)){var l=r.pending;return null===l?n.next=n:(n.next=l.next,l.next=n),r.pending=n,Ra(e,t)}return null===(l=r.interleaved)?(n.next=n,La(r)):(n.next=l.next,l.next=n),r.interleaved=n,Ra(e,t)}function Aa(e,n,t){if(null!==(n=n.updateQueue)&&(n=n.shared,0!==(4194240&t))){var r=n.lanes;t|=r&=e.pendingLanes,n.lanes=t,bn(e,t)}}function Va(e,n){var t=e.updateQueue,r=e.alternate;if(null!==r&&t===(r=r.updateQueue)){var l=null,a=null;if(null!==(t=t.firstBaseUpdate)){do{var o={eventTime:t.eventTime,lane:t.lane,tag:t.tag,payload:t.payload,callback:t.callback,next:null};null===a?l=a=o:a=a.next=o,t=t.next}while(null!==t);null===a?l=a=n:a=a.next=n}else l=a=n;return t={baseState:r.baseState,firstBaseUpdate:l,lastBaseUpdate:a,shared:r.shared,effects:r.effects},void(e.updateQueue=t)}null===(e=t.lastBaseUpdate)?t.firstBaseUpdate=n:e.next=n,t.lastBaseUpdate=n}function $a(e,n,t,r){var l=e.updateQueue;Ma=!1;var a=l.firstBaseUpdate,o=l.lastBaseUpdate,i=l.shared.pending;if(null!==i){l.shared.pending=null;var u=i,s=u.next;u.next=null,null===o?a=s:o.next=s,o=u;var c=e.alternate;null!==c&&((i=(c=c.updateQueue).lastBaseUpdate)!==o&&(null===i?c.firstBaseUpdate=s:i.next=s,c.lastBaseUpdate=u))}if(null!==a){var d=l.baseState;for(o=0,c=s=u=null,i=a;;){var f=i.lane,p=i.eventTime;if((r&f)===f){null!==c&&(c=c.next={eventTime:p,lane:0,tag:i.tag,payload:i.payload,callback:i.callback,next:null});e:{var m=e,h=i;switch(f=n,p=t,h.tag){case 1:if("function"===typeof(m=h.payload)){d=m.call(p,d,f);break e}d=m;break e;case 3:m.flags=-65537&m.flags|128;case 0:if(null===(f="function"===typeof(m=h.payload)?m.call(p,d,f):m)||void 0===f)break e;d=F({},d,f);break e;case 2:Ma=!0}}null!==i.callback&&0!==i.lane&&(e.flags|=64,null===(f=l.effects)?l.effects=[i]:f.push(i))}else p={eventTime:p,lane:f,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===c?(s=c=p,u=d):c=c.next=p,o|=f;if(null===(i=i.next)){if(null===(i=l.shared.pending))break;i=(f=i).next,f.next=null,l.lastBaseUpdate=f,l.shared.pending=null}}if(null===c&&(u=d),l.baseState=u,l.firstBaseUpdate=s,l.lastBaseUpdate=c,null!==(n=l.shared.interleaved)){l=n;do{o|=l.lane,l=l.next}while(l!==n)}else null===a&&(l.shared.lanes=0);Du|=o,e.lanes=o,e.memoizedState=d}}function Wa(e,n,t){if(e=n.effects,n.effects=null,null!==e)for(n=0;n<e.length;n++){var r=e[n],l=r.callback;if(null!==l){if(r.callback=null,r=t,"function"!==typeof l)throw Error(a(191,l));l.call(r)}}}var Ba={},Ha=Nl(Ba),Qa=Nl(Ba),qa=Nl(Ba);function Ka(e){if(e===Ba)throw Error(a(174));return e}function Ya(e,n){switch(Cl(qa,n),Cl(Qa,e),Cl(Ha,Ba),e=n.nodeType){case 9:case 11:n=(n=n.documentElement)?n.namespaceURI:ue(null,"");break;default:n=ue(n=(e=8===e?n.parentNode:n).namespaceURI||null,e=e.tagName)}El(Ha),Cl(Ha,n)}function Xa(){El(Ha),El(Qa),El(qa)}function Ga(e){Ka(qa.current);var n=Ka(Ha.current),t=ue(n,e.type);n!==t&&(Cl(Qa,e),Cl(Ha,t))}function Za(e){Qa.current===e&&(El(Ha),El(Qa))}var Ja=Nl(0);function eo(e){for(var n=e;null!==n;){if(13===n.tag){var t=n.memoizedState;if(null!==t&&(null===(t=t.dehydrated)||"$?"===t.data||"$!"===t.data))return n}else if(19===n.tag&&void 0!==n.memoizedProps.revealOrder){if(0!==(128&n.flags))return n}else if(null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return null;n=n.return}n.sibling.return=n.return,n=n.sibling}return null}var no=[];function to(){for(var e=0;e<no.length;e++)no[e]._workInProgressVersionPrimary=null;no.length=0}var ro=x.ReactCurrentDispatcher,lo=x.ReactCurrentBatchConfig,ao=0,oo=null,io=null,uo=null,so=!1,co=!1,fo=0,po=0;function mo(){throw Error(a(321))}function ho(e,n){if(null===n)return!1;for(var t=0;t<n.length&&t<e.length;t++)if(!ir(e[t],n[t]))return!1;return!0}function go(e,n,t,r,l,o){if(ao=o,oo=n,n.memoizedState=null,n.updateQueue=null,n.lanes=0,ro.current=null===e||null===e.memoizedState?Jo:ei,e=t(r,l),co){o=0;do{if(co=!1,fo=0,25<=o)throw Error(a(301));o+=1,uo=io=null,n.updateQueue=null,ro.current=ni,e=t(r,l)}while(co)}if(ro.current=Zo,n=null!==io&&null!==io.next,ao=0,uo=io=oo=null,so=!1,n)throw Error(a(300));return e}function vo(){var e=0!==fo;return fo=0,e}function yo(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===uo?oo.memoizedState=uo=e:uo=uo.next=e,uo}function bo(){if(null===io){var e=oo.alternate;e=null!==e?e.memoizedState:null}else e=io.next;var n=null===uo?oo.memoizedState:uo.next;if(null!==n)uo=n,io=e;else{if(null===e)throw Error(a(310));e={memoizedState:(io=e).memoizedState,baseState:io.baseState,baseQueue:io.baseQueue,queue:io.queue,next:null},null===uo?oo.memoizedState=uo=e:uo=uo.next=e}return uo}function xo(e,n){return"function"===typeof n?n(e):n}function wo(e){var n=bo(),t=n.queue;if(null===t)throw Error(a(311));t.lastRenderedReducer=e;var r=io,l=r.baseQueue,o=t.pending;if(null!==o){if(null!==l){var i=l.next;l.next=o.next,o.next=i}r.baseQueue=l=o,t.pending=null}if(null!==l){o=l.next,r=r.baseState;var u=i=null,s=null,c=o;do{var d=c.lane;if((ao&d)===d)null!==s&&(s=s.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var f={lane:d,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};null===s?(u=s=f,i=r):s=s.next=f,oo.lanes|=d,Du|=d}c=c.next}while(null!==c&&c!==o);null===s?i=r:s.next=u,ir(r,n.memoizedState)||(bi=!0),n.memoizedState=r,n.baseState=i,n.baseQueue=s,t.lastRenderedState=r}if(null!==(e=t.interleaved)){l=e;do{o=l.lane,oo.lanes|=o,Du|=o,l=l.next}while(l!==e)}else null===l&&(t.lanes=0);return[n.memoizedState,t.dispatch]}function ko(e){var n=bo(),t=n.queue;if(null===t)throw Error(a(311));t.lastRenderedReducer=e;var r=t.dispatch,l=t.pending,o=n.memoizedState;if(null!==l){t.pending=null;var i=l=l.next;do{o=e(o,i.action),i=i.next}while(i!==l);ir(o,n.memoizedState)||(bi=!0),n.memoizedState=o,null===n.baseQueue&&(n.baseState=o),t.lastRenderedState=o}return[o,r]}function So(){}function No(e,n){var t=oo,r=bo(),l=n(),o=!ir(r.memoizedState,l);if(o&&(r.memoizedState=l,bi=!0),r=r.queue,Do(_o.bind(null,t,r,e),[e]),r.getSnapshot!==n||o||null!==uo&&1&uo.memoizedState.tag){if(t.flags|=2048,To(9,Co.bind(null,t,r,l,n),void 0,null),null===Pu)throw Error(a(349));0!==(30&ao)||Eo(t,n,l)}return l}function Eo(e,n,t){e.flags|=16384,e={getSnapshot:n,value:t},null===(n=oo.updateQueue)?(n={lastEffect:null,stores:null},oo.updateQueue=n,n.stores=[e]):null===(t=n.stores)?n.stores=[e]:t.push(e)}function Co(e,n,t,r){n.value=t,n.getSnapshot=r,jo(n)&&Po(e)}function _o(e,n,t){return t(function(){jo(n)&&Po(e)})}function jo(e){var n=e.getSnapshot;e=e.value;try{var t=n();return!ir(e,t)}catch(r){return!0}}function Po(e){var n=Ra(e,1);null!==n&&ts(n,e,1,-1)}function zo(e){var n=yo();return"function"===typeof e&&(e=e()),n.memoizedState=n.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:xo,lastRenderedState:e},n.queue=e,e=e.dispatch=Ko.bind(null,oo,e),[n.memoizedState,e]}function To(e,n,t,r){return e={tag:e,create:n,destroy:t,deps:r,next:null},null===(n=oo.updateQueue)?(n={lastEffect:null,stores:null},oo.updateQueue=n,n.lastEffect=e.next=e):null===(t=n.lastEffect)?n.lastEffect=e.next=e:(r=t.next,t.next=e,e.next=r,n.lastEffect=e),e}function Lo(){return bo().memoizedState}function Oo(e,n,t,r){var l=yo();oo.flags|=e,l.memoizedState=To(1|n,t,void 0,void 0===r?null:r)}function Ro(e,n,t,r){var l=bo();r=void 0===r?null:r;var a=void 0;if(null!==io){var o=io.memoizedState;if(a=o.destroy,null!==r&&ho(r,o.deps))return void(l.memoizedState=To(n,t,a,r))}oo.flags|=e,l.memoizedState=To(1|n,t,a,r)}function Mo(e,n){return Oo(8390656,8,e,n)}function Do(e,n){return Ro(2048,8,e,n)}function Fo(e,n){return Ro(4,2,e,n)}function Io(e,n){return Ro(4,4,e,n)}function Uo(e,n){return"function"===typeof n?(e=e(),n(e),function(){n(null)}):null!==n&&void 0!==n?(e=e(),n.current=e,function(){n.current=null}):void 0}function Ao(e,n,t){return t=null!==t&&void 0!==t?t.concat([e]):null,Ro(4,4,Uo.bind(null,n,e),t)}function Vo(){}function $o(e,n){var t=bo();n=void 0===n?null:n;var r=t.memoizedState;return null!==r&&null!==n&&ho(n,r[1])?r[0]:(t.memoizedState=[e,n],e)}function Wo(e,n){var t=bo();n=void 0===n?null:n;var r=t.memoizedState;return null!==r&&null!==n&&ho(n,r[1])?r[0]:(e=e(),t.memoizedState=[e,n],e)}function Bo(e,n,t){return 0===(21&ao)?(e.baseState&&(e.baseState=!1,bi=!0),e.memoizedState=t):(ir(t,n)||(t=gn(),oo.lanes|=t,Du|=t,e.baseState=!0),n)}function Ho(e,n){var t=xn;xn=0!==t&&4>t?t:4,e(!0);var r=lo.transition;lo.transition={};try{e(!1),n()}finally{xn=t,lo.transition=r}}function Qo(){return bo().memoizedState}function qo(e,n,t){var r=ns(e);if(t={lane:r,action:t,hasEagerState:!1,eagerState:null,next:null},Yo(e))Xo(n,t);else if(null!==(t=Oa(e,n,t,r))){ts(t,e,r,es()),Go(t,n,r)}}function Ko(e,n,t){var r=ns(e),l={lane:r,action:t,hasEagerState:!1,eagerState:null,next:null};if(Yo(e))Xo(n,l);else{var a=e.alternate;if(0===e.lanes&&(null===a||0===a.lanes)&&null!==(a=n.lastRenderedReducer))try{var o=n.lastRenderedState,i=a(o,t);if(l.hasEagerState=!0,l.eagerState=i,ir(i,o)){var u=n.interleaved;return null===u?(l.next=l,La(n)):(l.next=u.next,u.next=l),void(n.interleaved=l)}}catch(s){}null!==(t=Oa(e,n,l,r))&&(ts(t,e,r,l=es()),Go(t,n,r))}}function Yo(e){var n=e.alternate;return e===oo||null!==n&&n===oo}function Xo(e,n){co=so=!0;var t=e.pending;null===t?n.next=n:(n.next=t.next,t.next=n),e.pending=n}function Go(e,n,t){if(0!==(4194240&t)){var r=n.lanes;t|=r&=e.pendingLanes,n.lanes=t,bn(e,t)}}var Zo={readContext:za,useCallback:mo,useContext:mo,useEffect:mo,useImperativeHandle:mo,useInsertionEffect:mo,useLayoutEffect:mo,useMemo:mo,useReducer:mo,useRef:mo,useState:mo,useDebugValue:mo,useDeferredValue:mo,useTransition:mo,useMutableSource:mo,useSyncExternalStore:mo,useId:mo,unstable_isNewReconciler:!1},Jo={readContext:za,useCallback:function(e,n){return yo().memoizedState=[e,void 0===n?null:n],e},useContext:za,useEffect:Mo,useImperativeHandle:function(e,n,t){return t=null!==t&&void 0!==t?t.concat([e]):null,Oo(4194308,4,Uo.bind(null,n,e),t)},useLayoutEffect:function(e,n){return Oo(4194308,4,e,n)},useInsertionEffect:function(e,n){return Oo(4,2,e,n)},useMemo:function(e,n){var t=yo();return n=void 0===n?null:n,e=e(),t.memoizedState=[e,n],e},useReducer:function(e,n,t){var r=yo();return n=void 0!==t?t(n):n,r.memoizedState=r.baseState=n,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:n},r.queue=e,e=e.dispatch=qo.bind(null,oo,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},yo().memoizedState=e},useState:zo,useDebugValue:Vo,useDeferredValue:function(e){return yo().memoizedState=e},useTransition:function(){var e=zo(!1),n=e[0];return e=Ho.bind(null,e[1]),yo().memoizedState=e,[n,e]},useMutableSource:function(){},useSyncExternalStore:function(e,n,t){var r=oo,l=yo();if(la){if(void 0===t)throw Error(a(407));t=t()}else{if(t=n(),null===Pu)throw Error(a(349));0!==(30&ao)||Eo(r,n,t)}l.memoizedState=t;var o={value:t,getSnapshot:n};return l.queue=o,Mo(_o.bind(null,r,o,e),[e]),r.flags|=2048,To(9,Co.bind(null,r,o,t,n),void 0,null),t},useId:function(){var e=yo(),n=Pu.identifierPrefix;if(la){var t=Gl;n=":"+n+"R"+(t=(Xl&~(1<<32-on(Xl)-1)).toString(32)+t),0<(t=fo++)&&(n+="H"+t.toString(32)),n+=":"}else n=":"+n+"r"+(t=po++).toString(32)+":";return e.memoizedState=n},unstable_isNewReconciler:!1},ei={readContext:za,useCallback:$o,useContext:za,useEffect:Do,useImperativeHandle:Ao,useInsertionEffect:Fo,useLayoutEffect:Io,useMemo:Wo,useReducer:wo,useRef:Lo,useState:function(){return wo(xo)},useDebugValue:Vo,useDeferredValue:function(e){return Bo(bo(),io.memoizedState,e)},useTransition:function(){return[wo(xo)[0],bo().memoizedState]},useMutableSource:So,useSyncExternalStore:No,useId:Qo,unstable_isNewReconciler:!1},ni={readContext:za,useCallback:$o,useContext:za,useEffect:Do,useImperativeHandle:Ao,useInsertionEffect:Fo,useLayoutEffect:Io,useMemo:Wo,useReducer:ko,useRef:Lo,useState:function(){return ko(xo)},useDebugValue:Vo,useDeferredValue:function(e){var n=bo();return null===io?n.memoizedState=e:Bo(n,io.memoizedState,e)},useTransition:function(){return[ko(xo)[0],bo().memoizedState]},useMutableSource:So,useSyncExternalStore:No,useId:Qo,unstable_isNewReconciler:!1};function ti(e,n){if(e&&e.defaultProps){for(var t in n=F({},n),e=e.defaultProps)void 0===n[t]&&(n[t]=e[t]);return n}return n}function ri(e,n,t,r){t=null===(t=t(r,n=e.memoizedState))||void 0===t?n:F({},n,t),e.memoizedState=t,0===e.lanes&&(e.updateQueue.baseState=t)}var li={isMounted:function(e){return!!(e=e._reactInternals)&&$e(e)===e},enqueueSetState:function(e,n,t){e=e._reactInternals;var r=es(),l=ns(e),a=Ia(r,l);a.payload=n,void 0!==t&&null!==t&&(a.callback=t),null!==(n=Ua(e,a,l))&&(ts(n,e,l,r),Aa(n,e,l))},enqueueReplaceState:function(e,n,t){e=e._reactInternals;var r=es(),l=ns(e),a=Ia(r,l);a.tag=1,a.payload=n,void 0!==t&&null!==t&&(a.callback=t),null!==(n=Ua(e,a,l))&&(ts(n,e,l,r),Aa(n,e,l))},enqueueForceUpdate:function(e,n){e=e._reactInternals;var t=es(),r=ns(e),l=Ia(t,r);l.tag=2,void 0!==n&&null!==n&&(l.callback=n),null!==(n=Ua(e,l,r))&&(ts(n,e,r,t),Aa(n,e,r))}};function ai(e,n,t,r,l,a,o){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,a,o):!n.prototype||!n.prototype.isPureReactComponent||(!ur(t,r)||!ur(l,a))}function oi(e,n,t){var r=!1,l=_l,a=n.contextType;return"object"===typeof a&&null!==a?a=za(a):(l=Ll(n)?zl:jl.current,a=(r=null!==(r=n.contextTypes)&&void 0!==r)?Tl(e,l):_l),n=new n(t,a),e.memoizedState=null!==n.state&&void 0!==n.state?n.state:null,n.updater=li,e.stateNode=n,n._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=l,e.__reactInternalMemoizedMaskedChildContext=a),n}function ii(e,n,t,r){e=n.state,"function"===typeof n.componentWillReceiveProps&&n.componentWillReceiveProps(t,r),"function"===typeof n.UNSAFE_componentWillReceiveProps&&n.UNSAFE_componentWillReceiveProps(t,r),n.state!==e&&li.enqueueReplaceState(n,n.state,null)}function ui(e,n,t,r){var l=e.stateNode;l.props=t,l.state=e.memoizedState,l.refs={},Da(e);var a=n.contextType;"object"===typeof a&&null!==a?l.context=za(a):(a=Ll(n)?zl:jl.current,l.context=Tl(e,a)),l.state=e.memoizedState,"function"===typeof(a=n.getDerivedStateFromProps)&&(ri(e,n,a,t),l.state=e.memoizedState),"function"===typeof n.getDerivedStateFromProps||"function"===typeof l.getSnapshotBeforeUpdate||"function"!==typeof l.UNSAFE_componentWillMount&&"function"!==typeof l.componentWillMount||(n=l.state,"function"===typeof l.componentWillMount&&l.componentWillMount(),"function"===typeof l.UNSAFE_componentWillMount&&l.UNSAFE_componentWillMount(),n!==l.state&&li.enqueueReplaceState(l,l.state,null),$a(e,t,l,r),l.state=e.memoizedState),"function"===typeof l.componentDidMount&&(e.flags|=4194308)}function si(e,n){try{var t="",r=n;do{t+=V(r),r=r.return}while(r);var l=t}catch(a){l="\nError generating stack: "+a.message+"\n"+a.stack}return{value:e,source:n,stack:l,digest:null}}function ci(e,n,t){return{value:e,source:null,stack:null!=t?t:null,digest:null!=n?n:null}}function di(e,n){try{console.error(n.value)}catch(t){setTimeout(function(){throw t})}}var fi="function"===typeof WeakMap?WeakMap:Map;function pi(e,n,t){(t=Ia(-1,t)).tag=3,t.payload={element:null};var r=n.value;return t.callback=function(){Bu||(Bu=!0,Hu=r),di(0,n)},t}function mi(e,n,t){(t=Ia(-1,t)).tag=3;var r=e.type.getDerivedStateFromError;if("function"===typeof r){var l=n.value;t.payload=function(){return r(l)},t.callback=function(){di(0,n)}}var a=e.stateNode;return null!==a&&"function"===typeof a.componentDidCatch&&(t.callback=function(){di(0,n),"function"!==typeof r&&(null===Qu?Qu=new Set([this]):Qu.add(this));var e=n.stack;this.componentDidCatch(n.value,{componentStack:null!==e?e:""})}),t}function hi(e,n,t){var r=e.pingCache;if(null===r){r=e.pingCache=new fi;var l=new Set;r.set(n,l)}else void 0===(l=r.get(n))&&(l=new Set,r.set(n,l));l.has(t)||(l.add(t),e=Es.bind(null,e,n,t),n.then(e,e))}function gi(e){do{var n;if((n=13===e.tag)&&(n=null===(n=e.memoizedState)||null!==n.dehydrated),n)return e;e=e.return}while(null!==e);return null}function vi(e,n,t,r,l){return 0===(1&e.mode)?(e===n?e.flags|=65536:(e.flags|=128,t.flags|=131072,t.flags&=-52805,1===t.tag&&(null===t.alternate?t.tag=17:((n=Ia(-1,1)).tag=2,Ua(t,n,1))),t.lanes|=1),e):(e.flags|=65536,e.lanes=l,e)}var yi=x.ReactCurrentOwner,bi=!1;function xi(e,n,t,r){n.child=null===e?wa(n,null,t,r):xa(n,e.child,t,r)}function wi(e,n,t,r,l){t=t.render;var a=n.ref;return Pa(n,l),r=go(e,n,t,r,a,l),t=vo(),null===e||bi?(la&&t&&ea(n),n.flags|=1,xi(e,n,r,l),n.child):(n.updateQueue=e.updateQueue,n.flags&=-2053,e.lanes&=~l,Bi(e,n,l))}function ki(e,n,t,r,l){if(null===e){var a=t.type;return"function"!==typeof a||Ls(a)||void 0!==a.defaultProps||null!==t.compare||void 0!==t.defaultProps?((e=Rs(t.type,null,r,n,n.mode,l)).ref=n.ref,e.return=n,n.child=e):(n.tag=15,n.type=a,Si(e,n,a,r,l))}if(a=e.child,0===(e.lanes&l)){var o=a.memoizedProps;if((t=null!==(t=t.compare)?t:ur)(o,r)&&e.ref===n.ref)return Bi(e,n,l)}return n.flags|=1,(e=Os(a,r)).ref=n.ref,e.return=n,n.child=e}function Si(e,n,t,r,l){if(null!==e){var a=e.memoizedProps;if(ur(a,r)&&e.ref===n.ref){if(bi=!1,n.pendingProps=r=a,0===(e.lanes&l))return n.lanes=e.lanes,Bi(e,n,l);0!==(131072&e.flags)&&(bi=!0)}}return Ci(e,n,t,r,l)}function Ni(e,n,t){var r=n.pendingProps,l=r.children,a=null!==e?e.memoizedState:null;if("hidden"===r.mode)if(0===(1&n.mode))n.memoizedState={baseLanes:0,cachePool:null,transitions:null},Cl(Ou,Lu),Lu|=t;else{if(0===(1073741824&t))return e=null!==a?a.baseLanes|t:t,n.lanes=n.childLanes=1073741824,n.memoizedState={baseLanes:e,cachePool:null,transitions:null},n.updateQueue=null,Cl(Ou,Lu),Lu|=e,null;n.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==a?a.baseLanes:t,Cl(Ou,Lu),Lu|=r}else null!==a?(r=a.baseLanes|t,n.memoizedState=null):r=t,Cl(Ou,Lu),Lu|=r;return xi(e,n,l,t),n.child}function Ei(e,n){var t=n.ref;(null===e&&null!==t||null!==e&&e.ref!==t)&&(n.flags|=512,n.flags|=2097152)}function Ci(e,n,t,r,l){var a=Ll(t)?zl:jl.current;return a=Tl(n,a),Pa(n,l),t=go(e,n,t,r,a,l),r=vo(),null===e||bi?(la&&r&&ea(n),n.flags|=1,xi(e,n,t,l),n.child):(n.updateQueue=e.updateQueue,n.flags&=-2053,e.lanes&=~l,Bi(e,n,l))}function _i(e,n,t,r,l){if(Ll(t)){var a=!0;Dl(n)}else a=!1;if(Pa(n,l),null===n.stateNode)Wi(e,n),oi(n,t,r),ui(n,t,r,l),r=!0;else if(null===e){var o=n.stateNode,i=n.memoizedProps;o.props=i;var u=o.context,s=t.contextType;"object"===typeof s&&null!==s?s=za(s):s=Tl(n,s=Ll(t)?zl:jl.current);var c=t.getDerivedStateFromProps,d="function"===typeof c||"function"===typeof o.getSnapshotBeforeUpdate;d||"function"!==typeof o.UNSAFE_componentWillReceiveProps&&"function"!==typeof o.componentWillReceiveProps||(i!==r||u!==s)&&ii(n,o,r,s),Ma=!1;var f=n.memoizedState;o.state=f,$a(n,r,o,l),u=n.memoizedState,i!==r||f!==u||Pl.current||Ma?("function"===typeof c&&(ri(n,t,c,r),u=n.memoizedState),(i=Ma||ai(n,t,i,r,f,u,s))?(d||"function"!==typeof o.UNSAFE_componentWillMount&&"function"!==typeof o.componentWillMount||("function"===typeof o.componentWillMount&&o.componentWillMount(),"function"===typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount()),"function"===typeof o.componentDidMount&&(n.flags|=4194308)):("function"===typeof o.componentDidMount&&(n.flags|=4194308),n.memoizedProps=r,n.memoizedState=u),o.props=r,o.state=u,o.context=s,r=i):("function"===typeof o.componentDidMount&&(n.flags|=4194308),r=!1)}else{o=n.stateNode,Fa(e,n),i=n.memoizedProps,s=n.type===n.elementType?i:ti(n.type,i),o.props=s,d=n.pendingProps,f=o.context,"object"===typeof(u=t.contextType)&&null!==u?u=za(u):u=Tl(n,u=Ll(t)?zl:jl.current);var p=t.getDerivedStateFromProps;(c="function"===typeof p||"function"===typeof o.getSnapshotBeforeUpdate)||"function"!==typeof o.UNSAFE_componentWillReceiveProps&&"function"!==typeof o.componentWillReceiveProps||(i!==d||f!==u)&&ii(n,o,r,u),Ma=!1,f=n.memoizedState,o.state=f,$a(n,r,o,l);var m=n.memoizedState;i!==d||f!==m||Pl.current||Ma?("function"===typeof p&&(ri(n,t,p,r),m=n.memoizedState),(s=Ma||ai(n,t,s,r,f,m,u)||!1)?(c||"function"!==typeof o.UNSAFE_componentWillUpdate&&"function"!==typeof o.componentWillUpdate||("function"===typeof o.componentWillUpdate&&o.componentWillUpdate(r,m,u),"function"===typeof o.UNSAFE_componentWillUpdate&&o.UNSAFE_componentWillUpdate(r,m,u)),"function"===typeof o.componentDidUpdate&&(n.flags|=4),"function"===typeof o.getSnapshotBeforeUpdate&&(n.flags|=1024)):("function"!==typeof o.componentDidUpdate||i===e.memoizedProps&&f===e.memoizedState||(n.flags|=4),"function"!==typeof o.getSnapshotBeforeUpdate||i===e.memoizedProps&&f===e.memoizedState||(n.flags|=1024),n.memoizedProps=r,n.memoizedState=m),o.props=r,o.state=m,o.context=u,r=s):("function"!==typeof o.componentDidUpdate||i===e.memoizedProps&&f===e.memoizedState||(n.flags|=4),"function"!==typeof o.getSnapshotBeforeUpdate||i===e.memoizedProps&&f===e.memoizedState||(n.flags|=1024),r=!1)}return ji(e,n,t,r,a,l)}function ji(e,n,t,r,l,a){Ei(e,n);var o=0!==(128&n.flags);if(!r&&!o)return l&&Fl(n,t,!1),Bi(e,n,a);r=n.stateNode,yi.current=n;var i=o&&"function"!==typeof t.getDerivedStateFromError?null:r.render();return n.flags|=1,null!==e&&o?(n.child=xa(n,e.child,null,a),n.child=xa(n,null,i,a)):xi(e,n,i,a),n.memoizedState=r.state,l&&Fl(n,t,!0),n.child}function Pi(e){var n=e.stateNode;n.pendingContext?Rl(0,n.pendingContext,n.pendingContext!==n.context):n.context&&Rl(0,n.context,!1),Ya(e,n.containerInfo)}function zi(e,n,t,r,l){return pa(),ma(l),n.flags|=256,xi(e,n,t,r),n.child}var Ti,Li,Oi,Ri,Mi={dehydrated:null,treeContext:null,retryLane:0};function Di(e){return{baseLanes:e,cachePool:null,transitions:null}}function Fi(e,n,t){var r,l=n.pendingProps,o=Ja.current,i=!1,u=0!==(128&n.flags);if((r=u)||(r=(null===e||null!==e.memoizedState)&&0!==(2&o)),r?(i=!0,n.flags&=-129):null!==e&&null===e.memoizedState||(o|=1),Cl(Ja,1&o),null===e)return sa(n),null!==(e=n.memoizedState)&&null!==(e=e.dehydrated)?(0===(1&n.mode)?n.lanes=1:"$!"===e.data?n.lanes=8:n.lanes=1073741824,null):(u=l.children,e=l.fallback,i?(l=n.mode,i=n.child,u={mode:"hidden",children:u},0===(1&l)&&null!==i?(i.childLanes=0,i.pendingProps=u):i=Ds(u,l,0,null),e=Ms(e,l,t,null),i.return=n,e.return=n,i.sibling=e,n.child=i,n.child.memoizedState=Di(t),n.memoizedState=Mi,e):Ii(n,u));if(null!==(o=e.memoizedState)&&null!==(r=o.dehydrated))return function(e,n,t,r,l,o,i){if(t)return 256&n.flags?(n.flags&=-257,Ui(e,n,i,r=ci(Error(a(422))))):null!==n.memoizedState?(n.child=e.child,n.flags|=128,null):(o=r.fallback,l=n.mode,r=Ds({mode:"visible",children:r.children},l,0,null),(o=Ms(o,l,i,null)).flags|=2,r.return=n,o.return=n,r.sibling=o,n.child=r,0!==(1&n.mode)&&xa(n,e.child,null,i),n.child.memoizedState=Di(i),n.memoizedState=Mi,o);if(0===(1&n.mode))return Ui(e,n,i,null);if("$!"===l.data){if(r=l.nextSibling&&l.nextSibling.dataset)var u=r.dgst;return r=u,Ui(e,n,i,r=ci(o=Error(a(419)),r,void 0))}if(u=0!==(i&e.childLanes),bi||u){if(null!==(r=Pu)){switch(i&-i){case 4:l=2;break;case 16:l=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:l=32;break;case 536870912:l=268435456;break;default:l=0}0!==(l=0!==(l&(r.suspendedLanes|i))?0:l)&&l!==o.retryLane&&(o.retryLane=l,Ra(e,l),ts(r,e,l,-1))}return hs(),Ui(e,n,i,r=ci(Error(a(421))))}return"$?"===l.data?(n.flags|=128,n.child=e.child,n=_s.bind(null,e),l._reactRetry=n,null):(e=o.treeContext,ra=sl(l.nextSibling),ta=n,la=!0,aa=null,null!==e&&(ql[Kl++]=Xl,ql[Kl++]=Gl,ql[Kl++]=Yl,Xl=e.id,Gl=e.overflow,Yl=n),n=Ii(n,r.children),n.flags|=4096,n)}(e,n,u,l,r,o,t);if(i){i=l.fallback,u=n.mode,r=(o=e.child).sibling;var s={mode:"hidden",children:l.children};return 0===(1&u)&&n.child!==o?((l=n.child).childLanes=0,l.pendingProps=s,n.deletions=null):(l=Os(o,s)).subtreeFlags=14680064&o.subtreeFlags,null!==r?i=Os(r,i):(i=Ms(i,u,t,null)).flags|=2,i.return=n,l.return=n,l.sibling=i,n.child=l,l=i,i=n.child,u=null===(u=e.child.memoizedState)?Di(t):{baseLanes:u.baseLanes|t,cachePool:null,transitions:u.transitions},i.memoizedState=u,i.childLanes=e.childLanes&~t,n.memoizedState=Mi,l}return e=(i=e.child).sibling,l=Os(i,{mode:"visible",children:l.children}),0===(1&n.mode)&&(l.lanes=t),l.return=n,l.sibling=null,null!==e&&(null===(t=n.deletions)?(n.deletions=[e],n.flags|=16):t.push(e)),n.child=l,n.memoizedState=null,l}function Ii(e,n){return(n=Ds({mode:"visible",children:n},e.mode,0,null)).return=e,e.child=n}function Ui(e,n,t,r){return null!==r&&ma(r),xa(n,e.child,null,t),(e=Ii(n,n.pendingProps.children)).flags|=2,n.memoizedState=null,e}function Ai(e,n,t){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n),ja(e.return,n,t)}function Vi(e,n,t,r,l){var a=e.memoizedState;null===a?e.memoizedState={isBackwards:n,rendering:null,renderingStartTime:0,last:r,tail:t,tailMode:l}:(a.isBackwards=n,a.rendering=null,a.renderingStartTime=0,a.last=r,a.tail=t,a.tailMode=l)}function $i(e,n,t){var r=n.pendingProps,l=r.revealOrder,a=r.tail;if(xi(e,n,r.children,t),0!==(2&(r=Ja.current)))r=1&r|2,n.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=n.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Ai(e,t,n);else if(19===e.tag)Ai(e,t,n);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===n)break e;for(;null===e.sibling;){if(null===e.return||e.return===n)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(Cl(Ja,r),0===(1&n.mode))n.memoizedState=null;else switch(l){case"forwards":for(t=n.child,l=null;null!==t;)null!==(e=t.alternate)&&null===eo(e)&&(l=t),t=t.sibling;null===(t=l)?(l=n.child,n.child=null):(l=t.sibling,t.sibling=null),Vi(n,!1,l,t,a);break;case"backwards":for(t=null,l=n.child,n.child=null;null!==l;){if(null!==(e=l.alternate)&&null===eo(e)){n.child=l;break}e=l.sibling,l.sibling=t,t=l,l=e}Vi(n,!0,t,null,a);break;case"together":Vi(n,!1,null,null,void 0);break;default:n.memoizedState=null}return n.child}function Wi(e,n){0===(1&n.mode)&&null!==e&&(e.alternate=null,n.alternate=null,n.flags|=2)}function Bi(e,n,t){if(null!==e&&(n.dependencies=e.dependencies),Du|=n.lanes,0===(t&n.childLanes))return null;if(null!==e&&n.child!==e.child)throw Error(a(153));if(null!==n.child){for(t=Os(e=n.child,e.pendingProps),n.child=t,t.return=n;null!==e.sibling;)e=e.sibling,(t=t.sibling=Os(e,e.pendingProps)).return=n;t.sibling=null}return n.child}function Hi(e,n){if(!la)switch(e.tailMode){case"hidden":n=e.tail;for(var t=null;null!==n;)null!==n.alternate&&(t=n),n=n.sibling;null===t?e.tail=null:t.sibling=null;break;case"collapsed":t=e.tail;for(var r=null;null!==t;)null!==t.alternate&&(r=t),t=t.sibling;null===r?n||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Qi(e){var n=null!==e.alternate&&e.alternate.child===e.child,t=0,r=0;if(n)for(var l=e.child;null!==l;)t|=l.lanes|l.childLanes,r|=14680064&l.subtreeFlags,r|=14680064&l.flags,l.return=e,l=l.sibling;else for(l=e.child;null!==l;)t|=l.lanes|l.childLanes,r|=l.subtreeFlags,r|=l.flags,l.return=e,l=l.sibling;return e.subtreeFlags|=r,e.childLanes=t,n}function qi(e,n,t){var r=n.pendingProps;switch(na(n),n.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Qi(n),null;case 1:case 17:return Ll(n.type)&&Ol(),Qi(n),null;case 3:return r=n.stateNode,Xa(),El(Pl),El(jl),to(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(da(n)?n.flags|=4:null===e||e.memoizedState.isDehydrated&&0===(256&n.flags)||(n.flags|=1024,null!==aa&&(os(aa),aa=null))),Li(e,n),Qi(n),null;case 5:Za(n);var l=Ka(qa.current);if(t=n.type,null!==e&&null!=n.stateNode)Oi(e,n,t,r,l),e.ref!==n.ref&&(n.flags|=512,n.flags|=2097152);else{if(!r){if(null===n.stateNode)throw Error(a(166));return Qi(n),null}if(e=Ka(Ha.current),da(n)){r=n.stateNode,t=n.type;var o=n.memoizedProps;switch(r[fl]=n,r[pl]=o,e=0!==(1&n.mode),t){case"dialog":Ur("cancel",r),Ur("close",r);break;case"iframe":case"object":case"embed":Ur("load",r);break;case"video":case"audio":for(l=0;l<Mr.length;l++)Ur(Mr[l],r);break;case"source":Ur("error",r);break;case"img":case"image":case"link":Ur("error",r),Ur("load",r);break;case"details":Ur("toggle",r);break;case"input":X(r,o),Ur("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!o.multiple},Ur("invalid",r);break;case"textarea":le(r,o),Ur("invalid",r)}for(var u in ye(t,o),l=null,o)if(o.hasOwnProperty(u)){var s=o[u];"children"===u?"string"===typeof s?r.textContent!==s&&(!0!==o.suppressHydrationWarning&&Zr(r.textContent,s,e),l=["children",s]):"number"===typeof s&&r.textContent!==""+s&&(!0!==o.suppressHydrationWarning&&Zr(r.textContent,s,e),l=["children",""+s]):i.hasOwnProperty(u)&&null!=s&&"onScroll"===u&&Ur("scroll",r)}switch(t){case"input":Q(r),J(r,o,!0);break;case"textarea":Q(r),oe(r);break;case"select":case"option":break;default:"function"===typeof o.onClick&&(r.onclick=Jr)}r=l,n.updateQueue=r,null!==r&&(n.flags|=4)}else{u=9===l.nodeType?l:l.ownerDocument,"http://www.w3.org/1999/xhtml"===e&&(e=ie(t)),"http://www.w3.org/1999/xhtml"===e?"script"===t?((e=u.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"===typeof r.is?e=u.createElement(t,{is:r.is}):(e=u.createElement(t),"select"===t&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,t),e[fl]=n,e[pl]=r,Ti(e,n,!1,!1),n.stateNode=e;e:{switch(u=be(t,r),t){case"dialog":Ur("cancel",e),Ur("close",e),l=r;break;case"iframe":case"object":case"embed":Ur("load",e),l=r;break;case"video":case"audio":for(l=0;l<Mr.length;l++)Ur(Mr[l],e);l=r;break;case"source":Ur("error",e),l=r;break;case"img":case"image":case"link":Ur("error",e),Ur("load",e),l=r;break;case"details":Ur("toggle",e),l=r;break;case"input":X(e,r),l=Y(e,r),Ur("invalid",e);break;case"option":default:l=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},l=F({},r,{value:void 0}),Ur("invalid",e);break;case"textarea":le(e,r),l=re(e,r),Ur("invalid",e)}for(o in ye(t,l),s=l)if(s.hasOwnProperty(o)){var c=s[o];"style"===o?ge(e,c):"dangerouslySetInnerHTML"===o?null!=(c=c?c.__html:void 0)&&de(e,c):"children"===o?"string"===typeof c?("textarea"!==t||""!==c)&&fe(e,c):"number"===typeof c&&fe(e,""+c):"suppressContentEditableWarning"!==o&&"suppressHydrationWarning"!==o&&"autoFocus"!==o&&(i.hasOwnProperty(o)?null!=c&&"onScroll"===o&&Ur("scroll",e):null!=c&&b(e,o,c,u))}switch(t){case"input":Q(e),J(e,r,!1);break;case"textarea":Q(e),oe(e);break;case"option":null!=r.value&&e.setAttribute("value",""+B(r.value));break;case"select":e.multiple=!!r.multiple,null!=(o=r.value)?te(e,!!r.multiple,o,!1):null!=r.defaultValue&&te(e,!!r.multiple,r.defaultValue,!0);break;default:"function"===typeof l.onClick&&(e.onclick=Jr)}switch(t){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(n.flags|=4)}null!==n.ref&&(n.flags|=512,n.flags|=2097152)}return Qi(n),null;case 6:if(e&&null!=n.stateNode)Ri(e,n,e.memoizedProps,r);else{if("string"!==typeof r&&null===n.stateNode)throw Error(a(166));if(t=Ka(qa.current),Ka(Ha.current),da(n)){if(r=n.stateNode,t=n.memoizedProps,r[fl]=n,(o=r.nodeValue!==t)&&null!==(e=ta))switch(e.tag){case 3:Zr(r.nodeValue,t,0!==(1&e.mode));break;case 5:!0!==e.memoizedProps.suppressHydrationWarning&&Zr(r.nodeValue,t,0!==(1&e.mode))}o&&(n.flags|=4)}else(r=(9===t.nodeType?t:t.ownerDocument).createTextNode(r))[fl]=n,n.stateNode=r}return Qi(n),null;case 13:if(El(Ja),r=n.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(la&&null!==ra&&0!==(1&n.mode)&&0===(128&n.flags))fa(),pa(),n.flags|=98560,o=!1;else if(o=da(n),null!==r&&null!==r.dehydrated){if(null===e){if(!o)throw Error(a(318));if(!(o=null!==(o=n.memoizedState)?o.dehydrated:null))throw Error(a(317));o[fl]=n}else pa(),0===(128&n.flags)&&(n.memoizedState=null),n.flags|=4;Qi(n),o=!1}else null!==aa&&(os(aa),aa=null),o=!0;if(!o)return 65536&n.flags?n:null}return 0!==(128&n.flags)?(n.lanes=t,n):((r=null!==r)!==(null!==e&&null!==e.memoizedState)&&r&&(n.child.flags|=8192,0!==(1&n.mode)&&(null===e||0!==(1&Ja.current)?0===Ru&&(Ru=3):hs())),null!==n.updateQueue&&(n.flags|=4),Qi(n),null);case 4:return Xa(),Li(e,n),null===e&&$r(n.stateNode.containerInfo),Qi(n),null;case 10:return _a(n.type._context),Qi(n),null;case 19:if(El(Ja),null===(o=n.memoizedState))return Qi(n),null;if(r=0!==(128&n.flags),null===(u=o.rendering))if(r)Hi(o,!1);else{if(0!==Ru||null!==e&&0!==(128&e.flags))for(e=n.child;null!==e;){if(null!==(u=eo(e))){for(n.flags|=128,Hi(o,!1),null!==(r=u.updateQueue)&&(n.updateQueue=r,n.flags|=4),n.subtreeFlags=0,r=t,t=n.child;null!==t;)e=r,(o=t).flags&=14680066,null===(u=o.alternate)?(o.childLanes=0,o.lanes=e,o.child=null,o.subtreeFlags=0,o.memoizedProps=null,o.memoizedState=null,o.updateQueue=null,o.dependencies=null,o.stateNode=null):(o.childLanes=u.childLanes,o.lanes=u.lanes,o.child=u.child,o.subtreeFlags=0,o.deletions=null,o.memoizedProps=u.memoizedProps,o.memoizedState=u.memoizedState,o.updateQueue=u.updateQueue,o.type=u.type,e=u.dependencies,o.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),t=t.sibling;return Cl(Ja,1&Ja.current|2),n.child}e=e.sibling}null!==o.tail&&Ge()>$u&&(n.flags|=128,r=!0,Hi(o,!1),n.lanes=4194304)}else{if(!r)if(null!==(e=eo(u))){if(n.flags|=128,r=!0,null!==(t=e.updateQueue)&&(n.updateQueue=t,n.flags|=4),Hi(o,!0),null===o.tail&&"hidden"===o.tailMode&&!u.alternate&&!la)return Qi(n),null}else 2*Ge()-o.renderingStartTime>$u&&1073741824!==t&&(n.flags|=128,r=!0,Hi(o,!1),n.lanes=4194304);o.isBackwards?(u.sibling=n.child,n.child=u):(null!==(t=o.last)?t.sibling=u:n.child=u,o.last=u)}return null!==o.tail?(n=o.tail,o.rendering=n,o.tail=n.sibling,o.renderingStartTime=Ge(),n.sibling=null,t=Ja.current,Cl(Ja,r?1&t|2:1&t),n):(Qi(n),null);case 22:case 23:return ds(),r=null!==n.memoizedState,null!==e&&null!==e.memoizedState!==r&&(n.flags|=8192),r&&0!==(1&n.mode)?0!==(1073741824&Lu)&&(Qi(n),6&n.subtreeFlags&&(n.flags|=8192)):Qi(n),null;case 24:case 25:return null}throw Error(a(156,n.tag))}function Ki(e,n){switch(na(n),n.tag){case 1:return Ll(n.type)&&Ol(),65536&(e=n.flags)?(n.flags=-65537&e|128,n):null;case 3:return Xa(),El(Pl),El(jl),to(),0!==(65536&(e=n.flags))&&0===(128&e)?(n.flags=-65537&e|128,n):null;case 5:return Za(n),null;case 13:if(El(Ja),null!==(e=n.memoizedState)&&null!==e.dehydrated){if(null===n.alternate)throw Error(a(340));pa()}return 65536&(e=n.flags)?(n.flags=-65537&e|128,n):null;case 19:return El(Ja),null;case 4:return Xa(),null;case 10:return _a(n.type._context),null;case 22:case 23:return ds(),null;default:return null}}Ti=function(e,n){for(var t=n.child;null!==t;){if(5===t.tag||6===t.tag)e.appendChild(t.stateNode);else if(4!==t.tag&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===n)break;for(;null===t.sibling;){if(null===t.return||t.return===n)return;t=t.return}t.sibling.return=t.return,t=t.sibling}},Li=function(){},Oi=function(e,n,t,r){var l=e.memoizedProps;if(l!==r){e=n.stateNode,Ka(Ha.current);var a,o=null;switch(t){case"input":l=Y(e,l),r=Y(e,r),o=[];break;case"select":l=F({},l,{value:void 0}),r=F({},r,{value:void 0}),o=[];break;case"textarea":l=re(e,l),r=re(e,r),o=[];break;default:"function"!==typeof l.onClick&&"function"===typeof r.onClick&&(e.onclick=Jr)}for(c in ye(t,r),t=null,l)if(!r.hasOwnProperty(c)&&l.hasOwnProperty(c)&&null!=l[c])if("style"===c){var u=l[c];for(a in u)u.hasOwnProperty(a)&&(t||(t={}),t[a]="")}else"dangerouslySetInnerHTML"!==c&&"children"!==c&&"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&"autoFocus"!==c&&(i.hasOwnProperty(c)?o||(o=[]):(o=o||[]).push(c,null));for(c in r){var s=r[c];if(u=null!=l?l[c]:void 0,r.hasOwnProperty(c)&&s!==u&&(null!=s||null!=u))if("style"===c)if(u){for(a in u)!u.hasOwnProperty(a)||s&&s.hasOwnProperty(a)||(t||(t={}),t[a]="");for(a in s)s.hasOwnProperty(a)&&u[a]!==s[a]&&(t||(t={}),t[a]=s[a])}else t||(o||(o=[]),o.push(c,t)),t=s;else"dangerouslySetInnerHTML"===c?(s=s?s.__html:void 0,u=u?u.__html:void 0,null!=s&&u!==s&&(o=o||[]).push(c,s)):"children"===c?"string"!==typeof s&&"number"!==typeof s||(o=o||[]).push(c,""+s):"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&(i.hasOwnProperty(c)?(null!=s&&"onScroll"===c&&Ur("scroll",e),o||u===s||(o=[])):(o=o||[]).push(c,s))}t&&(o=o||[]).push("style",t);var c=o;(n.updateQueue=c)&&(n.flags|=4)}},Ri=function(e,n,t,r){t!==r&&(n.flags|=4)};var Yi=!1,Xi=!1,Gi="function"===typeof WeakSet?WeakSet:Set,Zi=null;function Ji(e,n){var t=e.ref;if(null!==t)if("function"===typeof t)try{t(null)}catch(r){Ns(e,n,r)}else t.current=null}function eu(e,n,t){try{t()}catch(r){Ns(e,n,r)}}var nu=!1;function tu(e,n,t){var r=n.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var l=r=r.next;do{if((l.tag&e)===e){var a=l.destroy;l.destroy=void 0,void 0!==a&&eu(n,t,a)}l=l.next}while(l!==r)}}function ru(e,n){if(null!==(n=null!==(n=n.updateQueue)?n.lastEffect:null)){var t=n=n.next;do{if((t.tag&e)===e){var r=t.create;t.destroy=r()}t=t.next}while(t!==n)}}function lu(e){var n=e.ref;if(null!==n){var t=e.stateNode;e.tag,e=t,"function"===typeof n?n(e):n.current=e}}function au(e){var n=e.alternate;null!==n&&(e.alternate=null,au(n)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(n=e.stateNode)&&(delete n[fl],delete n[pl],delete n[hl],delete n[gl],delete n[vl])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function ou(e){return 5===e.tag||3===e.tag||4===e.tag}function iu(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||ou(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function uu(e,n,t){var r=e.tag;if(5===r||6===r)e=e.stateNode,n?8===t.nodeType?t.parentNode.insertBefore(e,n):t.insertBefore(e,n):(8===t.nodeType?(n=t.parentNode).insertBefore(e,t):(n=t).appendChild(e),null!==(t=t._reactRootContainer)&&void 0!==t||null!==n.onclick||(n.onclick=Jr));else if(4!==r&&null!==(e=e.child))for(uu(e,n,t),e=e.sibling;null!==e;)uu(e,n,t),e=e.sibling}function su(e,n,t){var r=e.tag;if(5===r||6===r)e=e.stateNode,n?t.insertBefore(e,n):t.appendChild(e);else if(4!==r&&null!==(e=e.child))for(su(e,n,t),e=e.sibling;null!==e;)su(e,n,t),e=e.sibling}var cu=null,du=!1;function fu(e,n,t){for(t=t.child;null!==t;)pu(e,n,t),t=t.sibling}function pu(e,n,t){if(an&&"function"===typeof an.onCommitFiberUnmount)try{an.onCommitFiberUnmount(ln,t)}catch(i){}switch(t.tag){case 5:Xi||Ji(t,n);case 6:var r=cu,l=du;cu=null,fu(e,n,t),du=l,null!==(cu=r)&&(du?(e=cu,t=t.stateNode,8===e.nodeType?e.parentNode.removeChild(t):e.removeChild(t)):cu.removeChild(t.stateNode));break;case 18:null!==cu&&(du?(e=cu,t=t.stateNode,8===e.nodeType?ul(e.parentNode,t):1===e.nodeType&&ul(e,t),Wn(e)):ul(cu,t.stateNode));break;case 4:r=cu,l=du,cu=t.stateNode.containerInfo,du=!0,fu(e,n,t),cu=r,du=l;break;case 0:case 11:case 14:case 15:if(!Xi&&(null!==(r=t.updateQueue)&&null!==(r=r.lastEffect))){l=r=r.next;do{var a=l,o=a.destroy;a=a.tag,void 0!==o&&(0!==(2&a)||0!==(4&a))&&eu(t,n,o),l=l.next}while(l!==r)}fu(e,n,t);break;case 1:if(!Xi&&(Ji(t,n),"function"===typeof(r=t.stateNode).componentWillUnmount))try{r.props=t.memoizedProps,r.state=t.memoizedState,r.componentWillUnmount()}catch(i){Ns(t,n,i)}fu(e,n,t);break;case 21:fu(e,n,t);break;case 22:1&t.mode?(Xi=(r=Xi)||null!==t.memoizedState,fu(e,n,t),Xi=r):fu(e,n,t);break;default:fu(e,n,t)}}function mu(e){var n=e.updateQueue;if(null!==n){e.updateQueue=null;var t=e.stateNode;null===t&&(t=e.stateNode=new Gi),n.forEach(function(n){var r=js.bind(null,e,n);t.has(n)||(t.add(n),n.then(r,r))})}}function hu(e,n){var t=n.deletions;if(null!==t)for(var r=0;r<t.length;r++){var l=t[r];try{var o=e,i=n,u=i;e:for(;null!==u;){switch(u.tag){case 5:cu=u.stateNode,du=!1;break e;case 3:case 4:cu=u.stateNode.containerInfo,du=!0;break e}u=u.return}if(null===cu)throw Error(a(160));pu(o,i,l),cu=null,du=!1;var s=l.alternate;null!==s&&(s.return=null),l.return=null}catch(c){Ns(l,n,c)}}if(12854&n.subtreeFlags)for(n=n.child;null!==n;)gu(n,e),n=n.sibling}function gu(e,n){var t=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(hu(n,e),vu(e),4&r){try{tu(3,e,e.return),ru(3,e)}catch(g){Ns(e,e.return,g)}try{tu(5,e,e.return)}catch(g){Ns(e,e.return,g)}}break;case 1:hu(n,e),vu(e),512&r&&null!==t&&Ji(t,t.return);break;case 5:if(hu(n,e),vu(e),512&r&&null!==t&&Ji(t,t.return),32&e.flags){var l=e.stateNode;try{fe(l,"")}catch(g){Ns(e,e.return,g)}}if(4&r&&null!=(l=e.stateNode)){var o=e.memoizedProps,i=null!==t?t.memoizedProps:o,u=e.type,s=e.updateQueue;if(e.updateQueue=null,null!==s)try{"input"===u&&"radio"===o.type&&null!=o.name&&G(l,o),be(u,i);var c=be(u,o);for(i=0;i<s.length;i+=2){var d=s[i],f=s[i+1];"style"===d?ge(l,f):"dangerouslySetInnerHTML"===d?de(l,f):"children"===d?fe(l,f):b(l,d,f,c)}switch(u){case"input":Z(l,o);break;case"textarea":ae(l,o);break;case"select":var p=l._wrapperState.wasMultiple;l._wrapperState.wasMultiple=!!o.multiple;var m=o.value;null!=m?te(l,!!o.multiple,m,!1):p!==!!o.multiple&&(null!=o.defaultValue?te(l,!!o.multiple,o.defaultValue,!0):te(l,!!o.multiple,o.multiple?[]:"",!1))}l[pl]=o}catch(g){Ns(e,e.return,g)}}break;case 6:if(hu(n,e),vu(e),4&r){if(null===e.stateNode)throw Error(a(162));l=e.stateNode,o=e.memoizedProps;try{l.nodeValue=o}catch(g){Ns(e,e.return,g)}}break;case 3:if(hu(n,e),vu(e),4&r&&null!==t&&t.memoizedState.isDehydrated)try{Wn(n.containerInfo)}catch(g){Ns(e,e.return,g)}break;case 4:default:hu(n,e),vu(e);break;case 13:hu(n,e),vu(e),8192&(l=e.child).flags&&(o=null!==l.memoizedState,l.stateNode.isHidden=o,!o||null!==l.alternate&&null!==l.alternate.memoizedState||(Vu=Ge())),4&r&&mu(e);break;case 22:if(d=null!==t&&null!==t.memoizedState,1&e.mode?(Xi=(c=Xi)||d,hu(n,e),Xi=c):hu(n,e),vu(e),8192&r){if(c=null!==e.memoizedState,(e.stateNode.isHidden=c)&&!d&&0!==(1&e.mode))for(Zi=e,d=e.child;null!==d;){for(f=Zi=d;null!==Zi;){switch(m=(p=Zi).child,p.tag){case 0:case 11:case 14:case 15:tu(4,p,p.return);break;case 1:Ji(p,p.return);var h=p.stateNode;if("function"===typeof h.componentWillUnmount){r=p,t=p.return;try{n=r,h.props=n.memoizedProps,h.state=n.memoizedState,h.componentWillUnmount()}catch(g){Ns(r,t,g)}}break;case 5:Ji(p,p.return);break;case 22:if(null!==p.memoizedState){wu(f);continue}}null!==m?(m.return=p,Zi=m):wu(f)}d=d.sibling}e:for(d=null,f=e;;){if(5===f.tag){if(null===d){d=f;try{l=f.stateNode,c?"function"===typeof(o=l.style).setProperty?o.setProperty("display","none","important"):o.display="none":(u=f.stateNode,i=void 0!==(s=f.memoizedProps.style)&&null!==s&&s.hasOwnProperty("display")?s.display:null,u.style.display=he("display",i))}catch(g){Ns(e,e.return,g)}}}else if(6===f.tag){if(null===d)try{f.stateNode.nodeValue=c?"":f.memoizedProps}catch(g){Ns(e,e.return,g)}}else if((22!==f.tag&&23!==f.tag||null===f.memoizedState||f===e)&&null!==f.child){f.child.return=f,f=f.child;continue}if(f===e)break e;for(;null===f.sibling;){if(null===f.return||f.return===e)break e;d===f&&(d=null),f=f.return}d===f&&(d=null),f.sibling.return=f.return,f=f.sibling}}break;case 19:hu(n,e),vu(e),4&r&&mu(e);case 21:}}function vu(e){var n=e.flags;if(2&n){try{e:{for(var t=e.return;null!==t;){if(ou(t)){var r=t;break e}t=t.return}throw Error(a(160))}switch(r.tag){case 5:var l=r.stateNode;32&r.flags&&(fe(l,""),r.flags&=-33),su(e,iu(e),l);break;case 3:case 4:var o=r.stateNode.containerInfo;uu(e,iu(e),o);break;default:throw Error(a(161))}}catch(i){Ns(e,e.return,i)}e.flags&=-3}4096&n&&(e.flags&=-4097)}function yu(e,n,t){Zi=e,bu(e,n,t)}function bu(e,n,t){for(var r=0!==(1&e.mode);null!==Zi;){var l=Zi,a=l.child;if(22===l.tag&&r){var o=null!==l.memoizedState||Yi;if(!o){var i=l.alternate,u=null!==i&&null!==i.memoizedState||Xi;i=Yi;var s=Xi;if(Yi=o,(Xi=u)&&!s)for(Zi=l;null!==Zi;)u=(o=Zi).child,22===o.tag&&null!==o.memoizedState?ku(l):null!==u?(u.return=o,Zi=u):ku(l);for(;null!==a;)Zi=a,bu(a,n,t),a=a.sibling;Zi=l,Yi=i,Xi=s}xu(e)}else 0!==(8772&l.subtreeFlags)&&null!==a?(a.return=l,Zi=a):xu(e)}}function xu(e){for(;null!==Zi;){var n=Zi;if(0!==(8772&n.flags)){var t=n.alternate;try{if(0!==(8772&n.flags))switch(n.tag){case 0:case 11:case 15:Xi||ru(5,n);break;case 1:var r=n.stateNode;if(4&n.flags&&!Xi)if(null===t)r.componentDidMount();else{var l=n.elementType===n.type?t.memoizedProps:ti(n.type,t.memoizedProps);r.componentDidUpdate(l,t.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var o=n.updateQueue;null!==o&&Wa(n,o,r);break;case 3:var i=n.updateQueue;if(null!==i){if(t=null,null!==n.child)switch(n.child.tag){case 5:case 1:t=n.child.stateNode}Wa(n,i,t)}break;case 5:var u=n.stateNode;if(null===t&&4&n.flags){t=u;var s=n.memoizedProps;switch(n.type){case"button":case"input":case"select":case"textarea":s.autoFocus&&t.focus();break;case"img":s.src&&(t.src=s.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===n.memoizedState){var c=n.alternate;if(null!==c){var d=c.memoizedState;if(null!==d){var f=d.dehydrated;null!==f&&Wn(f)}}}break;default:throw Error(a(163))}Xi||512&n.flags&&lu(n)}catch(p){Ns(n,n.return,p)}}if(n===e){Zi=null;break}if(null!==(t=n.sibling)){t.return=n.return,Zi=t;break}Zi=n.return}}function wu(e){for(;null!==Zi;){var n=Zi;if(n===e){Zi=null;break}var t=n.sibling;if(null!==t){t.return=n.return,Zi=t;break}Zi=n.return}}function ku(e){for(;null!==Zi;){var n=Zi;try{switch(n.tag){case 0:case 11:case 15:var t=n.return;try{ru(4,n)}catch(u){Ns(n,t,u)}break;case 1:var r=n.stateNode;if("function"===typeof r.componentDidMount){var l=n.return;try{r.componentDidMount()}catch(u){Ns(n,l,u)}}var a=n.return;try{lu(n)}catch(u){Ns(n,a,u)}break;case 5:var o=n.return;try{lu(n)}catch(u){Ns(n,o,u)}}}catch(u){Ns(n,n.return,u)}if(n===e){Zi=null;break}var i=n.sibling;if(null!==i){i.return=n.return,Zi=i;break}Zi=n.return}}var Su,Nu=Math.ceil,Eu=x.ReactCurrentDispatcher,Cu=x.ReactCurrentOwner,_u=x.ReactCurrentBatchConfig,ju=0,Pu=null,zu=null,Tu=0,Lu=0,Ou=Nl(0),Ru=0,Mu=null,Du=0,Fu=0,Iu=0,Uu=null,Au=null,Vu=0,$u=1/0,Wu=null,Bu=!1,Hu=null,Qu=null,qu=!1,Ku=null,Yu=0,Xu=0,Gu=null,Zu=-1,Ju=0;function es(){return 0!==(6&ju)?Ge():-1!==Zu?Zu:Zu=Ge()}function ns(e){return 0===(1&e.mode)?1:0!==(2&ju)&&0!==Tu?Tu&-Tu:null!==ha.transition?(0===Ju&&(Ju=gn()),Ju):0!==(e=xn)?e:e=void 0===(e=window.event)?16:Gn(e.type)}function ts(e,n,t,r){if(50<Xu)throw Xu=0,Gu=null,Error(a(185));yn(e,t,r),0!==(2&ju)&&e===Pu||(e===Pu&&(0===(2&ju)&&(Fu|=t),4===Ru&&is(e,Tu)),rs(e,r),1===t&&0===ju&&0===(1&n.mode)&&($u=Ge()+500,Ul&&$l()))}function rs(e,n){var t=e.callbackNode;!function(e,n){for(var t=e.suspendedLanes,r=e.pingedLanes,l=e.expirationTimes,a=e.pendingLanes;0<a;){var o=31-on(a),i=1<<o,u=l[o];-1===u?0!==(i&t)&&0===(i&r)||(l[o]=mn(i,n)):u<=n&&(e.expiredLanes|=i),a&=~i}}(e,n);var r=pn(e,e===Pu?Tu:0);if(0===r)null!==t&&Ke(t),e.callbackNode=null,e.callbackPriority=0;else if(n=r&-r,e.callbackPriority!==n){if(null!=t&&Ke(t),1===n)0===e.tag?function(e){Ul=!0,Vl(e)}(us.bind(null,e)):Vl(us.bind(null,e)),ol(function(){0===(6&ju)&&$l()}),t=null;else{switch(wn(r)){case 1:t=Je;break;case 4:t=en;break;case 16:default:t=nn;break;case 536870912:t=rn}t=Ps(t,ls.bind(null,e))}e.callbackPriority=n,e.callbackNode=t}}function ls(e,n){if(Zu=-1,Ju=0,0!==(6&ju))throw Error(a(327));var t=e.callbackNode;if(ks()&&e.callbackNode!==t)return null;var r=pn(e,e===Pu?Tu:0);if(0===r)return null;if(0!==(30&r)||0!==(r&e.expiredLanes)||n)n=gs(e,r);else{n=r;var l=ju;ju|=2;var o=ms();for(Pu===e&&Tu===n||(Wu=null,$u=Ge()+500,fs(e,n));;)try{ys();break}catch(u){ps(e,u)}Ca(),Eu.current=o,ju=l,null!==zu?n=0:(Pu=null,Tu=0,n=Ru)}if(0!==n){if(2===n&&(0!==(l=hn(e))&&(r=l,n=as(e,l))),1===n)throw t=Mu,fs(e,0),is(e,r),rs(e,Ge()),t;if(6===n)is(e,r);else{if(l=e.current.alternate,0===(30&r)&&!function(e){for(var n=e;;){if(16384&n.flags){var t=n.updateQueue;if(null!==t&&null!==(t=t.stores))for(var r=0;r<t.length;r++){var l=t[r],a=l.getSnapshot;l=l.value;try{if(!ir(a(),l))return!1}catch(i){return!1}}}if(t=n.child,16384&n.subtreeFlags&&null!==t)t.return=n,n=t;else{if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return!0;n=n.return}n.sibling.return=n.return,n=n.sibling}}return!0}(l)&&(2===(n=gs(e,r))&&(0!==(o=hn(e))&&(r=o,n=as(e,o))),1===n))throw t=Mu,fs(e,0),is(e,r),rs(e,Ge()),t;switch(e.finishedWork=l,e.finishedLanes=r,n){case 0:case 1:throw Error(a(345));case 2:case 5:ws(e,Au,Wu);break;case 3:if(is(e,r),(130023424&r)===r&&10<(n=Vu+500-Ge())){if(0!==pn(e,0))break;if(((l=e.suspendedLanes)&r)!==r){es(),e.pingedLanes|=e.suspendedLanes&l;break}e.timeoutHandle=rl(ws.bind(null,e,Au,Wu),n);break}ws(e,Au,Wu);break;case 4:if(is(e,r),(4194240&r)===r)break;for(n=e.eventTimes,l=-1;0<r;){var i=31-on(r);o=1<<i,(i=n[i])>l&&(l=i),r&=~o}if(r=l,10<(r=(120>(r=Ge()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*Nu(r/1960))-r)){e.timeoutHandle=rl(ws.bind(null,e,Au,Wu),r);break}ws(e,Au,Wu);break;default:throw Error(a(329))}}}return rs(e,Ge()),e.callbackNode===t?ls.bind(null,e):null}function as(e,n){var t=Uu;return e.current.memoizedState.isDehydrated&&(fs(e,n).flags|=256),2!==(e=gs(e,n))&&(n=Au,Au=t,null!==n&&os(n)),e}function os(e){null===Au?Au=e:Au.push.apply(Au,e)}function is(e,n){for(n&=~Iu,n&=~Fu,e.suspendedLanes|=n,e.pingedLanes&=~n,e=e.expirationTimes;0<n;){var t=31-on(n),r=1<<t;e[t]=-1,n&=~r}}function us(e){if(0!==(6&ju))throw Error(a(327));ks();var n=pn(e,0);if(0===(1&n))return rs(e,Ge()),null;var t=gs(e,n);if(0!==e.tag&&2===t){var r=hn(e);0!==r&&(n=r,t=as(e,r))}if(1===t)throw t=Mu,fs(e,0),is(e,n),rs(e,Ge()),t;if(6===t)throw Error(a(345));return e.finishedWork=e.current.alternate,e.finishedLanes=n,ws(e,Au,Wu),rs(e,Ge()),null}function ss(e,n){var t=ju;ju|=1;try{return e(n)}finally{0===(ju=t)&&($u=Ge()+500,Ul&&$l())}}function cs(e){null!==Ku&&0===Ku.tag&&0===(6&ju)&&ks();var n=ju;ju|=1;var t=_u.transition,r=xn;try{if(_u.transition=null,xn=1,e)return e()}finally{xn=r,_u.transition=t,0===(6&(ju=n))&&$l()}}function ds(){Lu=Ou.current,El(Ou)}function fs(e,n){e.finishedWork=null,e.finishedLanes=0;var t=e.timeoutHandle;if(-1!==t&&(e.timeoutHandle=-1,ll(t)),null!==zu)for(t=zu.return;null!==t;){var r=t;switch(na(r),r.tag){case 1:null!==(r=r.type.childContextTypes)&&void 0!==r&&Ol();break;case 3:Xa(),El(Pl),El(jl),to();break;case 5:Za(r);break;case 4:Xa();break;case 13:case 19:El(Ja);break;case 10:_a(r.type._context);break;case 22:case 23:ds()}t=t.return}if(Pu=e,zu=e=Os(e.current,null),Tu=Lu=n,Ru=0,Mu=null,Iu=Fu=Du=0,Au=Uu=null,null!==Ta){for(n=0;n<Ta.length;n++)if(null!==(r=(t=Ta[n]).interleaved)){t.interleaved=null;var l=r.next,a=t.pending;if(null!==a){var o=a.next;a.next=l,r.next=o}t.pending=r}Ta=null}return e}function ps(e,n){for(;;){var t=zu;try{if(Ca(),ro.current=Zo,so){for(var r=oo.memoizedState;null!==r;){var l=r.queue;null!==l&&(l.pending=null),r=r.next}so=!1}if(ao=0,uo=io=oo=null,co=!1,fo=0,Cu.current=null,null===t||null===t.return){Ru=1,Mu=n,zu=null;break}e:{var o=e,i=t.return,u=t,s=n;if(n=Tu,u.flags|=32768,null!==s&&"object"===typeof s&&"function"===typeof s.then){var c=s,d=u,f=d.tag;if(0===(1&d.mode)&&(0===f||11===f||15===f)){var p=d.alternate;p?(d.updateQueue=p.updateQueue,d.memoizedState=p.memoizedState,d.lanes=p.lanes):(d.updateQueue=null,d.memoizedState=null)}var m=gi(i);if(null!==m){m.flags&=-257,vi(m,i,u,0,n),1&m.mode&&hi(o,c,n),s=c;var h=(n=m).updateQueue;if(null===h){var g=new Set;g.add(s),n.updateQueue=g}else h.add(s);break e}if(0===(1&n)){hi(o,c,n),hs();break e}s=Error(a(426))}else if(la&&1&u.mode){var v=gi(i);if(null!==v){0===(65536&v.flags)&&(v.flags|=256),vi(v,i,u,0,n),ma(si(s,u));break e}}o=s=si(s,u),4!==Ru&&(Ru=2),null===Uu?Uu=[o]:Uu.push(o),o=i;do{switch(o.tag){case 3:o.flags|=65536,n&=-n,o.lanes|=n,Va(o,pi(0,s,n));break e;case 1:u=s;var y=o.type,b=o.stateNode;if(0===(128&o.flags)&&("function"===typeof y.getDerivedStateFromError||null!==b&&"function"===typeof b.componentDidCatch&&(null===Qu||!Qu.has(b)))){o.flags|=65536,n&=-n,o.lanes|=n,Va(o,mi(o,u,n));break e}}o=o.return}while(null!==o)}xs(t)}catch(x){n=x,zu===t&&null!==t&&(zu=t=t.return);continue}break}}function ms(){var e=Eu.current;return Eu.current=Zo,null===e?Zo:e}function hs(){0!==Ru&&3!==Ru&&2!==Ru||(Ru=4),null===Pu||0===(268435455&Du)&&0===(268435455&Fu)||is(Pu,Tu)}function gs(e,n){var t=ju;ju|=2;var r=ms();for(Pu===e&&Tu===n||(Wu=null,fs(e,n));;)try{vs();break}catch(l){ps(e,l)}if(Ca(),ju=t,Eu.current=r,null!==zu)throw Error(a(261));return Pu=null,Tu=0,Ru}function vs(){for(;null!==zu;)bs(zu)}function ys(){for(;null!==zu&&!Ye();)bs(zu)}function bs(e){var n=Su(e.alternate,e,Lu);e.memoizedProps=e.pendingProps,null===n?xs(e):zu=n,Cu.current=null}function xs(e){var n=e;do{var t=n.alternate;if(e=n.return,0===(32768&n.flags)){if(null!==(t=qi(t,n,Lu)))return void(zu=t)}else{if(null!==(t=Ki(t,n)))return t.flags&=32767,void(zu=t);if(null===e)return Ru=6,void(zu=null);e.flags|=32768,e.subtreeFlags=0,e.deletions=null}if(null!==(n=n.sibling))return void(zu=n);zu=n=e}while(null!==n);0===Ru&&(Ru=5)}function ws(e,n,t){var r=xn,l=_u.transition;try{_u.transition=null,xn=1,function(e,n,t,r){do{ks()}while(null!==Ku);if(0!==(6&ju))throw Error(a(327));t=e.finishedWork;var l=e.finishedLanes;if(null===t)return null;if(e.finishedWork=null,e.finishedLanes=0,t===e.current)throw Error(a(177));e.callbackNode=null,e.callbackPriority=0;var o=t.lanes|t.childLanes;if(function(e,n){var t=e.pendingLanes&~n;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=n,e.mutableReadLanes&=n,e.entangledLanes&=n,n=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<t;){var l=31-on(t),a=1<<l;n[l]=0,r[l]=-1,e[l]=-1,t&=~a}}(e,o),e===Pu&&(zu=Pu=null,Tu=0),0===(2064&t.subtreeFlags)&&0===(2064&t.flags)||qu||(qu=!0,Ps(nn,function(){return ks(),null})),o=0!==(15990&t.flags),0!==(15990&t.subtreeFlags)||o){o=_u.transition,_u.transition=null;var i=xn;xn=1;var u=ju;ju|=4,Cu.current=null,function(e,n){if(el=Hn,pr(e=fr())){if("selectionStart"in e)var t={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(t=(t=e.ownerDocument)&&t.defaultView||window).getSelection&&t.getSelection();if(r&&0!==r.rangeCount){t=r.anchorNode;var l=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{t.nodeType,o.nodeType}catch(w){t=null;break e}var i=0,u=-1,s=-1,c=0,d=0,f=e,p=null;n:for(;;){for(var m;f!==t||0!==l&&3!==f.nodeType||(u=i+l),f!==o||0!==r&&3!==f.nodeType||(s=i+r),3===f.nodeType&&(i+=f.nodeValue.length),null!==(m=f.firstChild);)p=f,f=m;for(;;){if(f===e)break n;if(p===t&&++c===l&&(u=i),p===o&&++d===r&&(s=i),null!==(m=f.nextSibling))break;p=(f=p).parentNode}f=m}t=-1===u||-1===s?null:{start:u,end:s}}else t=null}t=t||{start:0,end:0}}else t=null;for(nl={focusedElem:e,selectionRange:t},Hn=!1,Zi=n;null!==Zi;)if(e=(n=Zi).child,0!==(1028&n.subtreeFlags)&&null!==e)e.return=n,Zi=e;else for(;null!==Zi;){n=Zi;try{var h=n.alternate;if(0!==(1024&n.flags))switch(n.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==h){var g=h.memoizedProps,v=h.memoizedState,y=n.stateNode,b=y.getSnapshotBeforeUpdate(n.elementType===n.type?g:ti(n.type,g),v);y.__reactInternalSnapshotBeforeUpdate=b}break;case 3:var x=n.stateNode.containerInfo;1===x.nodeType?x.textContent="":9===x.nodeType&&x.documentElement&&x.removeChild(x.documentElement);break;default:throw Error(a(163))}}catch(w){Ns(n,n.return,w)}if(null!==(e=n.sibling)){e.return=n.return,Zi=e;break}Zi=n.return}h=nu,nu=!1}(e,t),gu(t,e),mr(nl),Hn=!!el,nl=el=null,e.current=t,yu(t,e,l),Xe(),ju=u,xn=i,_u.transition=o}else e.current=t;if(qu&&(qu=!1,Ku=e,Yu=l),o=e.pendingLanes,0===o&&(Qu=null),function(e){if(an&&"function"===typeof an.onCommitFiberRoot)try{an.onCommitFiberRoot(ln,e,void 0,128===(128&e.current.flags))}catch(n){}}(t.stateNode),rs(e,Ge()),null!==n)for(r=e.onRecoverableError,t=0;t<n.length;t++)l=n[t],r(l.value,{componentStack:l.stack,digest:l.digest});if(Bu)throw Bu=!1,e=Hu,Hu=null,e;0!==(1&Yu)&&0!==e.tag&&ks(),o=e.pendingLanes,0!==(1&o)?e===Gu?Xu++:(Xu=0,Gu=e):Xu=0,$l()}(e,n,t,r)}finally{_u.transition=l,xn=r}return null}function ks(){if(null!==Ku){var e=wn(Yu),n=_u.transition,t=xn;try{if(_u.transition=null,xn=16>e?16:e,null===Ku)var r=!1;else{if(e=Ku,Ku=null,Yu=0,0!==(6&ju))throw Error(a(331));var l=ju;for(ju|=4,Zi=e.current;null!==Zi;){var o=Zi,i=o.child;if(0!==(16&Zi.flags)){var u=o.deletions;if(null!==u){for(var s=0;s<u.length;s++){var c=u[s];for(Zi=c;null!==Zi;){var d=Zi;switch(d.tag){case 0:case 11:case 15:tu(8,d,o)}var f=d.child;if(null!==f)f.return=d,Zi=f;else for(;null!==Zi;){var p=(d=Zi).sibling,m=d.return;if(au(d),d===c){Zi=null;break}if(null!==p){p.return=m,Zi=p;break}Zi=m}}}var h=o.alternate;if(null!==h){var g=h.child;if(null!==g){h.child=null;do{var v=g.sibling;g.sibling=null,g=v}while(null!==g)}}Zi=o}}if(0!==(2064&o.subtreeFlags)&&null!==i)i.return=o,Zi=i;else e:for(;null!==Zi;){if(0!==(2048&(o=Zi).flags))switch(o.tag){case 0:case 11:case 15:tu(9,o,o.return)}var y=o.sibling;if(null!==y){y.return=o.return,Zi=y;break e}Zi=o.return}}var b=e.current;for(Zi=b;null!==Zi;){var x=(i=Zi).child;if(0!==(2064&i.subtreeFlags)&&null!==x)x.return=i,Zi=x;else e:for(i=b;null!==Zi;){if(0!==(2048&(u=Zi).flags))try{switch(u.tag){case 0:case 11:case 15:ru(9,u)}}catch(k){Ns(u,u.return,k)}if(u===i){Zi=null;break e}var w=u.sibling;if(null!==w){w.return=u.return,Zi=w;break e}Zi=u.return}}if(ju=l,$l(),an&&"function"===typeof an.onPostCommitFiberRoot)try{an.onPostCommitFiberRoot(ln,e)}catch(k){}r=!0}return r}finally{xn=t,_u.transition=n}}return!1}function Ss(e,n,t){e=Ua(e,n=pi(0,n=si(t,n),1),1),n=es(),null!==e&&(yn(e,1,n),rs(e,n))}function Ns(e,n,t){if(3===e.tag)Ss(e,e,t);else for(;null!==n;){if(3===n.tag){Ss(n,e,t);break}if(1===n.tag){var r=n.stateNode;if("function"===typeof n.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Qu||!Qu.has(r))){n=Ua(n,e=mi(n,e=si(t,e),1),1),e=es(),null!==n&&(yn(n,1,e),rs(n,e));break}}n=n.return}}function Es(e,n,t){var r=e.pingCache;null!==r&&r.delete(n),n=es(),e.pingedLanes|=e.suspendedLanes&t,Pu===e&&(Tu&t)===t&&(4===Ru||3===Ru&&(130023424&Tu)===Tu&&500>Ge()-Vu?fs(e,0):Iu|=t),rs(e,n)}function Cs(e,n){0===n&&(0===(1&e.mode)?n=1:(n=dn,0===(130023424&(dn<<=1))&&(dn=4194304)));var t=es();null!==(e=Ra(e,n))&&(yn(e,n,t),rs(e,t))}function _s(e){var n=e.memoizedState,t=0;null!==n&&(t=n.retryLane),Cs(e,t)}function js(e,n){var t=0;switch(e.tag){case 13:var r=e.stateNode,l=e.memoizedState;null!==l&&(t=l.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(a(314))}null!==r&&r.delete(n),Cs(e,t)}function Ps(e,n){return qe(e,n)}function zs(e,n,t,r){this.tag=e,this.key=t,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=n,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Ts(e,n,t,r){return new zs(e,n,t,r)}function Ls(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Os(e,n){var t=e.alternate;return null===t?((t=Ts(e.tag,n,e.key,e.mode)).elementType=e.elementType,t.type=e.type,t.stateNode=e.stateNode,t.alternate=e,e.alternate=t):(t.pendingProps=n,t.type=e.type,t.flags=0,t.subtreeFlags=0,t.deletions=null),t.flags=14680064&e.flags,t.childLanes=e.childLanes,t.lanes=e.lanes,t.child=e.child,t.memoizedProps=e.memoizedProps,t.memoizedState=e.memoizedState,t.updateQueue=e.updateQueue,n=e.dependencies,t.dependencies=null===n?null:{lanes:n.lanes,firstContext:n.firstContext},t.sibling=e.sibling,t.index=e.index,t.ref=e.ref,t}function Rs(e,n,t,r,l,o){var i=2;if(r=e,"function"===typeof e)Ls(e)&&(i=1);else if("string"===typeof e)i=5;else e:switch(e){case S:return Ms(t.children,l,o,n);case N:i=8,l|=8;break;case E:return(e=Ts(12,t,n,2|l)).elementType=E,e.lanes=o,e;case P:return(e=Ts(13,t,n,l)).elementType=P,e.lanes=o,e;case z:return(e=Ts(19,t,n,l)).elementType=z,e.lanes=o,e;case O:return Ds(t,l,o,n);default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case C:i=10;break e;case _:i=9;break e;case j:i=11;break e;case T:i=14;break e;case L:i=16,r=null;break e}throw Error(a(130,null==e?e:typeof e,""))}return(n=Ts(i,t,n,l)).elementType=e,n.type=r,n.lanes=o,n}function Ms(e,n,t,r){return(e=Ts(7,e,r,n)).lanes=t,e}function Ds(e,n,t,r){return(e=Ts(22,e,r,n)).elementType=O,e.lanes=t,e.stateNode={isHidden:!1},e}function Fs(e,n,t){return(e=Ts(6,e,null,n)).lanes=t,e}function Is(e,n,t){return(n=Ts(4,null!==e.children?e.children:[],e.key,n)).lanes=t,n.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},n}function Us(e,n,t,r,l){this.tag=n,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=vn(0),this.expirationTimes=vn(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=vn(0),this.identifierPrefix=r,this.onRecoverableError=l,this.mutableSourceEagerHydrationData=null}function As(e,n,t,r,l,a,o,i,u){return e=new Us(e,n,t,i,u),1===n?(n=1,!0===a&&(n|=8)):n=0,a=Ts(3,null,null,n),e.current=a,a.stateNode=e,a.memoizedState={element:r,isDehydrated:t,cache:null,transitions:null,pendingSuspenseBoundaries:null},Da(a),e}function Vs(e){if(!e)return _l;e:{if($e(e=e._reactInternals)!==e||1!==e.tag)throw Error(a(170));var n=e;do{switch(n.tag){case 3:n=n.stateNode.context;break e;case 1:if(Ll(n.type)){n=n.stateNode.__reactInternalMemoizedMergedChildContext;break e}}n=n.return}while(null!==n);throw Error(a(171))}if(1===e.tag){var t=e.type;if(Ll(t))return Ml(e,t,n)}return n}function $s(e,n,t,r,l,a,o,i,u){return(e=As(t,r,!0,e,0,a,0,i,u)).context=Vs(null),t=e.current,(a=Ia(r=es(),l=ns(t))).callback=void 0!==n&&null!==n?n:null,Ua(t,a,l),e.current.lanes=l,yn(e,l,r),rs(e,r),e}function Ws(e,n,t,r){var l=n.current,a=es(),o=ns(l);return t=Vs(t),null===n.context?n.context=t:n.pendingContext=t,(n=Ia(a,o)).payload={element:e},null!==(r=void 0===r?null:r)&&(n.callback=r),null!==(e=Ua(l,n,o))&&(ts(e,l,o,a),Aa(e,l,o)),o}function Bs(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function Hs(e,n){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var t=e.retryLane;e.retryLane=0!==t&&t<n?t:n}}function Qs(e,n){Hs(e,n),(e=e.alternate)&&Hs(e,n)}Su=function(e,n,t){if(null!==e)if(e.memoizedProps!==n.pendingProps||Pl.current)bi=!0;else{if(0===(e.lanes&t)&&0===(128&n.flags))return bi=!1,function(e,n,t){switch(n.tag){case 3:Pi(n),pa();break;case 5:Ga(n);break;case 1:Ll(n.type)&&Dl(n);break;case 4:Ya(n,n.stateNode.containerInfo);break;case 10:var r=n.type._context,l=n.memoizedProps.value;Cl(ka,r._currentValue),r._currentValue=l;break;case 13:if(null!==(r=n.memoizedState))return null!==r.dehydrated?(Cl(Ja,1&Ja.current),n.flags|=128,null):0!==(t&n.child.childLanes)?Fi(e,n,t):(Cl(Ja,1&Ja.current),null!==(e=Bi(e,n,t))?e.sibling:null);Cl(Ja,1&Ja.current);break;case 19:if(r=0!==(t&n.childLanes),0!==(128&e.flags)){if(r)return $i(e,n,t);n.flags|=128}if(null!==(l=n.memoizedState)&&(l.rendering=null,l.tail=null,l.lastEffect=null),Cl(Ja,Ja.current),r)break;return null;case 22:case 23:return n.lanes=0,Ni(e,n,t)}return Bi(e,n,t)}(e,n,t);bi=0!==(131072&e.flags)}else bi=!1,la&&0!==(1048576&n.flags)&&Jl(n,Ql,n.index);switch(n.lanes=0,n.tag){case 2:var r=n.type;Wi(e,n),e=n.pendingProps;var l=Tl(n,jl.current);Pa(n,t),l=go(null,n,r,e,l,t);var o=vo();return n.flags|=1,"object"===typeof l&&null!==l&&"function"===typeof l.render&&void 0===l.$$typeof?(n.tag=1,n.memoizedState=null,n.updateQueue=null,Ll(r)?(o=!0,Dl(n)):o=!1,n.memoizedState=null!==l.state&&void 0!==l.state?l.state:null,Da(n),l.updater=li,n.stateNode=l,l._reactInternals=n,ui(n,r,e,t),n=ji(null,n,r,!0,o,t)):(n.tag=0,la&&o&&ea(n),xi(null,n,l,t),n=n.child),n;case 16:r=n.elementType;e:{switch(Wi(e,n),e=n.pendingProps,r=(l=r._init)(r._payload),n.type=r,l=n.tag=function(e){if("function"===typeof e)return Ls(e)?1:0;if(void 0!==e&&null!==e){if((e=e.$$typeof)===j)return 11;if(e===T)return 14}return 2}(r),e=ti(r,e),l){case 0:n=Ci(null,n,r,e,t);break e;case 1:n=_i(null,n,r,e,t);break e;case 11:n=wi(null,n,r,e,t);break e;case 14:n=ki(null,n,r,ti(r.type,e),t);break e}throw Error(a(306,r,""))}return n;case 0:return r=n.type,l=n.pendingProps,Ci(e,n,r,l=n.elementType===r?l:ti(r,l),t);case 1:return r=n.type,l=n.pendingProps,_i(e,n,r,l=n.elementType===r?l:ti(r,l),t);case 3:e:{if(Pi(n),null===e)throw Error(a(387));r=n.pendingProps,l=(o=n.memoizedState).element,Fa(e,n),$a(n,r,null,t);var i=n.memoizedState;if(r=i.element,o.isDehydrated){if(o={element:r,isDehydrated:!1,cache:i.cache,pendingSuspenseBoundaries:i.pendingSuspenseBoundaries,transitions:i.transitions},n.updateQueue.baseState=o,n.memoizedState=o,256&n.flags){n=zi(e,n,r,t,l=si(Error(a(423)),n));break e}if(r!==l){n=zi(e,n,r,t,l=si(Error(a(424)),n));break e}for(ra=sl(n.stateNode.containerInfo.firstChild),ta=n,la=!0,aa=null,t=wa(n,null,r,t),n.child=t;t;)t.flags=-3&t.flags|4096,t=t.sibling}else{if(pa(),r===l){n=Bi(e,n,t);break e}xi(e,n,r,t)}n=n.child}return n;case 5:return Ga(n),null===e&&sa(n),r=n.type,l=n.pendingProps,o=null!==e?e.memoizedProps:null,i=l.children,tl(r,l)?i=null:null!==o&&tl(r,o)&&(n.flags|=32),Ei(e,n),xi(e,n,i,t),n.child;case 6:return null===e&&sa(n),null;case 13:return Fi(e,n,t);case 4:return Ya(n,n.stateNode.containerInfo),r=n.pendingProps,null===e?n.child=xa(n,null,r,t):xi(e,n,r,t),n.child;case 11:return r=n.type,l=n.pendingProps,wi(e,n,r,l=n.elementType===r?l:ti(r,l),t);case 7:return xi(e,n,n.pendingProps,t),n.child;case 8:case 12:return xi(e,n,n.pendingProps.children,t),n.child;case 10:e:{if(r=n.type._context,l=n.pendingProps,o=n.memoizedProps,i=l.value,Cl(ka,r._currentValue),r._currentValue=i,null!==o)if(ir(o.value,i)){if(o.children===l.children&&!Pl.current){n=Bi(e,n,t);break e}}else for(null!==(o=n.child)&&(o.return=n);null!==o;){var u=o.dependencies;if(null!==u){i=o.child;for(var s=u.firstContext;null!==s;){if(s.context===r){if(1===o.tag){(s=Ia(-1,t&-t)).tag=2;var c=o.updateQueue;if(null!==c){var d=(c=c.shared).pending;null===d?s.next=s:(s.next=d.next,d.next=s),c.pending=s}}o.lanes|=t,null!==(s=o.alternate)&&(s.lanes|=t),ja(o.return,t,n),u.lanes|=t;break}s=s.next}}else if(10===o.tag)i=o.type===n.type?null:o.child;else if(18===o.tag){if(null===(i=o.return))throw Error(a(341));i.lanes|=t,null!==(u=i.alternate)&&(u.lanes|=t),ja(i,t,n),i=o.sibling}else i=o.child;if(null!==i)i.return=o;else for(i=o;null!==i;){if(i===n){i=null;break}if(null!==(o=i.sibling)){o.return=i.return,i=o;break}i=i.return}o=i}xi(e,n,l.children,t),n=n.child}return n;case 9:return l=n.type,r=n.pendingProps.children,Pa(n,t),r=r(l=za(l)),n.flags|=1,xi(e,n,r,t),n.child;case 14:return l=ti(r=n.type,n.pendingProps),ki(e,n,r,l=ti(r.type,l),t);case 15:return Si(e,n,n.type,n.pendingProps,t);case 17:return r=n.type,l=n.pendingProps,l=n.elementType===r?l:ti(r,l),Wi(e,n),n.tag=1,Ll(r)?(e=!0,Dl(n)):e=!1,Pa(n,t),oi(n,r,l),ui(n,r,l,t),ji(null,n,r,!0,e,t);case 19:return $i(e,n,t);case 22:return Ni(e,n,t)}throw Error(a(156,n.tag))};var qs="function"===typeof reportError?reportError:function(e){console.error(e)};function Ks(e){this._internalRoot=e}function Ys(e){this._internalRoot=e}function Xs(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function Gs(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Zs(){}function Js(e,n,t,r,l){var a=t._reactRootContainer;if(a){var o=a;if("function"===typeof l){var i=l;l=function(){var e=Bs(o);i.call(e)}}Ws(n,o,e,l)}else o=function(e,n,t,r,l){if(l){if("function"===typeof r){var a=r;r=function(){var e=Bs(o);a.call(e)}}var o=$s(n,r,e,0,null,!1,0,"",Zs);return e._reactRootContainer=o,e[ml]=o.current,$r(8===e.nodeType?e.parentNode:e),cs(),o}for(;l=e.lastChild;)e.removeChild(l);if("function"===typeof r){var i=r;r=function(){var e=Bs(u);i.call(e)}}var u=As(e,0,!1,null,0,!1,0,"",Zs);return e._reactRootContainer=u,e[ml]=u.current,$r(8===e.nodeType?e.parentNode:e),cs(function(){Ws(n,u,t,r)}),u}(t,n,e,l,r);return Bs(o)}Ys.prototype.render=Ks.prototype.render=function(e){var n=this._internalRoot;if(null===n)throw Error(a(409));Ws(e,n,null,null)},Ys.prototype.unmount=Ks.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var n=e.containerInfo;cs(function(){Ws(null,e,null,null)}),n[ml]=null}},Ys.prototype.unstable_scheduleHydration=function(e){if(e){var n=En();e={blockedOn:null,target:e,priority:n};for(var t=0;t<Rn.length&&0!==n&&n<Rn[t].priority;t++);Rn.splice(t,0,e),0===t&&In(e)}},kn=function(e){switch(e.tag){case 3:var n=e.stateNode;if(n.current.memoizedState.isDehydrated){var t=fn(n.pendingLanes);0!==t&&(bn(n,1|t),rs(n,Ge()),0===(6&ju)&&($u=Ge()+500,$l()))}break;case 13:cs(function(){var n=Ra(e,1);if(null!==n){var t=es();ts(n,e,1,t)}}),Qs(e,1)}},Sn=function(e){if(13===e.tag){var n=Ra(e,134217728);if(null!==n)ts(n,e,134217728,es());Qs(e,134217728)}},Nn=function(e){if(13===e.tag){var n=ns(e),t=Ra(e,n);if(null!==t)ts(t,e,n,es());Qs(e,n)}},En=function(){return xn},Cn=function(e,n){var t=xn;try{return xn=e,n()}finally{xn=t}},ke=function(e,n,t){switch(n){case"input":if(Z(e,t),n=t.name,"radio"===t.type&&null!=n){for(t=e;t.parentNode;)t=t.parentNode;for(t=t.querySelectorAll("input[name="+JSON.stringify(""+n)+'][type="radio"]'),n=0;n<t.length;n++){var r=t[n];if(r!==e&&r.form===e.form){var l=wl(r);if(!l)throw Error(a(90));q(r),Z(r,l)}}}break;case"textarea":ae(e,t);break;case"select":null!=(n=t.value)&&te(e,!!t.multiple,n,!1)}},je=ss,Pe=cs;var ec={usingClientEntryPoint:!1,Events:[bl,xl,wl,Ce,_e,ss]},nc={findFiberByHostInstance:yl,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},tc={bundleType:nc.bundleType,version:nc.version,rendererPackageName:nc.rendererPackageName,rendererConfig:nc.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:x.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=He(e))?null:e.stateNode},findFiberByHostInstance:nc.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var rc=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!rc.isDisabled&&rc.supportsFiber)try{ln=rc.inject(tc),an=rc}catch(ce){}}n.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=ec,n.createPortal=function(e,n){var t=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Xs(n))throw Error(a(200));return function(e,n,t){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:k,key:null==r?null:""+r,children:e,containerInfo:n,implementation:t}}(e,n,null,t)},n.createRoot=function(e,n){if(!Xs(e))throw Error(a(299));var t=!1,r="",l=qs;return null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(t=!0),void 0!==n.identifierPrefix&&(r=n.identifierPrefix),void 0!==n.onRecoverableError&&(l=n.onRecoverableError)),n=As(e,1,!1,null,0,t,0,r,l),e[ml]=n.current,$r(8===e.nodeType?e.parentNode:e),new Ks(n)},n.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var n=e._reactInternals;if(void 0===n){if("function"===typeof e.render)throw Error(a(188));throw e=Object.keys(e).join(","),Error(a(268,e))}return e=null===(e=He(n))?null:e.stateNode},n.flushSync=function(e){return cs(e)},n.hydrate=function(e,n,t){if(!Gs(n))throw Error(a(200));return Js(null,e,n,!0,t)},n.hydrateRoot=function(e,n,t){if(!Xs(e))throw Error(a(405));var r=null!=t&&t.hydratedSources||null,l=!1,o="",i=qs;if(null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(l=!0),void 0!==t.identifierPrefix&&(o=t.identifierPrefix),void 0!==t.onRecoverableError&&(i=t.onRecoverableError)),n=$s(n,null,e,1,null!=t?t:null,l,0,o,i),e[ml]=n.current,$r(e),r)for(e=0;e<r.length;e++)l=(l=(t=r[e])._getVersion)(t._source),null==n.mutableSourceEagerHydrationData?n.mutableSourceEagerHydrationData=[t,l]:n.mutableSourceEagerHydrationData.push(t,l);return new Ys(n)},n.render=function(e,n,t){if(!Gs(n))throw Error(a(200));return Js(null,e,n,!1,t)},n.unmountComponentAtNode=function(e){if(!Gs(e))throw Error(a(40));return!!e._reactRootContainer&&(cs(function(){Js(null,null,e,!1,function(){e._reactRootContainer=null,e[ml]=null})}),!0)},n.unstable_batchedUpdates=ss,n.unstable_renderSubtreeIntoContainer=function(e,n,t,r){if(!Gs(t))throw Error(a(200));if(null==e||void 0===e._reactInternals)throw Error(a(38));return Js(e,n,t,!1,r)},n.version="18.3.1-next-f1338f8080-20240426"},853:(e,n,t)=>{e.exports=t(234)},950:(e,n,t)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(n){console.error(n)}}(),e.exports=t(730)}},n={};function t(r){var l=n[r];if(void 0!==l)return l.exports;var a=n[r]={exports:{}};return e[r](a,a.exports,t),a.exports}var r=t(43),l=t(391);function a(e){return a="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},a(e)}function o(e){var n=function(e,n){if("object"!=a(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var r=t.call(e,n||"default");if("object"!=a(r))return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return("string"===n?String:Number)(e)}(e,"string");return"symbol"==a(n)?n:n+""}function i(e,n,t){return(n=o(n))in e?Object.defineProperty(e,n,{value:t,enumerable:!0,configurable:!0,writable:!0}):e[n]=t,e}function u(e,n){var t=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);n&&(r=r.filter(function(n){return Object.getOwnPropertyDescriptor(e,n).enumerable})),t.push.apply(t,r)}return t}function s(e){for(var n=1;n<arguments.length;n++){var t=null!=arguments[n]?arguments[n]:{};n%2?u(Object(t),!0).forEach(function(n){i(e,n,t[n])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(t)):u(Object(t)).forEach(function(n){Object.defineProperty(e,n,Object.getOwnPropertyDescriptor(t,n))})}return e}var c={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};const d=["color","size","strokeWidth","absoluteStrokeWidth","children"];var f=(e,n)=>{const t=(0,r.forwardRef)((t,l)=>{let{color:a="currentColor",size:o=24,strokeWidth:i=2,absoluteStrokeWidth:u,children:f}=t,p=function(e,n){if(null==e)return{};var t,r,l=function(e,n){if(null==e)return{};var t={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(-1!==n.indexOf(r))continue;t[r]=e[r]}return t}(e,n);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)t=a[r],-1===n.indexOf(t)&&{}.propertyIsEnumerable.call(e,t)&&(l[t]=e[t])}return l}(t,d);return(0,r.createElement)("svg",s(s({ref:l},c),{},{width:o,height:o,stroke:a,strokeWidth:u?24*Number(i)/Number(o):i,className:"lucide lucide-".concat((m=e,m.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase()))},p),[...n.map(e=>{let[n,t]=e;return(0,r.createElement)(n,t)}),...(Array.isArray(f)?f:[f])||[]]);var m});return t.displayName="".concat(e),t};const p=f("Sparkles",[["path",{d:"m12 3-1.912 5.813a2 2 0 0 1-1.275 1.275L3 12l5.813 1.912a2 2 0 0 1 1.275 1.275L12 21l1.912-5.813a2 2 0 0 1 1.275-1.275L21 12l-5.813-1.912a2 2 0 0 1-1.275-1.275L12 3Z",key:"17u4zn"}],["path",{d:"M5 3v4",key:"bklmnn"}],["path",{d:"M19 17v4",key:"iiml17"}],["path",{d:"M3 5h4",key:"nem4j1"}],["path",{d:"M17 19h4",key:"lbex7p"}]]),m=f("CheckCircle",[["path",{d:"M22 11.08V12a10 10 0 1 1-5.93-9.14",key:"g774vq"}],["polyline",{points:"22 4 12 14.01 9 11.01",key:"6xbx8j"}]]),h=f("Loader2",[["path",{d:"M21 12a9 9 0 1 1-6.219-8.56",key:"13zald"}]]),g=f("Upload",[["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["polyline",{points:"17 8 12 3 7 8",key:"t8dd8p"}],["line",{x1:"12",x2:"12",y1:"3",y2:"15",key:"widbto"}]]),v=f("FileText",[["path",{d:"M14.5 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V7.5L14.5 2z",key:"1nnpy2"}],["polyline",{points:"14 2 14 8 20 8",key:"1ew0cm"}],["line",{x1:"16",x2:"8",y1:"13",y2:"13",key:"14keom"}],["line",{x1:"16",x2:"8",y1:"17",y2:"17",key:"17nazh"}],["line",{x1:"10",x2:"8",y1:"9",y2:"9",key:"1a5vjj"}]]),y=f("Save",[["path",{d:"M19 21H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h11l5 5v11a2 2 0 0 1-2 2z",key:"1owoqh"}],["polyline",{points:"17 21 17 13 7 13 7 21",key:"1md35c"}],["polyline",{points:"7 3 7 8 15 8",key:"8nz8an"}]]),b=f("Pen",[["path",{d:"M17 3a2.85 2.83 0 1 1 4 4L7.5 20.5 2 22l1.5-5.5Z",key:"5qss01"}]]),x=f("Download",[["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["polyline",{points:"7 10 12 15 17 10",key:"2ggqvy"}],["line",{x1:"12",x2:"12",y1:"15",y2:"3",key:"1vk2je"}]]),w=f("FileDown",[["path",{d:"M14.5 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V7.5L14.5 2z",key:"1nnpy2"}],["polyline",{points:"14 2 14 8 20 8",key:"1ew0cm"}],["path",{d:"M12 18v-6",key:"17g6i2"}],["path",{d:"m9 15 3 3 3-3",key:"1npd3o"}]]);var k=t(579);const S={NODE_ENV:"production",PUBLIC_URL:"",WDS_SOCKET_HOST:void 0,WDS_SOCKET_PATH:void 0,WDS_SOCKET_PORT:void 0,FAST_REFRESH:!0,REACT_APP_NAME:"AI Resume Generator"}.REACT_APP_API_URL||"/api";function N(){const[e,n]=(0,r.useState)(null),[t,l]=(0,r.useState)(null),[a,o]=(0,r.useState)(null),[i,u]=(0,r.useState)("modern"),[c,d]=(0,r.useState)(!1),[f,N]=(0,r.useState)(1),[E,C]=(0,r.useState)(""),[_,j]=(0,r.useState)(!1),P=async e=>{const t=e.target.files[0];if(!t)return;if(!t.name.endsWith(".docx")&&!t.name.endsWith(".doc"))return void C("Please upload a .doc or .docx file");n(t),d(!0),C("");const r=new FormData;r.append("file",t);try{const e=await fetch("".concat(S,"/upload"),{method:"POST",body:r}),n=await e.json();n.success?(l(n.data),o(n.data),N(2)):C(n.error||"Failed to process document")}catch(a){C("Failed to connect to server. Make sure the Python backend is running on port 5000."),console.error(a)}finally{d(!1)}},z=(e,n)=>{o(t=>s(s({},t),{},{[e]:n}))},T=async function(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"pdf";const n="pdf"===e?"generate-pdf":"generate-docx";try{const t=await fetch("".concat(S,"/").concat(n),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({resumeData:a,template:i})});if(t.ok){const n=await t.blob(),r=window.URL.createObjectURL(n),l=document.createElement("a");l.href=r,l.download="resume_".concat((new Date).getTime(),".").concat(e),document.body.appendChild(l),l.click(),window.URL.revokeObjectURL(r),document.body.removeChild(l)}else C("Failed to generate ".concat(e.toUpperCase()))}catch(t){C("Failed to download resume"),console.error(t)}},L=e=>{let{data:n}=e;return(0,k.jsxs)("div",{className:"bg-white text-gray-900 p-8 rounded-lg shadow-2xl",children:[(0,k.jsxs)("div",{className:"border-l-4 border-blue-600 pl-6 mb-6",children:[(0,k.jsx)("h1",{className:"text-4xl font-bold text-gray-900 mb-2",children:n.name}),(0,k.jsxs)("div",{className:"text-sm text-gray-600 space-y-1",children:[n.email&&(0,k.jsx)("p",{children:n.email}),n.phone&&(0,k.jsx)("p",{children:n.phone}),n.location&&(0,k.jsx)("p",{children:n.location}),n.linkedin&&(0,k.jsx)("p",{className:"text-blue-600",children:n.linkedin})]})]}),n.summary&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-xl font-bold text-blue-600 mb-3 border-b-2 border-blue-600 pb-1",children:"PROFESSIONAL SUMMARY"}),(0,k.jsx)("p",{className:"text-gray-700 leading-relaxed",children:n.summary})]}),n.skills&&n.skills.length>0&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-xl font-bold text-blue-600 mb-3 border-b-2 border-blue-600 pb-1",children:"SKILLS"}),(0,k.jsx)("div",{className:"flex flex-wrap gap-2",children:n.skills.map((e,n)=>(0,k.jsx)("span",{className:"bg-blue-100 text-blue-800 px-3 py-1 rounded-full text-sm font-medium",children:e},n))})]}),n.experience&&n.experience.length>0&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-xl font-bold text-blue-600 mb-3 border-b-2 border-blue-600 pb-1",children:"EXPERIENCE"}),n.experience.map((e,n)=>(0,k.jsxs)("div",{className:"mb-4",children:[(0,k.jsx)("h3",{className:"font-bold text-lg",children:e.title}),(0,k.jsxs)("p",{className:"text-gray-600 text-sm",children:[e.company," | ",e.period]}),(0,k.jsx)("p",{className:"text-gray-700 mt-1",children:e.description})]},n))]}),n.education&&n.education.length>0&&(0,k.jsxs)("div",{children:[(0,k.jsx)("h2",{className:"text-xl font-bold text-blue-600 mb-3 border-b-2 border-blue-600 pb-1",children:"EDUCATION"}),n.education.map((e,n)=>(0,k.jsxs)("div",{className:"mb-2",children:[(0,k.jsx)("h3",{className:"font-bold",children:e.degree}),(0,k.jsxs)("p",{className:"text-gray-600 text-sm",children:[e.institution," | ",e.year]})]},n))]})]})},O=e=>{let{data:n}=e;return(0,k.jsxs)("div",{className:"bg-white text-gray-900 p-8 rounded-lg shadow-2xl",children:[(0,k.jsxs)("div",{className:"text-center mb-6 pb-4 border-b-2 border-gray-800",children:[(0,k.jsx)("h1",{className:"text-4xl font-bold text-gray-900 mb-2",children:n.name}),(0,k.jsxs)("div",{className:"text-sm text-gray-600 space-x-2",children:[n.email&&(0,k.jsx)("span",{children:n.email}),n.phone&&(0,k.jsx)("span",{children:"\u2022"}),n.phone&&(0,k.jsx)("span",{children:n.phone}),n.location&&(0,k.jsx)("span",{children:"\u2022"}),n.location&&(0,k.jsx)("span",{children:n.location})]})]}),n.summary&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-lg font-bold text-gray-900 mb-2 uppercase tracking-wide",children:"Professional Summary"}),(0,k.jsx)("p",{className:"text-gray-700 leading-relaxed",children:n.summary})]}),n.experience&&n.experience.length>0&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-lg font-bold text-gray-900 mb-2 uppercase tracking-wide",children:"Experience"}),n.experience.map((e,n)=>(0,k.jsxs)("div",{className:"mb-4",children:[(0,k.jsxs)("div",{className:"flex justify-between items-start",children:[(0,k.jsx)("h3",{className:"font-bold",children:e.title}),(0,k.jsx)("span",{className:"text-gray-600 text-sm",children:e.period})]}),(0,k.jsx)("p",{className:"text-gray-600 text-sm italic",children:e.company}),(0,k.jsx)("p",{className:"text-gray-700 mt-1",children:e.description})]},n))]}),n.education&&n.education.length>0&&(0,k.jsxs)("div",{className:"mb-6",children:[(0,k.jsx)("h2",{className:"text-lg font-bold text-gray-900 mb-2 uppercase tracking-wide",children:"Education"}),n.education.map((e,n)=>(0,k.jsxs)("div",{className:"mb-2",children:[(0,k.jsxs)("div",{className:"flex justify-between",children:[(0,k.jsx)("h3",{className:"font-semibold",children:e.degree}),(0,k.jsx)("span",{className:"text-gray-600 text-sm",children:e.year})]}),(0,k.jsx)("p",{className:"text-gray-600 text-sm",children:e.institution})]},n))]}),n.skills&&n.skills.length>0&&(0,k.jsxs)("div",{children:[(0,k.jsx)("h2",{className:"text-lg font-bold text-gray-900 mb-2 uppercase tracking-wide",children:"Skills"}),(0,k.jsx)("p",{className:"text-gray-700",children:n.skills.join(" \u2022 ")})]})]})};return(0,k.jsx)("div",{className:"min-h-screen bg-gradient-to-br from-indigo-900 via-purple-900 to-pink-900 p-6",children:(0,k.jsxs)("div",{className:"max-w-6xl mx-auto",children:[(0,k.jsxs)("div",{className:"text-center mb-8",children:[(0,k.jsxs)("h1",{className:"text-5xl font-bold text-white mb-2 flex items-center justify-center gap-3",children:[(0,k.jsx)(p,{className:"w-12 h-12 animate-pulse"}),"AI Resume Generator"]}),(0,k.jsx)("p",{className:"text-purple-200 text-lg",children:"Upload your document and create a professional resume in minutes"})]}),E&&(0,k.jsx)("div",{className:"bg-red-500 text-white px-6 py-4 rounded-lg mb-6 text-center shadow-lg animate-shake",children:(0,k.jsx)("p",{className:"font-semibold",children:E})}),(0,k.jsx)("div",{className:"flex gap-4 mb-8 justify-center flex-wrap",children:[1,2,3].map(e=>(0,k.jsxs)("div",{className:"flex items-center gap-2",children:[(0,k.jsx)("div",{className:"w-10 h-10 rounded-full flex items-center justify-center font-bold transition-all ".concat(f>=e?"bg-white text-purple-900 shadow-lg scale-110":"bg-purple-700 text-white"),children:f>e?(0,k.jsx)(m,{className:"w-6 h-6"}):e}),(0,k.jsx)("span",{className:"text-white text-sm font-medium",children:1===e?"Upload":2===e?"Customize":"Generate"}),e<3&&(0,k.jsx)("div",{className:"w-16 h-1 bg-purple-700 rounded"})]},e))}),1===f&&(0,k.jsx)("div",{className:"bg-white rounded-2xl shadow-2xl p-8 animate-fadeIn",children:(0,k.jsx)("div",{className:"max-w-2xl mx-auto",children:(0,k.jsx)("label",{className:"block w-full",children:(0,k.jsxs)("div",{onDragOver:e=>{e.preventDefault(),e.stopPropagation()},onDrop:e=>{e.preventDefault(),e.stopPropagation();const n=e.dataTransfer.files[0];if(n){P({target:{files:[n]}})}},className:"border-4 border-dashed rounded-2xl p-16 text-center cursor-pointer transition-all duration-300 ".concat(e?"border-green-500 bg-green-50":"border-gray-300 hover:border-purple-500 hover:bg-purple-50"),children:[c?(0,k.jsxs)("div",{className:"space-y-4",children:[(0,k.jsx)(h,{className:"w-20 h-20 mx-auto text-purple-600 animate-spin"}),(0,k.jsx)("p",{className:"text-xl font-bold text-gray-700",children:"Processing your document..."}),(0,k.jsx)("p",{className:"text-sm text-gray-500",children:"AI is analyzing your resume data"}),(0,k.jsx)("div",{className:"w-64 h-2 bg-gray-200 rounded-full mx-auto overflow-hidden",children:(0,k.jsx)("div",{className:"h-full bg-purple-600 animate-progress"})})]}):e?(0,k.jsxs)("div",{className:"space-y-4",children:[(0,k.jsx)(m,{className:"w-20 h-20 mx-auto text-green-600"}),(0,k.jsx)("p",{className:"text-xl font-bold text-gray-700",children:e.name}),(0,k.jsx)("p",{className:"text-sm text-green-600 font-medium",children:"\u2713 File uploaded successfully"})]}):(0,k.jsxs)("div",{className:"space-y-6",children:[(0,k.jsx)(g,{className:"w-20 h-20 mx-auto text-gray-400"}),(0,k.jsxs)("div",{children:[(0,k.jsx)("p",{className:"text-2xl font-bold text-gray-700 mb-2",children:"Drop your resume here"}),(0,k.jsx)("p",{className:"text-gray-500",children:"or click to browse"})]}),(0,k.jsxs)("div",{className:"flex items-center justify-center gap-4 text-xs text-gray-400",children:[(0,k.jsxs)("span",{className:"flex items-center gap-1",children:[(0,k.jsx)(v,{className:"w-4 h-4"}),".DOC"]}),(0,k.jsx)("span",{children:"\u2022"}),(0,k.jsxs)("span",{className:"flex items-center gap-1",children:[(0,k.jsx)(v,{className:"w-4 h-4"}),".DOCX"]}),(0,k.jsx)("span",{children:"\u2022"}),(0,k.jsx)("span",{children:"Max 16MB"})]})]}),(0,k.jsx)("input",{type:"file",accept:".doc,.docx",onChange:P,className:"hidden",disabled:c})]})})})}),2===f&&a&&(0,k.jsxs)("div",{className:"bg-white rounded-2xl shadow-2xl p-8 animate-fadeIn",children:[(0,k.jsxs)("div",{className:"flex justify-between items-center mb-6",children:[(0,k.jsx)("h2",{className:"text-3xl font-bold text-gray-900",children:"Customize Your Resume"}),(0,k.jsxs)("div",{className:"flex items-center gap-4",children:[t.score&&(0,k.jsxs)("div",{className:"text-right",children:[(0,k.jsx)("p",{className:"text-sm text-gray-600",children:"Resume Score"}),(0,k.jsxs)("p",{className:"text-3xl font-bold ".concat((R=t.score,R>=80?"text-green-600":R>=60?"text-yellow-600":"text-red-600")),children:[t.score,"%"]})]}),(0,k.jsxs)("button",{onClick:()=>j(!_),className:"bg-blue-600 text-white px-4 py-2 rounded-lg font-bold hover:bg-blue-700 transition-all flex items-center gap-2",children:[_?(0,k.jsx)(y,{className:"w-4 h-4"}):(0,k.jsx)(b,{className:"w-4 h-4"}),_?"Save":"Edit"]})]})]}),_?(0,k.jsxs)("div",{className:"space-y-6 mb-8",children:[(0,k.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:[(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Full Name"}),(0,k.jsx)("input",{type:"text",value:a.name,onChange:e=>z("name",e.target.value),className:"w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"})]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Email"}),(0,k.jsx)("input",{type:"email",value:a.email,onChange:e=>z("email",e.target.value),className:"w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"})]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Phone"}),(0,k.jsx)("input",{type:"tel",value:a.phone,onChange:e=>z("phone",e.target.value),className:"w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"})]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Location"}),(0,k.jsx)("input",{type:"text",value:a.location,onChange:e=>z("location",e.target.value),className:"w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"})]})]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Professional Summary"}),(0,k.jsx)("textarea",{value:a.summary,onChange:e=>z("summary",e.target.value),rows:"4",className:"w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"})]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("label",{className:"block text-sm font-bold text-gray-700 mb-2",children:"Skills"}),(0,k.jsx)("div",{className:"flex flex-wrap gap-2 mb-2",children:a.skills.map((e,n)=>(0,k.jsxs)("span",{className:"bg-blue-100 text-blue-800 px-3 py-1 rounded-full text-sm font-medium flex items-center gap-2",children:[e,(0,k.jsx)("button",{onClick:()=>{return e=n,void o(n=>s(s({},n),{},{skills:n.skills.filter((n,t)=>t!==e)}));var e},className:"text-red-600 hover:text-red-800",children:"\xd7"})]},n))})]}),(0,k.jsxs)("button",{onClick:()=>{l(a),j(!1)},className:"w-full bg-green-600 text-white py-3 rounded-lg font-bold hover:bg-green-700 transition-all flex items-center justify-center gap-2",children:[(0,k.jsx)(y,{className:"w-5 h-5"}),"Save Changes"]})]}):(0,k.jsxs)("div",{className:"bg-gray-50 rounded-lg p-6 mb-8",children:[(0,k.jsxs)("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4 text-sm",children:[(0,k.jsxs)("div",{children:[(0,k.jsx)("strong",{children:"Name:"})," ",a.name]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("strong",{children:"Email:"})," ",a.email||"Not provided"]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("strong",{children:"Phone:"})," ",a.phone||"Not provided"]}),(0,k.jsxs)("div",{children:[(0,k.jsx)("strong",{children:"Location:"})," ",a.location||"Not provided"]})]}),a.skills&&a.skills.length>0&&(0,k.jsxs)("div",{className:"mt-4",children:[(0,k.jsxs)("strong",{className:"text-sm",children:["Skills (",a.skills.length,"):"]}),(0,k.jsx)("div",{className:"flex flex-wrap gap-2 mt-2",children:a.skills.map((e,n)=>(0,k.jsx)("span",{className:"bg-blue-100 text-blue-800 px-3 py-1 rounded-full text-xs font-medium",children:e},n))})]})]}),(0,k.jsxs)("div",{className:"mb-8",children:[(0,k.jsx)("h3",{className:"text-xl font-bold text-gray-900 mb-4",children:"Choose Your Template"}),(0,k.jsx)("div",{className:"grid grid-cols-2 md:grid-cols-3 lg:grid-cols-6 gap-4",children:[{id:"modern",name:"Modern",color:"bg-gradient-to-br from-blue-600 to-purple-600",desc:"Clean and contemporary"},{id:"professional",name:"Professional",color:"bg-gradient-to-br from-gray-700 to-gray-900",desc:"Classic business style"},{id:"creative",name:"Creative",color:"bg-gradient-to-br from-pink-500 to-orange-500",desc:"Bold and colorful"},{id:"minimal",name:"Minimal",color:"bg-gradient-to-br from-teal-500 to-green-600",desc:"Simple and elegant"},{id:"executive",name:"Executive",color:"bg-gradient-to-br from-indigo-600 to-blue-700",desc:"Senior professional"},{id:"tech",name:"Tech",color:"bg-gradient-to-br from-cyan-500 to-blue-500",desc:"Tech-focused design"}].map(e=>(0,k.jsx)("div",{onClick:()=>u(e.id),className:"".concat(e.color," rounded-xl p-4 cursor-pointer transition-all transform hover:scale-105 ").concat(i===e.id?"ring-4 ring-white shadow-2xl scale-105":"hover:shadow-xl"),children:(0,k.jsxs)("div",{className:"text-white text-center",children:[(0,k.jsx)("div",{className:"w-full h-20 bg-white/20 rounded-lg mb-2 flex items-center justify-center",children:(0,k.jsx)(v,{className:"w-8 h-8"})}),(0,k.jsx)("p",{className:"font-bold text-sm",children:e.name}),(0,k.jsx)("p",{className:"text-xs opacity-80 mt-1",children:e.desc})]})},e.id))})]}),(0,k.jsxs)("button",{onClick:()=>{N(3)},className:"w-full bg-gradient-to-r from-purple-600 to-pink-600 text-white py-4 rounded-xl font-bold text-lg hover:from-purple-700 hover:to-pink-700 transition-all flex items-center justify-center gap-3 shadow-xl",children:[(0,k.jsx)(p,{className:"w-6 h-6"}),"Generate My Resume"]})]}),3===f&&a&&(0,k.jsxs)("div",{className:"space-y-6 animate-fadeIn",children:[(0,k.jsxs)("div",{className:"bg-white rounded-2xl shadow-2xl p-6",children:[(0,k.jsxs)("div",{className:"flex justify-between items-center mb-6 flex-wrap gap-4",children:[(0,k.jsx)("h2",{className:"text-3xl font-bold text-gray-900",children:"Your Professional Resume"}),(0,k.jsxs)("div",{className:"flex gap-3",children:[(0,k.jsxs)("button",{onClick:()=>T("pdf"),className:"bg-red-600 text-white px-6 py-3 rounded-lg font-bold hover:bg-red-700 transition-all flex items-center gap-2 shadow-lg",children:[(0,k.jsx)(x,{className:"w-5 h-5"}),"Download PDF"]}),(0,k.jsxs)("button",{onClick:()=>T("docx"),className:"bg-blue-600 text-white px-6 py-3 rounded-lg font-bold hover:bg-blue-700 transition-all flex items-center gap-2 shadow-lg",children:[(0,k.jsx)(w,{className:"w-5 h-5"}),"Download DOCX"]})]})]}),(0,k.jsxs)("div",{id:"resume-preview",className:"bg-gray-100 p-8 rounded-xl overflow-auto max-h-screen shadow-inner",children:[("modern"===i||"executive"===i||"tech"===i)&&(0,k.jsx)(L,{data:a}),("professional"===i||"minimal"===i||"creative"===i)&&(0,k.jsx)(O,{data:a})]})]}),(0,k.jsxs)("div",{className:"flex gap-4",children:[(0,k.jsx)("button",{onClick:()=>N(2),className:"flex-1 bg-gray-600 text-white py-3 rounded-xl font-bold hover:bg-gray-700 transition-all",children:"\u2190 Back to Edit"}),(0,k.jsx)("button",{onClick:()=>{N(1),n(null),l(null),o(null),C(""),j(!1)},className:"flex-1 bg-purple-600 text-white py-3 rounded-xl font-bold hover:bg-purple-700 transition-all",children:"Create Another Resume"})]})]})]})});var R}l.createRoot(document.getElementById("root")).render((0,k.jsx)(r.StrictMode,{children:(0,k.jsx)(N,{})}))})();
+//# sourceMappingURL=main.d852ff98.js.map
\ No newline at end of file
@@ -1,7 +1,9 @@
 import React, { useState } from 'react';
 import { Upload, FileText, Download, Sparkles, Loader2, CheckCircle, Edit2, Save, FileDown } from 'lucide-react';
 
-const API_URL = 'http://localhost:5000/api';
+// Relative by default: the backend serves the build, and `npm start` proxies
+// /api to it (see "proxy" in package.json).
+const API_URL = process.env.REACT_APP_API_URL || '/api';
 
 export default function ResumeGenerator() {
   const [file, setFile] = useState(null);